@@ -0,0 +1,255 @@
+# armazem_paginas.py - Armazém de páginas já baixadas (bytes crus + metadados HTTP) em disco
+# 📦 O crawl guarda cada página uma vez; analisador, abas e CLIs leem daqui antes de ir à rede
+# 🔖 Cada crawl abre um escopo por domínio (iniciar_crawl): só páginas guardadas no crawl atual valem
+
+import gzip
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+ARMAZEM_DIR = os.path.join(".cache", "paginas")
+ARMAZEM_VERSAO = 2                      # v2: entradas marcadas com o id do crawl
+ARQUIVO_CRAWL = "_crawl.json"           # {id, inicio} do crawl atual, por domínio
+MAX_BYTES_PAGINA = 5 * 1024 * 1024      # Arquivos gigantes não são páginas: não vão para o disco
+
+
+@dataclass
+class PaginaArmazenada:
+    """📄 Resposta HTTP mínima para reparsear a página sem rede"""
+    url: str
+    conteudo: bytes = b''
+    final_url: str = ''
+    status_code: Optional[int] = None
+    content_type: str = ''
+    encoding: Optional[str] = None      # Charset declarado no Content-Type (None = não declarado)
+    motivo: str = ''                    # Reason phrase (monta a mesma mensagem do raise_for_status)
+    origem: str = 'rede'                # rede | armazem | render_cache
+    armazenado_em: float = 0.0
+
+    @classmethod
+    def de_resposta(cls, url: str, response) -> 'PaginaArmazenada':
+        content_type = response.headers.get('Content-Type', '')
+        return cls(
+            url=url,
+            conteudo=response.content or b'',
+            final_url=response.url,
+            status_code=response.status_code,
+            content_type=content_type,
+            # Sem charset no Content-Type o requests assume ISO-8859-1: quem lê usa UTF-8
+            encoding=response.encoding if 'charset' in content_type.lower() else None,
+            motivo=response.reason or '',
+            armazenado_em=time.time()
+        )
+
+    @property
+    def html(self) -> str:
+        try:
+            return self.conteudo.decode(self.encoding or 'utf-8', errors='replace')
+        except LookupError:
+            return self.conteudo.decode('utf-8', errors='replace')
+
+    @property
+    def erro_http(self) -> str:
+        """❌ Mesma mensagem de response.raise_for_status() ('' = 2xx/3xx)"""
+        status = self.status_code or 0
+        if 400 <= status < 500:
+            return f"{status} Client Error: {self.motivo} for url: {self.final_url or self.url}"
+        if 500 <= status < 600:
+            return f"{status} Server Error: {self.motivo} for url: {self.final_url or self.url}"
+        return ''
+
+
+class ArmazemPaginas:
+    """📦 Páginas por URL em .cache/paginas/<dominio>/<md5>.pkl.gz, válidas só dentro do crawl atual
+
+    O DOM do render cache (pós-JS, scripts neutralizados) não é o que o servidor enviou: só entra
+    como fonte quando o chamador pede (obter(..., render_cache=True) - motor de headings).
+    """
+
+    def __init__(self, diretorio: str = ARMAZEM_DIR):
+        self.diretorio = diretorio
+        self._crawls: Dict[str, Dict] = {}
+        self._render_caches: Dict[str, object] = {}
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'hits_render_cache': 0, 'misses': 0, 'outro_crawl': 0, 'salvos': 0, 'bytes_salvos': 0}
+
+    def _pasta(self, url: str) -> str:
+        dominio = urlparse(url).netloc.replace('.', '_').replace(':', '_') or '_'
+        return os.path.join(self.diretorio, dominio)
+
+    def _arquivo(self, url: str) -> str:
+        return os.path.join(self._pasta(url), f"{hashlib.md5(url.encode('utf-8')).hexdigest()}.pkl.gz")
+
+    def _contar(self, chave: str, valor: int = 1):
+        with self._lock:
+            self.stats[chave] += valor
+
+    # ========================
+    # 🔖 ESCOPO DO CRAWL
+    # ========================
+
+    def iniciar_crawl(self, url: str) -> Dict:
+        """🔖 Novo crawl do domínio da URL: páginas de crawls anteriores deixam de valer"""
+        crawl = {'id': f"{time.time():.6f}-{os.getpid()}", 'inicio': time.time()}
+        pasta = self._pasta(url)
+        try:
+            os.makedirs(pasta, exist_ok=True)
+            temporario = os.path.join(pasta, f"{ARQUIVO_CRAWL}.{os.getpid()}.tmp")
+            with open(temporario, 'w', encoding='utf-8') as f:
+                json.dump(crawl, f)
+            os.replace(temporario, os.path.join(pasta, ARQUIVO_CRAWL))
+        except Exception as e:
+            print(f"   ⚠️ Escopo do crawl não gravado em {pasta}: {e}")
+        with self._lock:
+            self._crawls[pasta] = crawl
+        return crawl
+
+    def crawl_atual(self, url: str) -> Dict:
+        """🔖 Crawl vigente do domínio (gravado por iniciar_crawl; sem nenhum, abre um agora)"""
+        pasta = self._pasta(url)
+        with self._lock:
+            crawl = self._crawls.get(pasta)
+        if crawl is not None:
+            return crawl
+        try:
+            with open(os.path.join(pasta, ARQUIVO_CRAWL), encoding='utf-8') as f:
+                crawl = json.load(f)
+        except (OSError, ValueError):
+            return self.iniciar_crawl(url)
+        with self._lock:
+            return self._crawls.setdefault(pasta, crawl)
+
+    # ========================
+    # 💾 ESCRITA
+    # ========================
+
+    def guardar(self, pagina: PaginaArmazenada):
+        """💾 Grava a página (e a URL final, se houve redirect) - escrita atômica, segura entre threads"""
+        if len(pagina.conteudo) > MAX_BYTES_PAGINA:
+            return
+        entrada = {
+            'versao': ARMAZEM_VERSAO,
+            'url': pagina.url,
+            'conteudo': pagina.conteudo,
+            'final_url': pagina.final_url,
+            'status_code': pagina.status_code,
+            'content_type': pagina.content_type,
+            'encoding': pagina.encoding,
+            'motivo': pagina.motivo,
+            'armazenado_em': pagina.armazenado_em or time.time()
+        }
+        chaves = [pagina.url]
+        if pagina.final_url and pagina.final_url != pagina.url and pagina.status_code == 200:
+            chaves.append(pagina.final_url)
+
+        for chave in chaves:
+            path = self._arquivo(chave)
+            temporario = f"{path}.{threading.get_ident()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with gzip.open(temporario, 'wb', compresslevel=3) as f:
+                    pickle.dump({**entrada, 'url': chave, 'id_crawl': self.crawl_atual(chave)['id']}, f,
+                                protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temporario, path)
+                self._contar('salvos')
+                self._contar('bytes_salvos', os.path.getsize(path))
+            except Exception as e:
+                print(f"   ⚠️ Erro salvando página no armazém ({chave}): {e}")
+
+    def guardar_resposta(self, url: str, response) -> PaginaArmazenada:
+        """💾 Atalho para quem acabou de fazer o GET (crawler, analisador)"""
+        pagina = PaginaArmazenada.de_resposta(url, response)
+        self.guardar(pagina)
+        return pagina
+
+    # ========================
+    # 📂 LEITURA (sem rede)
+    # ========================
+
+    def _carregar(self, url: str) -> Optional[dict]:
+        path = self._arquivo(url)
+        if not os.path.exists(path):
+            return None
+        try:
+            with gzip.open(path, 'rb') as f:
+                entrada = pickle.load(f)
+        except Exception:
+            return None
+        if entrada.get('versao') != ARMAZEM_VERSAO or entrada.get('url') != url:
+            return None
+        return entrada
+
+    def _do_render_cache(self, url: str) -> Optional[PaginaArmazenada]:
+        """🎭 DOM pós-JS salvo (ou revalidado) pelo crawler Playwright durante o crawl atual"""
+        from render_cache import RENDER_CACHE_DIR, RenderCache
+
+        dominio = urlparse(url).netloc
+        if not os.path.isdir(os.path.join(RENDER_CACHE_DIR, dominio.replace('.', '_'))):
+            return None
+        with self._lock:
+            cache = self._render_caches.get(dominio)
+            if cache is None:
+                cache = self._render_caches[dominio] = RenderCache(dominio)
+        entrada = cache.carregar(url)
+        if not entrada or cache.validado_em(url) < self.crawl_atual(url)['inicio']:
+            return None
+        return PaginaArmazenada(
+            url=url,
+            conteudo=(entrada.get('dom') or '').encode('utf-8'),
+            final_url=entrada.get('final_url') or url,
+            status_code=entrada.get('status_code_http'),
+            content_type=entrada.get('tipo_conteudo') or 'text/html; charset=utf-8',
+            encoding='utf-8',
+            origem='render_cache',
+            armazenado_em=entrada.get('renderizado_em', 0)
+        )
+
+    def obter(self, url: str, render_cache: bool = False) -> Optional[PaginaArmazenada]:
+        """📂 Página guardada no crawl atual; render_cache=True aceita o DOM renderizado; None = precisa baixar"""
+        entrada = self._carregar(url)
+
+        if entrada is not None:
+            if entrada.get('id_crawl') == self.crawl_atual(url)['id']:
+                self._contar('hits')
+                return PaginaArmazenada(
+                    url=url,
+                    conteudo=entrada['conteudo'],
+                    final_url=entrada['final_url'],
+                    status_code=entrada['status_code'],
+                    content_type=entrada['content_type'],
+                    encoding=entrada['encoding'],
+                    motivo=entrada['motivo'],
+                    origem='armazem',
+                    armazenado_em=entrada['armazenado_em']
+                )
+            self._contar('outro_crawl')
+
+        if render_cache:
+            pagina = self._do_render_cache(url)
+            if pagina is not None:
+                self._contar('hits_render_cache')
+                return pagina
+
+        self._contar('misses')
+        return None
+
+    def get_stats(self) -> Dict:
+        """📊 Estatísticas do armazém"""
+        return {**self.stats, 'mb_salvos': round(self.stats['bytes_salvos'] / 1024 / 1024, 2)}
+
+
+_ARMAZEM_PADRAO: Optional[ArmazemPaginas] = None
+
+
+def obter_armazem() -> ArmazemPaginas:
+    """📦 Armazém compartilhado pelo processo (crawler, analisador, motor de headings)"""
+    global _ARMAZEM_PADRAO
+    if _ARMAZEM_PADRAO is None:
+        _ARMAZEM_PADRAO = ArmazemPaginas()
+    return _ARMAZEM_PADRAO
@@ -0,0 +1,129 @@
+# bench_duplicatas.py - Benchmark da detecção de duplicatas (groupby vetorizado x loops por URL)
+# 🏁 Uso: python bench_duplicatas.py [total_paginas]   (padrão: 500000)
+
+import random
+import sys
+import time
+from collections import defaultdict
+
+import pandas as pd
+
+from exporters.duplicatas import detectar_duplicatas, filtrar_urls_paginas_200, grupos_para_dict
+
+
+# ========================
+# 🐢 IMPLEMENTAÇÕES ANTERIORES (referência de resultado)
+# ========================
+
+def duplicatas_legado(resultados, campo, min_caracteres):
+    mapa = defaultdict(list)
+    for resultado in resultados:
+        if not resultado.get('sucesso', False):
+            continue
+        texto = resultado[campo]
+        if texto and len(texto) > min_caracteres:
+            mapa[texto].append(resultado['url'])
+    return {texto: urls for texto, urls in mapa.items() if len(urls) > 1}
+
+
+def duplicatas_listas_legado(resultados, campo):
+    mapa = defaultdict(list)
+    for resultado in resultados:
+        if not resultado.get('sucesso', False):
+            continue
+        for texto in resultado[campo]:
+            mapa[texto].append(resultado['url'])
+    return {texto: urls for texto, urls in mapa.items() if len(urls) > 1}
+
+
+def filtro_legado(df):
+    urls_validas = []
+    for _, row in df.iterrows():
+        url = row.get('url', '')
+        if not url or pd.isna(url):
+            continue
+        url_str = str(url).strip()
+        if not url_str.startswith(('http://', 'https://')):
+            continue
+        if any(url_str.lower().endswith(ext) for ext in ['.pdf', '.jpg', '.jpeg', '.png', '.gif', '.zip', '.rar',
+                                                          '.js', '.css', '.mp3', '.mp4', '.xml', '.json']):
+            continue
+        status_code = row.get('status_code_http', row.get('status_code', None))
+        if status_code is not None:
+            try:
+                if int(float(status_code)) != 200:
+                    continue
+            except (ValueError, TypeError):
+                continue
+        if any(p in url_str.lower() for p in ['?page=', '&page=', '?p=', '&p=', '?pagina=', '&pagina=', '?pg=', '&pg=',
+                                              '/page/', '/p/', '/pagina/', '/pg/', '?offset=', '&offset=', '?start=',
+                                              '&start=', '?pagenum=', '&pagenum=', '?paged=', '&paged=']):
+            continue
+        urls_validas.append(url_str)
+    return set(urls_validas)
+
+
+# ========================
+# 🏗️ DADOS SINTÉTICOS
+# ========================
+
+def gerar_resultados(total: int, semente: int = 42):
+    aleatorio = random.Random(semente)
+    titles_template = [f'Produto {i} | Loja Exemplo' for i in range(total // 20)]
+    h2_comuns = ['Produtos relacionados', 'Avaliações', 'Newsletter', 'Fale conosco']
+    resultados = []
+    for i in range(total):
+        title = aleatorio.choice(titles_template) if aleatorio.random() < 0.3 else f'Página única {i} | Loja Exemplo'
+        resultados.append({
+            'url': f'https://www.exemplo.com.br/p/{i}' if i % 50 == 0 else f'https://www.exemplo.com.br/produto/{i}',
+            'sucesso': aleatorio.random() > 0.01,
+            'title_text': title if aleatorio.random() > 0.02 else '',
+            'h1_textos': [title.split(' | ')[0]] * (2 if i % 97 == 0 else 1),
+            'h2_textos': aleatorio.sample(h2_comuns, 2) + [f'Especificações {i}'],
+        })
+    return resultados
+
+
+def medir(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    resultados = gerar_resultados(total)
+
+    print(f"🏁 BENCHMARK DUPLICATAS - {total} páginas")
+    print(f"{'Etapa':<28}{'Legado (s)':>12}{'Vetorizado (s)':>16}{'Grupos':>10}")
+
+    df_title = pd.DataFrame([r for r in resultados if r['sucesso']], columns=['url', 'title_text'])
+    esperado, t_legado = medir(lambda: duplicatas_legado(resultados, 'title_text', 3))
+    obtido, t_novo = medir(lambda: grupos_para_dict(detectar_duplicatas(df_title, 'title_text', min_caracteres=3)))
+    assert obtido == esperado, "❌ Titles duplicados divergentes"
+    print(f"{'Title duplicado':<28}{t_legado:>12.2f}{t_novo:>16.2f}{len(obtido):>10}")
+
+    df_headings = pd.DataFrame([r for r in resultados if r['sucesso']], columns=['url', 'h1_textos', 'h2_textos'])
+    for coluna in ('h1_textos', 'h2_textos'):
+        esperado, t_legado = medir(lambda: duplicatas_listas_legado(resultados, coluna))
+        obtido, t_novo = medir(lambda: grupos_para_dict(
+            detectar_duplicatas(df_headings[['url', coluna]].explode(coluna), coluna)))
+        assert obtido == esperado, f"❌ {coluna} duplicados divergentes"
+        print(f"{coluna.upper() + ' duplicado':<28}{t_legado:>12.2f}{t_novo:>16.2f}{len(obtido):>10}")
+
+    # Filtro de URLs: iterrows é lento demais para o total completo
+    total_filtro = min(total, 50000)
+    df_urls = pd.DataFrame({
+        'url': [r['url'] for r in resultados[:total_filtro]],
+        'status_code': [200 if i % 10 else 404 for i in range(total_filtro)]
+    })
+    esperado, t_legado = medir(lambda: filtro_legado(df_urls))
+    obtido, t_novo = medir(lambda: filtrar_urls_paginas_200(df_urls))
+    assert set(obtido) == esperado, "❌ Filtro de URLs divergente"
+    print(f"{f'Filtro URLs ({total_filtro})':<28}{t_legado:>12.2f}{t_novo:>16.2f}{len(obtido):>10}")
+
+    print("✅ Resultados idênticos")
+
+
+if __name__ == "__main__":
+    main()
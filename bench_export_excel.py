@@ -0,0 +1,175 @@
+# bench_export_excel.py - Benchmark da exportação Excel (limpeza célula a célula + xlsxwriter em memória
+#                         x limpeza vetorizada + writer constant_memory)
+# 🏁 Uso: python bench_export_excel.py [total_urls] [colunas]   (padrão: 12000 x 40)
+#    Cada exportação roda num processo novo para medir o pico de memória (ru_maxrss) sem interferência
+
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+from exporters.escritor_excel import abrir_escritor_excel
+from exporters.excel_manager import clean_dataframe_for_excel, safe_clean_value
+from exporters.sheets.ssl_problemas_sheet import SSLProblemasSheet
+
+ABAS_DERIVADAS = ['Status_HTTP', 'Metatags', 'Headings', 'Links']
+
+
+# ========================
+# 🐢 IMPLEMENTAÇÃO ANTERIOR (referência de resultado)
+# ========================
+
+def limpar_legado(df):
+    df_clean = df.copy()
+    for col in df_clean.columns:
+        if df_clean[col].dtype == 'object':
+            df_clean[col] = df_clean[col].apply(safe_clean_value)
+    return df_clean
+
+
+def exportar_ssl_legado(writer, df_ssl, sheet_name='SSL_Problemas'):
+    """📤 to_excel + reescrita do header e das linhas CRITICO/ALTO (só funciona fora do constant_memory)"""
+    df_ssl.to_excel(writer, sheet_name=sheet_name, index=False)
+    worksheet = writer.sheets[sheet_name]
+    header_format = writer.book.add_format({'bold': True, 'bg_color': '#D7E4BC', 'border': 1})
+    formatos = {
+        'CRITICO': writer.book.add_format({'bg_color': '#FFE6E6', 'border': 1}),
+        'ALTO': writer.book.add_format({'bg_color': '#FFF2E6', 'border': 1})
+    }
+    for col_num, value in enumerate(df_ssl.columns.values):
+        worksheet.write(0, col_num, value, header_format)
+    for row_num in range(1, len(df_ssl) + 1):
+        formato = formatos.get(df_ssl.iloc[row_num - 1]['Gravidade'])
+        if formato is not None:
+            for col_num in range(len(df_ssl.columns)):
+                worksheet.write(row_num, col_num, df_ssl.iloc[row_num - 1, col_num], formato)
+
+
+# ========================
+# 🏗️ DADOS SINTÉTICOS
+# ========================
+
+def gerar_crawl(total: int, colunas: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    base = {
+        'url': [f'https://www.exemplo.com.br/categoria-{i % 50}/produto-{i}' for i in range(total)],
+        'title': [f'Produto {i} \x07| Loja Exemplo' if i % 97 == 0 else f'Produto {i} | Loja Exemplo' for i in range(total)],
+        'description': ['Descrição longa ' * 40 if i % 13 == 0 else (None if i % 11 == 0 else f'Compre o produto {i}')
+                        for i in range(total)],
+        'status_code_http': rng.choice([200, 200, 200, 301, 404, 500], size=total),
+        'response_time': rng.random(total).round(3),
+        'h1_texts': [[f'Produto {i}'] if i % 5 else [] for i in range(total)],
+        'headings_sequence': [['h1', 'h2', 'h2', 'h3'] for _ in range(total)],
+        'canonical': [f'https://www.exemplo.com.br/produto-{i}' if i % 3 else np.nan for i in range(total)],
+    }
+    for c in range(max(colunas - len(base), 0)):
+        base[f'campo_{c}'] = [f'valor {c}-{i}' if (i + c) % 9 else None for i in range(total)]
+    return pd.DataFrame(base).astype({k: object for k in base if k not in ('status_code_http', 'response_time')})
+
+
+def gerar_ssl(total: int) -> pd.DataFrame:
+    gravidades = ['CRITICO', 'ALTO', 'MEDIO', 'BAIXO']
+    return pd.DataFrame({
+        'Dominio': [f'host{i}.exemplo.com' for i in range(total)],
+        'URL_Verificada': [f'https://host{i}.exemplo.com/' for i in range(total)],
+        'Problema_Principal': ['CERTIFICADO_EXPIRADO' if i % 4 == 0 else 'TLS_FRACO' for i in range(total)],
+        'Grade_SSL': ['F', 'D', 'C', 'B'] * (total // 4) + ['B'] * (total % 4),
+        'Score_SSL': np.arange(total) % 100,
+        'Gravidade': [gravidades[i % 4] for i in range(total)],
+        'Problemas_Detalhados': ['expired; weak_cipher' for _ in range(total)],
+    })
+
+
+# ========================
+# 🏁 EXPORTAÇÕES (um processo cada)
+# ========================
+
+def exportar(modo: str, total: int, colunas: int, destino: str, fila):
+    try:
+        fila.put(_exportar(modo, total, colunas, destino))
+    except Exception as e:
+        fila.put(e)
+
+
+def _exportar(modo: str, total: int, colunas: int, destino: str):
+    df = gerar_crawl(total, colunas)
+    df_ssl = gerar_ssl(max(total // 100, 8))
+    rss_antes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    inicio = time.perf_counter()
+    limpo = limpar_legado(df) if modo == 'legado' else clean_dataframe_for_excel(df)
+    t_limpeza = time.perf_counter() - inicio
+
+    writer = pd.ExcelWriter(destino, engine='xlsxwriter') if modo == 'legado' else abrir_escritor_excel(destino)
+    with writer:
+        writer.book.default_url_format = writer.book.add_format({'font_color': 'black', 'underline': False})
+        limpo.to_excel(writer, sheet_name='Dados_Completos', index=False)
+        for i, aba in enumerate(ABAS_DERIVADAS):
+            colunas_aba = [0] + [c % len(limpo.columns) for c in range(1 + i * 5, 6 + i * 5)]
+            limpo.iloc[:, sorted(set(colunas_aba))].to_excel(writer, sheet_name=aba, index=False)
+        if modo == 'legado':
+            exportar_ssl_legado(writer, df_ssl)
+        else:
+            SSLProblemasSheet(df, writer)._exportar_aba_ssl(df_ssl)
+
+    segundos = time.perf_counter() - inicio
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return t_limpeza, segundos, (pico - rss_antes) / 1024, os.path.getsize(destino) / 1024 / 1024
+
+
+def medir(nome, modo, total, colunas, destino):
+    contexto = multiprocessing.get_context('spawn')
+    fila = contexto.Queue()
+    processo = contexto.Process(target=exportar, args=(modo, total, colunas, destino, fila))
+    processo.start()
+    resultado = fila.get()
+    processo.join()
+    if isinstance(resultado, Exception):
+        raise resultado
+    t_limpeza, segundos, pico_mb, tamanho_mb = resultado
+    print(f"   {nome:<34} limpeza {t_limpeza:6.2f}s | total {segundos:6.2f}s | "
+          f"pico +{pico_mb:7.1f} MB | arquivo {tamanho_mb:5.1f} MB")
+
+
+def celulas(path: str) -> dict:
+    """📋 Valor (e cor de fundo) de cada célula, por aba"""
+    workbook = load_workbook(path, read_only=True)
+    abas = {}
+    for worksheet in workbook.worksheets:
+        abas[worksheet.title] = [
+            tuple((c.value, c.fill.fgColor.rgb if c.fill is not None and c.fill.fill_type else None) for c in linha)
+            for linha in worksheet.iter_rows()
+        ]
+    workbook.close()
+    return abas
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 12000
+    colunas = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+
+    print(f"🏁 Exportação Excel: {total} URLs x {colunas} colunas, {len(ABAS_DERIVADAS) + 2} abas")
+
+    df = gerar_crawl(total, colunas)
+    pd.testing.assert_frame_equal(limpar_legado(df), clean_dataframe_for_excel(df))
+    print("   ✅ clean_dataframe_for_excel: DataFrame idêntico ao da limpeza célula a célula")
+
+    with tempfile.TemporaryDirectory() as pasta:
+        legado = os.path.join(pasta, 'legado.xlsx')
+        streaming = os.path.join(pasta, 'streaming.xlsx')
+        medir('célula a célula + xlsxwriter padrão', 'legado', total, colunas, legado)
+        medir('vetorizado + constant_memory', 'streaming', total, colunas, streaming)
+
+        esperado, obtido = celulas(legado), celulas(streaming)
+        iguais = list(esperado) == list(obtido) and all(esperado[aba] == obtido[aba] for aba in esperado)
+        print(f"   {'✅' if iguais else '❌'} Workbooks: mesmas abas, valores e cores em todas as células")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# bench_grafo_links.py - Benchmark do grafo de links internos (construção, BFS, PageRank)
+# 🏁 Uso: python bench_grafo_links.py [total_arestas]   (padrão: 1000000)
+
+import random
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+import grafo_links
+from grafo_links import GrafoLinks
+
+
+# ========================
+# 🏗️ DADOS SINTÉTICOS
+# ========================
+
+def gerar_resultados(total_arestas: int, semente: int = 42):
+    """🏗️ Site sintético: ~10 links por página, metade apontando para páginas "populares" (cauda exponencial)"""
+    aleatorio = random.Random(semente)
+    total_paginas = max(total_arestas // 10, 2)
+    links = [set() for _ in range(total_paginas)]
+    for _ in range(total_arestas):
+        origem = aleatorio.randrange(total_paginas)
+        if aleatorio.random() < 0.5:
+            destino = min(total_paginas - 1, int(aleatorio.expovariate(1 / max(total_paginas // 20, 1))))
+        else:
+            destino = aleatorio.randrange(total_paginas)
+        links[origem].add(f'https://www.exemplo.com.br/p/{destino}')
+    return [
+        {'url': f'https://www.exemplo.com.br/p/{i}', 'nivel': 0 if i == 0 else 1, 'links_encontrados': list(links[i])}
+        for i in range(total_paginas)
+    ]
+
+
+# ========================
+# 🐢 REFERÊNCIAS (laços Python)
+# ========================
+
+def bfs_referencia(indptr, destinos, raiz):
+    profundidade = [-1] * (len(indptr) - 1)
+    profundidade[raiz] = 0
+    fila = deque([raiz])
+    while fila:
+        atual = fila.popleft()
+        for vizinho in destinos[indptr[atual]:indptr[atual + 1]]:
+            if profundidade[vizinho] < 0:
+                profundidade[vizinho] = profundidade[atual] + 1
+                fila.append(vizinho)
+    return np.array(profundidade)
+
+
+def main():
+    total_arestas = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    resultados = gerar_resultados(total_arestas)
+    print(f"🏁 Grafo de links: {len(resultados)} páginas, ~{total_arestas} arestas")
+
+    inicio = time.perf_counter()
+    grafo = GrafoLinks.de_resultados(resultados)
+    print(f"   construção (IDs + arrays)   {time.perf_counter() - inicio:6.2f}s")
+
+    inicio = time.perf_counter()
+    grafo.csr()
+    print(f"   CSR (dedupe + ordenação)    {time.perf_counter() - inicio:6.2f}s")
+
+    inicio = time.perf_counter()
+    profundidade = grafo.profundidade()
+    print(f"   BFS vetorizado              {time.perf_counter() - inicio:6.2f}s")
+
+    inicio = time.perf_counter()
+    pagerank = grafo.pagerank()
+    print(f"   PageRank ({'scipy' if grafo_links.SCIPY_AVAILABLE else 'numpy'}, "
+          f"{grafo.stats['iteracoes_pagerank']} iterações) {time.perf_counter() - inicio:6.2f}s")
+
+    indptr, destinos, _ = grafo.csr()
+    inicio = time.perf_counter()
+    referencia = bfs_referencia(indptr, destinos, grafo.raizes[0])
+    print(f"   BFS laço Python (referência) {time.perf_counter() - inicio:6.2f}s")
+
+    print(f"   {'✅' if (referencia == profundidade).all() else '❌'} Profundidades idênticas à BFS de referência")
+    print(f"   {'✅' if abs(pagerank.sum() - 1) < 1e-6 else '❌'} PageRank soma 1 ({pagerank.sum():.8f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+# bench_indice_css.py - Benchmark do índice de CSS na validação de headings (índice x regex por classe)
+# 🏁 Uso: python bench_indice_css.py [pasta_com_paginas_html]
+#    Sem pasta, gera páginas sintéticas no estilo WordPress (centenas de KB de <style> inline)
+
+import os
+import random
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+from indice_css import IndiceCSS
+from validador_headings import analisar_css_ocultacao, analisar_css_pai, extrair_css_global
+
+TAGS_HEADING = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+
+# Casos que exercitam a semântica do regex original
+CSS_CASOS_LIMITE = """
+.sr-only{position:absolute;display:none}
+.titulo.escondido { visibility:hidden }
+.lista-a, .lista-b { display:none }
+div > .card-Titulo{color:#fff}
+@media (max-width: 600px) { .mobile-hide { display:none } }
+/* comentario.com.pontos */.depois-comentario{color:white}
+#Banner-Topo { display:none }
+#banner-topo { display:none }
+.sem-fechar { display:none
+"""
+
+
+def gerar_css_wordpress(regras: int, semente: int) -> str:
+    aleatorio = random.Random(semente)
+    propriedades = ['margin:0', 'padding:4px', 'display:none', 'color:#333', 'visibility:hidden',
+                    'font-size:14px', 'color:#fff', 'display:block']
+    blocos = []
+    for i in range(regras):
+        seletor = aleatorio.choice([
+            f'.wp-block-{i}', f'.elementor-element-{i} .elementor-widget', f'#secao-{i}',
+            f'.has-text-{i}.is-hidden', f'.coluna-{i}, .coluna-{i}-alt', f'.wp-block-{i}:hover'
+        ])
+        corpo = ';'.join(aleatorio.sample(propriedades, 3))
+        blocos.append(f'{seletor}{{{corpo}}}' if i % 3 else f'{seletor} {{ {corpo} }}')
+    return '\n'.join(blocos)
+
+
+def gerar_pagina(regras: int, headings: int, semente: int) -> str:
+    aleatorio = random.Random(semente)
+    corpo = []
+    for i in range(headings):
+        tag = aleatorio.choice(TAGS_HEADING)
+        classe = aleatorio.choice([
+            f'wp-block-{aleatorio.randrange(regras)}', f'elementor-widget', 'sr-only', 'titulo escondido',
+            f'has-text-{aleatorio.randrange(regras)} is-hidden', 'lista-b', 'card-Titulo', 'mobile-hide',
+            'depois-comentario', 'sem-fechar'
+        ])
+        id_heading = aleatorio.choice(['', f'secao-{aleatorio.randrange(regras)}', 'banner-topo', 'Banner-Topo'])
+        atributo_id = f' id="{id_heading}"' if id_heading else ''
+        corpo.append(
+            f'<div class="coluna-{aleatorio.randrange(regras)} elementor-element-{i}">'
+            f'<{tag} class="{classe}"{atributo_id}>Título {i}</{tag}></div>'
+        )
+    css = gerar_css_wordpress(regras, semente)
+    return (f"<html><head><style>{css}</style><style>{CSS_CASOS_LIMITE}</style></head>"
+            f"<body>{''.join(corpo)}</body></html>")
+
+
+def carregar_corpus(pasta: str):
+    for nome in sorted(os.listdir(pasta)):
+        if nome.lower().endswith(('.html', '.htm')):
+            with open(os.path.join(pasta, nome), encoding='utf-8', errors='ignore') as arquivo:
+                yield nome, arquivo.read()
+
+
+def corpus_sintetico():
+    for regras, headings in [(500, 50), (3000, 150), (8000, 300)]:
+        yield f"sintetica_{regras}_regras", gerar_pagina(regras, headings, semente=regras)
+
+
+def checar_headings(soup, css_global, indice_css=None):
+    resultados = []
+    for tag in soup.find_all(TAGS_HEADING):
+        resultados.append((analisar_css_ocultacao(tag, css_global, indice_css),
+                           analisar_css_pai(tag, css_global, indice_css)))
+    return resultados
+
+
+def main():
+    corpus = carregar_corpus(sys.argv[1]) if len(sys.argv) > 1 else corpus_sintetico()
+
+    print("🏁 BENCHMARK ÍNDICE CSS - headings ocultos por CSS")
+    print(f"{'Página':<28}{'CSS (KB)':>9}{'Headings':>9}{'Regex (ms)':>12}{'Índice (ms)':>13}{'Ganho':>8}")
+
+    total_paginas = 0
+    for nome, html in corpus:
+        soup = BeautifulSoup(html, 'lxml')
+        css_global = extrair_css_global(soup)
+
+        inicio = time.perf_counter()
+        esperado = checar_headings(soup, css_global)
+        t_regex = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        obtido = checar_headings(soup, css_global, IndiceCSS(css_global))
+        t_indice = time.perf_counter() - inicio
+
+        if obtido != esperado:
+            print(f"❌ Resultado divergente em {nome}")
+            sys.exit(1)
+
+        total_paginas += 1
+        print(f"{nome[:27]:<28}{len(css_global) / 1024:>9.0f}{len(esperado):>9}"
+              f"{t_regex * 1000:>12.1f}{t_indice * 1000:>13.1f}{t_regex / max(t_indice, 1e-9):>7.1f}x")
+
+    print(f"✅ Resultados idênticos em {total_paginas} páginas")
+
+
+if __name__ == "__main__":
+    main()
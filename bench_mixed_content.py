@@ -0,0 +1,303 @@
+# bench_mixed_content.py - Benchmark do scanner http:// (tokenizer em passe único x árvores BeautifulSoup)
+# 🏁 Páginas sintéticas pesadas de template: confere achados de mixed content idênticos e mede o ganho
+#    Legado = parse html.parser + scan de mixed content + http_inseguro antigo (parse lxml, regex, find_all(True))
+
+import re
+import sys
+import time
+from urllib.parse import urljoin
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from cache_stylesheets import CacheStylesheets
+from exporters.sheets.mixed_content_sheet import MixedContentSheet
+from scanner_http import varrer_http
+
+BASE_URL = 'https://www.exemplo.com.br/categoria/produto'
+
+CSS_EXTERNO = """
+.hero { background: url(http://cdn.exemplo.com.br/hero.jpg) no-repeat; }
+.logo { background-image: url('http://cdn.exemplo.com.br/logo.png'); }
+.ok { background-image: url(https://cdn.exemplo.com.br/seguro.png); }
+"""
+
+
+# ========================
+# 🐢 SCANNER LEGADO (18 find_all + subidas de ancestrais por achado)
+# ========================
+
+class ScannerLegado:
+    """🐢 Implementação anterior, mantida aqui só como referência de resultado"""
+
+    def __init__(self, sheet: MixedContentSheet):
+        self.sheet = sheet
+
+    def scan(self, soup, base_url):
+        issues = []
+        url_patterns = [
+            ('img', 'src'), ('img', 'data-src'), ('video', 'src'), ('video', 'poster'),
+            ('audio', 'src'), ('source', 'src'), ('source', 'srcset'),
+            ('iframe', 'src'), ('embed', 'src'), ('object', 'data'),
+            ('link', 'href'), ('a', 'href'), ('form', 'action'),
+            ('div', 'data-bg'), ('section', 'data-background'), ('header', 'data-bg-image'),
+        ]
+
+        for tag_name, attr_name in url_patterns:
+            for element in soup.find_all(tag_name, {attr_name: True}):
+                url_value = element.get(attr_name, '').strip()
+                if not url_value:
+                    continue
+                if url_value.startswith('//'):
+                    url_absoluta = 'http:' + url_value
+                elif url_value.startswith('/'):
+                    url_absoluta = urljoin(base_url, url_value)
+                elif url_value.startswith('http://'):
+                    url_absoluta = url_value
+                elif url_value.startswith('https://'):
+                    continue
+                else:
+                    url_absoluta = urljoin(base_url, url_value)
+
+                if url_absoluta.startswith('http://'):
+                    localizacao_dom = self.detectar_localizacao_dom(element)
+                    issues.append({
+                        'tipo': tag_name,
+                        'url_recurso': url_value,
+                        'url_absoluta': url_absoluta,
+                        'severidade': self.sheet._classificar_severidade(tag_name, attr_name),
+                        'localizacao_dom': localizacao_dom,
+                        'prioridade_correcao': self.sheet._calcular_prioridade_correcao(localizacao_dom, tag_name),
+                        'atributo': attr_name,
+                        'contexto_semantico': contexto_semantico_legado(
+                            element, self.detectar_localizacao_dom(element)),
+                        'path_dom': self.extrair_path_dom(element),
+                        'tag_completa': str(element)[:200]
+                    })
+
+        for element in soup.find_all('style'):
+            localizacao_dom = self.detectar_localizacao_dom(element)
+            for css_url in re.findall(r'url\(["\']?(http://[^"\')]+)["\']?\)', element.get_text()):
+                issues.append({
+                    'tipo': 'css_inline', 'url_recurso': css_url, 'url_absoluta': css_url, 'severidade': 'MÉDIO',
+                    'localizacao_dom': localizacao_dom,
+                    'prioridade_correcao': self.sheet._calcular_prioridade_correcao(localizacao_dom, 'css'),
+                    'atributo': 'url()', 'contexto_semantico': f'CSS inline em {localizacao_dom}',
+                    'path_dom': self.extrair_path_dom(element), 'tag_completa': f'<style>...{css_url}...</style>'
+                })
+
+        for element in soup.find_all('link', rel='stylesheet', href=True):
+            href = element.get('href')
+            if href and href.startswith('https://'):
+                try:
+                    css_content = self.sheet.session.get(urljoin(base_url, href), timeout=5).text
+                except:
+                    continue
+                localizacao_dom = self.detectar_localizacao_dom(element)
+                for css_http_url in re.findall(r'url\(["\']?(http://[^"\')]+)["\']?\)', css_content):
+                    issues.append({
+                        'tipo': 'css_external', 'url_recurso': css_http_url, 'url_absoluta': css_http_url,
+                        'severidade': 'MÉDIO', 'localizacao_dom': localizacao_dom,
+                        'prioridade_correcao': self.sheet._calcular_prioridade_correcao(localizacao_dom, 'css'),
+                        'atributo': 'url()', 'contexto_semantico': f'CSS externo: {href}',
+                        'path_dom': self.extrair_path_dom(element), 'tag_completa': f'External CSS: {css_http_url}'
+                    })
+
+        for element in soup.find_all(attrs={'style': True}):
+            style_content = element.get('style', '')
+            localizacao_dom = self.detectar_localizacao_dom(element)
+            bg_urls = re.findall(r'background-image\s*:\s*url\(["\']?(http://[^"\')]+)["\']?\)', style_content)
+            bg_urls.extend(re.findall(r'background\s*:\s*[^;]*url\(["\']?(http://[^"\')]+)["\']?\)', style_content))
+            for bg_url in bg_urls:
+                issues.append({
+                    'tipo': 'background_image', 'url_recurso': bg_url, 'url_absoluta': bg_url, 'severidade': 'MÉDIO',
+                    'localizacao_dom': localizacao_dom,
+                    'prioridade_correcao': self.sheet._calcular_prioridade_correcao(localizacao_dom, 'background'),
+                    'atributo': 'style', 'contexto_semantico': f'Background image em {element.name}',
+                    'path_dom': self.extrair_path_dom(element),
+                    'tag_completa': f'<{element.name} style="...{bg_url}...">'
+                })
+
+        return issues
+
+    def detectar_localizacao_dom(self, element):
+        if element.find_parent("head"):
+            return "HEAD"
+        if element.find_parent("body"):
+            regioes = [
+                ('FOOTER', 'footer', ['footer', 'rodape', 'bottom']),
+                ('HEADER', 'header', ['header', 'cabecalho', 'top', 'nav', 'navbar']),
+                ('SIDEBAR', None, ['sidebar', 'aside', 'lateral']),
+                ('MODAL', None, ['modal', 'popup', 'overlay', 'dialog']),
+                ('MAIN_CONTENT', None, ['main', 'content', 'conteudo', 'article']),
+            ]
+            for localizacao, tag_semantica, palavras in regioes:
+                for parent in element.parents:
+                    if tag_semantica and parent.name == tag_semantica:
+                        return localizacao
+                    parent_class = ' '.join(parent.get('class', [])).lower()
+                    parent_id = parent.get('id', '').lower()
+                    if any(k in parent_class or k in parent_id for k in palavras):
+                        return localizacao
+            return "BODY"
+        return "UNKNOWN"
+
+    def extrair_path_dom(self, element):
+        path_parts = []
+        current = element
+        while current and current.name and current.name != '[document]':
+            part = current.name
+            if current.get('id'):
+                part += f"#{current['id']}"
+            if current.get('class'):
+                part += f".{current['class'][0]}"
+            path_parts.append(part)
+            current = current.parent
+            if len(path_parts) >= 5:
+                break
+        return ' > '.join(reversed(path_parts))
+
+
+def contexto_semantico_legado(element, localizacao):
+    contexto_parts = [f"DOM: {localizacao}"]
+    if element.get('id'):
+        contexto_parts.append(f"ID: {element['id']}")
+    if element.get('class'):
+        contexto_parts.append(f"Class: {' '.join(element['class'][:2])}")
+    if element.name == 'img' and element.get('alt'):
+        contexto_parts.append(f"Alt: {element['alt'][:30]}")
+    if element.get('title'):
+        contexto_parts.append(f"Title: {element['title'][:30]}")
+    immediate_parent = element.parent
+    if immediate_parent and immediate_parent.name != 'body':
+        parent_info = immediate_parent.name
+        if immediate_parent.get('class'):
+            parent_info += f".{' '.join(immediate_parent['class'][:1])}"
+        contexto_parts.append(f"Parent: {parent_info}")
+    return ' | '.join(contexto_parts) if contexto_parts else 'Sem contexto'
+
+
+def http_inseguro_legado(html):
+    """🐢 analisar_http_inseguro anterior (sem o GET): regex no HTML, find_all(True) e find_all('style')"""
+    resultados = [{'tipo': 'html', 'trecho': o} for o in set(re.findall(r'(http://[^"\s\)]+)', html))]
+    soup = BeautifulSoup(html, "lxml")
+    for tag in soup.find_all(True):
+        style = tag.get("style")
+        if style and "http://" in style:
+            resultados.extend({'tipo': 'css_inline', 'trecho': l} for l in re.findall(r'(http://[^"\s\)]+)', style))
+    for style_tag in soup.find_all("style"):
+        css = style_tag.get_text()
+        if "http://" in css:
+            resultados.extend({'tipo': 'style_tag', 'trecho': l} for l in re.findall(r'(http://[^"\s\)]+)', css))
+    return resultados
+
+
+def sem_tag_completa(issues):
+    """🔎 O tokenizer guarda só a tag de abertura (sem filhos) em tag_completa"""
+    return [{k: v for k, v in issue.items() if k != 'tag_completa'} for issue in issues]
+
+
+class _RespostaCSS:
+    status_code = 200
+    text = CSS_EXTERNO
+
+
+class SessaoCSSFixa:
+    """📄 Responde todo stylesheet com o mesmo CSS (benchmark sem rede)"""
+
+    def get(self, url, **kwargs):
+        return _RespostaCSS()
+
+
+# ========================
+# 🏗️ PÁGINAS SINTÉTICAS
+# ========================
+
+def _bloco_template(i: int) -> str:
+    return f"""
+    <div class="menu-item col-{i}"><a href="http://www.exemplo.com.br/secao/{i}">Seção {i}</a>
+      <img src="//cdn.exemplo.com.br/icone-{i}.png" alt="ícone {i}">
+      <span style="background: #fff url(http://cdn.exemplo.com.br/bg-{i}.png) repeat-x">&nbsp;</span>
+    </div>"""
+
+
+def _bloco_conteudo(i: int) -> str:
+    return f"""
+    <article class="card" id="produto-{i}">
+      <div class="wrapper"><div class="inner"><div class="media">
+        <img src="/imagens/produto-{i}.jpg" data-src="http://img.exemplo.com.br/p-{i}.jpg" title="Produto {i}">
+        <picture><source srcset="http://img.exemplo.com.br/p-{i}.webp"></picture>
+      </div></div></div>
+      <a href="https://www.exemplo.com.br/produto/{i}">Ver produto</a>
+      <div data-bg="http://img.exemplo.com.br/fundo-{i}.jpg" style="background-image: url('http://img.exemplo.com.br/f-{i}.jpg')"></div>
+      <form action="http://www.exemplo.com.br/carrinho/{i}"><input type="submit"></form>
+    </article>"""
+
+
+def gerar_pagina(blocos_template: int, blocos_conteudo: int) -> str:
+    template = ''.join(_bloco_template(i) for i in range(blocos_template))
+    conteudo = ''.join(_bloco_conteudo(i) for i in range(blocos_conteudo))
+    return f"""<!DOCTYPE html><html><head>
+    <link rel="stylesheet" href="https://cdn.exemplo.com.br/tema.css">
+    <link rel="stylesheet" href="http://cdn.exemplo.com.br/legado.css">
+    <style>.banner {{ background: url(http://cdn.exemplo.com.br/banner.jpg); }}</style>
+    </head><body>
+    <header class="site-header"><nav class="navbar">{template}</nav></header>
+    <div class="container"><aside class="sidebar">{template}</aside>
+    <main class="main-content">{conteudo}</main>
+    <div class="modal" id="newsletter"><iframe src="http://www.exemplo.com.br/form"></iframe></div></div>
+    <footer class="rodape"><section data-background="http://cdn.exemplo.com.br/rodape.jpg">{template}</section></footer>
+    <embed src="http://cdn.exemplo.com.br/animacao.swf"><object data="http://cdn.exemplo.com.br/doc.pdf"></object>
+    </body></html>"""
+
+
+def medir(funcao, repeticoes: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    sheet = MixedContentSheet(pd.DataFrame(), None)
+    sheet.session = SessaoCSSFixa()
+    sheet.cache_stylesheets = CacheStylesheets(session=sheet.session)
+    legado = ScannerLegado(sheet)
+
+    print(f"🏁 BENCHMARK SCANNER HTTP - tokenizer em passe único x árvores ({repeticoes} repetições)")
+    print(f"{'Página':<22}{'KB':>6}{'Mixed':>7}{'HTTP leg.':>10}{'HTTP novo':>10}"
+          f"{'Legado (ms)':>13}{'Novo (ms)':>11}{'Ganho':>8}")
+
+    for blocos_template, blocos_conteudo in [(20, 20), (100, 100), (400, 300)]:
+        html = gerar_pagina(blocos_template, blocos_conteudo)
+        conteudo = html.encode('utf-8')
+
+        def _legado():
+            soup = BeautifulSoup(conteudo, 'html.parser')
+            return legado.scan(soup, BASE_URL), http_inseguro_legado(html)
+
+        def _novo():
+            varredura = varrer_http(conteudo, BASE_URL)
+            return sheet._issues_de_varredura(varredura, BASE_URL), varredura.ocorrencias_unicas()
+
+        (issues_legado, http_legado), (issues_novo, http_novo) = _legado(), _novo()
+        if sem_tag_completa(issues_novo) != sem_tag_completa(issues_legado):
+            print(f"❌ Achados divergentes em {blocos_template}x{blocos_conteudo}: "
+                  f"legado={len(issues_legado)} novo={len(issues_novo)}")
+            sys.exit(1)
+
+        t_legado = medir(_legado, repeticoes)
+        t_novo = medir(_novo, repeticoes)
+
+        nome = f"{blocos_template} tpl x {blocos_conteudo} cont"
+        print(f"{nome:<22}{len(conteudo) // 1024:>6}{len(issues_novo):>7}{len(http_legado):>10}{len(http_novo):>10}"
+              f"{t_legado * 1000:>13.1f}{t_novo * 1000:>11.1f}{t_legado / t_novo:>7.1f}x")
+
+    print("✅ Achados de mixed content idênticos em todas as páginas")
+    print("   HTTP leg. conta duplicatas (mesmo http:// no regex do HTML e no style); HTTP novo = 1 por contexto")
+
+
+if __name__ == "__main__":
+    main()
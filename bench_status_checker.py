@@ -0,0 +1,142 @@
+# bench_status_checker.py - Benchmark do status checker (requests.head avulso x pool requests x pool aiohttp)
+# 🏁 Uso: python bench_status_checker.py [total_urls]   (padrão: 2000)
+#    Servidor local HTTP/1.1 com keep-alive: 200, HEAD recusado (405/501), 404 e redirect 301
+
+import contextlib
+import http.server
+import io
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+from status_checker import AIOHTTP_AVAILABLE, HEADERS_PADRAO, VerificadorStatus
+
+CORPO = b'<html><head><title>Fixture</title></head><body>' + b'<p>conteudo</p>' * 2000 + b'</body></html>'
+
+
+# ========================
+# 🐢 IMPLEMENTAÇÃO ANTERIOR (referência de resultado)
+# ========================
+
+def checar_status_legado(url, timeout=10):
+    try:
+        response = requests.head(url, allow_redirects=True, timeout=timeout, headers=HEADERS_PADRAO, verify=False)
+        if response.status_code == 405:
+            response = requests.get(url, stream=True, timeout=timeout, headers=HEADERS_PADRAO, verify=False)
+        return response.status_code, response.headers.get("Content-Type", "")
+    except requests.exceptions.RequestException as e:
+        return None, str(e)
+
+
+def verificar_legado(urls, max_threads=30):
+    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        futuros = {executor.submit(checar_status_legado, url): url for url in urls}
+        return {futuros[f]: f.result() for f in as_completed(futuros)}
+
+
+# ========================
+# 🏗️ SERVIDOR FIXTURE
+# ========================
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'   # Keep-alive: o pool reaproveita conexões
+
+    def log_message(self, *args):
+        pass
+
+    def _responder(self, com_corpo: bool):
+        caminho = self.path
+        if caminho.startswith('/redir/'):
+            self.send_response(301)
+            self.send_header('Location', caminho.replace('/redir/', '/ok/', 1))
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if caminho.startswith('/sem-head/') and not com_corpo:
+            self.send_response(405 if caminho.endswith(('0', '2', '4', '6', '8')) else 501)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        status = 404 if caminho.startswith('/404/') else 200
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(CORPO)))
+        self.end_headers()
+        if com_corpo:
+            try:
+                self.wfile.write(CORPO)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    def do_HEAD(self):
+        self._responder(com_corpo=False)
+
+    def do_GET(self):
+        self._responder(com_corpo=True)
+
+
+class Servidor(http.server.ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        pass  # Conexões keep-alive fechadas pelo cliente no fim de cada medição
+
+
+def iniciar_servidor():
+    servidor = Servidor(('127.0.0.1', 0), Handler)
+    servidor.daemon_threads = True
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor
+
+
+def gerar_urls(base: str, total: int):
+    tipos = ['ok'] * 7 + ['sem-head', '404', 'redir']
+    return [f'{base}/{tipos[i % len(tipos)]}/{i}' for i in range(total)]
+
+
+# ========================
+# 🏁 BENCHMARK
+# ========================
+
+def medir(nome, funcao, urls):
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # Sem o progresso a cada 100 URLs
+        resultados = funcao(urls)
+    segundos = time.perf_counter() - inicio
+    print(f"   {nome:<28} {segundos:7.2f}s  {len(urls) / segundos:8.0f} URLs/s")
+    return resultados
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    servidor = iniciar_servidor()
+    urls = gerar_urls(f'http://127.0.0.1:{servidor.server_port}', total)
+
+    print(f"🏁 Status checker: {total} URLs num servidor local (70% 200, 10% sem HEAD, 10% 404, 10% 301)")
+
+    legado = medir('requests.head avulso (30t)', verificar_legado, urls)
+    pool_requests = medir('pool requests', lambda u: VerificadorStatus(usar_aiohttp=False).verificar(u, max_workers=30), urls)
+    resultados = {'pool requests': pool_requests}
+
+    if AIOHTTP_AVAILABLE:
+        resultados['pool aiohttp'] = medir('pool aiohttp', lambda u: VerificadorStatus(usar_aiohttp=True).verificar(u), urls)
+    else:
+        print("   ⚠️ aiohttp não instalado - caminho assíncrono não medido")
+
+    verificador = VerificadorStatus(usar_aiohttp=AIOHTTP_AVAILABLE)
+    with contextlib.redirect_stdout(io.StringIO()):
+        verificador.verificar(urls)
+    medir('cache TTL (2ª auditoria)', verificador.verificar, urls)
+
+    # O legado só repetia com GET no 405; o novo também no 501
+    esperado = {url: (200, r[1]) if url.split('/')[3] == 'sem-head' else r for url, r in legado.items()}
+    for nome, obtidos in resultados.items():
+        status_iguais = all(obtidos[url][0] == esperado[url][0] for url in urls)
+        print(f"   {'✅' if status_iguais else '❌'} {nome}: status idênticos ao legado (501 agora confirmado com GET)")
+
+    servidor.shutdown()
+
+
+if __name__ == '__main__':
+    main()
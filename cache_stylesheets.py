@@ -0,0 +1,166 @@
+# cache_stylesheets.py - Cache de stylesheets externos com escopo de crawl
+# 🎨 Cada CSS é baixado UMA vez (com @import resolvido) e compartilhado por todas as páginas que o usam
+
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import requests
+
+from indice_css import IndiceCSS
+
+# @import url("a.css") / @import url(a.css) screen / @import "a.css" / @import 'a.css' print
+RE_IMPORT = re.compile(r'@import\s+(?:url\(\s*)?["\']?([^"\')\s;]+)', re.IGNORECASE)
+# Mesmo padrão do scanner de mixed content
+RE_CSS_URL_HTTP = re.compile(r'url\(["\']?(http://[^"\')]+)["\']?\)')
+
+MAX_PROFUNDIDADE_IMPORT = 5
+MAX_BYTES_CSS = 2 * 1024 * 1024
+
+
+@dataclass
+class Stylesheet:
+    """🎨 CSS externo já baixado e pré-processado"""
+    url: str
+    texto: str = ''
+    erro: str = ''
+    imports: List[str] = field(default_factory=list)     # URLs absolutas, em ordem
+    urls_http: List[str] = field(default_factory=list)   # url(http://...) + @import http://
+    _indice: Optional[IndiceCSS] = None
+
+    @property
+    def indice(self) -> IndiceCSS:
+        """🗂️ Índice de seletores montado na primeira página que precisar"""
+        if self._indice is None:
+            self._indice = IndiceCSS(self.texto)
+        return self._indice
+
+
+def urls_stylesheets_da_pagina(soup, base_url: str) -> List[str]:
+    """🔗 <link rel="stylesheet"> da página, absolutos e sem repetição (ordem do documento)"""
+    urls = []
+    for link in soup.find_all('link', href=True):
+        rel = link.get('rel') or []
+        if isinstance(rel, str):
+            rel = rel.split()
+        if 'stylesheet' not in [r.lower() for r in rel]:
+            continue
+        href = link.get('href', '').strip()
+        if href and not href.startswith(('data:', 'javascript:')):
+            urls.append(urljoin(base_url, href))
+    return list(dict.fromkeys(urls))
+
+
+class CacheStylesheets:
+    """🎨 Single-flight por URL: N páginas x M stylesheets viram M downloads"""
+
+    def __init__(self, session: Optional[requests.Session] = None, max_workers: int = 10,
+                 timeout: int = 5, max_profundidade_import: int = MAX_PROFUNDIDADE_IMPORT):
+        self.session = session or requests.Session()
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.max_profundidade_import = max_profundidade_import
+
+        self._lock = threading.Lock()
+        self._futuros: Dict[str, Future] = {}
+
+        self.stats = {'downloads': 0, 'reusos': 0, 'erros': 0}
+
+    # ========================
+    # 🌐 DOWNLOAD
+    # ========================
+
+    def _baixar(self, url: str) -> Stylesheet:
+        stylesheet = Stylesheet(url=url)
+        try:
+            response = self.session.get(url, timeout=self.timeout, verify=False)
+            if response.status_code >= 400:
+                stylesheet.erro = f'Status {response.status_code}'
+            else:
+                stylesheet.texto = response.text[:MAX_BYTES_CSS]
+        except Exception as e:
+            stylesheet.erro = str(e)
+
+        with self._lock:
+            self.stats['downloads'] += 1
+            if stylesheet.erro:
+                self.stats['erros'] += 1
+
+        if stylesheet.texto:
+            stylesheet.imports = list(dict.fromkeys(
+                urljoin(url, destino) for destino in RE_IMPORT.findall(stylesheet.texto)
+            ))
+            stylesheet.urls_http = RE_CSS_URL_HTTP.findall(stylesheet.texto)
+            stylesheet.urls_http.extend(
+                destino for destino in stylesheet.imports
+                if destino.startswith('http://') and destino not in stylesheet.urls_http
+            )
+
+        return stylesheet
+
+    def obter(self, url: str) -> Stylesheet:
+        """🎨 Stylesheet do cache; o primeiro pedido baixa, os simultâneos esperam o mesmo download"""
+        with self._lock:
+            futuro = self._futuros.get(url)
+            dono = futuro is None
+            if dono:
+                futuro = self._futuros[url] = Future()
+            else:
+                self.stats['reusos'] += 1
+
+        if dono:
+            futuro.set_result(self._baixar(url))
+        return futuro.result()
+
+    def prefetch(self, urls: Iterable[str]):
+        """🚀 Baixa em paralelo os stylesheets ainda não vistos, em ondas de @import"""
+        vistos = set()
+        onda = [u for u in dict.fromkeys(urls) if u]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for _ in range(self.max_profundidade_import + 1):
+                onda = [u for u in onda if u not in vistos]
+                if not onda:
+                    break
+                vistos.update(onda)
+                stylesheets = list(executor.map(self.obter, onda))
+                onda = [destino for stylesheet in stylesheets for destino in stylesheet.imports]
+
+    # ========================
+    # 🔗 CONSULTAS
+    # ========================
+
+    def cadeia(self, url: str) -> List[Stylesheet]:
+        """🔗 Stylesheets importados (antes, como na cascata) + o próprio, sem ciclos"""
+        resultado = []
+        visitados = set()
+
+        def _visitar(atual: str, profundidade: int):
+            if atual in visitados or profundidade > self.max_profundidade_import:
+                return
+            visitados.add(atual)
+            stylesheet = self.obter(atual)
+            for destino in stylesheet.imports:
+                _visitar(destino, profundidade + 1)
+            resultado.append(stylesheet)
+
+        _visitar(url, 0)
+        return resultado
+
+    def achados_http(self, url: str) -> List[Tuple[str, str]]:
+        """🔒 (stylesheet de origem, recurso http://) no CSS e nos seus @import"""
+        return [(stylesheet.url, url_http) for stylesheet in self.cadeia(url) for url_http in stylesheet.urls_http]
+
+    def indices_da_pagina(self, soup, base_url: str) -> List[IndiceCSS]:
+        """🗂️ Índices dos stylesheets externos da página (compartilhados entre páginas)"""
+        indices = []
+        for url in urls_stylesheets_da_pagina(soup, base_url):
+            indices.extend(stylesheet.indice for stylesheet in self.cadeia(url) if stylesheet.texto)
+        return indices
+
+    def get_stats(self) -> Dict:
+        """📊 Estatísticas do cache"""
+        return {**self.stats, 'stylesheets': len(self._futuros)}
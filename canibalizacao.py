@@ -0,0 +1,333 @@
+# canibalizacao.py - Canibalização de palavra-chave (titles/H1 quase idênticos disputando a mesma busca)
+# 🎯 TF-IDF esparso por campo + produto de matrizes em blocos: sem laço O(n²) entre páginas
+
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+    from scipy.sparse import csr_matrix
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# 🎯 CONFIGURAÇÕES
+LIMIAR_CANDIDATO = 0.80         # Cosseno mínimo no title ou no H1 para virar par candidato
+LIMIAR_CANIBALIZACAO = 0.60     # Score combinado (title + H1 + description) mínimo do par
+MAX_DF = 0.50                   # Termos em mais da metade das páginas não diferenciam nada
+MIN_DOCS_MAX_DF = 50            # Em sites pequenos o corte por frequência distorce o TF-IDF
+TAMANHO_BLOCO = 2000            # Linhas por produto esparso de candidatos (limita a memória)
+PROPORCAO_SUFIXO_MARCA = 0.20   # "... | Marca" em >= 20% dos titles é marca, não palavra-chave
+
+PESOS_CAMPOS = {'title': 0.5, 'h1': 0.3, 'description': 0.2}
+CAMPOS_CANDIDATOS = ('title', 'h1')
+
+STOPWORDS_PT = {
+    'a', 'ao', 'aos', 'as', 'com', 'como', 'da', 'das', 'de', 'do', 'dos', 'e', 'em', 'na', 'nas',
+    'no', 'nos', 'o', 'os', 'ou', 'para', 'pela', 'pelas', 'pelo', 'pelos', 'por', 'pra', 'que',
+    'se', 'sem', 'seu', 'sua', 'seus', 'suas', 'um', 'uma', 'uns', 'umas', 'mais', 'muito', 'ja',
+    'sobre', 'entre', 'ate', 'voce', 'the', 'and', 'of', 'for', 'to', 'in', 'on', 'with'
+}
+
+SEPARADORES_TITLE = re.compile(r'\s+[|\-–—:•·]+\s+')
+RE_TOKEN = re.compile(r'[a-z0-9]+')
+
+
+# ========================
+# 🔤 TOKENIZAÇÃO (PORTUGUÊS)
+# ========================
+
+def _sem_acentos(texto: str) -> str:
+    return ''.join(c for c in unicodedata.normalize('NFKD', texto) if not unicodedata.combining(c))
+
+
+def _radical(token: str) -> str:
+    """🌱 Plural -> singular (planos -> plano, opções -> opcao, hospitais -> hospital)"""
+    if len(token) <= 3 or token.isdigit():
+        return token
+    if token.endswith(('oes', 'aes')):
+        return token[:-3] + 'ao'
+    if token.endswith('ais') and len(token) > 4:
+        return token[:-2] + 'l'
+    if token.endswith('eis') and len(token) > 4:
+        return token[:-2] + 'l'
+    if token.endswith('s') and not token.endswith(('ss', 'us', 'is')):
+        return token[:-1]
+    return token
+
+
+def tokenizar(texto: str) -> List[str]:
+    """🔤 Casefold + sem acentos + sem stopwords + plural reduzido; unigramas e bigramas"""
+    if not texto:
+        return []
+    palavras = [
+        _radical(token) for token in RE_TOKEN.findall(_sem_acentos(texto).casefold())
+        if token not in STOPWORDS_PT
+    ]
+    bigramas = [f'{a} {b}' for a, b in zip(palavras, palavras[1:])]
+    return palavras + bigramas
+
+
+def remover_sufixos_marca(titles: List[str]) -> List[str]:
+    """🏷️ Tira o sufixo de marca ("Planos de Saúde | Hapvida" -> "Planos de Saúde")
+
+    O sufixo só é removido se aparecer como último segmento em boa parte dos titles;
+    segmentos raros podem ser a própria palavra-chave.
+    """
+    sufixos = []
+    for title in titles:
+        partes = SEPARADORES_TITLE.split(title or '')
+        sufixos.append(partes[-1].strip().casefold() if len(partes) > 1 else '')
+
+    contagem = Counter(s for s in sufixos if s)
+    minimo = max(3, PROPORCAO_SUFIXO_MARCA * len(titles))
+    marcas = {sufixo for sufixo, total in contagem.items() if total >= minimo}
+    if not marcas:
+        return list(titles)
+
+    resultado = []
+    for title, sufixo in zip(titles, sufixos):
+        if sufixo in marcas:
+            partes = SEPARADORES_TITLE.split(title)
+            title = title[:len(title) - len(partes[-1])].rstrip(' |-–—:•·')
+        resultado.append(title or '')
+    return resultado
+
+
+# ========================
+# 🧮 TF-IDF ESPARSO
+# ========================
+
+class MatrizTFIDF:
+    """🧮 Vetores TF-IDF (tf sublinear, idf suavizado, norma L2) de um campo"""
+
+    def __init__(self, documentos: List[List[str]], max_df: float = MAX_DF):
+        self.total = len(documentos)
+        frequencia_doc = Counter(termo for tokens in documentos for termo in set(tokens))
+
+        limite_df = max_df * self.total if self.total >= MIN_DOCS_MAX_DF else self.total
+        self.vocabulario: Dict[str, int] = {}
+        self.termos: List[str] = []
+        self.idf: List[float] = []
+        self.frequencia: List[int] = []
+        for termo, df in frequencia_doc.items():
+            if df > limite_df:
+                continue
+            self.vocabulario[termo] = len(self.idf)
+            self.termos.append(termo)
+            self.idf.append(math.log((1 + self.total) / (1 + df)) + 1.0)
+            self.frequencia.append(df)
+
+        # Linha = {coluna: peso}; linhas vazias (campo ausente) não participam de pares
+        self.linhas: List[Dict[int, float]] = []
+        for tokens in documentos:
+            contagem = Counter(self.vocabulario[t] for t in tokens if t in self.vocabulario)
+            linha = {col: (1.0 + math.log(n)) * self.idf[col] for col, n in contagem.items()}
+            norma = math.sqrt(sum(p * p for p in linha.values()))
+            self.linhas.append({col: p / norma for col, p in linha.items()} if norma else {})
+
+        self.matriz = self._montar_csr(self.linhas) if SCIPY_AVAILABLE else None
+
+    def _montar_csr(self, linhas: List[Dict[int, float]]):
+        indptr = [0]
+        indices = []
+        dados = []
+        for linha in linhas:
+            indices.extend(linha.keys())
+            dados.extend(linha.values())
+            indptr.append(len(indices))
+        return csr_matrix((np.array(dados, dtype=np.float64), np.array(indices, dtype=np.int64),
+                           np.array(indptr, dtype=np.int64)), shape=(self.total, max(len(self.idf), 1)))
+
+    def similaridade(self, i: int, j: int) -> float:
+        a, b = self.linhas[i], self.linhas[j]
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(peso * b[col] for col, peso in a.items() if col in b)
+
+    def _prefixo(self, linha: Dict[int, float], limiar: float) -> List[int]:
+        """✂️ Termos raros da linha; os frequentes que sobram somam norma < limiar
+
+        Dois vetores com cosseno >= limiar obrigatoriamente dividem um termo dos dois
+        prefixos (ordem global por frequência). Termos comuns ("plano", "saude") deixam
+        de gerar candidatos e o produto esparso fica proporcional aos pares parecidos.
+        """
+        ordem = sorted(linha, key=lambda col: (self.frequencia[col], col))
+        limite = (limiar - 1e-9) ** 2
+        norma_sufixo = 0.0
+        corte = len(ordem)
+        while corte > 0 and norma_sufixo + linha[ordem[corte - 1]] ** 2 < limite:
+            norma_sufixo += linha[ordem[corte - 1]] ** 2
+            corte -= 1
+        return ordem[:corte]
+
+    def pares_similares(self, limiar: float, tamanho_bloco: int = TAMANHO_BLOCO) -> Iterator[Tuple[int, int, float]]:
+        """🔗 (i, j, cosseno) com i < j e cosseno >= limiar (exato: o prefixo só poda candidatos)"""
+        prefixos = [{col: 1.0 for col in self._prefixo(linha, limiar)} for linha in self.linhas]
+        if self.matriz is not None:
+            yield from self._pares_scipy(prefixos, limiar, tamanho_bloco)
+        else:
+            yield from self._pares_indice_invertido(prefixos, limiar)
+
+    def _pares_scipy(self, prefixos: List[Dict[int, float]], limiar: float, tamanho_bloco: int):
+        """🧮 Candidatos = prefixos x prefixos em blocos de linhas; cosseno exato só nos candidatos"""
+        matriz_prefixos = self._montar_csr(prefixos)
+        transposta = matriz_prefixos.T.tocsr()
+        for inicio in range(0, self.total, tamanho_bloco):
+            bloco = (matriz_prefixos[inicio:inicio + tamanho_bloco] @ transposta).tocoo()
+            linhas = bloco.row + inicio
+            acima = bloco.col > linhas
+            linhas, colunas = linhas[acima], bloco.col[acima]
+            if not len(linhas):
+                continue
+            similaridades = np.asarray(self.matriz[linhas].multiply(self.matriz[colunas]).sum(axis=1)).ravel()
+            manter = similaridades >= limiar - 1e-9
+            for i, j, sim in zip(linhas[manter], colunas[manter], similaridades[manter]):
+                yield int(i), int(j), float(sim)
+
+    def _pares_indice_invertido(self, prefixos: List[Dict[int, float]], limiar: float):
+        """🐍 Mesma poda via listas invertidas dos prefixos (sem scipy)"""
+        postings: Dict[int, List[int]] = defaultdict(list)
+        for j, prefixo in enumerate(prefixos):
+            for col in prefixo:
+                postings[col].append(j)
+
+        for i, prefixo in enumerate(prefixos):
+            candidatos = {j for col in prefixo for j in postings[col] if j > i}
+            for j in sorted(candidatos):
+                sim = self.similaridade(i, j)
+                if sim >= limiar - 1e-9:
+                    yield i, j, sim
+
+    def termos_principais(self, linhas: List[int], total: int = 3) -> List[str]:
+        """🏷️ Termos de maior peso somado num grupo de páginas"""
+        soma: Dict[int, float] = defaultdict(float)
+        for i in linhas:
+            for col, peso in self.linhas[i].items():
+                soma[col] += peso
+        return [self.termos[col] for col, _ in sorted(soma.items(), key=lambda x: (-x[1], x[0]))[:total]]
+
+
+# ========================
+# 🎯 DETECTOR
+# ========================
+
+@dataclass
+class ClusterCanibalizacao:
+    """🎯 Páginas que disputam a mesma busca"""
+    indices: List[int]
+    score_medio: float
+    score_minimo: float
+    termos: List[str] = field(default_factory=list)
+    # índice da página -> (melhor score, índice do par mais parecido)
+    melhor_par: Dict[int, Tuple[float, int]] = field(default_factory=dict)
+
+
+class _UniaoBusca:
+    def __init__(self, total: int):
+        self.pai = list(range(total))
+
+    def raiz(self, i: int) -> int:
+        while self.pai[i] != i:
+            self.pai[i] = self.pai[self.pai[i]]
+            i = self.pai[i]
+        return i
+
+    def unir(self, i: int, j: int):
+        a, b = self.raiz(i), self.raiz(j)
+        if a != b:
+            self.pai[max(a, b)] = min(a, b)
+
+
+class DetectorCanibalizacao:
+    """🎯 Pares por campo (title/H1) -> score combinado -> clusters (união-busca)"""
+
+    def __init__(self, limiar_candidato: float = LIMIAR_CANDIDATO,
+                 limiar_canibalizacao: float = LIMIAR_CANIBALIZACAO,
+                 pesos: Optional[Dict[str, float]] = None, max_df: float = MAX_DF,
+                 tamanho_bloco: int = TAMANHO_BLOCO):
+        self.limiar_candidato = limiar_candidato
+        self.limiar_canibalizacao = limiar_canibalizacao
+        self.pesos = pesos or dict(PESOS_CAMPOS)
+        self.max_df = max_df
+        self.tamanho_bloco = tamanho_bloco
+        self.matrizes: Dict[str, MatrizTFIDF] = {}
+        self.stats = {'paginas': 0, 'pares_candidatos': 0, 'pares_canibalizados': 0, 'clusters': 0}
+
+    def score_par(self, i: int, j: int) -> float:
+        """⚖️ Média ponderada dos cossenos nos campos presentes nas duas páginas"""
+        soma = peso_total = 0.0
+        for campo, matriz in self.matrizes.items():
+            if matriz.linhas[i] and matriz.linhas[j]:
+                peso = self.pesos.get(campo, 0.0)
+                soma += peso * matriz.similaridade(i, j)
+                peso_total += peso
+        return soma / peso_total if peso_total else 0.0
+
+    def detectar(self, paginas: List[Dict[str, str]]) -> List[ClusterCanibalizacao]:
+        """🎯 paginas: [{'title': ..., 'h1': ..., 'description': ...}] na ordem do crawl"""
+        total = len(paginas)
+        self.stats['paginas'] = total
+        if total < 2:
+            return []
+
+        titles = remover_sufixos_marca([p.get('title', '') or '' for p in paginas])
+        textos = {
+            'title': titles,
+            'h1': [p.get('h1', '') or '' for p in paginas],
+            'description': [p.get('description', '') or '' for p in paginas],
+        }
+        self.matrizes = {
+            campo: MatrizTFIDF([tokenizar(t) for t in textos[campo]], self.max_df)
+            for campo in self.pesos if campo in textos
+        }
+
+        candidatos = set()
+        for campo in CAMPOS_CANDIDATOS:
+            if campo in self.matrizes:
+                for i, j, _ in self.matrizes[campo].pares_similares(self.limiar_candidato, self.tamanho_bloco):
+                    candidatos.add((i, j))
+        self.stats['pares_candidatos'] = len(candidatos)
+
+        uniao = _UniaoBusca(total)
+        arestas = []
+        for i, j in sorted(candidatos):
+            score = self.score_par(i, j)
+            if score >= self.limiar_canibalizacao:
+                arestas.append((i, j, score))
+                uniao.unir(i, j)
+        self.stats['pares_canibalizados'] = len(arestas)
+
+        por_raiz: Dict[int, List[Tuple[int, int, float]]] = defaultdict(list)
+        for aresta in arestas:
+            por_raiz[uniao.raiz(aresta[0])].append(aresta)
+
+        clusters = []
+        for raiz, arestas_cluster in por_raiz.items():
+            melhor_par: Dict[int, Tuple[float, int]] = {}
+            for i, j, score in arestas_cluster:
+                if score > melhor_par.get(i, (-1.0, -1))[0]:
+                    melhor_par[i] = (score, j)
+                if score > melhor_par.get(j, (-1.0, -1))[0]:
+                    melhor_par[j] = (score, i)
+            indices = sorted(melhor_par)
+            scores = [score for _, _, score in arestas_cluster]
+            clusters.append(ClusterCanibalizacao(
+                indices=indices,
+                score_medio=sum(scores) / len(scores),
+                score_minimo=min(scores),
+                termos=self.matrizes['title'].termos_principais(indices) if 'title' in self.matrizes else [],
+                melhor_par=melhor_par
+            ))
+
+        clusters.sort(key=lambda c: (-len(c.indices), -c.score_medio, c.indices[0]))
+        self.stats['clusters'] = len(clusters)
+        return clusters
+
+    def get_stats(self) -> Dict:
+        """📊 Estatísticas da última detecção"""
+        return {**self.stats, 'scipy': SCIPY_AVAILABLE}
@@ -0,0 +1,305 @@
+# clusterizacao_templates.py - Agrupa URLs por template (esqueleto do DOM + padrão de URL)
+# 🧩 Só K representantes por template passam pela renderização completa do Playwright
+
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from typing import Dict, List, Optional, Tuple
+import re
+
+from templates_url import chave_template_url, segmentos_template_url
+from verificador_links import extrair_links_todos
+
+# 🎯 CONFIGURAÇÕES
+REPRESENTANTES_POR_TEMPLATE = 3
+LIMIAR_SIMILARIDADE_DOM = 0.80      # Jaccard mínimo entre esqueletos
+BONUS_MESMO_PADRAO_URL = 0.10       # Mesmo padrão de URL reduz o limiar exigido
+PROFUNDIDADE_SHINGLE = 4            # Tamanho do caminho de tags em cada shingle
+PROPORCAO_ACHADO_TEMPLATE = 0.5     # Achado vale para o template se >= 50% dos representantes
+
+TAGS_VAZIAS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr'
+}
+TAGS_IGNORADAS = {'script', 'style', 'noscript', 'svg', 'path', 'template'}
+
+_RE_DIGITOS = re.compile(r'\d+')
+
+# Achados de template: calculados nos representantes, propagados aos membros
+DESCRICAO_ACHADOS = {
+    'title_renderizado_js': 'Title renderizado por JS',
+    'description_renderizada_js': 'Description renderizada por JS',
+    'h1_renderizado_js': 'H1 renderizado por JS',
+    'links_renderizados_js': 'Links internos renderizados por JS',
+    'h1_oculto': 'H1 em elemento oculto',
+    'precisa_javascript': 'Template depende de JS'
+}
+
+
+class _ParserEsqueleto(HTMLParser):
+    """🦴 Passe único de tokenização: shingles de caminhos de tags + dados SEO estáticos"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.pilha: List[str] = []
+        self.shingles = set()
+        self.title = ''
+        self.description = ''
+        self.canonical = ''
+        self.og_title = ''
+        self.robots = ''
+        self.headings: Dict[str, List[str]] = {f'h{i}': [] for i in range(1, 7)}
+        self.hrefs: List[str] = []
+        self._em_title = False
+        self._heading_atual: Optional[str] = None
+        self._texto_heading: List[str] = []
+        self._ignorando = 0
+
+    def _rotulo(self, tag: str, attrs: Dict[str, str]) -> str:
+        classes = (attrs.get('class') or '').split()
+        if classes:
+            # Classes com IDs (post-123) variam por página, não por template
+            return f"{tag}.{_RE_DIGITOS.sub('', classes[0])}"
+        return tag
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {k: (v or '') for k, v in attrs}
+
+        if tag in TAGS_IGNORADAS:
+            if tag not in TAGS_VAZIAS:
+                self._ignorando += 1
+            return
+
+        if self._ignorando:
+            return
+
+        caminho = self.pilha[-(PROFUNDIDADE_SHINGLE - 1):] + [self._rotulo(tag, attrs)]
+        self.shingles.add('>'.join(caminho))
+
+        if tag == 'title':
+            self._em_title = True
+        elif tag in self.headings:
+            self._heading_atual = tag
+            self._texto_heading = []
+        elif tag == 'meta':
+            nome = attrs.get('name', '').lower()
+            propriedade = attrs.get('property', '').lower()
+            if nome == 'description' and not self.description:
+                self.description = attrs.get('content', '')
+            elif propriedade == 'og:title' and not self.og_title:
+                self.og_title = attrs.get('content', '')
+            elif nome == 'robots' and not self.robots:
+                self.robots = attrs.get('content', '')
+        elif tag == 'link' and 'canonical' in attrs.get('rel', '').lower().split():
+            self.canonical = self.canonical or attrs.get('href', '')
+        elif tag == 'a' and attrs.get('href'):
+            self.hrefs.append(attrs['href'])
+
+        if tag not in TAGS_VAZIAS:
+            self.pilha.append(self._rotulo(tag, attrs))
+
+    def handle_endtag(self, tag):
+        if tag in TAGS_IGNORADAS:
+            if tag not in TAGS_VAZIAS and self._ignorando:
+                self._ignorando -= 1
+            return
+
+        if tag == 'title':
+            self._em_title = False
+        elif tag == self._heading_atual:
+            texto = ' '.join(''.join(self._texto_heading).split())
+            if texto:
+                self.headings[tag].append(texto)
+            self._heading_atual = None
+
+        # Fecha até a tag correspondente (HTML real tem tags sem fechamento)
+        for i in range(len(self.pilha) - 1, -1, -1):
+            if self.pilha[i] == tag or self.pilha[i].startswith(tag + '.'):
+                del self.pilha[i:]
+                break
+
+    def handle_data(self, data):
+        if self._ignorando:
+            return
+        if self._em_title:
+            self.title += data
+        if self._heading_atual:
+            self._texto_heading.append(data)
+
+
+def analisar_html_estatico(html: str) -> _ParserEsqueleto:
+    """🦴 Tokeniza HTML estático uma vez (esqueleto + dados SEO)"""
+    parser = _ParserEsqueleto()
+    try:
+        parser.feed(html or '')
+        parser.close()
+    except Exception:
+        pass
+    return parser
+
+
+def extrair_links_estaticos(hrefs: List[str], base_url: str, domain: str) -> List[str]:
+    """🔗 Links internos do HTML estático (mesma regra do extract_links do Playwright)"""
+    links = []
+    vistos = set()
+    for href in hrefs:
+        if href.startswith(('#', 'mailto:', 'tel:', 'javascript:')):
+            continue
+        full_url = urljoin(base_url, href)
+        if domain not in full_url:
+            continue
+        limpa = full_url.split('#')[0].split('?')[0]
+        if limpa not in vistos:
+            vistos.add(limpa)
+            links.append(limpa)
+    return links
+
+
+def dados_seo_estaticos(parser: _ParserEsqueleto, base_url: str, domain: str) -> Dict:
+    """📊 Dados SEO do HTML estático no mesmo formato do extract_seo_data"""
+    dados = {
+        'title': ' '.join(parser.title.split()),
+        'description': parser.description.strip(),
+        'canonical': parser.canonical.strip(),
+        'og_title': parser.og_title.strip(),
+        'meta_robots': parser.robots.strip()
+    }
+    for tag, textos in parser.headings.items():
+        dados[tag] = len(textos)
+        dados[f'{tag}_texts'] = textos
+    dados['h1_ausente'] = dados['h1'] == 0
+    dados['h2_ausente'] = dados['h2'] == 0
+    dados['links_encontrados'] = extrair_links_estaticos(parser.hrefs, base_url, domain)
+    dados['links_todos'] = extrair_links_todos(parser.hrefs, base_url)
+    return dados
+
+
+def similaridade_jaccard(a: set, b: set) -> float:
+    if not a and not b:
+        return 1.0
+    uniao = len(a | b)
+    return len(a & b) / uniao if uniao else 0.0
+
+
+class ClusterizadorTemplates:
+    """🧩 Clusterização incremental de URLs por esqueleto do DOM + padrão de URL"""
+
+    def __init__(self, representantes_por_template: int = REPRESENTANTES_POR_TEMPLATE,
+                 limiar_similaridade: float = LIMIAR_SIMILARIDADE_DOM):
+        self.representantes_por_template = max(1, representantes_por_template)
+        self.limiar_similaridade = limiar_similaridade
+        self.templates: List[Dict] = []
+        self.template_por_url: Dict[str, str] = {}
+
+    def _melhor_template(self, shingles: set, chave_url: str, segmentos: List[str]) -> Tuple[Optional[Dict], float]:
+        """🔍 Template mais parecido que passa no limiar"""
+        melhor, melhor_score = None, 0.0
+        for template in self.templates:
+            score = similaridade_jaccard(shingles, template['prototipo'])
+            limiar = self.limiar_similaridade
+            if chave_url in template['padroes_url']:
+                limiar -= BONUS_MESMO_PADRAO_URL
+            elif segmentos[:1] == template['segmentos'][:1] and len(segmentos) == len(template['segmentos']):
+                limiar -= BONUS_MESMO_PADRAO_URL / 2
+            if score >= limiar and score > melhor_score:
+                melhor, melhor_score = template, score
+        return melhor, melhor_score
+
+    def atribuir(self, url: str, parser: _ParserEsqueleto) -> Tuple[str, bool]:
+        """🧩 Atribui URL a um template. Retorna (template_id, é_representante)"""
+
+        chave_url = chave_template_url(url)
+        segmentos = segmentos_template_url(url)
+        template, score = self._melhor_template(parser.shingles, chave_url, segmentos)
+
+        if template is None:
+            template = {
+                'id': f"T{len(self.templates) + 1:02d} {chave_url}",
+                'prototipo': parser.shingles,
+                'padroes_url': {chave_url},
+                'segmentos': segmentos,
+                'membros': [],
+                'representantes': [],
+                'achados_representantes': []
+            }
+            self.templates.append(template)
+        else:
+            template['padroes_url'].add(chave_url)
+
+        template['membros'].append(url)
+        self.template_por_url[url] = template['id']
+
+        representante = len(template['representantes']) < self.representantes_por_template
+        if representante:
+            template['representantes'].append(url)
+
+        return template['id'], representante
+
+    def _template(self, template_id: str) -> Optional[Dict]:
+        for template in self.templates:
+            if template['id'] == template_id:
+                return template
+        return None
+
+    def registrar_representante(self, template_id: str, resultado_render: Dict, dados_estaticos: Dict):
+        """🔬 Compara render x estático do representante e guarda os achados"""
+
+        template = self._template(template_id)
+        if template is None or resultado_render.get('error'):
+            return
+
+        title_render = (resultado_render.get('title') or '').strip()
+        desc_render = (resultado_render.get('description') or '').strip()
+        links_render = resultado_render.get('links_encontrados') or []
+        links_estaticos = dados_estaticos.get('links_encontrados') or []
+
+        achados = {
+            'title_renderizado_js': bool(title_render) and title_render != dados_estaticos.get('title', ''),
+            'description_renderizada_js': bool(desc_render) and not dados_estaticos.get('description'),
+            'h1_renderizado_js': resultado_render.get('h1', 0) > 0 and dados_estaticos.get('h1', 0) == 0,
+            'links_renderizados_js': len(links_render) > max(5, len(links_estaticos) * 1.5),
+            'h1_oculto': resultado_render.get('h1_ocultos', 0) > 0,
+            'precisa_javascript': bool(resultado_render.get('needs_javascript'))
+        }
+
+        template['achados_representantes'].append({
+            'achados': achados,
+            'js_detection_reason': resultado_render.get('js_detection_reason', ''),
+            'framework_detected': resultado_render.get('framework_detected', 'none')
+        })
+
+    def achados_template(self, template_id: str) -> Dict:
+        """📋 Achados válidos para o template (maioria dos representantes)"""
+
+        template = self._template(template_id)
+        if not template or not template['achados_representantes']:
+            return {'achados': {}, 'representante': None}
+
+        registros = template['achados_representantes']
+        total = len(registros)
+        achados = {
+            chave: sum(1 for r in registros if r['achados'].get(chave)) / total >= PROPORCAO_ACHADO_TEMPLATE
+            for chave in DESCRICAO_ACHADOS
+        }
+
+        return {
+            'achados': achados,
+            'representante': template['representantes'][0],
+            'js_detection_reason': registros[0]['js_detection_reason'],
+            'framework_detected': registros[0]['framework_detected']
+        }
+
+    def descrever_achados(self, achados: Dict) -> str:
+        ativos = [DESCRICAO_ACHADOS[chave] for chave, ativo in achados.items() if ativo]
+        return '; '.join(ativos)
+
+    def get_stats(self) -> Dict:
+        """📊 Estatísticas da clusterização"""
+        total_urls = sum(len(t['membros']) for t in self.templates)
+        renderizadas = sum(len(t['representantes']) for t in self.templates)
+        return {
+            'templates': len(self.templates),
+            'urls_classificadas': total_urls,
+            'urls_renderizadas': renderizadas,
+            'urls_extrapoladas': total_urls - renderizadas,
+            'economia_render_percent': round((total_urls - renderizadas) / total_urls * 100, 1) if total_urls else 0.0
+        }
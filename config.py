@@ -10,7 +10,10 @@ class CrawlerGlobalConfig:
     VERSION = "2.0.0-modular"
     
     # Timeouts globais (em ms)
-    DEFAULT_TITLE_TIMEOUT = 15000  # 15s - HARDENED
+    DEFAULT_TITLE_TIMEOUT = 15000  # 15s - HARDENED (teto da espera adaptativa)
+    ADAPTIVE_TITLE_TIMEOUT = True  # Aprende espera por host/template durante o crawl
+    ADAPTIVE_TIMEOUT_PERCENTILE = 0.95
+    MIN_TITLE_TIMEOUT = 1500
     DEFAULT_PAGE_TIMEOUT = 30000   # 30s
     DEFAULT_NAVIGATION_TIMEOUT = 20000  # 20s
     
@@ -67,6 +70,9 @@ class CrawlerGlobalConfig:
             'version': cls.VERSION,
             'timeouts': {
                 'title': cls.DEFAULT_TITLE_TIMEOUT,
+                'title_adaptive': cls.ADAPTIVE_TITLE_TIMEOUT,
+                'title_adaptive_percentile': cls.ADAPTIVE_TIMEOUT_PERCENTILE,
+                'title_min': cls.MIN_TITLE_TIMEOUT,
                 'page': cls.DEFAULT_PAGE_TIMEOUT,
                 'navigation': cls.DEFAULT_NAVIGATION_TIMEOUT
             },
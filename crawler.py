@@ -12,6 +12,9 @@ import pickle
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
+from armazem_paginas import obter_armazem
+from verificador_links import extrair_links_todos
+
 warnings.filterwarnings("ignore")
 
 # ========================
@@ -116,6 +119,9 @@ def processar_url_compativel(url, nivel, dominio_base):
         if (response.status_code == 200 and 
             'text/html' in resultado["tipo_conteudo"]):
             
+            # 📦 Página guardada: analisador e motor de headings não baixam de novo
+            obter_armazem().guardar_resposta(url, response)
+            
             # USA LXML como original
             soup = BeautifulSoup(response.text, 'lxml')
             
@@ -131,6 +137,8 @@ def processar_url_compativel(url, nivel, dominio_base):
             
             # Adiciona links como campo extra (não afeta compatibilidade)
             resultado["links_encontrados"] = list(set(links_encontrados))
+            # Todos os <a href> (externos e arquivos) para o verificador de links quebrados
+            resultado["links_todos"] = extrair_links_todos((tag["href"] for tag in soup.find_all("a", href=True)), url)
         
         return resultado
         
@@ -195,6 +203,9 @@ def rastrear_profundo(url_inicial, max_urls=1000, max_depth=3, forcar_reindexaca
     resultados = []
     dominio_base = urlparse(url_inicial).netloc
 
+    # 🔖 Páginas guardadas por crawls anteriores deixam de valer para analisador e abas
+    obter_armazem().iniciar_crawl(url_inicial)
+
     # PROGRESS BAR ORIGINAL
     with tqdm(total=max_urls, desc="🔍 Rastreamento Otimizado") as pbar:
         
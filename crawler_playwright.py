@@ -1,6 +1,9 @@
 # crawler_playwright.py - Pipeline LEAN: Title V5 Hardened + Browser Pool Inteligente
 
 import asyncio
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from playwright._impl._errors import TimeoutError as PlaywrightTimeoutError
 from urllib.parse import urljoin, urlparse
@@ -10,16 +13,188 @@ import os
 import pickle
 import warnings
 from typing import List, Dict, Optional, Tuple
+from armazem_paginas import obter_armazem
+from render_cache import RenderCache, calcular_hash_conteudo, validador_de_headers, SUBRECURSOS_RELEVANTES
+from clusterizacao_templates import ClusterizadorTemplates, analisar_html_estatico, dados_seo_estaticos
+from timeouts_adaptativos import EstimadorTimeoutAdaptativo
+from config import CrawlerGlobalConfig
+from dom_snapshot import capturar_snapshot
+from fronteira_sqlite import FronteiraSQLite, CONCLUIDA
+from diff_estatico_renderizado import diff_de_html
+from verificador_links import extrair_links_todos
 
 warnings.filterwarnings("ignore")
 
 # 🎯 CONFIGURAÇÕES SIMPLES E EFICAZES
-TITLE_TIMEOUT = 15000  # 15s - HARDENED para sites como GNDI
+TITLE_TIMEOUT = CrawlerGlobalConfig.DEFAULT_TITLE_TIMEOUT  # 15s - HARDENED para sites como GNDI (agora é o TETO da espera adaptativa)
 FALLBACK_TIMEOUT = 3000  # 3s adicional para JS assíncrono
+HEADINGS_WAIT_TIMEOUT = 1500  # Teto da espera de headings após scroll forçado
+TIMEOUT_ADAPTATIVO = CrawlerGlobalConfig.ADAPTIVE_TITLE_TIMEOUT  # Aprende espera por host/template em vez de sempre esperar o teto
 PAGE_TIMEOUT = 30000
 NAV_TIMEOUT = 20000
 BROWSER_POOL_SIZE = 5
 
+# 🗄️ CACHE DE SUBRECURSOS ENTRE PÁGINAS
+# None = contexto efêmero (original) | 'route' = cache do crawler via page.route | 'persistente' = perfil em disco
+MODOS_CACHE_BROWSER = (None, 'route', 'persistente')
+BROWSER_PROFILES_DIR = os.path.join(".cache", "browser_profiles")
+ROUTE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+ROUTE_CACHE_MAX_ITEM_BYTES = 8 * 1024 * 1024
+ROUTE_CACHE_TIPOS = ('stylesheet', 'script', 'font', 'image')
+
+# 📸 MODO DE EXTRAÇÃO DE VISIBILIDADE
+# 'dom' = getComputedStyle por heading (original) | 'snapshot' = um DOMSnapshot.captureSnapshot por página
+MODOS_EXTRACAO = ('dom', 'snapshot')
+
+# 🧵 SHARDING MULTI-PROCESSO (cada processo: event loop + browser pool próprios)
+FRONTEIRA_DIR = os.path.join(".cache", "fronteira")
+ESPERA_FRONTEIRA_S = 0.5
+
+# 🔀 DIFF ESTÁTICO x RENDERIZADO (usa o corpo da resposta da navegação, sem fetch extra)
+DIFF_ESTATICO_RENDERIZADO = True
+
+# 📈 OBSERVERS DE PERFORMANCE (instalados antes de qualquer script da página)
+PERFORMANCE_INIT_SCRIPT = """
+(() => {
+    window.__seoPerf = { lcp: null, cls: 0 };
+    try {
+        new PerformanceObserver(list => {
+            const entries = list.getEntries();
+            if (entries.length) {
+                window.__seoPerf.lcp = entries[entries.length - 1].startTime;
+            }
+        }).observe({ type: 'largest-contentful-paint', buffered: true });
+    } catch (e) {}
+    try {
+        new PerformanceObserver(list => {
+            for (const entry of list.getEntries()) {
+                if (!entry.hadRecentInput) {
+                    window.__seoPerf.cls += entry.value;
+                }
+            }
+        }).observe({ type: 'layout-shift', buffered: true });
+    } catch (e) {}
+})();
+"""
+
+# ⏱️ Estimadores de espera (aprendem durante o crawl) - piso e percentil vêm do CrawlerGlobalConfig
+ESTIMADOR_TITLE = EstimadorTimeoutAdaptativo(TITLE_TIMEOUT, piso_ms=CrawlerGlobalConfig.MIN_TITLE_TIMEOUT,
+                                             percentil=CrawlerGlobalConfig.ADAPTIVE_TIMEOUT_PERCENTILE)
+ESTIMADOR_HEADINGS = EstimadorTimeoutAdaptativo(HEADINGS_WAIT_TIMEOUT, piso_ms=300,
+                                                percentil=CrawlerGlobalConfig.ADAPTIVE_TIMEOUT_PERCENTILE,
+                                                espera_fixa_original=True)
+
+# Headings presentes e estáveis por 300ms (lazy loading assentou)
+HEADINGS_ESTAVEIS_JS = """
+() => {
+    const total = document.querySelectorAll('h1, h2, h3, h4, h5, h6').length;
+    const estado = window.__seoHeadingsWait || (window.__seoHeadingsWait = { total: -1, desde: 0 });
+    const agora = performance.now();
+    if (total !== estado.total) {
+        estado.total = total;
+        estado.desde = agora;
+        return false;
+    }
+    return total > 0 && agora - estado.desde >= 300;
+}
+"""
+
+# ========================
+# 🗄️ CACHE DE SUBRECURSOS DO CRAWLER (page.route)
+# ========================
+
+class RouteResponseCache:
+    """🗄️ CSS/JS/fontes/imagens baixados uma vez e servidos a todas as páginas do pool"""
+    
+    def __init__(self, max_bytes: int = ROUTE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict = OrderedDict()  # url -> (status, headers, body) em ordem LRU
+        self.em_voo: Dict[str, asyncio.Future] = {}
+        self.total_bytes = 0
+        self.stats = {'hits': 0, 'misses': 0, 'bytes_servidos_cache': 0, 'nao_cacheaveis': 0}
+    
+    def _armazenar(self, url: str, status: int, headers: Dict, body: bytes):
+        self.entries[url] = (status, headers, body)
+        self.total_bytes += len(body)
+        while self.total_bytes > self.max_bytes and self.entries:
+            _, (_, _, antigo) = self.entries.popitem(last=False)
+            self.total_bytes -= len(antigo)
+    
+    async def handle(self, route):
+        """🔀 Handler de route: serve do cache ou busca uma única vez"""
+        request = route.request
+        
+        if request.method != 'GET' or request.resource_type not in ROUTE_CACHE_TIPOS:
+            await route.continue_()
+            return
+        
+        url = request.url
+        
+        if url in self.entries:
+            status, headers, body = self.entries[url]
+            self.entries.move_to_end(url)
+            self.stats['hits'] += 1
+            self.stats['bytes_servidos_cache'] += len(body)
+            await route.fulfill(status=status, headers=headers, body=body)
+            return
+        
+        # Mesmo bundle pedido por várias páginas ao mesmo tempo: só uma busca
+        if url in self.em_voo:
+            try:
+                await asyncio.shield(self.em_voo[url])
+            except Exception:
+                pass
+            if url in self.entries:
+                await self.handle(route)
+                return
+            await route.continue_()
+            return
+        
+        futuro = asyncio.get_running_loop().create_future()
+        self.em_voo[url] = futuro
+        self.stats['misses'] += 1
+        
+        try:
+            response = await route.fetch()
+            body = await response.body()
+            cache_control = response.headers.get('cache-control', '').lower()
+            
+            if response.status == 200 and 'no-store' not in cache_control and len(body) <= ROUTE_CACHE_MAX_ITEM_BYTES:
+                self._armazenar(url, response.status, response.headers, body)
+            else:
+                self.stats['nao_cacheaveis'] += 1
+            
+            await route.fulfill(response=response, body=body)
+        except Exception:
+            try:
+                await route.continue_()
+            except Exception:
+                pass
+        finally:
+            if not futuro.done():
+                futuro.set_result(True)
+            self.em_voo.pop(url, None)
+    
+    def tamanho_transferido(self, url: str) -> int:
+        """📦 Bytes que a rede teria transferido (Content-Length, senão o corpo) - 0 se não está no cache"""
+        entrada = self.entries.get(url)
+        if entrada is None:
+            return 0
+        _, headers, body = entrada
+        try:
+            return int(headers.get('content-length') or len(body))
+        except (TypeError, ValueError):
+            return len(body)
+    
+    def get_stats(self) -> Dict:
+        consultas = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'itens': len(self.entries),
+            'mb_em_memoria': round(self.total_bytes / 1024 / 1024, 1),
+            'hit_rate_percent': round(self.stats['hits'] / consultas * 100, 1) if consultas else 0.0
+        }
+
 # ========================
 # 🎭 BROWSER POOL SIMPLES E EFICAZ
 # ========================
@@ -27,34 +202,59 @@ BROWSER_POOL_SIZE = 5
 class BrowserPool:
     """🎭 Pool de browsers - simples e funcional"""
     
-    def __init__(self, size: int = BROWSER_POOL_SIZE):
+    BROWSER_ARGS = [
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-images',  # Performance
+        '--disable-web-security'
+    ]
+    
+    CONTEXT_OPTIONS = {
+        'user_agent': "Mozilla/5.0 (compatible; SEO-Analyzer/1.0)",
+        'viewport': {"width": 1366, "height": 768},
+        'ignore_https_errors': True
+    }
+    
+    def __init__(self, size: int = BROWSER_POOL_SIZE, modo_cache: Optional[str] = None, id_pool: int = 0):
+        if modo_cache not in MODOS_CACHE_BROWSER:
+            raise ValueError(f"modo_cache inválido: {modo_cache} (use {MODOS_CACHE_BROWSER})")
         self.size = size
+        self.modo_cache = modo_cache
+        self.id_pool = id_pool  # Processos worker não podem abrir o mesmo perfil persistente
         self.browsers: List[Browser] = []
         self.contexts: List[BrowserContext] = []
         self.semaphore = asyncio.Semaphore(size * 10)  # 10 páginas por browser
+        self.route_cache = RouteResponseCache() if modo_cache == 'route' else None
     
     async def initialize(self, playwright):
         """🚀 Inicializa pool"""
-        print(f"🎭 Inicializando {self.size} browsers...")
+        print(f"🎭 Inicializando {self.size} browsers..." + (f" (cache: {self.modo_cache})" if self.modo_cache else ""))
         
         for i in range(self.size):
-            browser = await playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-images',  # Performance
-                    '--disable-web-security'
-                ]
-            )
+            if self.modo_cache == 'persistente':
+                # Perfil em disco por slot: cache HTTP do Chromium sobrevive entre páginas e execuções
+                slot = f"slot_{i}" if self.id_pool == 0 else f"w{self.id_pool}_slot_{i}"
+                perfil_dir = os.path.join(BROWSER_PROFILES_DIR, slot)
+                os.makedirs(perfil_dir, exist_ok=True)
+                context = await playwright.chromium.launch_persistent_context(
+                    perfil_dir,
+                    headless=True,
+                    args=self.BROWSER_ARGS,
+                    **self.CONTEXT_OPTIONS
+                )
+            else:
+                browser = await playwright.chromium.launch(
+                    headless=True,
+                    args=self.BROWSER_ARGS
+                )
+                context = await browser.new_context(**self.CONTEXT_OPTIONS)
+                self.browsers.append(browser)
+            
+            await context.add_init_script(PERFORMANCE_INIT_SCRIPT)
             
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (compatible; SEO-Analyzer/1.0)",
-                viewport={"width": 1366, "height": 768},
-                ignore_https_errors=True
-            )
+            if self.route_cache:
+                await context.route('**/*', self.route_cache.handle)
             
-            self.browsers.append(browser)
             self.contexts.append(context)
         
         print(f"✅ Pool inicializado: {self.size} browsers")
@@ -84,6 +284,14 @@ class BrowserPool:
     
     async def close_all(self):
         """🔚 Fecha todos os browsers"""
+        # Contextos persistentes não têm Browser próprio: fechar o contexto grava o cache em disco
+        if self.modo_cache == 'persistente':
+            for context in self.contexts:
+                try:
+                    await context.close()
+                except:
+                    pass
+        
         for browser in self.browsers:
             try:
                 await browser.close()
@@ -94,18 +302,26 @@ class BrowserPool:
 # 📝 TITLE EXTRACTOR V5 HARDENED
 # ========================
 
-async def extract_title_hardened(page: Page, url: str) -> str:
+async def extract_title_hardened(page: Page, url: str, aguardar_js: bool = True) -> str:
     """📝 Title V5 Hardened - resolve problemas de JS assíncrono"""
     
     try:
         # ESTRATÉGIA 1: Wait for function com timeout aumentado
-        try:
-            await page.wait_for_function(
-                "document.title && document.title.trim().length > 0", 
-                timeout=TITLE_TIMEOUT
-            )
-        except PlaywrightTimeoutError:
-            pass
+        # (DOM vindo do render cache já está pronto - não há JS para esperar)
+        # Timeout aprendido por host/template (teto = TITLE_TIMEOUT)
+        timeout_title = ESTIMADOR_TITLE.timeout_para(url) if TIMEOUT_ADAPTATIVO else TITLE_TIMEOUT
+        espera_expirou = False
+        if aguardar_js:
+            inicio_espera = time.time()
+            try:
+                await page.wait_for_function(
+                    "document.title && document.title.trim().length > 0", 
+                    timeout=timeout_title
+                )
+                ESTIMADOR_TITLE.registrar(url, (time.time() - inicio_espera) * 1000)
+            except PlaywrightTimeoutError:
+                espera_expirou = True
+            ESTIMADOR_TITLE.registrar_espera(timeout_title, (time.time() - inicio_espera) * 1000, espera_expirou)
         
         # ESTRATÉGIA 2: Title API
         title = await page.title()
@@ -121,11 +337,21 @@ async def extract_title_hardened(page: Page, url: str) -> str:
         
         # ESTRATÉGIA 4: Fallback agressivo para SPAs
         if not title or title.strip() == "" or title.lower() in ['loading', 'carregando', 'app']:
-            await page.wait_for_timeout(FALLBACK_TIMEOUT)
+            # Fallback só enquanto já resolveu algo neste host
+            usar_fallback = aguardar_js and (not TIMEOUT_ADAPTATIVO or ESTIMADOR_TITLE.usar_fallback(url))
+            if usar_fallback:
+                await page.wait_for_timeout(FALLBACK_TIMEOUT)
             title = await page.title()
             
             if not title or title.strip() == "":
                 title = await page.evaluate("document.title")
+            
+            if usar_fallback:
+                resolvido = bool(title and title.strip())
+                ESTIMADOR_TITLE.registrar_fallback(url, resolvido)
+                # Title chegou depois da espera adaptativa: amostra ajusta o percentil para cima
+                if resolvido and espera_expirou:
+                    ESTIMADOR_TITLE.registrar(url, timeout_title + FALLBACK_TIMEOUT)
         
         # ESTRATÉGIA 5: Title alternativo via H1
         if not title or title.strip() == "":
@@ -158,26 +384,37 @@ async def extract_title_hardened(page: Page, url: str) -> str:
 # CORREÇÃO para crawler_playwright.py
 # Substitua a função extract_seo_data por esta versão:
 
-async def extract_seo_data(page: Page, url: str) -> Dict:
+async def extract_seo_data(page: Page, url: str, forcar_lazy_loading: bool = True) -> Dict:
     """📊 Extrai dados SEO essenciais - VERSÃO CORRIGIDA ANTI LAZY LOADING"""
     
     try:
-        # 🚀 CORREÇÃO 1: SCROLL FORÇADO + ESPERA
-        print(f"   🔄 Forçando lazy loading...")
-        
-        # Scroll para baixo (força lazy loading)
-        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        await page.wait_for_timeout(1500)  # Espera renderização
-        
-        # Scroll para cima (estabiliza)
-        await page.evaluate("window.scrollTo(0, 0)")
-        await page.wait_for_timeout(500)
-        
-        # Aguarda network idle se possível
-        try:
-            await page.wait_for_load_state('networkidle', timeout=3000)
-        except:
-            pass  # Ignora timeout
+        # 🚀 CORREÇÃO 1: SCROLL FORÇADO + ESPERA (desnecessário em DOM do render cache)
+        if forcar_lazy_loading:
+            print(f"   🔄 Forçando lazy loading...")
+            
+            # Scroll para baixo (força lazy loading)
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            
+            # Espera renderização: headings estáveis, com timeout aprendido (teto 1.5s)
+            timeout_headings = ESTIMADOR_HEADINGS.timeout_para(url) if TIMEOUT_ADAPTATIVO else HEADINGS_WAIT_TIMEOUT
+            inicio_espera = time.time()
+            try:
+                await page.wait_for_function(HEADINGS_ESTAVEIS_JS, timeout=timeout_headings)
+                ESTIMADOR_HEADINGS.registrar(url, (time.time() - inicio_espera) * 1000)
+                headings_expirou = False
+            except PlaywrightTimeoutError:
+                headings_expirou = True
+            ESTIMADOR_HEADINGS.registrar_espera(timeout_headings, (time.time() - inicio_espera) * 1000, headings_expirou)
+            
+            # Scroll para cima (estabiliza)
+            await page.evaluate("window.scrollTo(0, 0)")
+            await page.wait_for_timeout(500)
+            
+            # Aguarda network idle se possível
+            try:
+                await page.wait_for_load_state('networkidle', timeout=3000)
+            except:
+                pass  # Ignora timeout
         
         print(f"   📊 Extraindo dados SEO...")
         
@@ -262,10 +499,17 @@ async def extract_seo_data(page: Page, url: str) -> Dict:
         if og_title_elem:
             og_title = await og_title_elem.get_attribute('content') or ""
         
+        # Meta robots (JS pode injetar/remover noindex)
+        robots_elem = await page.query_selector('meta[name="robots"]')
+        meta_robots = ""
+        if robots_elem:
+            meta_robots = await robots_elem.get_attribute('content') or ""
+        
         return {
             'description': description.strip(),
             'canonical': canonical.strip(),
             'og_title': og_title.strip(),
+            'meta_robots': meta_robots.strip(),
             **headings_data,
             'h1_ausente': headings_data.get('h1', 0) == 0,
             'h2_ausente': headings_data.get('h2', 0) == 0
@@ -277,6 +521,7 @@ async def extract_seo_data(page: Page, url: str) -> Dict:
             'description': '', 
             'canonical': '', 
             'og_title': '', 
+            'meta_robots': '',
             'h1_ausente': True, 
             'h2_ausente': True,
             # Headings vazios
@@ -288,6 +533,128 @@ async def extract_seo_data(page: Page, url: str) -> Dict:
             'h6': 0, 'h6_texts': []
         }
 # ========================
+# 👻 HEADINGS OCULTOS (RENDERIZADO)
+# ========================
+
+async def extract_headings_ocultos(page: Page, url: str) -> Dict:
+    """👻 Conta headings presentes no DOM mas invisíveis após renderização"""
+    
+    try:
+        return await page.evaluate("""
+            () => {
+                const oculto = el => {
+                    if (!el.getClientRects().length) return true;
+                    const style = getComputedStyle(el);
+                    return style.visibility === 'hidden' || parseFloat(style.opacity) === 0;
+                };
+                const headings = Array.from(document.querySelectorAll('h1, h2, h3, h4, h5, h6'));
+                return {
+                    h1_ocultos: headings.filter(h => h.tagName === 'H1' && oculto(h)).length,
+                    headings_ocultos: headings.filter(oculto).length
+                };
+            }
+        """)
+    except Exception as e:
+        print(f"   ⚠️ Erro verificando headings ocultos de {url}: {e}")
+        return {'h1_ocultos': 0, 'headings_ocultos': 0}
+
+# ========================
+# 📈 PERFORMANCE EXTRACTOR (LAB)
+# ========================
+
+async def extract_performance_metrics(page: Page, url: str, requests_count: int = 0,
+                                      route_cache: Optional[RouteResponseCache] = None) -> Dict:
+    """📈 Métricas de laboratório da página já renderizada - sem passe extra
+
+    Recursos servidos pelo RouteResponseCache (modo_cache='route') chegam com transferSize 0:
+    o peso deles é somado a partir do cache e reportado também em perf_bytes_route_cache.
+    """
+    
+    try:
+        metrics = await page.evaluate("""
+            () => {
+                const nav = performance.getEntriesByType('navigation')[0];
+                const resources = performance.getEntriesByType('resource');
+                const observed = window.__seoPerf || { lcp: null, cls: null };
+                
+                let transferred = nav ? (nav.transferSize || 0) : 0;
+                let bytesJs = 0, bytesCss = 0, bytesImg = 0;
+                let countJs = 0, countCss = 0, countImg = 0;
+                const semTamanho = [];
+                
+                resources.forEach(r => {
+                    const size = r.transferSize || r.encodedBodySize || 0;
+                    let tipo = '';
+                    transferred += size;
+                    if (r.initiatorType === 'script') { bytesJs += size; countJs++; tipo = 'js'; }
+                    else if (r.initiatorType === 'link' || r.initiatorType === 'css') { bytesCss += size; countCss++; tipo = 'css'; }
+                    else if (r.initiatorType === 'img' || r.initiatorType === 'image') { bytesImg += size; countImg++; tipo = 'img'; }
+                    if (!size) semTamanho.push([r.name, tipo]);
+                });
+                
+                // Fallback: LCP bufferizado se o init script não rodou
+                let lcp = observed.lcp;
+                if (lcp === null) {
+                    const lcpEntries = performance.getEntriesByType('largest-contentful-paint');
+                    if (lcpEntries.length) lcp = lcpEntries[lcpEntries.length - 1].startTime;
+                }
+                
+                return {
+                    ttfb: nav ? nav.responseStart - nav.requestStart : null,
+                    dom_interactive: nav ? nav.domInteractive : null,
+                    dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+                    load: nav ? nav.loadEventEnd : null,
+                    lcp: lcp,
+                    cls: observed.cls,
+                    dom_nodes: document.getElementsByTagName('*').length,
+                    transferred: transferred,
+                    resources: resources.length,
+                    bytes_js: bytesJs, bytes_css: bytesCss, bytes_img: bytesImg,
+                    count_js: countJs, count_css: countCss, count_img: countImg,
+                    sem_tamanho: semTamanho
+                };
+            }
+        """)
+        
+        # Servidos do cache do crawler via route.fulfill: o browser não vê transferência
+        bytes_route_cache = 0
+        if route_cache is not None:
+            for nome, tipo in metrics.get('sem_tamanho') or []:
+                tamanho = route_cache.tamanho_transferido(nome)
+                if tamanho:
+                    bytes_route_cache += tamanho
+                    if tipo:
+                        metrics[f'bytes_{tipo}'] = (metrics.get(f'bytes_{tipo}') or 0) + tamanho
+            metrics['transferred'] = (metrics.get('transferred') or 0) + bytes_route_cache
+        
+        def _ms(valor):
+            return round(valor, 1) if isinstance(valor, (int, float)) and valor > 0 else None
+        
+        return {
+            'perf_ttfb_ms': _ms(metrics.get('ttfb')),
+            'perf_dom_interactive_ms': _ms(metrics.get('dom_interactive')),
+            'perf_dom_content_loaded_ms': _ms(metrics.get('dom_content_loaded')),
+            'perf_load_ms': _ms(metrics.get('load')),
+            'perf_lcp_ms': _ms(metrics.get('lcp')),
+            'perf_cls': round(metrics['cls'], 4) if metrics.get('cls') is not None else None,
+            'perf_dom_nodes': metrics.get('dom_nodes', 0),
+            'perf_bytes_transferidos': int(metrics.get('transferred') or 0),
+            'perf_bytes_js': int(metrics.get('bytes_js') or 0),
+            'perf_bytes_css': int(metrics.get('bytes_css') or 0),
+            'perf_bytes_img': int(metrics.get('bytes_img') or 0),
+            'perf_bytes_route_cache': bytes_route_cache,
+            'perf_recursos_js': metrics.get('count_js', 0),
+            'perf_recursos_css': metrics.get('count_css', 0),
+            'perf_recursos_img': metrics.get('count_img', 0),
+            # Contagem real via eventos do Playwright (Resource Timing omite alguns)
+            'perf_requests': max(requests_count, metrics.get('resources', 0) + 1)
+        }
+        
+    except Exception as e:
+        print(f"   ⚠️ Erro coletando métricas de performance de {url}: {e}")
+        return {}
+
+# ========================
 # 🔗 LINK EXTRACTOR SIMPLES
 # ========================
 
@@ -324,6 +691,15 @@ async def extract_links(page: Page, domain: str) -> List[str]:
     except Exception as e:
         return []
 
+async def extract_links_todos(page: Page) -> List[str]:
+    """🔗 Todos os <a href> (externos e arquivos) para o verificador de links quebrados"""
+    
+    try:
+        hrefs = await page.evaluate("() => Array.from(document.querySelectorAll('a[href]'), a => a.getAttribute('href'))")
+        return extrair_links_todos(hrefs, page.url)
+    except Exception:
+        return []
+
 # ========================
 # 🧠 SITE ANALYZER SIMPLES
 # ========================
@@ -377,16 +753,104 @@ async def analyze_site_simple(page: Page, url: str) -> Dict:
 # 🎯 PROCESSADOR PRINCIPAL
 # ========================
 
-async def process_url_lean(url: str, nivel: int, domain: str, browser_pool: BrowserPool) -> Dict:
+async def process_url_render_cache(url: str, nivel: int, domain: str, browser_pool: BrowserPool,
+                                   entrada: Dict, start_time: float) -> Dict:
+    """♻️ Re-executa só a extração sobre o DOM renderizado salvo - sem rede, sem JS"""
+    
+    page = None
+    
+    try:
+        page, browser_index = await browser_pool.get_page()
+        final_url = entrada.get('final_url') or url
+        
+        # Serve o DOM salvo na navegação principal e bloqueia todo o resto
+        async def _servir_dom_cache(route):
+            request = route.request
+            if request.is_navigation_request() and request.frame.parent_frame is None:
+                await route.fulfill(status=200, content_type='text/html; charset=utf-8', body=entrada['dom'])
+            else:
+                await route.abort()
+        
+        await page.route('**/*', _servir_dom_cache)
+        await page.goto(final_url, wait_until='domcontentloaded', timeout=NAV_TIMEOUT)
+        
+        title = await extract_title_hardened(page, url, aguardar_js=False)
+        seo_data = await extract_seo_data(page, url, forcar_lazy_loading=False)
+        links = await extract_links(page, domain)
+        links_todos = await extract_links_todos(page)
+        
+        # Análise de JS, métricas e visibilidade dos headings só existem durante a renderização real
+        # (no replay o CSS é bloqueado, então estilos computados não valem - nunca recalcula aqui)
+        analise_render = entrada.get('analise_render', {})
+        headings_ocultos = analise_render.get('headings_ocultos') or {}
+        
+        return {
+            'url': url,
+            'nivel': nivel,
+            'status_code_http': entrada.get('status_code_http'),
+            'tipo_conteudo': entrada.get('tipo_conteudo', 'unknown'),
+            'final_url': final_url,
+            'redirected': final_url != url,
+            'title': title,
+            **seo_data,
+            **headings_ocultos,
+            **(analise_render.get('diff_js') or {}),
+            'needs_javascript': analise_render.get('needs_javascript', False),
+            'js_detection_reason': analise_render.get('js_detection_reason', ''),
+            'framework_detected': analise_render.get('framework_detected', 'none'),
+            'links_encontrados': links,
+            'links_todos': links_todos,
+            'response_time': round((time.time() - start_time) * 1000, 2),
+            'browser_index': browser_index,
+            **analise_render.get('performance', {}),
+            'render_cache_hit': True,
+            'renderizado_em': entrada.get('renderizado_em'),
+            'crawler_version': 'lean_v1.0',
+            'extraction_timestamp': time.time()
+        }
+        
+    except Exception as e:
+        return {
+            'url': url,
+            'nivel': nivel,
+            'status_code_http': None,
+            'tipo_conteudo': f'Erro: {str(e)}',
+            'title': '',
+            'error': str(e),
+            'render_cache_hit': True,
+            'response_time': round((time.time() - start_time) * 1000, 2)
+        }
+    
+    finally:
+        if page:
+            await browser_pool.release_page(page)
+
+async def process_url_lean(url: str, nivel: int, domain: str, browser_pool: BrowserPool,
+                           render_cache: Optional[RenderCache] = None, modo_extracao: str = 'dom') -> Dict:
     """🎯 Processa URL com pipeline limpo"""
     
     page = None
     start_time = time.time()
     
+    # ♻️ DOM já renderizado e HTML original inalterado: só re-extrai
+    if render_cache is not None:
+        entrada = await render_cache.obter_valido(url, browser_pool.contexts[0].request)
+        if entrada:
+            return await process_url_render_cache(url, nivel, domain, browser_pool, entrada, start_time)
+    
     try:
         # 1. Obtém página
         page, browser_index = await browser_pool.get_page()
         
+        requests_count = [0]
+        page.on('request', lambda request: requests_count.__setitem__(0, requests_count[0] + 1))
+        
+        # Validadores (ETag/Last-Modified) dos JS/CSS que moldam o DOM renderizado
+        subrecursos = {}
+        if render_cache is not None:
+            page.on('response', lambda resp: subrecursos.__setitem__(resp.url, validador_de_headers(resp.headers))
+                    if resp.request.resource_type in SUBRECURSOS_RELEVANTES else None)
+        
         # 2. Navega
         response = await page.goto(url, wait_until='domcontentloaded', timeout=NAV_TIMEOUT)
         
@@ -396,11 +860,60 @@ async def process_url_lean(url: str, nivel: int, domain: str, browser_pool: Brow
         except:
             pass
         
+        # 3.1 Métricas de performance antes do scroll forçado (não distorce CLS/LCP)
+        performance_data = await extract_performance_metrics(page, url, requests_count[0], browser_pool.route_cache)
+        
         # 4. PIPELINE DE EXTRAÇÃO
         title = await extract_title_hardened(page, url)
         seo_data = await extract_seo_data(page, url)
+        if modo_extracao == 'snapshot':
+            # Headings vazios/ocultos, texto fora da tela e links invisíveis numa única ida CDP
+            headings_ocultos = await capturar_snapshot(page, url)
+        else:
+            headings_ocultos = await extract_headings_ocultos(page, url)
         site_analysis = await analyze_site_simple(page, url)
         links = await extract_links(page, domain)
+        links_todos = await extract_links_todos(page)
+        
+        # 4.1 HTML como o bot recebe x DOM renderizado (corpo já baixado pelo goto)
+        diff_js = {}
+        if DIFF_ESTATICO_RENDERIZADO and response:
+            try:
+                html_estatico = await response.text()
+                # textContent: h1_texts do seo_data vem de inner_text(), que aplica text-transform do CSS
+                h1_dom = await page.eval_on_selector_all(
+                    'h1', "hs => hs.map(h => (h.textContent || '').trim()).filter(Boolean)"
+                )
+                # document.title cru: o title hardened pode vir do H1 ou ser apagado pela blacklist
+                title_documento = await page.title()
+                diff_js = diff_de_html(html_estatico, page.url, domain,
+                                       {**seo_data, 'title': title_documento, 'h1_texts': h1_dom,
+                                        'links_encontrados': links})
+            except Exception as e:
+                print(f"   ⚠️ Diff estático x renderizado indisponível para {url}: {e}")
+        
+        # 4.2 Salva DOM renderizado para reruns só de extração
+        if render_cache is not None and response:
+            try:
+                render_cache.salvar(
+                    url=url,
+                    final_url=page.url,
+                    status_code=response.status,
+                    tipo_conteudo=response.headers.get('content-type', 'unknown'),
+                    hash_html=calcular_hash_conteudo(await response.body()),
+                    subrecursos=subrecursos,
+                    dom=await page.content(),
+                    analise_render={
+                        'needs_javascript': site_analysis['needs_javascript'],
+                        'js_detection_reason': site_analysis['js_reason'],
+                        'framework_detected': site_analysis['framework_detected'],
+                        'performance': performance_data,
+                        'headings_ocultos': headings_ocultos,
+                        'diff_js': diff_js
+                    }
+                )
+            except Exception as e:
+                print(f"   ⚠️ Render cache não salvo para {url}: {e}")
         
         # 5. Resultado consolidado
         processing_time = round((time.time() - start_time) * 1000, 2)
@@ -419,6 +932,8 @@ async def process_url_lean(url: str, nivel: int, domain: str, browser_pool: Brow
             
             # SEO Data
             **seo_data,
+            **headings_ocultos,
+            **diff_js,
             
             # Site Analysis
             'needs_javascript': site_analysis['needs_javascript'],
@@ -427,9 +942,14 @@ async def process_url_lean(url: str, nivel: int, domain: str, browser_pool: Brow
             
             # Links e performance
             'links_encontrados': links,
+            'links_todos': links_todos,
             'response_time': processing_time,
             'browser_index': browser_index,
             
+            # Performance de laboratório (Navigation/Resource Timing + LCP/CLS)
+            **performance_data,
+            'render_cache_hit': False,
+            
             # Metadados
             'crawler_version': 'lean_v1.0',
             'extraction_timestamp': time.time()
@@ -450,6 +970,212 @@ async def process_url_lean(url: str, nivel: int, domain: str, browser_pool: Brow
         if page:
             await browser_pool.release_page(page)
 
+# ========================
+# 🧩 PROCESSADOR POR TEMPLATE (K REPRESENTANTES)
+# ========================
+
+async def process_url_clusterizado(url: str, nivel: int, domain: str, browser_pool: BrowserPool,
+                                   clusterizador: ClusterizadorTemplates,
+                                   render_cache: Optional[RenderCache] = None, modo_extracao: str = 'dom') -> Dict:
+    """🧩 Fetch estático barato -> template. Só representantes são renderizados"""
+    
+    start_time = time.time()
+    
+    try:
+        response = await browser_pool.contexts[0].request.get(url, timeout=NAV_TIMEOUT)
+        content_type = response.headers.get('content-type', 'unknown')
+        
+        # Não-HTML ou erro: sem esqueleto para comparar, segue pipeline normal
+        if 'html' not in content_type.lower() or response.status >= 400:
+            return await process_url_lean(url, nivel, domain, browser_pool, render_cache, modo_extracao)
+        
+        html = await response.text()
+        final_url = response.url
+        
+    except Exception:
+        return await process_url_lean(url, nivel, domain, browser_pool, render_cache, modo_extracao)
+    
+    parser = analisar_html_estatico(html)
+    template_id, representante = clusterizador.atribuir(url, parser)
+    estatico = dados_seo_estaticos(parser, final_url, domain)
+    
+    if representante:
+        result = await process_url_lean(url, nivel, domain, browser_pool, render_cache, modo_extracao)
+        clusterizador.registrar_representante(template_id, result, estatico)
+        result.update({
+            'template_id': template_id,
+            'template_representante': True,
+            'dados_extrapolados': False,
+            'achados_template': ''
+        })
+        return result
+    
+    # 📋 Membro: dados estáticos + achados do template propagados (marcados como extrapolados)
+    template = clusterizador.achados_template(template_id)
+    achados = template['achados']
+    
+    return {
+        'url': url,
+        'nivel': nivel,
+        'status_code_http': response.status,
+        'tipo_conteudo': content_type,
+        'final_url': final_url,
+        'redirected': final_url != url,
+        **estatico,
+        'h1_ocultos': 1 if achados.get('h1_oculto') else 0,
+        'needs_javascript': achados.get('precisa_javascript', False),
+        'js_detection_reason': template.get('js_detection_reason', ''),
+        'framework_detected': template.get('framework_detected', 'none'),
+        'response_time': round((time.time() - start_time) * 1000, 2),
+        'template_id': template_id,
+        'template_representante': False,
+        'dados_extrapolados': True,
+        'extrapolado_de': template['representante'],
+        'achados_template': clusterizador.descrever_achados(achados),
+        'crawler_version': 'lean_v1.0',
+        'extraction_timestamp': time.time()
+    }
+
+# ========================
+# 🧵 SHARDING MULTI-PROCESSO
+# ========================
+
+async def _executar_worker_shard(config: Dict) -> Dict:
+    """🧵 Loop de um processo worker: reserva URLs na fronteira compartilhada e renderiza"""
+    
+    worker_id = config['worker_id']
+    domain = config['domain']
+    
+    # sqlite3 é bloqueante (BEGIN IMMEDIATE + busy wait no lock do WAL): uma thread dedicada por shard
+    # mantém a conexão numa thread só e o event loop livre para as páginas em voo
+    executor_fronteira = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'fronteira-{worker_id}')
+    loop = asyncio.get_running_loop()
+    
+    async def _na_fronteira(funcao, *args):
+        return await loop.run_in_executor(executor_fronteira, funcao, *args)
+    
+    fronteira = await _na_fronteira(FronteiraSQLite, config['fronteira_path'], domain, config['max_urls'])
+    render_cache = RenderCache(domain) if config['usar_render_cache'] else None
+    
+    # Clusterização por template é local a cada worker (K representantes por worker)
+    representantes = config['representantes_por_template']
+    clusterizador = ClusterizadorTemplates(representantes) if representantes > 0 else None
+    processadas = [0]
+    
+    async def consumidor(browser_pool: BrowserPool):
+        while True:
+            proxima = await _na_fronteira(fronteira.reservar, worker_id)
+            if not proxima:
+                if await _na_fronteira(fronteira.finalizada):
+                    return
+                # Outros workers ainda podem descobrir links
+                await asyncio.sleep(ESPERA_FRONTEIRA_S)
+                continue
+            
+            url, nivel = proxima
+            if clusterizador:
+                result = await process_url_clusterizado(
+                    url, nivel, domain, browser_pool, clusterizador, render_cache, config['modo_extracao']
+                )
+            else:
+                result = await process_url_lean(url, nivel, domain, browser_pool, render_cache,
+                                                config['modo_extracao'])
+            
+            result['worker_id'] = worker_id
+            links = (result.get('links_encontrados') or []) if nivel < config['max_depth'] else []
+            await _na_fronteira(fronteira.concluir, url, result, links, nivel + 1)
+            processadas[0] += 1
+    
+    try:
+        async with async_playwright() as playwright:
+            browser_pool = BrowserPool(config['browser_pool_size'], modo_cache=config['modo_cache_browser'],
+                                       id_pool=worker_id)
+            await browser_pool.initialize(playwright)
+            try:
+                # Um consumidor por browser: o processo mantém todos os browsers ocupados
+                await asyncio.gather(*[consumidor(browser_pool) for _ in range(browser_pool.size)])
+            finally:
+                await browser_pool.close_all()
+    finally:
+        await _na_fronteira(fronteira.close)
+        executor_fronteira.shutdown()
+    
+    print(f"   🧵 Worker {worker_id}: {processadas[0]} URLs processadas")
+    return {'worker_id': worker_id, 'processadas': processadas[0]}
+
+
+def _worker_shard(config: Dict):
+    """🧵 Ponto de entrada do processo worker (função de módulo para o spawn)"""
+    warnings.filterwarnings("ignore")
+    asyncio.run(_executar_worker_shard(config))
+
+
+def rastrear_multiprocesso(url_inicial: str, max_urls: int, max_depth: int, num_processos: int,
+                           browser_pool_size: int, usar_render_cache: bool, representantes_por_template: int,
+                           modo_cache_browser: Optional[str], modo_extracao: str) -> List[Dict]:
+    """🧵 N processos, cada um com event loop e browser pool próprios, coordenados por SQLite"""
+    
+    domain = urlparse(url_inicial).netloc
+    fronteira_path = os.path.join(FRONTEIRA_DIR, f"{domain.replace('.', '_')}.sqlite")
+    FronteiraSQLite.remover(fronteira_path)
+    
+    fronteira = FronteiraSQLite(fronteira_path, domain, max_urls)
+    fronteira.adicionar_urls([url_inicial], 0)
+    
+    # spawn: Playwright não sobrevive a fork de um processo com event loop
+    ctx = multiprocessing.get_context('spawn')
+    processos = {}
+    for worker_id in range(num_processos):
+        config = {
+            'worker_id': worker_id,
+            'fronteira_path': fronteira_path,
+            'domain': domain,
+            'max_urls': max_urls,
+            'max_depth': max_depth,
+            'browser_pool_size': browser_pool_size,
+            'usar_render_cache': usar_render_cache,
+            'representantes_por_template': representantes_por_template,
+            'modo_cache_browser': modo_cache_browser,
+            'modo_extracao': modo_extracao
+        }
+        processo = ctx.Process(target=_worker_shard, args=(config,), name=f"playwright-shard-{worker_id}")
+        processo.start()
+        processos[worker_id] = processo
+    
+    print(f"🧵 {num_processos} processos worker x {browser_pool_size} browsers | fronteira: {fronteira_path}")
+    
+    try:
+        with tqdm(total=max_urls, desc="🎯 Playwright LEAN Crawling (multi-processo)") as pbar:
+            ativos = dict(processos)
+            while ativos:
+                time.sleep(1)
+                
+                for worker_id, processo in list(ativos.items()):
+                    if processo.is_alive():
+                        continue
+                    del ativos[worker_id]
+                    if processo.exitcode != 0:
+                        devolvidas = fronteira.liberar_worker(worker_id)
+                        print(f"   ⚠️ Worker {worker_id} terminou com código {processo.exitcode}"
+                              f" - {devolvidas} URLs devolvidas à fila")
+                
+                concluidas = fronteira.contar(CONCLUIDA)
+                pbar.update(concluidas - pbar.n)
+        
+        results = fronteira.resultados()
+        stats = fronteira.get_stats()
+        if stats['pendentes']:
+            print(f"   ⚠️ {stats['pendentes']} URLs ficaram na fila (todos os workers encerraram)")
+        print(f"   🧵 URLs por worker: {stats['por_worker']}")
+        return results
+    
+    finally:
+        for processo in processos.values():
+            if processo.is_alive():
+                processo.terminate()
+            processo.join()
+        fronteira.close()
+
 # ========================
 # 📦 URL MANAGER SIMPLES
 # ========================
@@ -530,26 +1256,85 @@ async def rastrear_playwright_profundo(
     max_depth: int = 3,
     forcar_reindexacao: bool = False,
     browser_pool_size: int = BROWSER_POOL_SIZE,
-    perfil_seo: str = 'blog'
+    perfil_seo: str = 'blog',
+    usar_render_cache: bool = True,
+    reextrair: bool = False,
+    representantes_por_template: int = 0,
+    modo_cache_browser: Optional[str] = None,
+    modo_extracao: str = 'dom',
+    num_processos: int = 1
 ) -> List[Dict]:
-    """🚀 Crawler Playwright LEAN - Title V5 Hardened + Pipeline Simples"""
+    """🚀 Crawler Playwright LEAN - Title V5 Hardened + Pipeline Simples
+    
+    reextrair=True ignora o cache de resultados (.pkl) e re-executa só a extração
+    sobre os DOMs do render cache cujo HTML original não mudou.
+    
+    representantes_por_template=K renderiza só K URLs por template (esqueleto do DOM
+    via fetch estático); as demais herdam os achados do template, marcadas como extrapoladas.
+    
+    modo_cache_browser='route' serve CSS/JS/fontes/imagens de um cache do crawler via page.route;
+    'persistente' usa perfis em disco por browser (cache HTTP do Chromium entre páginas e execuções).
+    
+    modo_extracao='snapshot' usa DOMSnapshot.captureSnapshot (estilos computados + layout) para
+    headings vazios/ocultos, texto fora da tela e links invisíveis - inclui CSS externo.
+    
+    num_processos=N > 1 distribui a renderização em N processos (event loop e browser_pool_size
+    browsers cada), coordenados por uma fronteira SQLite; os resultados são unidos aqui.
+    """
+    
+    if modo_extracao not in MODOS_EXTRACAO:
+        raise ValueError(f"modo_extracao inválido: {modo_extracao} (use {MODOS_EXTRACAO})")
     
     # Cache
     domain = urlparse(url_inicial).netloc.replace('.', '_')
     cache_path = f".cache_{domain}_playwright_lean.pkl"
+    render_cache = RenderCache(urlparse(url_inicial).netloc) if usar_render_cache else None
     
     if forcar_reindexacao:
         delete_cache(cache_path)
+        if render_cache:
+            render_cache.limpar()
     
-    if not forcar_reindexacao:
+    if not forcar_reindexacao and not reextrair:
         cached = load_cache(cache_path)
         if cached:
             print(f"♻️ Cache encontrado: {len(cached)} URLs")
             return cached
     
+    # 🔖 Novo escopo do armazém: páginas e DOMs renderizados de crawls anteriores não valem para as abas
+    obter_armazem().iniciar_crawl(url_inicial)
+    
+    if num_processos > 1:
+        print(f"🚀 Crawler Playwright LEAN iniciado! (multi-processo)")
+        inicio = time.time()
+        results = await asyncio.to_thread(
+            rastrear_multiprocesso, url_inicial, max_urls, max_depth, num_processos, browser_pool_size,
+            usar_render_cache, representantes_por_template, modo_cache_browser, modo_extracao
+        )
+        save_cache(cache_path, results)
+        
+        duracao_min = max(time.time() - inicio, 1) / 60
+        titles_captured = len([r for r in results if r.get('title', '').strip()])
+        print(f"\n📊 RELATÓRIO FINAL LEAN (multi-processo):")
+        print(f"   URLs processadas: {len(results)} ({len(results) / duracao_min:.0f} páginas/min)")
+        print(f"   Titles capturados: {titles_captured}/{len(results)}")
+        print(f"   Cache salvo: {cache_path}")
+        return results
+    
     print(f"🚀 Crawler Playwright LEAN iniciado!")
     print(f"📊 Config: {max_urls} URLs, profundidade {max_depth}, {browser_pool_size} browsers")
-    print(f"🔧 Title V5 Hardened: timeout {TITLE_TIMEOUT/1000}s + fallback {FALLBACK_TIMEOUT/1000}s")
+    if modo_extracao == 'snapshot':
+        print(f"📸 Visibilidade via DOMSnapshot (estilos computados + layout)")
+    print(f"🔧 Title V5 Hardened: timeout {TITLE_TIMEOUT/1000}s + fallback {FALLBACK_TIMEOUT/1000}s"
+          f"{' (adaptativo por host/template, teto)' if TIMEOUT_ADAPTATIVO else ''}")
+    ESTIMADOR_TITLE.reset()
+    ESTIMADOR_HEADINGS.reset()
+    if render_cache:
+        print(f"💾 Render cache: {render_cache.dir} ({'re-extração' if reextrair else 'gravação'})")
+    
+    clusterizador = ClusterizadorTemplates(representantes_por_template) if representantes_por_template > 0 else None
+    if clusterizador:
+        print(f"🧩 Clusterização por template: {representantes_por_template} representantes renderizados por template")
     
     # Inicialização
     domain_clean = urlparse(url_inicial).netloc
@@ -559,7 +1344,7 @@ async def rastrear_playwright_profundo(
     results = []
     
     async with async_playwright() as playwright:
-        browser_pool = BrowserPool(browser_pool_size)
+        browser_pool = BrowserPool(browser_pool_size, modo_cache=modo_cache_browser)
         await browser_pool.initialize(playwright)
         
         try:
@@ -574,7 +1359,13 @@ async def rastrear_playwright_profundo(
                     url, nivel = next_url
                     
                     # Processa URL
-                    result = await process_url_lean(url, nivel, domain_clean, browser_pool)
+                    if clusterizador:
+                        result = await process_url_clusterizado(
+                            url, nivel, domain_clean, browser_pool, clusterizador, render_cache, modo_extracao
+                        )
+                    else:
+                        result = await process_url_lean(url, nivel, domain_clean, browser_pool, render_cache,
+                                                        modo_extracao)
                     
                     if result:
                         results.append(result)
@@ -597,6 +1388,11 @@ async def rastrear_playwright_profundo(
         
         finally:
             await browser_pool.close_all()
+            
+            if browser_pool.route_cache:
+                rt_stats = browser_pool.route_cache.get_stats()
+                print(f"🗄️ Cache de subrecursos: {rt_stats['hits']} hits / {rt_stats['misses']} downloads "
+                      f"({rt_stats['hit_rate_percent']}%) | {rt_stats['bytes_servidos_cache'] / 1024 / 1024:.1f} MB não baixados")
     
     # Salva cache
     save_cache(cache_path, results)
@@ -610,6 +1406,22 @@ async def rastrear_playwright_profundo(
     print(f"   Titles capturados: {titles_captured}/{len(results)} ({titles_captured/len(results)*100:.1f}%)")
     print(f"   Sites com JS: {js_sites} ({js_sites/len(results)*100:.1f}%)")
     print(f"   Cache salvo: {cache_path}")
+    if TIMEOUT_ADAPTATIVO:
+        title_stats = ESTIMADOR_TITLE.get_stats()
+        headings_stats = ESTIMADOR_HEADINGS.get_stats()
+        economia_s = (title_stats['espera_economizada_ms'] + headings_stats['espera_economizada_ms']
+                      + ESTIMADOR_TITLE.economia_fallback_ms(FALLBACK_TIMEOUT)) / 1000
+        print(f"   Espera adaptativa: {title_stats['templates_aprendidos']} templates aprendidos | "
+              f"{title_stats['esperas_expiradas']} titles expirados | {economia_s:.0f}s economizados")
+    if clusterizador:
+        cl_stats = clusterizador.get_stats()
+        print(f"   Templates: {cl_stats['templates']} | Renderizadas: {cl_stats['urls_renderizadas']} | "
+              f"Extrapoladas: {cl_stats['urls_extrapoladas']} ({cl_stats['economia_render_percent']}% sem render)")
+    if render_cache:
+        rc_stats = render_cache.get_stats()
+        print(f"   Render cache: {rc_stats['hits']} re-extraídas | {rc_stats['misses']} novas | "
+              f"{rc_stats['invalidados_html'] + rc_stats['invalidados_subrecursos']} invalidadas | "
+              f"{rc_stats['salvos']} salvas ({rc_stats['mb_em_disco']} MB)")
     
     return results
 
@@ -0,0 +1,318 @@
+# deteccao_js.py - Detecção amostral de necessidade de JS por template (não bloqueante)
+# 🧠 Amostra estratificada por template + comparação estático x renderizado + cache por domínio
+
+import asyncio
+import json
+import os
+import time
+import random
+import re
+from urllib.parse import urlparse, urljoin
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from templates_url import chave_template_url
+from clusterizacao_templates import analisar_html_estatico, extrair_links_estaticos
+
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+# 🎯 CONFIGURAÇÕES
+TAMANHO_AMOSTRA = 24          # URLs buscadas estaticamente
+AMOSTRA_RENDERIZADA = 8       # Subconjunto comparado com Playwright (mínimo)
+MAX_AMOSTRA_RENDERIZADA = 24  # Teto quando há mais templates que a amostra mínima
+MAX_CONCORRENCIA = 8
+MAX_RENDER_CONCORRENTE = 3
+VALIDADE_CACHE_DIAS = 7
+LIMIAR_SITE_JS = 20           # % das URLs amostradas em templates que dependem de JS
+CACHE_DIR = "cache"
+
+# Marcadores específicos de apps renderizados no cliente (não substrings genéricas)
+MARCADORES_SPA = [
+    'id="__next"', "id='__next'", 'window.__nuxt__', 'id="__nuxt"', 'data-reactroot',
+    'ng-version=', 'ng-app', 'data-server-rendered', 'id="root"></div>', 'id="app"></div>',
+    'window.__initial_state__', '__gatsby'
+]
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8"
+}
+
+
+def _resumo_estatico(html: str, url: str, domain: str) -> Dict:
+    """📊 Title, headings, links e marcadores SPA do HTML sem JS"""
+    parser = analisar_html_estatico(html)
+    html_lower = html.lower()
+    return {
+        'title': ' '.join(parser.title.split()),
+        'headings': sum(len(t) for t in parser.headings.values()),
+        'h1': len(parser.headings['h1']),
+        'links': len(extrair_links_estaticos(parser.hrefs, url, domain)),
+        'marcadores_spa': [m for m in MARCADORES_SPA if m in html_lower],
+        'hrefs': parser.hrefs
+    }
+
+
+class DetectorJSAmostral:
+    """🧠 Veredito de JS por template com confiança, sem bloquear o event loop"""
+
+    def __init__(self, tamanho_amostra: int = TAMANHO_AMOSTRA,
+                 amostra_renderizada: int = AMOSTRA_RENDERIZADA,
+                 max_concorrencia: int = MAX_CONCORRENCIA,
+                 validade_dias: int = VALIDADE_CACHE_DIAS,
+                 cache_dir: str = CACHE_DIR):
+        self.tamanho_amostra = tamanho_amostra
+        self.amostra_renderizada = amostra_renderizada
+        self.max_concorrencia = max_concorrencia
+        self.validade_dias = validade_dias
+        self.cache_dir = cache_dir
+
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+
+    # ========================
+    # 💾 CACHE POR DOMÍNIO
+    # ========================
+
+    def _arquivo_cache(self, domain: str) -> str:
+        return os.path.join(self.cache_dir, f"{domain}_deteccao_js.json")
+
+    def carregar_cache(self, domain: str) -> Optional[Dict]:
+        path = self._arquivo_cache(domain)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                resultado = json.load(f)
+            idade_dias = (time.time() - resultado.get('gerado_em', 0)) / 86400
+            return resultado if idade_dias <= self.validade_dias else None
+        except Exception:
+            return None
+
+    def salvar_cache(self, domain: str, resultado: Dict):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self._arquivo_cache(domain), "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+
+    # ========================
+    # 🌐 FETCH ESTÁTICO CONCORRENTE
+    # ========================
+
+    def _get(self, url: str) -> Tuple[str, Optional[str], str]:
+        """🌐 GET bloqueante - sempre executado fora do event loop"""
+        try:
+            response = self.session.get(url, timeout=15, verify=False)
+            if 'html' not in response.headers.get('content-type', '').lower():
+                return url, None, response.url
+            return url, response.text, response.url
+        except Exception:
+            return url, None, url
+
+    async def _buscar_estaticos(self, urls: List[str]) -> Dict[str, Dict]:
+        semaforo = asyncio.Semaphore(self.max_concorrencia)
+
+        async def _buscar(url):
+            async with semaforo:
+                return await asyncio.to_thread(self._get, url)
+
+        resultados = await asyncio.gather(*[_buscar(u) for u in urls])
+        return {url: {'html': html, 'final_url': final} for url, html, final in resultados if html}
+
+    def _candidatos_sitemap(self, url_base: str) -> List[str]:
+        """🗺️ URLs do sitemap.xml (se existir) para ampliar a amostra"""
+        try:
+            response = self.session.get(urljoin(url_base, '/sitemap.xml'), timeout=10, verify=False)
+            if response.status_code != 200:
+                return []
+            locs = re.findall(r'<loc>\s*([^<\s]+)\s*</loc>', response.text)
+            # Sitemap index: só a primeira camada de páginas interessa
+            return [loc for loc in locs if not loc.endswith('.xml')][:500]
+        except Exception:
+            return []
+
+    def _amostra_estratificada(self, candidatos: List[str], limite: int) -> List[str]:
+        """🎯 Round-robin entre templates de URL - todos os templates representados"""
+        por_template: Dict[str, List[str]] = {}
+        for url in candidatos:
+            por_template.setdefault(chave_template_url(url), []).append(url)
+
+        rng = random.Random(42)  # Amostra reprodutível entre execuções
+        for urls in por_template.values():
+            rng.shuffle(urls)
+
+        amostra = []
+        while len(amostra) < limite and any(por_template.values()):
+            for template in list(por_template):
+                if por_template[template] and len(amostra) < limite:
+                    amostra.append(por_template[template].pop())
+        return amostra
+
+    # ========================
+    # 🎭 COMPARAÇÃO RENDERIZADA
+    # ========================
+
+    async def _renderizar(self, urls: List[str]) -> Dict[str, Dict]:
+        """🎭 Title, headings e links após JS para o subconjunto"""
+        if not PLAYWRIGHT_AVAILABLE or not urls:
+            return {}
+
+        renderizados = {}
+        semaforo = asyncio.Semaphore(MAX_RENDER_CONCORRENTE)
+
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=True, args=['--no-sandbox', '--disable-dev-shm-usage'])
+            context = await browser.new_context(user_agent=HEADERS['User-Agent'], ignore_https_errors=True)
+
+            async def _render(url):
+                async with semaforo:
+                    page = await context.new_page()
+                    try:
+                        await page.goto(url, wait_until='domcontentloaded', timeout=20000)
+                        try:
+                            await page.wait_for_load_state('networkidle', timeout=8000)
+                        except Exception:
+                            pass
+                        renderizados[url] = await page.evaluate("""
+                            () => ({
+                                title: (document.title || '').trim().replace(/\\s+/g, ' '),
+                                headings: document.querySelectorAll('h1, h2, h3, h4, h5, h6').length,
+                                h1: document.querySelectorAll('h1').length,
+                                links: new Set(Array.from(document.querySelectorAll('a[href]'))
+                                    .map(a => a.href.split('#')[0].split('?')[0])
+                                    .filter(h => h.startsWith(location.origin))).size
+                            })
+                        """)
+                    except Exception:
+                        pass
+                    finally:
+                        await page.close()
+
+            try:
+                await asyncio.gather(*[_render(u) for u in urls])
+            finally:
+                await browser.close()
+
+        return renderizados
+
+    def _diferencas(self, estatico: Dict, renderizado: Dict) -> List[str]:
+        """🔬 Diferenças relevantes para SEO entre estático e renderizado"""
+        motivos = []
+        if renderizado['title'] and renderizado['title'] != estatico['title']:
+            motivos.append('title')
+        if renderizado['h1'] > estatico['h1'] or renderizado['headings'] > estatico['headings'] + 1:
+            motivos.append('headings')
+        if renderizado['links'] > estatico['links'] * 1.5 + 5:
+            motivos.append('links')
+        return motivos
+
+    # ========================
+    # 🧠 VEREDITO
+    # ========================
+
+    async def detectar(self, url_base: str, usar_cache: bool = True) -> Dict:
+        """🧠 Detecção completa: amostra -> fetch concorrente -> render parcial -> veredito"""
+
+        domain = urlparse(url_base).netloc
+        if usar_cache:
+            cached = self.carregar_cache(domain)
+            if cached:
+                print(f"♻️ Detecção JS em cache para {domain} ({len(cached['templates'])} templates)")
+                cached['origem'] = 'cache'
+                return cached
+
+        # 1. Homepage + sitemap como fonte de candidatos (fora do event loop)
+        homepage = await self._buscar_estaticos([url_base])
+        candidatos = await asyncio.to_thread(self._candidatos_sitemap, url_base)
+
+        if url_base in homepage:
+            resumo_home = _resumo_estatico(homepage[url_base]['html'], url_base, domain)
+            candidatos += extrair_links_estaticos(resumo_home['hrefs'], url_base, domain)
+
+        candidatos = list(dict.fromkeys(c for c in candidatos if c != url_base))
+        amostra = [url_base] + self._amostra_estratificada(candidatos, self.tamanho_amostra - 1)
+
+        # 2. Fetch estático concorrente da amostra
+        paginas = {**homepage, **await self._buscar_estaticos([u for u in amostra if u not in homepage])}
+        estaticos = {url: _resumo_estatico(p['html'], p['final_url'], domain) for url, p in paginas.items()}
+
+        # 3. Subconjunto renderizado: 1 URL por template até o teto MAX_AMOSTRA_RENDERIZADA
+        total_templates = len({chave_template_url(url) for url in estaticos})
+        limite_render = min(max(self.amostra_renderizada, total_templates), MAX_AMOSTRA_RENDERIZADA)
+        subconjunto = self._amostra_estratificada(list(estaticos), limite_render)
+        renderizados = await self._renderizar(subconjunto)
+
+        # 4. Veredito por template
+        templates: Dict[str, Dict] = {}
+        for url, estatico in estaticos.items():
+            tpl = templates.setdefault(chave_template_url(url), {
+                'amostras': 0, 'renderizadas': 0, 'com_diferenca': 0,
+                'com_marcador_spa': 0, 'motivos': {}, 'exemplo': url
+            })
+            tpl['amostras'] += 1
+            if estatico['marcadores_spa']:
+                tpl['com_marcador_spa'] += 1
+
+            if url in renderizados:
+                tpl['renderizadas'] += 1
+                motivos = self._diferencas(estatico, renderizados[url])
+                if motivos:
+                    tpl['com_diferenca'] += 1
+                    for motivo in motivos:
+                        tpl['motivos'][motivo] = tpl['motivos'].get(motivo, 0) + 1
+
+        for tpl in templates.values():
+            if tpl['renderizadas']:
+                # Evidência direta: proporção que diverge, confiança cresce com a amostra renderizada
+                proporcao = tpl['com_diferenca'] / tpl['renderizadas']
+                tpl['precisa_js'] = proporcao >= 0.5
+                concordancia = proporcao if tpl['precisa_js'] else 1 - proporcao
+                tpl['confianca'] = round(concordancia * min(1.0, 0.6 + 0.15 * tpl['renderizadas']), 2)
+                tpl['base'] = 'comparacao_render'
+            else:
+                # Só heurística estática: marcadores SPA específicos, confiança baixa
+                proporcao = tpl['com_marcador_spa'] / tpl['amostras']
+                tpl['precisa_js'] = proporcao >= 0.5
+                tpl['confianca'] = 0.4 if proporcao in (0, 1) else 0.25
+                tpl['base'] = 'marcadores_estaticos'
+
+        sem_render = [tpl for tpl, dados in templates.items() if not dados['renderizadas']]
+        if sem_render:
+            print(f"⚠️ Detecção JS: {len(sem_render)} template(s) sem render (veredito por marcadores estáticos): "
+                  f"{', '.join(sem_render[:10])}{' ...' if len(sem_render) > 10 else ''}")
+
+        total_amostras = sum(t['amostras'] for t in templates.values()) or 1
+        urls_js = sum(t['amostras'] for t in templates.values() if t.get('precisa_js'))
+        percentual_js = round(urls_js / total_amostras * 100)
+
+        resultado = {
+            'url_base': url_base,
+            'gerado_em': time.time(),
+            'origem': 'amostra',
+            'total_amostras': len(estaticos),
+            'total_renderizadas': len(renderizados),
+            'percentual_urls_js': percentual_js,
+            'precisa_js': percentual_js >= LIMIAR_SITE_JS,
+            'templates': templates
+        }
+
+        if estaticos:
+            self.salvar_cache(domain, resultado)
+
+        return resultado
+
+
+def resumir_veredito(resultado: Dict) -> str:
+    """📝 Razão legível do veredito do site"""
+    templates_js = [
+        f"{tpl} ({', '.join(dados['motivos']) or dados['base']}, conf. {dados['confianca']:.0%})"
+        for tpl, dados in resultado.get('templates', {}).items() if dados.get('precisa_js')
+    ]
+    if not templates_js:
+        return f"Nenhum template depende de JS ({resultado.get('total_amostras', 0)} URLs amostradas)"
+    return f"{len(templates_js)} template(s) dependem de JS: " + ' | '.join(templates_js[:5])
@@ -0,0 +1,112 @@
+# diff_estatico_renderizado.py - Compara HTML estático (como o bot baixa) x DOM renderizado
+# 🔀 Usa o corpo da resposta da própria navegação - nenhuma requisição extra
+
+from urllib.parse import urlparse
+from typing import Dict, List
+
+from clusterizacao_templates import analisar_html_estatico, dados_seo_estaticos
+
+# Campos de texto comparados diretamente
+CAMPOS_TEXTO = ('title', 'description', 'canonical', 'meta_robots')
+
+SITUACOES = {
+    'SO_RENDERIZADO': 'Só existe após JS - bots sem renderização não veem',
+    'REMOVIDO_POR_JS': 'Existe no HTML, mas o JS remove',
+    'ALTERADO_POR_JS': 'JS troca o valor servido no HTML'
+}
+
+# Gravidade quando o campo depende de JS
+GRAVIDADE_CAMPO = {
+    'title': 'CRITICO',
+    'meta_robots': 'CRITICO',
+    'canonical': 'CRITICO',
+    'h1': 'ALTO',
+    'description': 'ALTO',
+    'links_internos': 'MEDIO'
+}
+
+MAX_AMOSTRA_LINKS = 5
+
+
+def _normalizar(valor) -> str:
+    return ' '.join(str(valor or '').split())
+
+
+def _normalizar_link(url: str) -> str:
+    """🔗 Mesma URL independente de query, fragmento e barra final (crawlers normalizam diferente)"""
+    parsed = urlparse(url)
+    return f"{parsed.netloc}{parsed.path}".rstrip('/').lower()
+
+
+def classificar(estatico: str, renderizado: str) -> str:
+    if estatico == renderizado:
+        return 'IGUAL'
+    if not estatico:
+        return 'SO_RENDERIZADO'
+    if not renderizado:
+        return 'REMOVIDO_POR_JS'
+    return 'ALTERADO_POR_JS'
+
+
+def comparar_estatico_renderizado(estatico: Dict, renderizado: Dict) -> List[Dict]:
+    """🔀 Diferenças campo a campo (só o que muda entre HTML e DOM renderizado)"""
+
+    diffs = []
+
+    def _registrar(campo, valor_estatico, valor_renderizado, situacao, detalhe=''):
+        diffs.append({
+            'campo': campo,
+            'situacao': situacao,
+            'estatico': valor_estatico,
+            'renderizado': valor_renderizado,
+            'detalhe': detalhe,
+            'gravidade': GRAVIDADE_CAMPO.get(campo, 'MEDIO')
+        })
+
+    for campo in CAMPOS_TEXTO:
+        valor_estatico = _normalizar(estatico.get(campo))
+        valor_renderizado = _normalizar(renderizado.get(campo))
+        situacao = classificar(valor_estatico.casefold(), valor_renderizado.casefold())
+        if situacao != 'IGUAL':
+            _registrar(campo, valor_estatico, valor_renderizado, situacao)
+
+    # H1: conjunto de textos (ordem, duplicatas e caixa não importam para o bot)
+    # O lado renderizado deve vir de textContent - innerText aplica text-transform do CSS
+    h1_estatico = [_normalizar(t) for t in estatico.get('h1_texts') or [] if _normalizar(t)]
+    h1_renderizado = [_normalizar(t) for t in renderizado.get('h1_texts') or [] if _normalizar(t)]
+    situacao = classificar(' | '.join(sorted({t.casefold() for t in h1_estatico})),
+                           ' | '.join(sorted({t.casefold() for t in h1_renderizado})))
+    if situacao != 'IGUAL':
+        _registrar('h1', ' | '.join(h1_estatico), ' | '.join(h1_renderizado), situacao)
+
+    # Links internos: só importam os que o bot não descobre sem JS
+    links_estaticos = {_normalizar_link(u) for u in estatico.get('links_encontrados') or []}
+    links_renderizados = {}
+    for url in renderizado.get('links_encontrados') or []:
+        links_renderizados.setdefault(_normalizar_link(url), url)
+    so_renderizados = [url for chave, url in links_renderizados.items() if chave not in links_estaticos]
+    if so_renderizados:
+        _registrar(
+            'links_internos',
+            f"{len(links_estaticos)} links",
+            f"{len(links_renderizados)} links",
+            'SO_RENDERIZADO',
+            f"{len(so_renderizados)} só após JS: " + ', '.join(so_renderizados[:MAX_AMOSTRA_LINKS])
+        )
+
+    return diffs
+
+
+def diff_de_html(html_estatico: str, base_url: str, domain: str, renderizado: Dict) -> Dict:
+    """🔀 Analisa o HTML já baixado na navegação e compara com os dados renderizados"""
+    try:
+        estatico = dados_seo_estaticos(analisar_html_estatico(html_estatico), base_url, domain)
+        diffs = comparar_estatico_renderizado(estatico, renderizado)
+    except Exception as e:
+        return {'diff_js': [], 'elementos_dependentes_js': 0, 'diff_js_erro': str(e)}
+
+    return {
+        'diff_js': diffs,
+        'elementos_dependentes_js': len(diffs),
+        'campos_dependentes_js': ', '.join(d['campo'] for d in diffs)
+    }
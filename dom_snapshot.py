@@ -0,0 +1,230 @@
+# dom_snapshot.py - Visibilidade real via CDP DOMSnapshot (estilos computados + layout)
+# 📸 Uma chamada captureSnapshot por página substitui a varredura heurística de CSS
+
+from typing import Dict, List
+
+# Mesmo critério de vazio do motor de headings (&nbsp;, zero width, BOM)
+from motor_headings import texto_util
+
+# Ordem importa: índices em layout.styles seguem esta lista
+ESTILOS_SNAPSHOT = ['display', 'visibility', 'opacity']
+
+TAGS_HEADING = {'H1', 'H2', 'H3', 'H4', 'H5', 'H6'}
+TAGS_SEM_TEXTO = {'SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE'}
+
+MAX_AMOSTRA_LINKS = 20
+MAX_TEXTO = 100
+
+NODE_ELEMENTO = 1
+NODE_TEXTO = 3
+
+
+def _valor(strings: List[str], indice: int) -> str:
+    return strings[indice] if 0 <= indice < len(strings) else ''
+
+
+def _atributos(strings: List[str], pares: List[int]) -> Dict[str, str]:
+    return {_valor(strings, pares[i]).lower(): _valor(strings, pares[i + 1]) for i in range(0, len(pares) - 1, 2)}
+
+
+def _descrever_elemento(nome: str, attrs: Dict[str, str]) -> str:
+    descricao = f"<{nome.lower()}"
+    if attrs.get('class'):
+        descricao += f" class='{attrs['class']}'"
+    if attrs.get('id'):
+        descricao += f" id='{attrs['id']}'"
+    return descricao + ">"
+
+
+def analisar_snapshot(snapshot: Dict) -> Dict:
+    """📸 Headings vazios/ocultos, texto fora da tela e links invisíveis a partir do snapshot
+
+    Regras de visibilidade (as mesmas do navegador):
+    - sem objeto de layout = display:none (próprio ou herdado)
+    - visibility é herdada pelo estilo computado, então vale a do próprio nó
+    - opacity não é herdada: a efetiva é o produto da cadeia de ancestrais
+    - caixa toda à esquerda/acima da origem = fora da tela (left:-9999px, text-indent)
+    """
+
+    strings = snapshot.get('strings', [])
+    documentos = snapshot.get('documents', [])
+    if not documentos:
+        return resultado_vazio()
+
+    # Só o documento principal (iframes vêm como documentos extras)
+    doc = documentos[0]
+    nodes = doc.get('nodes', {})
+    layout = doc.get('layout', {})
+
+    parents = nodes.get('parentIndex', [])
+    tipos = nodes.get('nodeType', [])
+    nomes = nodes.get('nodeName', [])
+    valores = nodes.get('nodeValue', [])
+    atributos = nodes.get('attributes', [])
+    total = len(parents)
+
+    # node_index -> (estilos, bounds)
+    layout_por_no = {}
+    for node_index, estilos, bounds in zip(layout.get('nodeIndex', []), layout.get('styles', []), layout.get('bounds', [])):
+        layout_por_no[node_index] = (estilos, bounds)
+
+    # Passe único em pré-ordem (pai sempre antes dos filhos)
+    opacidade = [1.0] * total
+    heading_ancestral = [-1] * total
+    ignorado = [False] * total
+    motivo_oculto = [''] * total
+
+    headings: List[int] = []
+    links: List[int] = []
+    textos_heading: Dict[int, List[str]] = {}
+    textos_visiveis_heading: Dict[int, List[str]] = {}
+    textos_fora_da_tela = 0
+
+    for i in range(total):
+        pai = parents[i] if i < len(parents) else -1
+        nome = _valor(strings, nomes[i]).upper() if i < len(nomes) else ''
+        tipo = tipos[i] if i < len(tipos) else 0
+
+        if pai >= 0:
+            opacidade[i] = opacidade[pai]
+            heading_ancestral[i] = heading_ancestral[pai]
+            ignorado[i] = ignorado[pai]
+            motivo_oculto[i] = motivo_oculto[pai]
+
+        info_layout = layout_por_no.get(i)
+
+        if tipo == NODE_ELEMENTO:
+            if nome in TAGS_SEM_TEXTO:
+                ignorado[i] = True
+
+            if info_layout is None:
+                motivo_oculto[i] = motivo_oculto[i] or 'display:none'
+            else:
+                estilos, bounds = info_layout
+                display = _valor(strings, estilos[0]) if len(estilos) > 0 else ''
+                visibility = _valor(strings, estilos[1]) if len(estilos) > 1 else ''
+                try:
+                    opacidade[i] *= float(_valor(strings, estilos[2])) if len(estilos) > 2 else 1.0
+                except ValueError:
+                    pass
+
+                # visibility computada pode ser reaberta por um filho: não herda o motivo
+                if visibility in ('hidden', 'collapse'):
+                    motivo_oculto[i] = 'visibility:hidden'
+                elif motivo_oculto[i] == 'visibility:hidden':
+                    motivo_oculto[i] = ''
+
+                if display == 'none':
+                    motivo_oculto[i] = 'display:none'
+                elif opacidade[i] <= 0.0 and not motivo_oculto[i]:
+                    motivo_oculto[i] = 'opacity:0'
+                elif len(bounds) == 4 and not motivo_oculto[i]:
+                    x, y, largura, altura = bounds
+                    if x + largura <= 0 or y + altura <= 0:
+                        motivo_oculto[i] = 'fora da tela'
+
+            if nome in TAGS_HEADING:
+                headings.append(i)
+                heading_ancestral[i] = i
+                textos_heading[i] = []
+                textos_visiveis_heading[i] = []
+            elif nome == 'A':
+                links.append(i)
+
+        elif tipo == NODE_TEXTO and not ignorado[i]:
+            texto = _valor(strings, valores[i]) if i < len(valores) else ''
+            h = heading_ancestral[i]
+            if h >= 0:
+                textos_heading[h].append(texto)
+            visivel = not motivo_oculto[i] and info_layout is not None
+            if h >= 0 and visivel:
+                textos_visiveis_heading[h].append(texto)
+            if texto_util(texto) and motivo_oculto[i] == 'fora da tela':
+                textos_fora_da_tela += 1
+
+    # 📋 Headings
+    headings_vazios = []
+    headings_ocultos = []
+    posicoes = {tag: 0 for tag in TAGS_HEADING}
+
+    for i in headings:
+        tag = _valor(strings, nomes[i]).upper()
+        posicoes[tag] += 1
+        attrs = _atributos(strings, atributos[i] if i < len(atributos) else [])
+        texto = ''.join(textos_heading[i])
+        texto_visivel = texto_util(''.join(textos_visiveis_heading[i]))
+        pai = parents[i]
+        contexto_pai = _descrever_elemento(_valor(strings, nomes[pai]), _atributos(strings, atributos[pai])) \
+            if pai >= 0 else 'sem pai'
+        atributos_heading = ' '.join(f"{k}='{attrs[k]}'" for k in ('class', 'id') if attrs.get(k)) or 'sem atributos'
+
+        base = {
+            'tag': tag.lower(),
+            'posicao': f'{posicoes[tag]}º {tag} na página',
+            'texto_extraido': texto[:MAX_TEXTO],
+            'contexto_pai': contexto_pai,
+            'atributos_heading': atributos_heading
+        }
+
+        if not texto_util(texto):
+            headings_vazios.append({**base, 'motivo': 'vazio', 'gravidade': 'CRITICO' if tag == 'H1' else 'ALTO'})
+        elif motivo_oculto[i]:
+            headings_ocultos.append({**base, 'motivo': motivo_oculto[i], 'gravidade': 'ALTO' if tag == 'H1' else 'MEDIO'})
+        elif not texto_visivel:
+            # Tem texto no DOM, mas todo ele está em descendentes invisíveis
+            headings_vazios.append({**base, 'motivo': 'vazio visualmente (texto oculto)',
+                                    'gravidade': 'CRITICO' if tag == 'H1' else 'ALTO'})
+
+    # 🔗 Links invisíveis (href presente, elemento oculto)
+    links_invisiveis = []
+    for i in links:
+        attrs = _atributos(strings, atributos[i] if i < len(atributos) else [])
+        href = attrs.get('href', '')
+        if href and not href.startswith(('#', 'javascript:')) and motivo_oculto[i]:
+            links_invisiveis.append({'href': href, 'motivo': motivo_oculto[i]})
+
+    return {
+        'h1_ocultos': len([h for h in headings_ocultos if h['tag'] == 'h1']),
+        'headings_ocultos': len(headings_ocultos),
+        'snapshot_headings_vazios': headings_vazios,
+        'snapshot_headings_ocultos': headings_ocultos,
+        'textos_fora_da_tela': textos_fora_da_tela,
+        'links_invisiveis': len(links_invisiveis),
+        'links_invisiveis_amostra': links_invisiveis[:MAX_AMOSTRA_LINKS],
+        'extracao_snapshot': True
+    }
+
+
+def resultado_vazio() -> Dict:
+    return {
+        'h1_ocultos': 0,
+        'headings_ocultos': 0,
+        'snapshot_headings_vazios': [],
+        'snapshot_headings_ocultos': [],
+        'textos_fora_da_tela': 0,
+        'links_invisiveis': 0,
+        'links_invisiveis_amostra': [],
+        'extracao_snapshot': False
+    }
+
+
+async def capturar_snapshot(page, url: str) -> Dict:
+    """📸 Uma ida e volta CDP: DOM + estilos computados + caixas de layout"""
+
+    cdp = None
+    try:
+        cdp = await page.context.new_cdp_session(page)
+        snapshot = await cdp.send('DOMSnapshot.captureSnapshot', {
+            'computedStyles': ESTILOS_SNAPSHOT,
+            'includeDOMRects': True
+        })
+        return analisar_snapshot(snapshot)
+    except Exception as e:
+        print(f"   ⚠️ Erro no DOMSnapshot de {url}: {e}")
+        return resultado_vazio()
+    finally:
+        if cdp:
+            try:
+                await cdp.detach()
+            except Exception:
+                pass
@@ -0,0 +1,285 @@
+# exporters/analisador_paginas.py - ANALISADOR ÚNICO DE PÁGINAS
+# 📄 Cada URL é baixada e parseada UMA vez; um passe pela árvore alimenta todas as abas
+
+import random
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from bs4 import BeautifulSoup
+from armazem_paginas import ArmazemPaginas, PaginaArmazenada
+from motor_headings import descrever_atributos, descrever_pai
+from scanner_http import VarreduraHTTP, varrer_http
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import warnings
+warnings.filterwarnings("ignore")
+
+TAGS_HEADING = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+METAS_EXTRAIDAS = ('description', 'robots', 'viewport', 'keywords')
+MAX_HTML_TRECHO = 200
+
+
+@dataclass
+class HeadingInfo:
+    """🔠 Heading como as abas usam (texto bruto, trecho HTML, contexto)"""
+    tag: str
+    posicao: int
+    texto: str
+    html: str
+    contexto_pai: str
+    atributos: str
+
+
+@dataclass
+class RegistroPagina:
+    """📄 Features de uma página extraídas num único parse"""
+    url: str
+    sucesso: bool = False
+    erro: str = ''
+    status_code: Optional[int] = None
+    final_url: str = ''
+    content_type: str = ''
+    erro_http: str = ''                     # Mensagem do raise_for_status (4xx/5xx)
+
+    # <title> e metatags (None = tag ausente)
+    title_html: Optional[str] = None
+    title_texto: str = ''
+    metas_html: Dict[str, str] = field(default_factory=dict)
+    metas: Dict[str, str] = field(default_factory=dict)
+    canonical: Optional[str] = None
+
+    # h1..h6 em ordem de documento
+    headings: Dict[str, List[HeadingInfo]] = field(default_factory=lambda: {t: [] for t in TAGS_HEADING})
+
+    # Referências http:// do HTML bruto (HTTP_Inseguro + mixed content), varridas no tokenizer
+    referencias_http: Optional[VarreduraHTTP] = None
+
+    # Resultados de extratores registrados por abas específicas (ex.: mixed content)
+    extras: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def http_ok(self) -> bool:
+        """✅ Equivale a response.raise_for_status() não lançar"""
+        return self.sucesso and not self.erro_http
+
+    @property
+    def erro_acesso(self) -> str:
+        return self.erro or self.erro_http
+
+
+class AnalisadorPaginas:
+    """📄 Fetch + parse únicos por URL, passe único com extratores por tag
+
+    armazem: páginas já guardadas pelo crawl são lidas do disco (sem rede); as baixadas aqui são guardadas
+    """
+
+    def __init__(self, max_workers: int = 15, timeout: int = 15, max_tentativas: int = 3,
+                 armazem: Optional[ArmazemPaginas] = None):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.max_tentativas = max_tentativas
+        self.armazem = armazem
+        self.session = self._criar_sessao()
+
+        # Passe único: nome da tag -> extrator
+        self.extratores_tag: Dict[str, Callable] = {
+            'title': self._extrair_title,
+            'meta': self._extrair_meta,
+            'link': self._extrair_link,
+            **{tag: self._extrair_heading for tag in TAGS_HEADING}
+        }
+
+        # Extratores de abas que precisam da árvore inteira: nome -> funcao(soup, registro)
+        self.extratores_pagina: Dict[str, Callable] = {}
+
+        self.stats = {'fetches': 0, 'erros': 0, 'tentativas_extras': 0, 'documentos': 0, 'fetches_economizados': 0,
+                      'do_armazem': 0}
+
+    def _criar_sessao(self) -> requests.Session:
+        """🚀 Sessão única (keep-alive) para todas as abas"""
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
+        })
+        adapter = requests.adapters.HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def registrar_extrator(self, nome: str, funcao: Callable):
+        """🧩 Registra extrator de aba: funcao(soup, registro) -> valor em registro.extras[nome]"""
+        self.extratores_pagina[nome] = funcao
+
+    # ========================
+    # 🔎 EXTRATORES DO PASSE ÚNICO
+    # ========================
+
+    def _extrair_title(self, tag, registro: RegistroPagina):
+        if registro.title_html is None:
+            registro.title_html = str(tag)[:MAX_HTML_TRECHO]
+            registro.title_texto = tag.get_text()
+
+    def _extrair_meta(self, tag, registro: RegistroPagina):
+        nome = tag.get('name')
+        if nome in METAS_EXTRAIDAS and nome not in registro.metas:
+            registro.metas[nome] = tag.get('content', '')
+            registro.metas_html[nome] = str(tag)[:MAX_HTML_TRECHO]
+
+    def _extrair_link(self, tag, registro: RegistroPagina):
+        if registro.canonical is None and 'canonical' in (tag.get('rel') or []):
+            registro.canonical = tag.get('href', '')
+
+    def _extrair_heading(self, tag, registro: RegistroPagina):
+        lista = registro.headings[tag.name]
+        lista.append(HeadingInfo(
+            tag=tag.name,
+            posicao=len(lista) + 1,
+            texto=tag.get_text(),
+            html=str(tag)[:MAX_HTML_TRECHO],
+            contexto_pai=descrever_pai(tag),
+            atributos=descrever_atributos(tag)
+        ))
+
+    # ========================
+    # 🌐 FETCH + PARSE
+    # ========================
+
+    def _baixar(self, url: str):
+        """🌐 GET com retry e backoff para erros de rede"""
+        for tentativa in range(1, self.max_tentativas + 1):
+            try:
+                self.stats['fetches'] += 1
+                return self.session.get(url, timeout=self.timeout, verify=False, allow_redirects=True)
+            except requests.exceptions.RequestException:
+                if tentativa == self.max_tentativas:
+                    raise
+                self.stats['tentativas_extras'] += 1
+                time.sleep((2 ** tentativa) + random.uniform(0, 1))
+
+    def _obter_pagina(self, url: str) -> PaginaArmazenada:
+        """📦 Armazém primeiro; GET só em miss (e a resposta vai para o armazém)"""
+        if self.armazem is not None:
+            pagina = self.armazem.obter(url)
+            if pagina is not None:
+                self.stats['do_armazem'] += 1
+                return pagina
+            return self.armazem.guardar_resposta(url, self._baixar(url))
+        return PaginaArmazenada.de_resposta(url, self._baixar(url))
+
+    def analisar_url(self, url: str, extratores_extras: Optional[Dict[str, Callable]] = None) -> RegistroPagina:
+        """📄 Baixa, parseia e percorre a árvore uma vez"""
+
+        registro = RegistroPagina(url=url)
+
+        try:
+            pagina = self._obter_pagina(url)
+            registro.status_code = pagina.status_code
+            registro.final_url = pagina.final_url
+            registro.content_type = pagina.content_type
+            registro.erro_http = pagina.erro_http
+
+            registro.referencias_http = varrer_http(pagina.conteudo, url, pagina.encoding)
+
+            soup = BeautifulSoup(pagina.conteudo, 'html.parser')
+
+            for tag in soup.find_all(True):
+                extrator = self.extratores_tag.get(tag.name)
+                if extrator:
+                    extrator(tag, registro)
+
+            registro.sucesso = True
+
+            for nome, funcao in {**self.extratores_pagina, **(extratores_extras or {})}.items():
+                try:
+                    registro.extras[nome] = funcao(soup, registro)
+                except Exception as e:
+                    registro.extras[nome] = {'url': url, 'sucesso': False, 'erro': str(e)}
+
+        except Exception as e:
+            self.stats['erros'] += 1
+            registro.erro = str(e)
+
+        return registro
+
+    def _registro_para(self, registro: RegistroPagina, url: str) -> RegistroPagina:
+        """🔁 Registro do documento final entregue a uma URL de origem (cópia rasa, extras com a URL de origem)"""
+        if registro.url == url:
+            return registro
+        extras = {
+            nome: {**valor, 'url': url} if isinstance(valor, dict) and valor.get('url') == registro.url else valor
+            for nome, valor in registro.extras.items()
+        }
+        return replace(registro, url=url, extras=extras)
+
+    def analisar(self, urls: List[str], urls_finais: Optional[Dict[str, str]] = None) -> Dict[str, RegistroPagina]:
+        """🚀 Analisa URLs em paralelo - um fetch + parse por documento final, um registro por URL
+
+        urls_finais: {url: final_url} (crawl ou cadeias de redirect). Variações http/https,
+        www e barra final que caem no mesmo documento são analisadas uma vez só.
+        """
+
+        urls_unicas = list(dict.fromkeys(
+            str(u).strip() for u in urls if u and str(u).strip().startswith(('http://', 'https://'))
+        ))
+        destinos = {url: _url_final(url, urls_finais) for url in urls_unicas}
+        documentos = list(dict.fromkeys(destinos.values()))
+        print(f"📄 Analisador único: {len(urls_unicas)} URLs -> {len(documentos)} documentos finais "
+              f"(1 fetch + 1 parse por documento)")
+
+        por_documento: Dict[str, RegistroPagina] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_url = {executor.submit(self.analisar_url, url): url for url in documentos}
+            for future in as_completed(future_to_url):
+                registro = future.result()
+                por_documento[registro.url] = registro
+                if len(por_documento) % 50 == 0:
+                    print(f"⚡ Analisados: {len(por_documento)}/{len(documentos)}")
+
+        registros = {url: self._registro_para(por_documento[destinos[url]], url) for url in urls_unicas}
+
+        self.stats['documentos'] += len(documentos)
+        self.stats['fetches_economizados'] += len(urls_unicas) - len(documentos)
+        print(f"   ✅ Registros: {len(registros)} | erros de acesso: {self.stats['erros']} | "
+              f"do armazém (sem rede): {self.stats['do_armazem']}")
+        print(f"   ♻️ Fetches + parses economizados: {len(urls_unicas) - len(documentos)} "
+              f"(URLs que redirecionam para um documento já analisado)")
+        return registros
+
+
+def _url_final(url: str, urls_finais: Optional[Dict[str, str]]) -> str:
+    final = (urls_finais or {}).get(url)
+    if isinstance(final, str) and final.strip().startswith(('http://', 'https://')):
+        return final.strip()
+    return url
+
+
+def mapear_urls_finais(df=None, cadeias=None) -> Dict[str, str]:
+    """🎯 {url: final_url} a partir do crawl (coluna final_url) e das cadeias de redirect (prioridade)"""
+    urls_finais: Dict[str, str] = {}
+
+    if df is not None and 'final_url' in getattr(df, 'columns', []):
+        for url, final in zip(df['url'], df['final_url']):
+            if isinstance(url, str) and isinstance(final, str) and final.strip():
+                urls_finais[url.strip()] = final.strip()
+
+    for url, cadeia in (cadeias or {}).items():
+        if cadeia.saltos and cadeia.status_final is not None and not (cadeia.loop or cadeia.excedeu_limite):
+            urls_finais[url] = cadeia.url_final
+
+    return urls_finais
+
+
+_ANALISADOR_PADRAO: Optional[AnalisadorPaginas] = None
+
+
+def analisar_pagina(url: str, extratores_extras: Optional[Dict[str, Callable]] = None) -> RegistroPagina:
+    """📄 Registro avulso (abas usadas sem o passe único)"""
+    global _ANALISADOR_PADRAO
+    if _ANALISADOR_PADRAO is None:
+        _ANALISADOR_PADRAO = AnalisadorPaginas()
+    return _ANALISADOR_PADRAO.analisar_url(url, extratores_extras)
@@ -1,9 +1,80 @@
+import threading
+
 import pandas as pd
 
 class BaseSheetExporter:
-    def __init__(self, df: pd.DataFrame, writer):
+    def __init__(self, df: pd.DataFrame, writer, registros=None, cadeias=None):
         self.df = df
         self.writer = writer
+        # Dict[url, RegistroPagina] do AnalisadorPaginas (None = a aba busca cada URL)
+        self.registros = registros
+        # Dict[url, CadeiaRedirect] do ResolvedorRedirects (None = a aba resolve cada URL)
+        self.cadeias = cadeias
+        self._resolvedor = None
+        self._lock_resolvedor = threading.Lock()
+        # {aba: (DataFrame, escrita)} enquanto calcular() roda (None = export() grava direto no writer)
+        self._abas = None
+
+    def __getstate__(self):
+        """📦 Para calcular em outro processo: sem writer nem locks (a gravação fica no processo principal)"""
+        estado = self.__dict__.copy()
+        estado.update(writer=None, _resolvedor=None, _lock_resolvedor=None)
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self._lock_resolvedor = threading.Lock()
+
+    def _registro(self, url: str, extratores_extras=None):
+        """📄 Registro da página: do passe único se houver, senão fetch + parse agora"""
+        if self.registros is not None and url in self.registros:
+            return self.registros[url]
+        from exporters.analisador_paginas import analisar_pagina
+        return analisar_pagina(url, extratores_extras)
+
+    def _cadeia_http(self, url: str, timeout: int = 10):
+        """🔗 Cadeia de redirects da URL: da resolução compartilhada se houver, senão resolve agora (HEAD salto a salto)"""
+        if self.cadeias is not None and url in self.cadeias:
+            return self.cadeias[url]
+        with self._lock_resolvedor:
+            if self._resolvedor is None:
+                from resolvedor_redirects import ResolvedorRedirects
+                self._resolvedor = ResolvedorRedirects(session=getattr(self, 'session', None), timeout=timeout)
+        return self._resolvedor.resolver(url)
+
+    # ========================
+    # 📤 CÁLCULO x GRAVAÇÃO
+    # ========================
+
+    def _gravar(self, df_aba: pd.DataFrame, sheet_name: str, escrita: str = None):
+        """📤 Grava a aba agora (export avulso) ou guarda para o escritor único (calcular)
+
+        escrita: nome do método que grava a aba com formatação própria (padrão: to_excel simples)
+        """
+        if self._abas is not None:
+            self._abas[sheet_name] = (df_aba, escrita)   # Última gravação da aba prevalece
+            return
+        self._escrever(df_aba, sheet_name, escrita)
+
+    def _escrever(self, df_aba: pd.DataFrame, sheet_name: str, escrita: str = None):
+        if escrita:
+            getattr(self, escrita)(df_aba)
+        else:
+            df_aba.to_excel(self.writer, index=False, sheet_name=sheet_name)
+
+    def calcular(self) -> dict:
+        """🧮 Roda o export sem tocar no workbook: {aba: (DataFrame, escrita)} para gravar depois"""
+        self._abas = {}
+        try:
+            self.export()
+            return self._abas
+        finally:
+            self._abas = None
+
+    def gravar(self, abas: dict):
+        """📤 Escreve no writer as abas devolvidas por calcular()"""
+        for sheet_name, (df_aba, escrita) in abas.items():
+            self._escrever(df_aba, sheet_name, escrita)
 
     def export(self):
         raise NotImplementedError("Subclasse deve implementar export()")
@@ -0,0 +1,158 @@
+# exporters/duplicatas.py - DETECÇÃO VETORIZADA DE DUPLICATAS (title, description, H1, H2...)
+# 🔍 Normaliza texto -> chave (factorize) -> groupby em NumPy; escala para centenas de milhares de páginas
+
+import unicodedata
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+
+# 'espacos': só colapsa espaços (mesmo critério das abas: ' '.join(texto.split()))
+# 'agressiva': espaços + casefold + sem acentos ("Início" == "inicio")
+MODOS_NORMALIZACAO = ('espacos', 'agressiva')
+
+EXTENSOES_NAO_HTML = (
+    '.pdf', '.jpg', '.jpeg', '.png', '.gif', '.zip', '.rar',
+    '.js', '.css', '.mp3', '.mp4', '.xml', '.json'
+)
+
+PARAMETROS_PAGINACAO = (
+    '?page=', '&page=', '?p=', '&p=',
+    '?pagina=', '&pagina=', '?pg=', '&pg=',
+    '/page/', '/p/', '/pagina/', '/pg/',
+    '?offset=', '&offset=', '?start=', '&start=',
+    '?pagenum=', '&pagenum=', '?paged=', '&paged='
+)
+
+COLUNAS_GRUPOS = ['chave', 'texto', 'total', 'urls', 'url_representativa']
+
+
+def _normalizar(texto: str, modo: str) -> str:
+    normalizado = ' '.join(texto.split())
+    if modo == 'agressiva':
+        normalizado = ''.join(
+            c for c in unicodedata.normalize('NFKD', normalizado) if not unicodedata.combining(c)
+        ).casefold()
+    return normalizado
+
+
+def _chaves_unicas(unicos: np.ndarray, modo: str) -> np.ndarray:
+    """🔑 Código da chave normalizada para cada valor distinto (normaliza uma vez por valor)"""
+    if modo not in MODOS_NORMALIZACAO:
+        raise ValueError(f"Modo de normalização inválido: {modo} (use {MODOS_NORMALIZACAO})")
+
+    normalizados = np.array([_normalizar(str(texto), modo) for texto in unicos], dtype=object)
+    chaves, _ = pd.factorize(normalizados, sort=False)
+    return chaves
+
+
+def detectar_duplicatas(df: pd.DataFrame, campo: str, coluna_url: str = 'url',
+                        min_caracteres: int = 0, modo: str = 'espacos', min_urls: int = 2) -> pd.DataFrame:
+    """🔍 Grupos de linhas com o mesmo texto normalizado
+
+    Cada linha (url, texto) conta uma vez: a mesma URL repetindo o texto (ex.: dois H1
+    iguais) entra duas vezes, como nos mapas texto -> [urls] das abas.
+    Grupos e URLs seguem a ordem da primeira aparição; 'texto' é o da primeira linha.
+    """
+
+    if df.empty or campo not in df.columns:
+        return pd.DataFrame(columns=COLUNAS_GRUPOS)
+
+    # Arrays object: iterar o dtype str do pandas custa mais que a própria normalização
+    textos = df[campo].to_numpy(dtype=object)
+    urls = df[coluna_url].to_numpy(dtype=object)
+
+    # Hash table sobre o texto bruto (nulos = -1); tamanho e normalização por valor distinto
+    codigos_brutos, unicos = pd.factorize(textos, sort=False)
+    if not len(unicos):
+        return pd.DataFrame(columns=COLUNAS_GRUPOS)
+
+    tamanhos = np.fromiter((len(str(texto)) for texto in unicos), dtype=np.int64, count=len(unicos))
+    validos = codigos_brutos >= 0
+    validos[validos] = tamanhos[codigos_brutos[validos]] > min_caracteres
+
+    if not validos.any():
+        return pd.DataFrame(columns=COLUNAS_GRUPOS)
+
+    textos = textos[validos]
+    urls = urls[validos]
+
+    # Chave exata: factorize do texto normalizado (sem colisão de hash), numerada pela 1ª aparição
+    codigos = _chaves_unicas(unicos, modo)[codigos_brutos[validos]]
+    codigos, _ = pd.factorize(codigos, sort=False)
+    contagens = np.bincount(codigos)
+
+    duplicadas = contagens[codigos] >= min_urls
+    if not duplicadas.any():
+        return pd.DataFrame(columns=COLUNAS_GRUPOS)
+
+    codigos = codigos[duplicadas]
+    urls = urls[duplicadas]
+    textos_originais = textos[duplicadas]
+
+    # Ordena por grupo mantendo a ordem das linhas dentro de cada grupo
+    ordem = np.argsort(codigos, kind='stable')
+    codigos_ordenados = codigos[ordem]
+    inicios = np.flatnonzero(np.r_[True, codigos_ordenados[1:] != codigos_ordenados[:-1]])
+    listas_urls = np.split(urls[ordem], inicios[1:])
+
+    grupos = pd.DataFrame({
+        'chave': codigos_ordenados[inicios],
+        'texto': textos_originais[ordem][inicios],
+        'total': np.diff(np.r_[inicios, len(ordem)]),
+        'urls': [lista.tolist() for lista in listas_urls],
+    })
+    grupos['url_representativa'] = [lista[0] for lista in grupos['urls']]
+
+    # factorize numera pela primeira aparição: ordenar pela chave = ordem de aparição
+    return grupos.sort_values('chave', kind='stable').reset_index(drop=True)
+
+
+def grupos_para_dict(grupos: pd.DataFrame) -> Dict[str, List[str]]:
+    """📋 Formato usado pelas abas: {texto: [urls]}"""
+    return dict(zip(grupos['texto'], grupos['urls']))
+
+
+def filtrar_urls_paginas_200(df: pd.DataFrame, excluir_paginacao: bool = True) -> List[str]:
+    """🧹 URLs HTML com status 200 (e sem paginação), sem iterrows
+
+    Mesmo critério do filtro linha a linha das abas: usa status_code_http se a coluna
+    existir (senão status_code); status não numérico descarta a URL, None mantém.
+    """
+
+    if df.empty or 'url' not in df.columns:
+        return []
+
+    urls = df['url']
+    mascara = urls.notna().to_numpy() & (urls.astype(str) != '').to_numpy()
+    urls_str = urls.astype(str).str.strip()
+    urls_lower = urls_str.str.lower()
+
+    mascara = mascara & urls_str.str.startswith(('http://', 'https://')).to_numpy()
+    mascara = mascara & ~urls_lower.str.endswith(EXTENSOES_NAO_HTML).to_numpy()
+
+    # 🎯 SÓ PÁGINAS 200 OK (int(float(status)) == 200)
+    coluna_status = 'status_code_http' if 'status_code_http' in df.columns else \
+        'status_code' if 'status_code' in df.columns else None
+    if coluna_status:
+        status = df[coluna_status]
+        sem_status = np.equal(status.to_numpy(dtype=object), None)
+        status_num = pd.to_numeric(status, errors='coerce').to_numpy(dtype=float)
+        with np.errstate(invalid='ignore'):
+            eh_200 = np.trunc(status_num) == 200
+        mascara = mascara & (sem_status | eh_200)
+
+    # 🚫 FILTRO PAGINAÇÃO
+    if excluir_paginacao:
+        paginacao = np.zeros(len(df), dtype=bool)
+        for parametro in PARAMETROS_PAGINACAO:
+            paginacao = paginacao | urls_lower.str.contains(parametro, regex=False).to_numpy()
+        paginacao = paginacao & mascara
+
+        total_paginacao = int(paginacao.sum())
+        if total_paginacao:
+            exemplos = ', '.join(urls_str[paginacao].head(3))
+            print(f"      🚫 Filtradas (paginação): {total_paginacao} URLs (ex.: {exemplos})")
+        mascara = mascara & ~paginacao
+
+    return list(dict.fromkeys(urls_str[mascara]))
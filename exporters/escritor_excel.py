@@ -0,0 +1,48 @@
+# escritor_excel.py - Writer do relatório em modo constant_memory (xlsxwriter)
+# 💾 Cada linha vai para o disco quando a próxima começa: memória por linha, não pelo workbook inteiro
+
+from operator import attrgetter
+
+import pandas as pd
+
+try:
+    from pandas.io.excel._xlsxwriter import XlsxWriter
+    ESCRITOR_STREAMING_AVAILABLE = True
+except ImportError:
+    XlsxWriter = object
+    ESCRITOR_STREAMING_AVAILABLE = False
+
+
+class EscritorExcelStreaming(XlsxWriter):
+    """💾 pd.ExcelWriter xlsxwriter com constant_memory; células de cada to_excel gravadas em ordem de linha
+
+    O pandas gera o corpo coluna a coluna, e no constant_memory o xlsxwriter descarta (sem erro)
+    qualquer célula de uma linha já gravada - por isso cada bloco é ordenado por (linha, coluna).
+    Abas que escrevem direto no worksheet precisam fazê-lo numa passada só, de cima para baixo.
+    """
+
+    def __init__(self, path, engine_kwargs=None, **kwargs):
+        engine_kwargs = dict(engine_kwargs or {})
+        engine_kwargs['options'] = {**engine_kwargs.get('options', {}), 'constant_memory': True}
+        super().__init__(path, engine_kwargs=engine_kwargs, **kwargs)
+        self._ultima_linha = {}
+
+    def _write_cells(self, cells, sheet_name=None, startrow=0, *args, **kwargs):
+        ordenadas = sorted(cells, key=attrgetter('row', 'col'))
+
+        if ordenadas:
+            nome = self._get_sheet_name(sheet_name)
+            primeira = startrow + ordenadas[0].row
+            ultima = self._ultima_linha.get(nome)
+            if ultima is not None and primeira < ultima:
+                print(f"⚠️ Aba '{nome}': linhas {primeira}-{ultima} já foram gravadas (constant_memory) - células ignoradas")
+            self._ultima_linha[nome] = max(ultima or 0, startrow + ordenadas[-1].row)
+
+        super()._write_cells(ordenadas, sheet_name, startrow, *args, **kwargs)
+
+
+def abrir_escritor_excel(output_path: str, streaming: bool = True):
+    """📂 Writer do relatório: streaming (constant_memory) quando disponível, senão o xlsxwriter padrão"""
+    if streaming and ESCRITOR_STREAMING_AVAILABLE:
+        return EscritorExcelStreaming(output_path)
+    return pd.ExcelWriter(output_path, engine="xlsxwriter")
@@ -1,6 +1,8 @@
 # excel_manager.py - ATUALIZADO COM MIXED CONTENT SHEET ENGINE
 
 import os
+import re
+import time
 import pandas as pd
 import numpy as np
 import logging
@@ -54,10 +56,41 @@ def safe_clean_value(x):
         except:
             return ''
 
+# Caracteres de controle removidos das strings (\t \n \r ficam) e limite de texto por célula
+CARACTERES_CONTROLE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+MAX_TEXTO_CELULA = 500
+
+def _limpar_coluna(serie):
+    """🧹 safe_clean_value em lote: strings vetorizadas, nulos viram '', o resto célula a célula"""
+    
+    valores = serie.to_numpy(dtype=object)
+    eh_str = np.fromiter((type(v) is str for v in valores), dtype=bool, count=len(valores))
+    nulo = pd.isna(valores) & ~eh_str
+    resto = ~(eh_str | nulo)
+    
+    limpos = np.empty(len(valores), dtype=object)
+    if eh_str.any():
+        textos = pd.Series(valores[eh_str], dtype=object)
+        # Uma busca na coluna inteira: quase sempre não há controle e nada é reescrito
+        if CARACTERES_CONTROLE.search(''.join(textos)):
+            textos = textos.str.replace(CARACTERES_CONTROLE, '', regex=True)
+        longos = (textos.str.len() > MAX_TEXTO_CELULA).to_numpy()
+        if longos.any():
+            textos[longos] = textos[longos].str.slice(0, MAX_TEXTO_CELULA) + '...'
+        limpos[eh_str] = textos.to_numpy(dtype=object)
+    limpos[nulo] = ''
+    if resto.any():
+        # Listas, dicts, arrays, números, subclasses de str: mesma regra de antes
+        limpos[resto] = [safe_clean_value(v) for v in valores[resto]]
+    
+    # Sem dtype explícito: o pandas infere igual ao .apply(safe_clean_value) de antes
+    return pd.Series(limpos, index=serie.index, name=serie.name)
+
 def clean_dataframe_for_excel(df):
-    """🧹 Limpa DataFrame para exportação segura no Excel"""
+    """🧹 Limpa DataFrame para exportação segura no Excel (colunas object, vetorizado)"""
     
-    df_clean = df.copy()
+    # Cópia rasa: colunas não-object não são tocadas, as limpas são substituídas inteiras
+    df_clean = df.copy(deep=False)
     logger.info(f"🧹 Limpando DataFrame: {len(df_clean)} linhas, {len(df_clean.columns)} colunas")
     
     for col in df_clean.columns:
@@ -70,10 +103,22 @@ def clean_dataframe_for_excel(df):
                 if isinstance(sample_value, (list, dict, tuple, set)):
                     logger.warning(f"⚠️ Coluna {col} contém objetos complexos - convertendo para string")
                 
-            df_clean[col] = df_clean[col].apply(safe_clean_value)
+            df_clean[col] = _limpar_coluna(df_clean[col])
     
     return df_clean
 
+def _gravar_aba_vazia(writer, df_clean, aba, classe, colunas_vazia):
+    """📄 Aba cuja engine falhou: _criar_aba_vazia() da engine, senão DataFrame com as colunas mínimas"""
+    
+    if colunas_vazia is None:
+        # Resumo: dados completos do crawl
+        df_clean.to_excel(writer, sheet_name=aba, index=False)
+        return
+    try:
+        classe(df_clean, writer)._criar_aba_vazia()
+    except:
+        pd.DataFrame(colunas_vazia).to_excel(writer, sheet_name=aba, index=False)
+
 def exportar_relatorio_completo(df, df_http, auditorias, output_path):
     """📊 Exporta relatório completo - TODAS AS ENGINES CIRÚRGICAS + MIXED CONTENT"""
     
@@ -137,6 +182,18 @@ def exportar_relatorio_completo(df, df_http, auditorias, output_path):
             from exporters.sheets.http_inseguro_sheet import HTTPInseguroSheet
             # 🔒 NOVA SHEET ENGINE - SIMPLES E LIMPA
             from exporters.sheets.mixed_content_sheet import MixedContentSheet
+            # 📈 PERFORMANCE DE LABORATÓRIO (métricas do crawler Playwright)
+            from exporters.sheets.performance_sheet import PerformanceSheet
+            # 🧩 TEMPLATES (clusterização por esqueleto do DOM)
+            from exporters.sheets.templates_sheet import TemplatesSheet
+            # 🔀 JS DEPENDENTE (HTML estático x DOM renderizado)
+            from exporters.sheets.js_dependente_sheet import JSDependenteSheet
+            # 🎯 CANIBALIZAÇÃO (titles/H1 quase idênticos)
+            from exporters.sheets.canibalizacao_sheet import CanibalizacaoSheet
+            # 🕸️ LINKS INTERNOS (grafo, profundidade de clique, órfãs, PageRank)
+            from exporters.sheets.links_internos_sheet import LinksInternosSheet
+            # 🔗 LINKS QUEBRADOS (todos os <a href>, destinos únicos, cache em disco)
+            from exporters.sheets.links_quebrados_sheet import LinksQuebradosSheet
             EXPORTERS_AVAILABLE = True
             print("✅ Exportadores especializados disponíveis (TODAS AS ENGINES + MIXED CONTENT)")
         except ImportError as e:
@@ -146,7 +203,10 @@ def exportar_relatorio_completo(df, df_http, auditorias, output_path):
         print("📋 Iniciando exportação Excel - VERSÃO CIRÚRGICA COMPLETA + MIXED CONTENT...")
         
         # 🔒 CONTEXT MANAGER + TODAS AS ABAS DIRETAS
-        with pd.ExcelWriter(output_path, engine="xlsxwriter") as writer:
+        # 💾 constant_memory: cada linha vai para o disco ao ser concluída (memória não cresce com o crawl)
+        from exporters.escritor_excel import abrir_escritor_excel
+        
+        with abrir_escritor_excel(output_path) as writer:
             
             # Configurações básicas
             if hasattr(writer, 'book'):
@@ -154,190 +214,185 @@ def exportar_relatorio_completo(df, df_http, auditorias, output_path):
             
             if EXPORTERS_AVAILABLE:
                 # 📊 TODAS AS ENGINES CIRÚRGICAS ATIVAS
+                # ⚡ Cálculo concorrente respeitando dependências; gravação sequencial na ordem canônica
+                from exporters.orquestrador_abas import OrquestradorAbas
+                orquestrador = OrquestradorAbas()
+                
+                # 🔗 CADEIAS DE REDIRECT: salto a salto (HEAD), uma vez para todas as abas de status
+                def resolver_cadeias(_):
+                    try:
+                        from resolvedor_redirects import ResolvedorRedirects
+                        return ResolvedorRedirects().resolver_todas(df_clean['url'].dropna().astype(str).str.strip().unique().tolist())
+                    except Exception as e:
+                        print(f"   ⚠️ Resolvedor de redirects indisponível, abas resolvem cada URL: {e}")
+                        return None
+                
+                # 📄 ANALISADOR ÚNICO: 1 fetch + 1 parse por documento final alimenta as abas de conteúdo
+                mixed_content = MixedContentSheet(df_clean, writer)
+                
+                def analisar_paginas(dependencias):
+                    try:
+                        from armazem_paginas import obter_armazem
+                        from exporters.analisador_paginas import AnalisadorPaginas, mapear_urls_finais
+                        # Páginas guardadas pelo crawl não são baixadas de novo
+                        analisador = AnalisadorPaginas(armazem=obter_armazem())
+                        analisador.registrar_extrator('mixed_content', mixed_content.extrair_de_registro)
+                        # Variações que redirecionam para o mesmo documento final: 1 análise, resultado replicado
+                        registros = analisador.analisar(df_clean['url'].dropna().unique().tolist(),
+                                                        urls_finais=mapear_urls_finais(df_clean, dependencias['cadeias']))
+                        mixed_content.registros = registros
+                        return registros
+                    except Exception as e:
+                        print(f"   ⚠️ Analisador único indisponível, abas buscam cada URL: {e}")
+                        return None
+                
+                orquestrador.etapa('cadeias', resolver_cadeias)
+                orquestrador.etapa('registros', analisar_paginas, depende_de=('cadeias',))
+                
+                # (aba, engine, mensagem de sucesso, colunas da aba vazia) na ordem em que vão para o workbook
+                ordem_abas = []
+                
+                def registrar(aba, classe, criar_motor, depende_de=(), mensagem='', colunas_vazia=None, processo=False):
+                    orquestrador.aba(aba, criar_motor, depende_de, processo=processo)
+                    ordem_abas.append((aba, classe, mensagem, colunas_vazia))
+                
+                CADEIAS = ('cadeias',)
+                REGISTROS = ('registros',)
                 
                 # 1. ABA RESUMO
-                try:
-                    ResumoSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'Resumo' criada")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba Resumo: {e}")
-                    df_clean.to_excel(writer, sheet_name='Resumo', index=False)
+                registrar('Resumo', ResumoSheet, lambda d: ResumoSheet(df_clean, writer),
+                          mensagem="   ✅ Aba 'Resumo' criada")
                 
                 # 2. ABA STATUS HTTP CIRÚRGICA
-                try:
-                    StatusHTTPSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'Status_HTTP' criada (CIRÚRGICA)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba Status_HTTP: {e}")
-                    try:
-                        StatusHTTPSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'status': []}).to_excel(writer, sheet_name='Status_HTTP', index=False)
+                registrar('Status_HTTP', StatusHTTPSheet, lambda d: StatusHTTPSheet(df_clean, writer, cadeias=d['cadeias']), CADEIAS,
+                          "   ✅ Aba 'Status_HTTP' criada (CIRÚRGICA)", {'url': [], 'status': []})
                 
                 # 3. ABA METATAGS CIRÚRGICA
-                try:
-                    MetatagsSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'Metatags' criada (CIRÚRGICA)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba Metatags: {e}")
-                    try:
-                        MetatagsSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'title': [], 'description': []}).to_excel(writer, sheet_name='Metatags', index=False)
+                registrar('Metatags', MetatagsSheet, lambda d: MetatagsSheet(df_clean, writer, registros=d['registros']), REGISTROS,
+                          "   ✅ Aba 'Metatags' criada (CIRÚRGICA)", {'url': [], 'title': [], 'description': []})
                 
                 # 4. ABA ESTRUTURA HEADINGS CIRÚRGICA
-                try:
-                    HeadingsEstruturaSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'Estrutura_Headings' criada (CIRÚRGICA)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba Estrutura_Headings: {e}")
-                    try:
-                        HeadingsEstruturaSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'estrutura': []}).to_excel(writer, sheet_name='Estrutura_Headings', index=False)
+                registrar('Estrutura_Headings', HeadingsEstruturaSheet,
+                          lambda d: HeadingsEstruturaSheet(df_clean, writer, registros=d['registros']), REGISTROS,
+                          "   ✅ Aba 'Estrutura_Headings' criada (CIRÚRGICA)", {'url': [], 'estrutura': []})
                 
                 # 5. ABA H1 H2 PROBLEMAS CIRÚRGICA
-                try:
-                    H1H2ProblemasSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'H1_H2_Problemas' criada (CIRÚRGICA)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba H1_H2_Problemas: {e}")
-                    try:
-                        H1H2ProblemasSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'problema': []}).to_excel(writer, sheet_name='H1_H2_Problemas', index=False)
+                registrar('H1_H2_Problemas', H1H2ProblemasSheet,
+                          lambda d: H1H2ProblemasSheet(df_clean, writer, registros=d['registros']), REGISTROS,
+                          "   ✅ Aba 'H1_H2_Problemas' criada (CIRÚRGICA)", {'url': [], 'problema': []})
                 
                 # 6. ABA HEADINGS VAZIOS CIRÚRGICA
-                try:
-                    HeadingsVaziosSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'Headings_Vazios' criada (CIRÚRGICA)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba Headings_Vazios: {e}")
-                    try:
-                        HeadingsVaziosSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'heading_vazio': []}).to_excel(writer, sheet_name='Headings_Vazios', index=False)
+                # DataFrame bruto: headings do DOMSnapshot são listas (df_clean vira texto truncado)
+                registrar('Headings_Vazios', HeadingsVaziosSheet,
+                          lambda d: HeadingsVaziosSheet(df, writer, registros=d['registros']), REGISTROS,
+                          "   ✅ Aba 'Headings_Vazios' criada (CIRÚRGICA)", {'url': [], 'heading_vazio': []})
                 
                 # 7. ABA TITLE AUSENTE CIRÚRGICA
-                try:
-                    TitleAusenteSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'Title_Ausente' criada (CIRÚRGICA)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba Title_Ausente: {e}")
-                    try:
-                        TitleAusenteSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'problema': []}).to_excel(writer, sheet_name='Title_Ausente', index=False)
+                registrar('Title_Ausente', TitleAusenteSheet,
+                          lambda d: TitleAusenteSheet(df_clean, writer, registros=d['registros']), REGISTROS,
+                          "   ✅ Aba 'Title_Ausente' criada (CIRÚRGICA)", {'url': [], 'problema': []})
                 
                 # 8. ABA DESCRIPTION AUSENTE CIRÚRGICA
-                try:
-                    DescriptionAusenteSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'Description_Ausente' criada (CIRÚRGICA)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba Description_Ausente: {e}")
-                    try:
-                        DescriptionAusenteSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'problema': []}).to_excel(writer, sheet_name='Description_Ausente', index=False)
+                registrar('Description_Ausente', DescriptionAusenteSheet,
+                          lambda d: DescriptionAusenteSheet(df_clean, writer, registros=d['registros']), REGISTROS,
+                          "   ✅ Aba 'Description_Ausente' criada (CIRÚRGICA)", {'url': [], 'problema': []})
                 
                 # 9. ABA TITLE DUPLICADO CIRÚRGICA
-                try:
-                    TitleDuplicadoSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'Title_Duplicado' criada (CIRÚRGICA)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba Title_Duplicado: {e}")
-                    try:
-                        TitleDuplicadoSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'title_duplicado': []}).to_excel(writer, sheet_name='Title_Duplicado', index=False)
+                registrar('Title_Duplicado', TitleDuplicadoSheet,
+                          lambda d: TitleDuplicadoSheet(df_clean, writer, registros=d['registros']), REGISTROS,
+                          "   ✅ Aba 'Title_Duplicado' criada (CIRÚRGICA)", {'url': [], 'title_duplicado': []})
                 
                 # 10. ABA DESCRIPTION DUPLICADO CIRÚRGICA
-                try:
-                    DescriptionDuplicadoSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'Description_Duplicado' criada (CIRÚRGICA)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba Description_Duplicado: {e}")
-                    try:
-                        DescriptionDuplicadoSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'description_duplicado': []}).to_excel(writer, sheet_name='Description_Duplicado', index=False)
+                registrar('Description_Duplicado', DescriptionDuplicadoSheet,
+                          lambda d: DescriptionDuplicadoSheet(df_clean, writer, registros=d['registros']), REGISTROS,
+                          "   ✅ Aba 'Description_Duplicado' criada (CIRÚRGICA)", {'url': [], 'description_duplicado': []})
                 
                 # 11. ABA HTTP INSEGURO CIRÚRGICA
-                try:
-                    HTTPInseguroSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'HTTP_Inseguro' criada (CIRÚRGICA)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba HTTP_Inseguro: {e}")
-                    try:
-                        HTTPInseguroSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'link_inseguro': []}).to_excel(writer, sheet_name='HTTP_Inseguro', index=False)
+                registrar('HTTP_Inseguro', HTTPInseguroSheet,
+                          lambda d: HTTPInseguroSheet(df_clean, writer, registros=d['registros']), REGISTROS,
+                          "   ✅ Aba 'HTTP_Inseguro' criada (CIRÚRGICA)", {'url': [], 'link_inseguro': []})
                 
                 # 12. ABA REDIRECTS 3XX CIRÚRGICA
-                try:
-                    Redirects3xxSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'Redirects_3xx' criada (CIRÚRGICA)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba Redirects_3xx: {e}")
-                    try:
-                        Redirects3xxSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'status': [], 'redirect': []}).to_excel(writer, sheet_name='Redirects_3xx', index=False)
+                registrar('Redirects_3xx', Redirects3xxSheet,
+                          lambda d: Redirects3xxSheet(df_clean, writer, cadeias=d['cadeias']), CADEIAS,
+                          "   ✅ Aba 'Redirects_3xx' criada (CIRÚRGICA)", {'url': [], 'status': [], 'redirect': []})
                 
                 # 13. ABA ERRORS 5XX CIRÚRGICA
-                try:
-                    Errors5xxSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'Errors_5xx' criada (CIRÚRGICA)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba Errors_5xx: {e}")
-                    try:
-                        Errors5xxSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'status': [], 'erro': []}).to_excel(writer, sheet_name='Errors_5xx', index=False)
+                registrar('Errors_5xx', Errors5xxSheet,
+                          lambda d: Errors5xxSheet(df_clean, writer, cadeias=d['cadeias']), CADEIAS,
+                          "   ✅ Aba 'Errors_5xx' criada (CIRÚRGICA)", {'url': [], 'status': [], 'erro': []})
                 
                 # 14. ABA ERRORS 4XX CIRÚRGICA
-                try:
-                    Errors4xxSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'Errors_4xx' criada (CIRÚRGICA)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba Errors_4xx: {e}")
-                    try:
-                        Errors4xxSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'status': [], 'erro': []}).to_excel(writer, sheet_name='Errors_4xx', index=False)
+                registrar('Errors_4xx', Errors4xxSheet,
+                          lambda d: Errors4xxSheet(df_clean, writer, cadeias=d['cadeias']), CADEIAS,
+                          "   ✅ Aba 'Errors_4xx' criada (CIRÚRGICA)", {'url': [], 'status': [], 'erro': []})
                 
                 # 15. ABA ERRORS HTTP CIRÚRGICA
-                try:
-                    ErrorsHTTPSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'Errors_HTTP' criada (CIRÚRGICA)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba Errors_HTTP: {e}")
-                    try:
-                        ErrorsHTTPSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'erro': []}).to_excel(writer, sheet_name='Errors_HTTP', index=False)
+                registrar('Errors_HTTP', ErrorsHTTPSheet,
+                          lambda d: ErrorsHTTPSheet(df_clean, writer, cadeias=d['cadeias']), CADEIAS,
+                          "   ✅ Aba 'Errors_HTTP' criada (CIRÚRGICA)", {'url': [], 'erro': []})
                 
                 # 16. ABA SSL PROBLEMAS CIRÚRGICA
-                try:
-                    SSLProblemasSheet(df_clean, writer).export()
-                    print("   ✅ Aba 'SSL_Problemas' criada (CIRÚRGICA)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba SSL_Problemas: {e}")
-                    try:
-                        SSLProblemasSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'ssl_problema': []}).to_excel(writer, sheet_name='SSL_Problemas', index=False)
+                registrar('SSL_Problemas', SSLProblemasSheet,
+                          lambda d: SSLProblemasSheet(df_clean, writer, registros=d['registros']), REGISTROS,
+                          "   ✅ Aba 'SSL_Problemas' criada (CIRÚRGICA)", {'url': [], 'ssl_problema': []})
                 
-                # 🔒 17. ABA MIXED CONTENT - SHEET ENGINE SIMPLES
-                try:
-                    MixedContentSheet(df_clean, writer).export()
-                    print("   🔒 Aba 'Mixed_Content' criada (SHEET ENGINE)")
-                except Exception as e:
-                    print(f"   ⚠️ Erro na aba Mixed_Content: {e}")
+                # 🔒 17. ABA MIXED CONTENT - SHEET ENGINE SIMPLES (mesma instância do extrator do analisador)
+                registrar('Mixed_Content', MixedContentSheet, lambda d: mixed_content, REGISTROS,
+                          "   🔒 Aba 'Mixed_Content' criada (SHEET ENGINE)",
+                          {'url': [], 'mixed_content_status': [], 'issues': []})
+                
+                # 📈 18. ABA PERFORMANCE - MÉTRICAS DE LABORATÓRIO POR TEMPLATE
+                registrar('Performance', PerformanceSheet, lambda d: PerformanceSheet(df_clean, writer),
+                          mensagem="   📈 Aba 'Performance' criada (LAB METRICS)",
+                          colunas_vazia={'url': [], 'template': [], 'lcp_ms': []})
+                
+                # 🧩 19. ABA TEMPLATES - REPRESENTANTES x EXTRAPOLADOS
+                registrar('Templates', TemplatesSheet, lambda d: TemplatesSheet(df_clean, writer),
+                          mensagem="   🧩 Aba 'Templates' criada (CLUSTERIZAÇÃO)",
+                          colunas_vazia={'url': [], 'template': [], 'papel': []})
+                
+                # 🔀 20. ABA JS DEPENDENTE - HTML ESTÁTICO x DOM RENDERIZADO (DataFrame bruto: diff_js é lista de dicts)
+                registrar('JS_Dependente', JSDependenteSheet, lambda d: JSDependenteSheet(df, writer),
+                          mensagem="   🔀 Aba 'JS_Dependente' criada (ESTÁTICO x RENDERIZADO)",
+                          colunas_vazia={'url': [], 'campo': [], 'situacao': []})
+                
+                # 🎯 21. ABA CANIBALIZAÇÃO - TITLES/H1 QUASE IDÊNTICOS (DataFrame bruto: h1_texts é lista)
+                # TF-IDF é CPU puro: processo próprio para não disputar o GIL com as engines de rede
+                registrar('Canibalizacao', CanibalizacaoSheet,
+                          lambda d: CanibalizacaoSheet(df, writer, registros=d['registros']), REGISTROS,
+                          "   🎯 Aba 'Canibalizacao' criada (TF-IDF)", {'url': [], 'cluster': [], 'score': []},
+                          processo=True)
+                
+                # 🕸️ 22. ABA LINKS INTERNOS - GRAFO DE LINKS (DataFrame bruto: links_encontrados é lista)
+                # Grafo + PageRank também em processo próprio
+                registrar('Links_Internos', LinksInternosSheet, lambda d: LinksInternosSheet(df, writer),
+                          mensagem="   🕸️ Aba 'Links_Internos' criada (grafo + PageRank)",
+                          colunas_vazia={'url': [], 'inlinks': [], 'pagerank': []}, processo=True)
+                
+                # 🔗 23. ABA LINKS QUEBRADOS - INTERNOS, EXTERNOS E ARQUIVOS (DataFrame bruto: links_todos é lista)
+                registrar('Links_Quebrados', LinksQuebradosSheet, lambda d: LinksQuebradosSheet(df, writer),
+                          mensagem="   🔗 Aba 'Links_Quebrados' criada (destinos únicos + cache)",
+                          colunas_vazia={'url': [], 'status': [], 'origens': []})
+                
+                resultados = orquestrador.executar()
+                
+                # 📤 ESCRITOR ÚNICO: uma aba por vez, na ordem canônica (constant_memory grava em sequência)
+                print(f"\n📤 Gravando {len(ordem_abas)} abas no workbook...")
+                for aba, classe, mensagem, colunas_vazia in ordem_abas:
+                    resultado = resultados[aba]
+                    inicio_gravacao = time.perf_counter()
                     try:
-                        MixedContentSheet(df_clean, writer)._criar_aba_vazia()
-                    except:
-                        pd.DataFrame({'url': [], 'mixed_content_status': [], 'issues': []}).to_excel(writer, sheet_name='Mixed_Content', index=False)
+                        if not resultado.sucesso:
+                            raise RuntimeError(resultado.erro)
+                        resultado.motor.gravar(resultado.valor)
+                        print(mensagem)
+                    except Exception as e:
+                        print(f"   ⚠️ Erro na aba {aba}: {e}")
+                        _gravar_aba_vazia(writer, df_clean, aba, classe, colunas_vazia)
+                    resultado.segundos_gravacao = time.perf_counter() - inicio_gravacao
+                
+                orquestrador.exibir_tempos(resultados)
                 
             else:
                 # FALLBACK BÁSICO se engines não disponíveis
@@ -371,6 +426,12 @@ def exportar_relatorio_completo(df, df_http, auditorias, output_path):
         print(f"   15. Errors_HTTP (timeouts, DNS, SSL)")
         print(f"   16. SSL_Problemas (certificados, chain, expiração)")
         print(f"   🔒 17. Mixed_Content (recursos HTTP em páginas HTTPS)")
+        print(f"   📈 18. Performance (LCP, CLS, TTFB, peso por template)")
+        print(f"   🧩 19. Templates (representantes renderizados x extrapolados)")
+        print(f"   🔀 20. JS_Dependente (title, H1, canonical, robots, links só após JS)")
+        print(f"   🎯 21. Canibalizacao (titles/H1 quase idênticos disputando a mesma busca)")
+        print(f"   🕸️ 22. Links_Internos (profundidade de clique, órfãs, PageRank interno)")
+        print(f"   🔗 23. Links_Quebrados (internos, externos e arquivos com status >= 400 ou sem resposta)")
         
         # 🔍 VALIDAÇÃO FINAL
         if os.path.exists(output_path):
@@ -0,0 +1,180 @@
+# exporters/orquestrador_abas.py - Cálculo concorrente das abas + gravação sequencial no workbook
+# ⚡ Engines calculam seus DataFrames ao mesmo tempo (threads para rede, processos para CPU) respeitando
+#    as dependências declaradas; o excel_manager grava depois, uma aba por vez, na ordem canônica
+
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+MAX_THREADS_ABAS = 8            # Engines de rede simultâneas (cada uma ainda tem seu próprio pool)
+MAX_PROCESSOS_ABAS = max((os.cpu_count() or 1) - 1, 1)
+
+
+@dataclass
+class Etapa:
+    """🧩 Nó do cálculo: resultado compartilhado (cadeias, registros) ou engine de uma aba"""
+    nome: str
+    funcao: Callable[[Dict[str, Any]], Any]     # Recebe {dependência: valor}
+    depende_de: Tuple[str, ...] = ()
+    aba: bool = False                           # funcao devolve o motor; o cálculo é motor.calcular()
+    processo: bool = False                      # CPU: motor.calcular() num processo separado
+
+
+@dataclass
+class ResultadoEtapa:
+    """⏱️ Valor (ou erro) e tempo de parede de uma etapa"""
+    nome: str
+    valor: Any = None
+    motor: Any = None
+    erro: str = ''
+    segundos: float = 0.0
+    modo: str = 'thread'
+    segundos_gravacao: float = 0.0
+
+    @property
+    def sucesso(self) -> bool:
+        return not self.erro
+
+
+def _cronometrar(funcao, *args):
+    """⏱️ (valor, erro, segundos) - erro da engine não derruba o pool nem as outras abas"""
+    inicio = time.perf_counter()
+    try:
+        return funcao(*args), '', time.perf_counter() - inicio
+    except Exception as e:
+        traceback.print_exc()
+        return None, f"{type(e).__name__}: {e}", time.perf_counter() - inicio
+
+
+def _calcular_motor(motor):
+    """🧮 Roda no processo filho: o motor chega sem writer e devolve só os DataFrames"""
+    return motor.calcular()
+
+
+def _contexto_processos():
+    # fork: filhos não reimportam o script principal; o pool é aberto antes das threads das abas
+    metodos = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('fork' if 'fork' in metodos else None)
+
+
+class OrquestradorAbas:
+    """⚡ Agenda as etapas assim que as dependências terminam; erro numa dependência vira valor None"""
+
+    def __init__(self, max_threads: int = MAX_THREADS_ABAS, max_processos: int = MAX_PROCESSOS_ABAS):
+        self.max_threads = max_threads
+        self.max_processos = max_processos
+        self._etapas: Dict[str, Etapa] = {}
+        self.segundos_total = 0.0
+
+    def etapa(self, nome: str, funcao: Callable, depende_de: Tuple[str, ...] = ()):
+        """🔗 Resultado compartilhado entre abas: funcao(dependências) -> valor, numa thread"""
+        self._etapas[nome] = Etapa(nome, funcao, tuple(depende_de))
+
+    def aba(self, nome: str, criar_motor: Callable, depende_de: Tuple[str, ...] = (), processo: bool = False):
+        """📄 Engine de aba: criar_motor(dependências) -> motor; motor.calcular() em thread ou processo"""
+        self._etapas[nome] = Etapa(nome, criar_motor, tuple(depende_de), aba=True, processo=processo)
+
+    # ========================
+    # ⚡ EXECUÇÃO
+    # ========================
+
+    def _abrir_pool_processos(self) -> Optional[ProcessPoolExecutor]:
+        total = len([e for e in self._etapas.values() if e.processo])
+        if not total or (os.cpu_count() or 1) < 2:
+            return None     # Sem engine de CPU ou sem segundo core: processo só adicionaria pickle
+        try:
+            pool = ProcessPoolExecutor(max_workers=min(total, self.max_processos), mp_context=_contexto_processos())
+            pool.submit(int).result()   # Sobe os filhos agora, antes de qualquer thread de aba existir
+            return pool
+        except Exception as e:
+            print(f"   ⚠️ Pool de processos indisponível, engines de CPU rodam em thread: {e}")
+            return None
+
+    def _iniciar(self, etapa: Etapa, resultados: Dict[str, ResultadoEtapa], threads, processos, em_execucao):
+        resultado = ResultadoEtapa(etapa.nome)
+        dependencias = {nome: resultados[nome].valor for nome in etapa.depende_de}
+
+        if not etapa.aba:
+            em_execucao[threads.submit(_cronometrar, etapa.funcao, dependencias)] = resultado
+            return
+
+        try:
+            resultado.motor = etapa.funcao(dependencias)
+        except Exception as e:
+            resultado.erro = f"{type(e).__name__}: {e}"
+            resultados[etapa.nome] = resultado
+            return
+
+        if etapa.processo and processos is not None:
+            resultado.modo = 'processo'
+            em_execucao[processos.submit(_cronometrar, _calcular_motor, resultado.motor)] = resultado
+        else:
+            em_execucao[threads.submit(_cronometrar, resultado.motor.calcular)] = resultado
+
+    def executar(self) -> Dict[str, ResultadoEtapa]:
+        """⚡ Calcula todas as etapas; devolve {nome: ResultadoEtapa} (DataFrames das abas em .valor)"""
+        inicio = time.perf_counter()
+        resultados: Dict[str, ResultadoEtapa] = {}
+        pendentes = list(self._etapas.values())
+        em_execucao = {}
+        processos = self._abrir_pool_processos()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_threads, thread_name_prefix='aba') as threads:
+                while pendentes or em_execucao:
+                    # Dispara tudo que ficou pronto (inclusive o que depende de etapa que falhou na criação)
+                    prontas = [e for e in pendentes if all(d in resultados for d in e.depende_de)]
+                    while prontas:
+                        for etapa in prontas:
+                            pendentes.remove(etapa)
+                            self._iniciar(etapa, resultados, threads, processos, em_execucao)
+                        prontas = [e for e in pendentes if all(d in resultados for d in e.depende_de)]
+
+                    if not em_execucao:
+                        for etapa in pendentes:
+                            faltando = [d for d in etapa.depende_de if d not in self._etapas]
+                            resultados[etapa.nome] = ResultadoEtapa(etapa.nome, erro=f"Dependência inexistente: {faltando}")
+                        break
+
+                    concluidos, _ = wait(em_execucao, return_when=FIRST_COMPLETED)
+                    for futuro in concluidos:
+                        resultado = em_execucao.pop(futuro)
+                        try:
+                            resultado.valor, resultado.erro, resultado.segundos = futuro.result()
+                        except Exception as e:
+                            # Falha do pool (pickle, filho morto): a engine recalcula numa thread
+                            print(f"   ⚠️ {resultado.nome}: processo falhou ({type(e).__name__}: {e}) - recalculando em thread")
+                            resultado.modo = 'thread'
+                            em_execucao[threads.submit(_cronometrar, resultado.motor.calcular)] = resultado
+                            continue
+                        resultados[resultado.nome] = resultado
+        finally:
+            if processos is not None:
+                processos.shutdown()
+
+        self.segundos_total = time.perf_counter() - inicio
+        return resultados
+
+    # ========================
+    # 📊 RELATÓRIO
+    # ========================
+
+    def exibir_tempos(self, resultados: Dict[str, ResultadoEtapa]):
+        """⏱️ Tempo de parede por engine (cálculo + gravação) e ganho sobre a execução em série"""
+        print(f"\n⏱️ TEMPO POR ENGINE (cálculo concorrente, gravação sequencial):")
+        for nome in self._etapas:
+            resultado = resultados.get(nome)
+            if resultado is None:
+                continue
+            situacao = '✅' if resultado.sucesso else f"❌ {resultado.erro[:60]}"
+            gravacao = f" + gravação {resultado.segundos_gravacao:5.2f}s" if resultado.segundos_gravacao else ''
+            print(f"   {nome:<22} {resultado.modo:<8} {resultado.segundos:7.2f}s{gravacao}  {situacao}")
+
+        soma = sum(r.segundos for r in resultados.values())
+        if self.segundos_total > 0:
+            print(f"   ⚡ Σ engines {soma:.1f}s em {self.segundos_total:.1f}s de parede "
+                  f"({soma / self.segundos_total:.1f}x sobre a execução em série)")
@@ -35,7 +35,7 @@ class AuditoriaSheets(BaseSheetExporter):
         else:
             df_export = pd.DataFrame(columns=colunas_padrao)
 
-        df_export.to_excel(self.writer, index=False, sheet_name=nome_aba)
+        self._gravar(df_export, nome_aba)
         
         # Log específico para cada aba
         if nome_aba == "Description_Ausente":
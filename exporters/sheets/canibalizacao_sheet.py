@@ -0,0 +1,135 @@
+# exporters/sheets/canibalizacao_sheet.py - CANIBALIZAÇÃO DE PALAVRA-CHAVE
+# 🎯 ENGINE: Clusters de páginas com title/H1 quase idênticos (TF-IDF + similaridade de cosseno)
+
+import pandas as pd
+from exporters.base_exporter import BaseSheetExporter
+from exporters.duplicatas import filtrar_urls_paginas_200
+from canibalizacao import DetectorCanibalizacao
+
+COLUNAS_CANIBALIZACAO = [
+    'URL', 'Cluster', 'Title', 'H1', 'Description', 'Score_Par', 'Par_Mais_Similar',
+    'Score_Medio_Cluster', 'Termos_Principais', 'Situacao', 'Gravidade',
+    'Total_URLs_Cluster', 'Tipo_Linha'
+]
+
+
+class CanibalizacaoSheet(BaseSheetExporter):
+    """🎯 Precisa do DataFrame bruto: h1_texts é lista por URL"""
+
+    def __init__(self, df, writer, registros=None, detector=None):
+        super().__init__(df, writer, registros)
+        self.detector = detector or DetectorCanibalizacao()
+
+    def _texto(self, valor) -> str:
+        if isinstance(valor, (list, tuple)):
+            return ' '.join(str(v) for v in valor if v)
+        if valor is None:
+            return ''
+        try:
+            if pd.isna(valor):
+                return ''
+        except (TypeError, ValueError):
+            pass
+        return str(valor)
+
+    def _pagina(self, url: str, row) -> dict:
+        """📄 Title/H1/description: do registro do analisador único se houver, senão do crawl"""
+        registro = self.registros.get(url) if self.registros else None
+        if registro is not None and registro.http_ok:
+            return {
+                'title': registro.title_texto,
+                'h1': ' '.join(h.texto for h in registro.headings.get('h1', [])),
+                'description': registro.metas.get('description', ''),
+            }
+        return {
+            'title': self._texto(row.get('title')),
+            'h1': self._texto(row.get('h1_texts')),
+            'description': self._texto(row.get('description')),
+        }
+
+    def _gravidade(self, score: float) -> str:
+        if score >= 0.90:
+            return 'ALTO'
+        if score >= 0.75:
+            return 'MEDIO'
+        return 'BAIXO'
+
+    def export(self):
+        """🎯 Gera aba Canibalizacao agrupada por cluster"""
+        try:
+            print(f"🎯 CANIBALIZAÇÃO - TITLES/H1 QUASE IDÊNTICOS (TF-IDF)")
+
+            urls = filtrar_urls_paginas_200(self.df, excluir_paginacao=True)
+            if len(urls) < 2:
+                print(f"   ⚠️ Páginas 200 insuficientes para comparar")
+                df_vazio = pd.DataFrame(columns=COLUNAS_CANIBALIZACAO)
+                self._gravar(df_vazio, "Canibalizacao")
+                return df_vazio
+
+            linhas_por_url = self.df.assign(url=self.df['url'].astype(str).str.strip()) \
+                .drop_duplicates(subset='url').set_index('url')
+            paginas = [self._pagina(url, linhas_por_url.loc[url]) for url in urls]
+
+            clusters = self.detector.detectar(paginas)
+
+            rows = []
+            for numero, cluster in enumerate(clusters, 1):
+                identicos = cluster.score_minimo >= 0.999
+                situacao = 'IDÊNTICOS (ver Title_Duplicado)' if identicos else 'QUASE IDÊNTICOS'
+                termos = ', '.join(cluster.termos)
+
+                rows.append({
+                    'URL': f'>>> CLUSTER {numero}: {len(cluster.indices)} URLs | SCORE {cluster.score_medio:.2f} | {termos} <<<',
+                    'Cluster': numero,
+                    'Title': '',
+                    'H1': '',
+                    'Description': '',
+                    'Score_Par': '',
+                    'Par_Mais_Similar': '',
+                    'Score_Medio_Cluster': round(cluster.score_medio, 3),
+                    'Termos_Principais': termos,
+                    'Situacao': situacao,
+                    'Gravidade': self._gravidade(cluster.score_medio),
+                    'Total_URLs_Cluster': len(cluster.indices),
+                    'Tipo_Linha': 'CABECALHO'
+                })
+
+                for indice in cluster.indices:
+                    score, par = cluster.melhor_par[indice]
+                    pagina = paginas[indice]
+                    rows.append({
+                        'URL': urls[indice],
+                        'Cluster': numero,
+                        'Title': pagina['title'],
+                        'H1': pagina['h1'],
+                        'Description': pagina['description'],
+                        'Score_Par': round(score, 3),
+                        'Par_Mais_Similar': urls[par],
+                        'Score_Medio_Cluster': round(cluster.score_medio, 3),
+                        'Termos_Principais': termos,
+                        'Situacao': situacao,
+                        'Gravidade': self._gravidade(score),
+                        'Total_URLs_Cluster': len(cluster.indices),
+                        'Tipo_Linha': 'URL_INDIVIDUAL'
+                    })
+
+            df_canibalizacao = pd.DataFrame(rows, columns=COLUNAS_CANIBALIZACAO)
+            self._gravar(df_canibalizacao, "Canibalizacao")
+
+            stats = self.detector.get_stats()
+            quase = len([c for c in clusters if c.score_minimo < 0.999])
+            print(f"   📊 Páginas comparadas: {stats['paginas']} | Pares candidatos: {stats['pares_candidatos']}")
+            print(f"   🎯 Clusters: {len(clusters)} ({quase} quase idênticos) | "
+                  f"Produto esparso: {'scipy' if stats['scipy'] else 'listas invertidas'}")
+            print(f"   📋 Aba 'Canibalizacao' criada")
+
+            return df_canibalizacao
+
+        except Exception as e:
+            print(f"❌ Erro no engine de canibalização: {e}")
+            import traceback
+            traceback.print_exc()
+
+            df_erro = pd.DataFrame(columns=COLUNAS_CANIBALIZACAO)
+            self._gravar(df_erro, "Canibalizacao")
+            return df_erro
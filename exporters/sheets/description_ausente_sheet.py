@@ -3,129 +3,66 @@
 # 🧠 v3.1: Elimina erros transitórios de rede com backoff exponencial
 
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from exporters.base_exporter import BaseSheetExporter
-import time
-import random
 
 class DescriptionAusenteSheet(BaseSheetExporter):
-    def __init__(self, df, writer):
-        super().__init__(df, writer)
-        self.session = self._criar_sessao_otimizada()
-        
-    def _criar_sessao_otimizada(self) -> requests.Session:
-        """🚀 Sessão otimizada para validação cirúrgica"""
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive'
-        })
-        return session
 
-    def _verificar_description_cirurgico(self, url: str, max_retries=3) -> dict:
-        """🎯 Verificação CIRÚRGICA com RETRY RESILIENTE v3.1"""
+    def _verificar_description_cirurgico(self, url: str) -> dict:
+        """🎯 Verificação CIRÚRGICA (retry resiliente fica no analisador de páginas)"""
         
-        for tentativa in range(1, max_retries + 1):
-            try:
-                response = self.session.get(url, timeout=10, verify=False)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # 🔎 BUSCA META DESCRIPTION
-                description_tag = soup.find('meta', attrs={'name': 'description'})
-                
-                if description_tag is None:
-                    # TAG AUSENTE
-                    return {
-                        'url': url,
-                        'sucesso': True,
-                        'tem_problema': True,
-                        'tipo_problema': 'TAG_AUSENTE',
-                        'description_html': '[TAG NÃO ENCONTRADA]',
-                        'description_texto': '',
-                        'gravidade': 'CRITICO'
-                    }
-                
-                # 🔎 EXTRAI CONTENT DA TAG
-                description_content = description_tag.get('content', '').strip()
-                
-                if not description_content:
-                    # TAG VAZIA
-                    return {
-                        'url': url,
-                        'sucesso': True,
-                        'tem_problema': True,
-                        'tipo_problema': 'TAG_VAZIA',
-                        'description_html': str(description_tag)[:200],
-                        'description_texto': '[VAZIO]',
-                        'gravidade': 'CRITICO'
-                    }
-                
-                # TAG OK - TEM CONTEÚDO
-                return {
-                    'url': url,
-                    'sucesso': True,
-                    'tem_problema': False,
-                    'tipo_problema': 'OK',
-                    'description_html': str(description_tag)[:200],
-                    'description_texto': description_content[:100],
-                    'gravidade': 'OK'
-                }
-                
-            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError, requests.exceptions.RequestException) as e:
-                if tentativa == max_retries:
-                    # Última tentativa falhou - retorna erro
-                    return {
-                        'url': url,
-                        'sucesso': False,
-                        'erro': str(e),
-                        'tem_problema': True,
-                        'tipo_problema': 'ERRO_ACESSO',
-                        'description_html': '[ERRO DE ACESSO]',
-                        'description_texto': '',
-                        'gravidade': 'ERRO'
-                    }
-                else:
-                    # Backoff exponencial com jitter
-                    wait_time = (2 ** tentativa) + random.uniform(0, 1)
-                    print(f"   ⚡ Tentativa {tentativa}/{max_retries} falhou para {url}. Retry em {wait_time:.1f}s...")
-                    time.sleep(wait_time)
-                    
-            except Exception as e:
-                if tentativa == max_retries:
-                    # Última tentativa - retorna erro técnico
-                    return {
-                        'url': url,
-                        'sucesso': False,
-                        'erro': str(e),
-                        'tem_problema': True,
-                        'tipo_problema': 'ERRO_ACESSO',
-                        'description_html': '[ERRO DE ACESSO]',
-                        'description_texto': '',
-                        'gravidade': 'ERRO'
-                    }
-                else:
-                    # Retry para outros erros também
-                    wait_time = (2 ** tentativa) + random.uniform(0, 1)
-                    print(f"   ⚡ Erro técnico tentativa {tentativa}/{max_retries} para {url}. Retry em {wait_time:.1f}s...")
-                    time.sleep(wait_time)
+        registro = self._registro(url)
         
-        # Fallback (não deveria chegar aqui)
+        if not registro.http_ok:
+            # Erro após as tentativas do analisador
+            return {
+                'url': url,
+                'sucesso': False,
+                'erro': registro.erro_acesso,
+                'tem_problema': True,
+                'tipo_problema': 'ERRO_ACESSO',
+                'description_html': '[ERRO DE ACESSO]',
+                'description_texto': '',
+                'gravidade': 'ERRO'
+            }
+        
+        # 🔎 META DESCRIPTION (primeira do documento)
+        if 'description' not in registro.metas:
+            # TAG AUSENTE
+            return {
+                'url': url,
+                'sucesso': True,
+                'tem_problema': True,
+                'tipo_problema': 'TAG_AUSENTE',
+                'description_html': '[TAG NÃO ENCONTRADA]',
+                'description_texto': '',
+                'gravidade': 'CRITICO'
+            }
+        
+        # 🔎 EXTRAI CONTENT DA TAG
+        description_content = registro.metas['description'].strip()
+        
+        if not description_content:
+            # TAG VAZIA
+            return {
+                'url': url,
+                'sucesso': True,
+                'tem_problema': True,
+                'tipo_problema': 'TAG_VAZIA',
+                'description_html': registro.metas_html['description'],
+                'description_texto': '[VAZIO]',
+                'gravidade': 'CRITICO'
+            }
+        
+        # TAG OK - TEM CONTEÚDO
         return {
             'url': url,
-            'sucesso': False,
-            'erro': 'Erro inesperado no retry loop',
-            'tem_problema': True,
-            'tipo_problema': 'ERRO_ACESSO',
-            'description_html': '[ERRO INESPERADO]',
-            'description_texto': '',
-            'gravidade': 'ERRO'
+            'sucesso': True,
+            'tem_problema': False,
+            'tipo_problema': 'OK',
+            'description_html': registro.metas_html['description'],
+            'description_texto': description_content[:100],
+            'gravidade': 'OK'
         }
 
     def _filtrar_urls_validas(self, urls_input) -> list:
@@ -188,6 +125,10 @@ class DescriptionAusenteSheet(BaseSheetExporter):
         
         print(f"📝 Verificação RESILIENTE de descriptions iniciada: {len(urls)} URLs")
         
+        # 📄 Registros do analisador único: sem rede, sem re-parse
+        if self.registros is not None:
+            return [self._verificar_description_cirurgico(url) for url in urls]
+        
         resultados = []
         
         with ThreadPoolExecutor(max_workers=10) as executor:  # Reduzido para 10 por causa dos retries
@@ -267,7 +208,7 @@ class DescriptionAusenteSheet(BaseSheetExporter):
             df_problemas = df_problemas.drop('sort_gravidade', axis=1)
             
             # 📤 EXPORTA
-            df_problemas.to_excel(self.writer, index=False, sheet_name="Description_Ausente")
+            self._gravar(df_problemas, "Description_Ausente")
             
             # 📊 ESTATÍSTICAS CIRÚRGICAS RESILIENTES
             urls_verificadas = len([r for r in resultados if r.get('sucesso', False)])
@@ -305,4 +246,4 @@ class DescriptionAusenteSheet(BaseSheetExporter):
         df_vazio = pd.DataFrame(columns=[
             'URL', 'Tipo_Problema', 'Description_HTML', 'Description_Texto', 'Gravidade'
         ])
-        df_vazio.to_excel(self.writer, index=False, sheet_name="Description_Ausente")
\ No newline at end of file
+        self._gravar(df_vazio, "Description_Ausente")
\ No newline at end of file
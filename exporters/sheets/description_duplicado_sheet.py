@@ -2,126 +2,52 @@
 # 🔄 ENGINE CIRÚRGICA: Detecta descriptions duplicadas reais entre páginas com agrupamento visual
 
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from collections import defaultdict
 from exporters.base_exporter import BaseSheetExporter
+from exporters.duplicatas import detectar_duplicatas, filtrar_urls_paginas_200, grupos_para_dict
 
 class DescriptionDuplicadoSheet(BaseSheetExporter):
-    def __init__(self, df, writer):
-        super().__init__(df, writer)
-        self.session = self._criar_sessao_otimizada()
-        
-    def _criar_sessao_otimizada(self) -> requests.Session:
-        """🚀 Sessão otimizada para análise de descriptions"""
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive'
-        })
-        return session
+    def __init__(self, df, writer, registros=None, modo_normalizacao='espacos'):
+        super().__init__(df, writer, registros)
+        # 'espacos' = texto idêntico; 'agressiva' também ignora maiúsculas e acentos
+        self.modo_normalizacao = modo_normalizacao
 
     def _extrair_description_real(self, url: str) -> dict:
-        """📝 Extrai meta description real via DOM"""
+        """📝 Extrai meta description real via DOM (registro do analisador único)"""
         
-        try:
-            response = self.session.get(url, timeout=10, verify=False)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extrai meta description real
-            description_tag = soup.find('meta', attrs={'name': 'description'})
-            description_content = description_tag.get('content', '').strip() if description_tag else ""
-            
-            # Limpa texto (remove quebras excessivas, espaços múltiplos)
-            if description_content:
-                description_limpa = ' '.join(description_content.split())
-                return {
-                    'url': url,
-                    'sucesso': True,
-                    'description_text': description_limpa,
-                    'description_length': len(description_limpa)
-                }
-            else:
-                return {
-                    'url': url,
-                    'sucesso': True,
-                    'description_text': '',
-                    'description_length': 0
-                }
-            
-        except Exception as e:
+        registro = self._registro(url)
+        
+        if not registro.http_ok:
             return {
                 'url': url,
                 'sucesso': False,
-                'erro': str(e),
+                'erro': registro.erro_acesso,
                 'description_text': '',
                 'description_length': 0
             }
+        
+        # Limpa texto (remove quebras excessivas, espaços múltiplos)
+        description_limpa = ' '.join(registro.metas.get('description', '').split())
+        return {
+            'url': url,
+            'sucesso': True,
+            'description_text': description_limpa,
+            'description_length': len(description_limpa)
+        }
 
     def _filtrar_urls_validas(self, urls_df) -> list:
-        """🧹 Remove URLs inválidas + FILTRA APENAS STATUS 200 + SEM PAGINAÇÃO"""
-        urls_validas = []
-        
-        for _, row in urls_df.iterrows():
-            url = row.get('url', '')
-            
-            if not url or pd.isna(url):
-                continue
-            
-            url_str = str(url).strip()
-            
-            # Filtros básicos
-            if not url_str.startswith(('http://', 'https://')):
-                continue
-            
-            # Remove extensões não-HTML
-            if any(url_str.lower().endswith(ext) for ext in [
-                '.pdf', '.jpg', '.jpeg', '.png', '.gif', '.zip', '.rar',
-                '.js', '.css', '.mp3', '.mp4', '.xml', '.json'
-            ]):
-                continue
-            
-            # 🎯 FILTRO CRUCIAL: SÓ PÁGINAS 200 OK
-            status_code = row.get('status_code_http', row.get('status_code', None))
-            if status_code is not None:
-                try:
-                    status_num = int(float(status_code))
-                    if status_num != 200:
-                        continue  # Pula páginas que não são 200 OK
-                except (ValueError, TypeError):
-                    continue  # Pula se não conseguir converter status
-            
-            # 🚫 FILTRO PAGINAÇÃO: Remove URLs com parâmetros de paginação
-            url_lower = url_str.lower()
-            pagination_params = [
-                '?page=', '&page=', '?p=', '&p=',
-                '?pagina=', '&pagina=', '?pg=', '&pg=',
-                '/page/', '/p/', '/pagina/', '/pg/',
-                '?offset=', '&offset=', '?start=', '&start=',
-                '?pagenum=', '&pagenum=', '?paged=', '&paged='
-            ]
-            
-            is_pagination = any(pagination_param in url_lower for pagination_param in pagination_params)
-            if is_pagination:
-                # DEBUG: Mostra URLs de paginação que estão sendo filtradas
-                print(f"      🚫 Filtrado (paginação): {url_str}")
-                continue  # Pula URLs de paginação
-            
-            urls_validas.append(url_str)
-        
-        return list(set(urls_validas))  # Remove duplicatas
+        """🧹 Remove URLs inválidas + FILTRA APENAS STATUS 200 + SEM PAGINAÇÃO (vetorizado)"""
+        return filtrar_urls_paginas_200(urls_df, excluir_paginacao=True)
 
     def _analisar_descriptions_paralelo(self, urls: list) -> list:
         """🚀 Análise paralela de descriptions"""
         
         print(f"📝 Análise de descriptions duplicadas iniciada: {len(urls)} URLs")
         
+        # 📄 Registros do analisador único: sem rede, sem re-parse
+        if self.registros is not None:
+            return [self._extrair_description_real(url) for url in urls]
+        
         resultados = []
         
         with ThreadPoolExecutor(max_workers=15) as executor:
@@ -143,26 +69,18 @@ class DescriptionDuplicadoSheet(BaseSheetExporter):
         return resultados
 
     def _detectar_duplicacoes(self, resultados: list) -> dict:
-        """🔍 Detecta descriptions duplicadas entre páginas"""
-        
-        descriptions_map = defaultdict(list)  # {description_text: [lista_urls]}
+        """🔍 Detecta descriptions duplicadas entre páginas (groupby vetorizado)"""
         
-        # Mapeia descriptions para URLs
-        for resultado in resultados:
-            if not resultado.get('sucesso', False):
-                continue
-            
-            url = resultado['url']
-            description_text = resultado['description_text']
-            
-            # Só considera descriptions não vazias e não muito curtas
-            if description_text and len(description_text) > 10:  # Ignora descriptions muito curtas
-                descriptions_map[description_text].append(url)
+        df_resultados = pd.DataFrame(
+            [r for r in resultados if r.get('sucesso', False)], columns=['url', 'description_text']
+        )
         
-        # Filtra apenas duplicados (mesma description em múltiplas páginas)
-        descriptions_duplicadas = {desc: urls for desc, urls in descriptions_map.items() if len(urls) > 1}
+        # Só considera descriptions não vazias e com mais de 10 caracteres
+        grupos = detectar_duplicatas(
+            df_resultados, 'description_text', min_caracteres=10, modo=self.modo_normalizacao
+        )
         
-        return descriptions_duplicadas
+        return grupos_para_dict(grupos)
 
     def export(self):
         """📝 Gera aba CIRÚRGICA de descriptions duplicadas com separadores"""
@@ -183,7 +101,7 @@ class DescriptionDuplicadoSheet(BaseSheetExporter):
                 df_vazio = pd.DataFrame(columns=[
                     'URL', 'Description', 'Total_URLs_Afetadas', 'Tipo_Linha'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="Description_Duplicado")
+                self._gravar(df_vazio, "Description_Duplicado")
                 return df_vazio
             
             # 📝 ANÁLISE CIRÚRGICA PARALELA
@@ -200,7 +118,7 @@ class DescriptionDuplicadoSheet(BaseSheetExporter):
                 df_vazio = pd.DataFrame(columns=[
                     'URL', 'Description', 'Total_URLs_Afetadas', 'Tipo_Linha'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="Description_Duplicado")
+                self._gravar(df_vazio, "Description_Duplicado")
                 return df_vazio
             
             # Ordena por quantidade de duplicação (maior primeiro)
@@ -242,7 +160,7 @@ class DescriptionDuplicadoSheet(BaseSheetExporter):
             df_problemas = df_problemas.drop(['Grupo_Ordenacao'], axis=1, errors='ignore')
             
             # 📤 EXPORTA
-            df_problemas.to_excel(self.writer, index=False, sheet_name="Description_Duplicado")
+            self._gravar(df_problemas, "Description_Duplicado")
             
             # 📊 ESTATÍSTICAS
             urls_com_sucesso = len([r for r in resultados if r.get('sucesso', False)])
@@ -266,5 +184,5 @@ class DescriptionDuplicadoSheet(BaseSheetExporter):
             df_erro = pd.DataFrame(columns=[
                 'URL', 'Description', 'Total_URLs_Afetadas', 'Tipo_Linha'
             ])
-            df_erro.to_excel(self.writer, index=False, sheet_name="Description_Duplicado")
+            self._gravar(df_erro, "Description_Duplicado")
             return df_erro
\ No newline at end of file
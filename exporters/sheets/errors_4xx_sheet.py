@@ -8,8 +8,8 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from exporters.base_exporter import BaseSheetExporter
 
 class Errors4xxSheet(BaseSheetExporter):
-    def __init__(self, df, writer):
-        super().__init__(df, writer)
+    def __init__(self, df, writer, cadeias=None):
+        super().__init__(df, writer, cadeias=cadeias)
         self.session = self._criar_sessao_otimizada()
         
     def _criar_sessao_otimizada(self) -> requests.Session:
@@ -27,7 +27,8 @@ class Errors4xxSheet(BaseSheetExporter):
         """❌ Análise cirúrgica de erros 4xx"""
         
         try:
-            response = self.session.get(url, timeout=10, verify=False, allow_redirects=True)
+            # Cadeia salto a salto (HEAD, memoizada); relança Timeout/SSLError/ConnectionError/TooManyRedirects
+            response = self._cadeia_http(url, timeout=10).resposta()
             status_code = response.status_code
             
             # Só processa se for 4xx
@@ -359,7 +360,7 @@ class Errors4xxSheet(BaseSheetExporter):
             df_errors = df_errors.drop('sort_prioridade', axis=1)
             
             # 📤 EXPORTA
-            df_errors.to_excel(self.writer, index=False, sheet_name="Errors_4xx")
+            self._gravar(df_errors, "Errors_4xx")
             
             # 📊 ESTATÍSTICAS
             urls_analisadas = len([r for r in resultados if r.get('sucesso', False)])
@@ -399,4 +400,4 @@ class Errors4xxSheet(BaseSheetExporter):
             'URL', 'Status', 'Tipo_Erro', 'Prioridade', 'Tempo_Resposta', 
             'Content_Type', 'Tem_Pagina_Erro', 'Sugestao_Acao', 'Possivel_Origem'
         ])
-        df_vazio.to_excel(self.writer, index=False, sheet_name="Errors_4xx")
\ No newline at end of file
+        self._gravar(df_vazio, "Errors_4xx")
\ No newline at end of file
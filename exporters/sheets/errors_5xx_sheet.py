@@ -7,8 +7,8 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from exporters.base_exporter import BaseSheetExporter
 
 class Errors5xxSheet(BaseSheetExporter):
-    def __init__(self, df, writer):
-        super().__init__(df, writer)
+    def __init__(self, df, writer, cadeias=None):
+        super().__init__(df, writer, cadeias=cadeias)
         self.session = self._criar_sessao_otimizada()
         
     def _criar_sessao_otimizada(self) -> requests.Session:
@@ -26,7 +26,8 @@ class Errors5xxSheet(BaseSheetExporter):
         """💥 Análise cirúrgica de erros 5xx"""
         
         try:
-            response = self.session.get(url, timeout=15, verify=False, allow_redirects=True)
+            # Cadeia salto a salto (HEAD, memoizada); relança Timeout/SSLError/ConnectionError/TooManyRedirects
+            response = self._cadeia_http(url, timeout=15).resposta()
             status_code = response.status_code
             
             # Só processa se for 5xx
@@ -235,7 +236,7 @@ class Errors5xxSheet(BaseSheetExporter):
                     'URL', 'Status', 'Tipo_Erro', 'Gravidade', 'Tempo_Resposta', 
                     'Server', 'Retry_After', 'Error_Details', 'Headers_Debug'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="Errors_5xx")
+                self._gravar(df_vazio, "Errors_5xx")
                 return df_vazio
             
             # 💥 ANÁLISE CIRÚRGICA PARALELA
@@ -266,7 +267,7 @@ class Errors5xxSheet(BaseSheetExporter):
                     'URL', 'Status', 'Tipo_Erro', 'Gravidade', 'Tempo_Resposta', 
                     'Server', 'Retry_After', 'Error_Details', 'Headers_Debug'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="Errors_5xx")
+                self._gravar(df_vazio, "Errors_5xx")
                 return df_vazio
             
             df_errors = pd.DataFrame(rows)
@@ -278,7 +279,7 @@ class Errors5xxSheet(BaseSheetExporter):
             df_errors = df_errors.drop('sort_gravidade', axis=1)
             
             # 📤 EXPORTA
-            df_errors.to_excel(self.writer, index=False, sheet_name="Errors_5xx")
+            self._gravar(df_errors, "Errors_5xx")
             
             # 📊 ESTATÍSTICAS
             urls_analisadas = len([r for r in resultados if r.get('sucesso', False)])
@@ -314,5 +315,5 @@ class Errors5xxSheet(BaseSheetExporter):
                 'URL', 'Status', 'Tipo_Erro', 'Gravidade', 'Tempo_Resposta', 
                 'Server', 'Retry_After', 'Error_Details', 'Headers_Debug'
             ])
-            df_erro.to_excel(self.writer, index=False, sheet_name="Errors_5xx")
+            self._gravar(df_erro, "Errors_5xx")
             return df_erro
\ No newline at end of file
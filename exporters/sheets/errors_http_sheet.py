@@ -9,8 +9,8 @@ import ssl
 import socket
 
 class ErrorsHTTPSheet(BaseSheetExporter):
-    def __init__(self, df, writer):
-        super().__init__(df, writer)
+    def __init__(self, df, writer, cadeias=None):
+        super().__init__(df, writer, cadeias=cadeias)
         self.session = self._criar_sessao_otimizada()
         
     def _criar_sessao_otimizada(self) -> requests.Session:
@@ -28,10 +28,13 @@ class ErrorsHTTPSheet(BaseSheetExporter):
         """🌐 Análise cirúrgica de erros HTTP gerais"""
         
         tempo_inicio = __import__('time').time()
+        cadeia = None
         
         try:
-            response = self.session.get(url, timeout=15, verify=False, allow_redirects=True)
-            tempo_total = __import__('time').time() - tempo_inicio
+            # Cadeia salto a salto (HEAD, memoizada); relança Timeout/SSLError/ConnectionError/TooManyRedirects
+            cadeia = self._cadeia_http(url, timeout=15)
+            response = cadeia.resposta()
+            tempo_total = cadeia.latencia_total
             
             # Se chegou aqui, não houve erro de conexão
             # Mas pode ter sido um status HTTP normal (200, 3xx, 4xx, 5xx)
@@ -46,7 +49,7 @@ class ErrorsHTTPSheet(BaseSheetExporter):
             }
             
         except requests.exceptions.Timeout:
-            tempo_total = __import__('time').time() - tempo_inicio
+            tempo_total = self._tempo_tentativa(cadeia, tempo_inicio)
             return {
                 'url': url,
                 'sucesso': True,
@@ -60,7 +63,7 @@ class ErrorsHTTPSheet(BaseSheetExporter):
             }
             
         except requests.exceptions.SSLError as e:
-            tempo_total = __import__('time').time() - tempo_inicio
+            tempo_total = self._tempo_tentativa(cadeia, tempo_inicio)
             ssl_detail = str(e)
             return {
                 'url': url,
@@ -75,7 +78,7 @@ class ErrorsHTTPSheet(BaseSheetExporter):
             }
             
         except requests.exceptions.ConnectionError as e:
-            tempo_total = __import__('time').time() - tempo_inicio
+            tempo_total = self._tempo_tentativa(cadeia, tempo_inicio)
             error_detail = str(e)
             
             # Analisa tipo específico de erro de conexão
@@ -129,7 +132,7 @@ class ErrorsHTTPSheet(BaseSheetExporter):
                 }
                 
         except requests.exceptions.TooManyRedirects:
-            tempo_total = __import__('time').time() - tempo_inicio
+            tempo_total = self._tempo_tentativa(cadeia, tempo_inicio)
             return {
                 'url': url,
                 'sucesso': True,
@@ -143,7 +146,7 @@ class ErrorsHTTPSheet(BaseSheetExporter):
             }
             
         except requests.exceptions.InvalidURL:
-            tempo_total = __import__('time').time() - tempo_inicio
+            tempo_total = self._tempo_tentativa(cadeia, tempo_inicio)
             return {
                 'url': url,
                 'sucesso': True,
@@ -157,7 +160,7 @@ class ErrorsHTTPSheet(BaseSheetExporter):
             }
             
         except requests.exceptions.InvalidSchema:
-            tempo_total = __import__('time').time() - tempo_inicio
+            tempo_total = self._tempo_tentativa(cadeia, tempo_inicio)
             return {
                 'url': url,
                 'sucesso': True,
@@ -171,7 +174,7 @@ class ErrorsHTTPSheet(BaseSheetExporter):
             }
             
         except Exception as e:
-            tempo_total = __import__('time').time() - tempo_inicio
+            tempo_total = self._tempo_tentativa(cadeia, tempo_inicio)
             return {
                 'url': url,
                 'sucesso': False,
@@ -185,6 +188,12 @@ class ErrorsHTTPSheet(BaseSheetExporter):
                 'categoria': 'Outros'
             }
 
+    def _tempo_tentativa(self, cadeia, tempo_inicio: float) -> float:
+        """⏱️ Latência somada dos saltos (cadeia compartilhada pode ter sido resolvida antes)"""
+        if cadeia is not None:
+            return cadeia.latencia_total
+        return __import__('time').time() - tempo_inicio
+
     def _filtrar_urls_validas(self, urls_df) -> list:
         """🧹 Remove URLs inválidas (mas aceita mais tipos para detectar erros)"""
         urls_validas = []
@@ -247,7 +256,7 @@ class ErrorsHTTPSheet(BaseSheetExporter):
                     'URL', 'Tipo_Erro', 'Erro_Detalhado', 'Tempo_Tentativa', 
                     'Gravidade', 'Sugestao_Acao', 'Categoria'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="Errors_HTTP")
+                self._gravar(df_vazio, "Errors_HTTP")
                 return df_vazio
             
             # 🌐 ANÁLISE CIRÚRGICA PARALELA
@@ -276,7 +285,7 @@ class ErrorsHTTPSheet(BaseSheetExporter):
                     'URL', 'Tipo_Erro', 'Erro_Detalhado', 'Tempo_Tentativa', 
                     'Gravidade', 'Sugestao_Acao', 'Categoria'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="Errors_HTTP")
+                self._gravar(df_vazio, "Errors_HTTP")
                 return df_vazio
             
             df_errors = pd.DataFrame(rows)
@@ -291,7 +300,7 @@ class ErrorsHTTPSheet(BaseSheetExporter):
             df_errors = df_errors.drop(['sort_gravidade', 'sort_categoria'], axis=1)
             
             # 📤 EXPORTA
-            df_errors.to_excel(self.writer, index=False, sheet_name="Errors_HTTP")
+            self._gravar(df_errors, "Errors_HTTP")
             
             # 📊 ESTATÍSTICAS
             urls_analisadas = len([r for r in resultados if r.get('sucesso', False) or r.get('tem_error_http', False)])
@@ -328,5 +337,5 @@ class ErrorsHTTPSheet(BaseSheetExporter):
                 'URL', 'Tipo_Erro', 'Erro_Detalhado', 'Tempo_Tentativa', 
                 'Gravidade', 'Sugestao_Acao', 'Categoria'
             ])
-            df_erro.to_excel(self.writer, index=False, sheet_name="Errors_HTTP")
+            self._gravar(df_erro, "Errors_HTTP")
             return df_erro
\ No newline at end of file
@@ -8,4 +8,4 @@ class ErrorsSheet(BaseSheetExporter):
         else:
             df_errors = pd.DataFrame(columns=["url", "status_code_http", "tipo_erro"])
 
-        df_errors.to_excel(self.writer, index=False, sheet_name="Errors_HTTP")
+        self._gravar(df_errors, "Errors_HTTP")
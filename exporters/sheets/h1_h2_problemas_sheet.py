@@ -2,45 +2,31 @@
 # 🔍 ENGINE CIRÚRGICA: Detecta duplicação real de textos H1/H2 entre páginas
 
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from collections import defaultdict
 from exporters.base_exporter import BaseSheetExporter
+from exporters.duplicatas import detectar_duplicatas, grupos_para_dict
 
 class H1H2ProblemasSheet(BaseSheetExporter):
-    def __init__(self, df, writer):
-        super().__init__(df, writer)
-        self.session = self._criar_sessao_otimizada()
-        
-    def _criar_sessao_otimizada(self) -> requests.Session:
-        """🚀 Sessão otimizada para análise de H1/H2"""
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive'
-        })
-        return session
+    def __init__(self, df, writer, registros=None, modo_normalizacao='espacos'):
+        super().__init__(df, writer, registros)
+        # 'espacos' = texto idêntico; 'agressiva' também ignora maiúsculas e acentos
+        self.modo_normalizacao = modo_normalizacao
 
     def _extrair_h1_h2_textos(self, url: str) -> dict:
         """🎯 Extrai textos reais de H1 e H2 via DOM"""
         
         try:
-            response = self.session.get(url, timeout=10, verify=False)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            registro = self._registro(url)
+            if not registro.http_ok:
+                raise Exception(registro.erro_acesso)
             
             # Extrai todos os H1 e H2 com texto válido
             h1_textos = []
             h2_textos = []
             
             # H1s
-            for h1_tag in soup.find_all('h1'):
-                texto = h1_tag.get_text().strip()
+            for h1 in registro.headings['h1']:
+                texto = h1.texto.strip()
                 if texto and len(texto) > 0:  # Só textos não vazios
                     # Limpa texto (remove quebras excessivas, espaços múltiplos)
                     texto_limpo = ' '.join(texto.split())
@@ -48,8 +34,8 @@ class H1H2ProblemasSheet(BaseSheetExporter):
                         h1_textos.append(texto_limpo)
             
             # H2s
-            for h2_tag in soup.find_all('h2'):
-                texto = h2_tag.get_text().strip()
+            for h2 in registro.headings['h2']:
+                texto = h2.texto.strip()
                 if texto and len(texto) > 0:  # Só textos não vazios
                     # Limpa texto (remove quebras excessivas, espaços múltiplos)
                     texto_limpo = ' '.join(texto.split())
@@ -110,6 +96,10 @@ class H1H2ProblemasSheet(BaseSheetExporter):
         
         print(f"🔍 Análise H1/H2 duplicados iniciada: {len(urls)} URLs")
         
+        # 📄 Registros do analisador único: sem rede, sem re-parse
+        if self.registros is not None:
+            return [self._extrair_h1_h2_textos(url) for url in urls]
+        
         resultados = []
         
         with ThreadPoolExecutor(max_workers=15) as executor:
@@ -131,30 +121,20 @@ class H1H2ProblemasSheet(BaseSheetExporter):
         return resultados
 
     def _detectar_duplicacoes(self, resultados: list) -> tuple:
-        """🔍 Detecta textos H1/H2 duplicados entre páginas"""
-        
-        h1_textos_map = defaultdict(list)  # {texto_h1: [lista_urls]}
-        h2_textos_map = defaultdict(list)  # {texto_h2: [lista_urls]}
+        """🔍 Detecta textos H1/H2 duplicados entre páginas (groupby vetorizado)"""
         
-        # Mapeia textos para URLs
-        for resultado in resultados:
-            if not resultado.get('sucesso', False):
-                continue
-            
-            url = resultado['url']
-            
-            # Mapeia H1s
-            for h1_texto in resultado['h1_textos']:
-                h1_textos_map[h1_texto].append(url)
-            
-            # Mapeia H2s
-            for h2_texto in resultado['h2_textos']:
-                h2_textos_map[h2_texto].append(url)
+        df_resultados = pd.DataFrame(
+            [r for r in resultados if r.get('sucesso', False)], columns=['url', 'h1_textos', 'h2_textos']
+        )
         
-        # Filtra apenas duplicados (mesmo texto em múltiplas páginas)
-        h1_duplicados = {texto: urls for texto, urls in h1_textos_map.items() if len(urls) > 1}
-        h2_duplicados = {texto: urls for texto, urls in h2_textos_map.items() if len(urls) > 1}
+        # Uma linha por (url, texto): H1 repetido na mesma página também conta
+        duplicados = []
+        for coluna in ('h1_textos', 'h2_textos'):
+            df_textos = df_resultados[['url', coluna]].explode(coluna)
+            grupos = detectar_duplicatas(df_textos, coluna, modo=self.modo_normalizacao)
+            duplicados.append(grupos_para_dict(grupos))
         
+        h1_duplicados, h2_duplicados = duplicados
         return h1_duplicados, h2_duplicados
 
     def export(self):
@@ -176,7 +156,7 @@ class H1H2ProblemasSheet(BaseSheetExporter):
                     'URL', 'Tag', 'Tipo_Problema', 'Texto_Heading', 'Total_URLs_Afetadas',
                     'Gravidade', 'Impacto_SEO'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="H1_H2_Problemas")
+                self._gravar(df_vazio, "H1_H2_Problemas")
                 return df_vazio
             
             # 🔍 ANÁLISE CIRÚRGICA PARALELA
@@ -255,7 +235,7 @@ class H1H2ProblemasSheet(BaseSheetExporter):
                     'URL', 'Tag', 'Tipo_Problema', 'Texto_Heading', 'Total_URLs_Afetadas',
                     'Gravidade', 'Impacto_SEO'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="H1_H2_Problemas")
+                self._gravar(df_vazio, "H1_H2_Problemas")
                 return df_vazio
             
             df_problemas = pd.DataFrame(rows)
@@ -273,7 +253,7 @@ class H1H2ProblemasSheet(BaseSheetExporter):
             df_problemas = df_problemas.drop(['tag_sort', 'Grupo_Ordenacao'], axis=1, errors='ignore')
             
             # 📤 EXPORTA
-            df_problemas.to_excel(self.writer, index=False, sheet_name="H1_H2_Problemas")
+            self._gravar(df_problemas, "H1_H2_Problemas")
             
             # 📊 ESTATÍSTICAS
             urls_com_sucesso = len([r for r in resultados if r.get('sucesso', False)])
@@ -302,5 +282,5 @@ class H1H2ProblemasSheet(BaseSheetExporter):
                 'URL', 'Tag', 'Tipo_Problema', 'Texto_Heading', 'Total_URLs_Afetadas',
                 'Gravidade', 'Impacto_SEO'
             ])
-            df_erro.to_excel(self.writer, index=False, sheet_name="H1_H2_Problemas")
+            self._gravar(df_erro, "H1_H2_Problemas")
             return df_erro
\ No newline at end of file
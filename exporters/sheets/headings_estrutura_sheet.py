@@ -2,45 +2,26 @@
 # 🔬 ENGINE CIRÚRGICA: Análise estrutural completa de headings H1-H6
 
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from exporters.base_exporter import BaseSheetExporter
 
 class HeadingsEstruturaSheet(BaseSheetExporter):
-    def __init__(self, df, writer):
-        super().__init__(df, writer)
-        self.session = self._criar_sessao_otimizada()
-        
-    def _criar_sessao_otimizada(self) -> requests.Session:
-        """🚀 Sessão otimizada para análise estrutural"""
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive'
-        })
-        return session
-
     def _analisar_estrutura_headings(self, url: str) -> dict:
         """🔬 Análise estrutural completa dos headings"""
         
         try:
-            response = self.session.get(url, timeout=10, verify=False)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            registro = self._registro(url)
+            if not registro.http_ok:
+                raise Exception(registro.erro_acesso)
             
             # Contadores por nível
             contadores = {}
             textos_headings = {}
             
             for i in range(1, 7):
-                tags = soup.find_all(f'h{i}')
-                contadores[f'h{i}_total'] = len(tags)
-                textos_headings[f'h{i}_textos'] = [tag.get_text().strip() for tag in tags if tag.get_text().strip()]
+                headings = registro.headings[f'h{i}']
+                contadores[f'h{i}_total'] = len(headings)
+                textos_headings[f'h{i}_textos'] = [h.texto.strip() for h in headings if h.texto.strip()]
             
             # ANÁLISES ESTRUTURAIS
             problemas = []
@@ -205,6 +186,10 @@ class HeadingsEstruturaSheet(BaseSheetExporter):
         
         print(f"🔬 Análise estrutural iniciada: {len(urls)} URLs")
         
+        # 📄 Registros do analisador único: sem rede, sem re-parse
+        if self.registros is not None:
+            return [self._analisar_estrutura_headings(url) for url in urls]
+        
         resultados = []
         
         with ThreadPoolExecutor(max_workers=15) as executor:
@@ -245,7 +230,7 @@ class HeadingsEstruturaSheet(BaseSheetExporter):
                     'H4_Total', 'H5_Total', 'H6_Total', 'Hierarquia_OK', 'Status_Geral',
                     'Comentario', 'H1_Textos', 'Problemas_Count'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="Estrutura_Headings")
+                self._gravar(df_vazio, "Estrutura_Headings")
                 return df_vazio
             
             # 🔬 ANÁLISE ESTRUTURAL PARALELA
@@ -300,7 +285,7 @@ class HeadingsEstruturaSheet(BaseSheetExporter):
                     'H4_Total', 'H5_Total', 'H6_Total', 'Hierarquia_OK', 'Status_Geral',
                     'Comentario', 'H1_Textos', 'Problemas_Count'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="Estrutura_Headings")
+                self._gravar(df_vazio, "Estrutura_Headings")
                 return df_vazio
             
             df_estrutura = pd.DataFrame(rows)
@@ -312,7 +297,7 @@ class HeadingsEstruturaSheet(BaseSheetExporter):
             df_estrutura = df_estrutura.drop('sort_gravidade', axis=1)
             
             # 📤 EXPORTA
-            df_estrutura.to_excel(self.writer, index=False, sheet_name="Estrutura_Headings")
+            self._gravar(df_estrutura, "Estrutura_Headings")
             
             # 📊 ESTATÍSTICAS
             urls_com_sucesso = len([r for r in resultados if r.get('sucesso', False)])
@@ -342,5 +327,5 @@ class HeadingsEstruturaSheet(BaseSheetExporter):
                 'H4_Total', 'H5_Total', 'H6_Total', 'Hierarquia_OK', 'Status_Geral',
                 'Comentario', 'H1_Textos', 'Problemas_Count'
             ])
-            df_erro.to_excel(self.writer, index=False, sheet_name="Estrutura_Headings")
+            self._gravar(df_erro, "Estrutura_Headings")
             return df_erro
\ No newline at end of file
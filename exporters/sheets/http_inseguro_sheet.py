@@ -1,39 +1,47 @@
 import pandas as pd
 from exporters.base_exporter import BaseSheetExporter
+from http_inseguro import extrair_http_inseguros, linhas_http_inseguro
+
+COLUNAS_HTTP_INSEGURO = ['URL', 'Problema', 'Url Externa', 'Elemento']
 
 class HTTPInseguroSheet(BaseSheetExporter):
+    def _coletar(self, urls):
+        """🔓 Ocorrências http:// por página: da varredura do analisador único, senão busca cada URL"""
+        if self.registros is None:
+            return extrair_http_inseguros(urls)
+        
+        resultados = []
+        for url in urls:
+            registro = self._registro(url)
+            if registro.referencias_http is not None:
+                resultados.extend(linhas_http_inseguro(url, registro.referencias_http))
+            elif registro.erro_acesso:
+                resultados.append({"url": url, "tipo": "erro", "trecho": registro.erro_acesso, "elemento": ""})
+        return resultados
+    
     def export(self):
-        if not self.df.empty:
+        urls = self.df['url'].dropna().astype(str).str.strip().unique().tolist() if 'url' in self.df.columns else []
+        resultados = self._coletar(urls) if urls else []
+        
+        if resultados:
             # Renomeia colunas para match com sua imagem
-            df_formatado = self.df.copy()
-            
-            # Mapeia as colunas originais para os nomes desejados
-            mapeamento_colunas = {
+            df_formatado = pd.DataFrame(resultados).rename(columns={
                 'url': 'URL',
                 'tipo': 'Problema', 
-                'trecho': 'Url Externa'
-            }
-            
-            # Renomeia apenas as colunas que existem
-            colunas_existentes = {k: v for k, v in mapeamento_colunas.items() if k in df_formatado.columns}
-            df_formatado = df_formatado.rename(columns=colunas_existentes)
-            
-            # Reordena colunas na ordem desejada
-            colunas_ordenadas = ['URL', 'Problema', 'Url Externa']
-            colunas_finais = [col for col in colunas_ordenadas if col in df_formatado.columns]
-            
-            # Se houver outras colunas, adiciona no final
-            outras_colunas = [col for col in df_formatado.columns if col not in colunas_finais]
-            colunas_finais.extend(outras_colunas)
+                'trecho': 'Url Externa',
+                'elemento': 'Elemento'
+            })
+            df_formatado = df_formatado.reindex(columns=COLUNAS_HTTP_INSEGURO)
             
-            df_formatado = df_formatado[colunas_finais]
+            # Transforma 'tipo' em maiúscula (ATRIBUTO, CSS_INLINE, STYLE_TAG, SCRIPT, TEXTO...)
+            df_formatado['Problema'] = df_formatado['Problema'].str.upper()
             
-            # Transforma 'tipo' em maiúscula para ficar como "HTTP"
-            if 'Problema' in df_formatado.columns:
-                df_formatado['Problema'] = df_formatado['Problema'].str.upper()
+            self._gravar(df_formatado, "HTTP_Inseguro")
             
-            df_formatado.to_excel(self.writer, index=False, sheet_name="HTTP_Inseguro")
+            contagem = df_formatado['Problema'].value_counts()
+            print(f"   🔓 {len(df_formatado)} referências http:// em {df_formatado['URL'].nunique()} páginas: "
+                  + ', '.join(f"{tipo} {total}" for tipo, total in contagem.items()))
         else:
             # DataFrame vazio com colunas formatadas
-            df_vazio = pd.DataFrame(columns=['URL', 'Problema', 'Url Externa'])
-            df_vazio.to_excel(self.writer, index=False, sheet_name="HTTP_Inseguro")
\ No newline at end of file
+            df_vazio = pd.DataFrame(columns=COLUNAS_HTTP_INSEGURO)
+            self._gravar(df_vazio, "HTTP_Inseguro")
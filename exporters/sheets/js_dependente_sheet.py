@@ -0,0 +1,96 @@
+# exporters/sheets/js_dependente_sheet.py - ELEMENTOS SEO QUE DEPENDEM DE JAVASCRIPT
+# 🔀 ENGINE: HTML estático (o que o bot baixa) x DOM renderizado, campo a campo
+
+import pandas as pd
+from exporters.base_exporter import BaseSheetExporter
+from diff_estatico_renderizado import SITUACOES
+
+COLUNAS_JS_DEPENDENTE = [
+    'URL', 'Campo', 'Situacao', 'HTML_Estatico', 'DOM_Renderizado', 'Detalhe',
+    'Impacto', 'Gravidade', 'Total_URLs_Campo', 'Tipo_Linha'
+]
+
+ORDEM_CAMPOS = ['meta_robots', 'title', 'canonical', 'h1', 'description', 'links_internos']
+
+NOMES_CAMPOS = {
+    'title': 'TITLE',
+    'description': 'META DESCRIPTION',
+    'canonical': 'CANONICAL',
+    'h1': 'H1',
+    'meta_robots': 'META ROBOTS',
+    'links_internos': 'LINKS INTERNOS'
+}
+
+
+class JSDependenteSheet(BaseSheetExporter):
+    """🔀 Precisa do DataFrame bruto: diff_js é uma lista de dicts por URL"""
+
+    def export(self):
+        """🔀 Gera aba JS_Dependente agrupada por campo"""
+        try:
+            print(f"🔀 JS DEPENDENTE - HTML ESTÁTICO x DOM RENDERIZADO")
+
+            if 'diff_js' not in self.df.columns:
+                print(f"   ⚠️ Crawl sem comparação estático x renderizado (crawler Requests ou cache antigo)")
+                df_vazio = pd.DataFrame(columns=COLUNAS_JS_DEPENDENTE)
+                self._gravar(df_vazio, "JS_Dependente")
+                return df_vazio
+
+            diffs_por_campo = {campo: [] for campo in ORDEM_CAMPOS}
+            for _, row in self.df.drop_duplicates(subset='url').iterrows():
+                diffs = row.get('diff_js')
+                if not isinstance(diffs, list):
+                    continue
+                for diff in diffs:
+                    diffs_por_campo.setdefault(diff.get('campo', ''), []).append((row['url'], diff))
+
+            rows = []
+            for campo, itens in diffs_por_campo.items():
+                if not itens:
+                    continue
+
+                rows.append({
+                    'URL': f'>>> {NOMES_CAMPOS.get(campo, campo.upper())}: {len(itens)} URLs DEPENDEM DE JS <<<',
+                    'Campo': NOMES_CAMPOS.get(campo, campo),
+                    'Situacao': '',
+                    'HTML_Estatico': '',
+                    'DOM_Renderizado': '',
+                    'Detalhe': '',
+                    'Impacto': '',
+                    'Gravidade': itens[0][1].get('gravidade', 'MEDIO'),
+                    'Total_URLs_Campo': len(itens),
+                    'Tipo_Linha': 'CABECALHO'
+                })
+
+                for url, diff in itens:
+                    situacao = diff.get('situacao', '')
+                    rows.append({
+                        'URL': url,
+                        'Campo': NOMES_CAMPOS.get(campo, campo),
+                        'Situacao': situacao,
+                        'HTML_Estatico': diff.get('estatico', '') or '(ausente)',
+                        'DOM_Renderizado': diff.get('renderizado', '') or '(ausente)',
+                        'Detalhe': diff.get('detalhe', ''),
+                        'Impacto': SITUACOES.get(situacao, ''),
+                        'Gravidade': diff.get('gravidade', 'MEDIO'),
+                        'Total_URLs_Campo': len(itens),
+                        'Tipo_Linha': 'URL_INDIVIDUAL'
+                    })
+
+            df_js = pd.DataFrame(rows, columns=COLUNAS_JS_DEPENDENTE)
+            self._gravar(df_js, "JS_Dependente")
+
+            urls_afetadas = len({r['URL'] for r in rows if r['Tipo_Linha'] == 'URL_INDIVIDUAL'})
+            print(f"   ✅ URLs com SEO dependente de JS: {urls_afetadas}")
+            print(f"   📋 Aba 'JS_Dependente' criada")
+
+            return df_js
+
+        except Exception as e:
+            print(f"❌ Erro no engine JS dependente: {e}")
+            import traceback
+            traceback.print_exc()
+
+            df_erro = pd.DataFrame(columns=COLUNAS_JS_DEPENDENTE)
+            self._gravar(df_erro, "JS_Dependente")
+            return df_erro
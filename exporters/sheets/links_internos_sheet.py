@@ -0,0 +1,122 @@
+# exporters/sheets/links_internos_sheet.py - LINKS INTERNOS
+# 🕸️ ENGINE: Profundidade de clique real, inlinks/outlinks, páginas órfãs e PageRank interno
+
+import numpy as np
+import pandas as pd
+from exporters.base_exporter import BaseSheetExporter
+from grafo_links import GrafoLinks, LIMITE_PROFUNDIDADE, chave_url, urls_do_sitemap
+
+COLUNAS_LINKS = [
+    'URL', 'Profundidade_Clique', 'Nivel_Crawl', 'Inlinks', 'Outlinks', 'PageRank_Interno',
+    'PageRank_Relativo', 'Fonte', 'Status_Code', 'Situacao', 'Gravidade'
+]
+
+
+class LinksInternosSheet(BaseSheetExporter):
+    """🕸️ Precisa do DataFrame bruto: links_encontrados é lista por URL"""
+
+    def __init__(self, df, writer, urls_sitemap=None, buscar_sitemap=True):
+        super().__init__(df, writer)
+        self.urls_sitemap = urls_sitemap
+        self.buscar_sitemap = buscar_sitemap
+        self.grafo = None
+
+    def _sitemap(self):
+        if self.urls_sitemap is not None or not self.buscar_sitemap:
+            return self.urls_sitemap or []
+        raizes = pd.Series(dtype=object)
+        if 'nivel' in self.df.columns:
+            raizes = self.df.loc[pd.to_numeric(self.df['nivel'], errors='coerce') == 0, 'url'].dropna()
+        url_base = raizes.iloc[0] if len(raizes) else self.df['url'].dropna().iloc[0]
+        urls = urls_do_sitemap(url_base)
+        print(f"   🗺️ Sitemap: {len(urls)} URLs")
+        return urls
+
+    def _situacao(self, orfa, profundidade, outlinks, inlinks, rastreada, nivel, nivel_max):
+        if orfa:
+            return 'ÓRFÃ (sem links internos)', 'ALTO'
+        if profundidade < 0:
+            return 'INALCANÇÁVEL A PARTIR DA HOME', 'MEDIO'
+        if profundidade > LIMITE_PROFUNDIDADE:
+            return f'PROFUNDA (>{LIMITE_PROFUNDIDADE} cliques)', 'MEDIO'
+        if rastreada and outlinks == 0 and nivel is not None and nivel < nivel_max:
+            return 'SEM LINKS DE SAÍDA', 'BAIXO'
+        return 'OK', ''
+
+    def export(self):
+        """🕸️ Gera aba Links_Internos (uma linha por URL conhecida)"""
+        try:
+            print(f"🕸️ LINKS INTERNOS - GRAFO, PROFUNDIDADE, ÓRFÃS E PAGERANK")
+
+            if 'url' not in self.df.columns or self.df['url'].dropna().empty:
+                df_vazio = pd.DataFrame(columns=COLUNAS_LINKS)
+                self._gravar(df_vazio, "Links_Internos")
+                return df_vazio
+
+            self.grafo = GrafoLinks.de_resultados(self.df, urls_sitemap=self._sitemap())
+            metricas = self.grafo.metricas()
+
+            # Atributos do crawl por nó (status, nível)
+            linhas_crawl = self.df.assign(_chave=self.df['url'].astype(str).map(chave_url)) \
+                .drop_duplicates(subset='_chave').set_index('_chave')
+            status_col = 'status_code_http' if 'status_code_http' in linhas_crawl.columns else 'status_code'
+            niveis = pd.to_numeric(linhas_crawl.get('nivel'), errors='coerce') if 'nivel' in linhas_crawl.columns else None
+            nivel_max = niveis.max() if niveis is not None and niveis.notna().any() else 0
+
+            pagerank = metricas['pagerank']
+            maximo = pagerank[metricas['conhecida']].max() if metricas['conhecida'].any() else 1.0
+
+            rows = []
+            for id_ in np.nonzero(metricas['conhecida'])[0]:
+                chave = self.grafo.urls[id_]
+                rastreada = id_ in self.grafo.rastreadas
+                sitemap = id_ in self.grafo.no_sitemap
+                nivel = niveis.get(chave) if niveis is not None and chave in niveis.index else None
+                nivel = None if nivel is None or pd.isna(nivel) else int(nivel)
+                status = linhas_crawl.at[chave, status_col] if rastreada and status_col in linhas_crawl.columns else ''
+                profundidade = int(metricas['profundidade'][id_])
+
+                situacao, gravidade = self._situacao(
+                    bool(metricas['orfa'][id_]), profundidade, int(metricas['outlinks'][id_]),
+                    int(metricas['inlinks'][id_]), rastreada, nivel, nivel_max
+                )
+
+                rows.append({
+                    'URL': linhas_crawl.at[chave, 'url'] if rastreada else chave,
+                    'Profundidade_Clique': profundidade if profundidade >= 0 else '',
+                    'Nivel_Crawl': '' if nivel is None else nivel,
+                    'Inlinks': int(metricas['inlinks'][id_]),
+                    'Outlinks': int(metricas['outlinks'][id_]),
+                    'PageRank_Interno': round(float(pagerank[id_]), 8),
+                    'PageRank_Relativo': round(100 * float(pagerank[id_]) / maximo, 1) if maximo else 0.0,
+                    'Fonte': 'CRAWL+SITEMAP' if rastreada and sitemap else ('CRAWL' if rastreada else 'SITEMAP'),
+                    'Status_Code': '' if status is None or (isinstance(status, float) and pd.isna(status)) else status,
+                    'Situacao': situacao,
+                    'Gravidade': gravidade
+                })
+
+            df_links = pd.DataFrame(rows, columns=COLUNAS_LINKS)
+            gravidade_order = {'ALTO': 0, 'MEDIO': 1, 'BAIXO': 2, '': 3}
+            df_links['_ordem'] = df_links['Gravidade'].map(gravidade_order)
+            df_links = df_links.sort_values(['_ordem', 'PageRank_Interno'], ascending=[True, False]) \
+                .drop(columns='_ordem')
+            self._gravar(df_links, "Links_Internos")
+
+            stats = self.grafo.get_stats()
+            print(f"   📊 Nós: {stats['nos']} | Arestas únicas: {stats['arestas']} | "
+                  f"PageRank: {stats.get('iteracoes_pagerank', 0)} iterações ({'scipy' if stats['scipy'] else 'numpy'}) | "
+                  f"{stats['segundos']}s")
+            for situacao, total in df_links.loc[df_links['Situacao'] != 'OK', 'Situacao'].value_counts().items():
+                print(f"      • {situacao}: {total} URLs")
+            print(f"   📋 Aba 'Links_Internos' criada")
+
+            return df_links
+
+        except Exception as e:
+            print(f"❌ Erro no engine de links internos: {e}")
+            import traceback
+            traceback.print_exc()
+
+            df_erro = pd.DataFrame(columns=COLUNAS_LINKS)
+            self._gravar(df_erro, "Links_Internos")
+            return df_erro
@@ -0,0 +1,96 @@
+# exporters/sheets/links_quebrados_sheet.py - LINKS QUEBRADOS
+# 🔗 ENGINE: Todos os <a href> do crawl (internos, externos, arquivos) verificados uma vez cada
+
+from urllib.parse import urlparse
+
+import pandas as pd
+from exporters.base_exporter import BaseSheetExporter
+from verificador_links import AMOSTRA_ORIGENS, VerificadorLinks, indice_destinos, link_quebrado, tipo_link
+
+COLUNAS_LINKS_QUEBRADOS = [
+    'URL_Destino', 'Tipo', 'Status_Code', 'Erro', 'Total_Paginas_Origem', 'Amostra_Origens', 'Gravidade'
+]
+
+
+class LinksQuebradosSheet(BaseSheetExporter):
+    """🔗 Precisa do DataFrame bruto: links_todos é lista por URL"""
+
+    def __init__(self, df, writer, verificador=None):
+        super().__init__(df, writer)
+        self.verificador = verificador
+
+    def _status_do_crawl(self):
+        """📥 {url: status} das páginas já baixadas - não repete requisição para elas"""
+        status_col = 'status_code_http' if 'status_code_http' in self.df.columns else 'status_code'
+        if status_col not in self.df.columns:
+            return {}
+        status = pd.to_numeric(self.df[status_col], errors='coerce')
+        validas = status.notna() & self.df['url'].notna()
+        return dict(zip(self.df.loc[validas, 'url'].astype(str).str.rstrip('/'), status[validas].astype(int)))
+
+    def _gravidade(self, tipo, status):
+        if status is None:
+            return 'MEDIO'  # Timeout/DNS: pode ser transitório
+        if tipo == 'EXTERNO':
+            return 'MEDIO'
+        return 'ALTO'
+
+    def export(self):
+        """🔗 Gera aba Links_Quebrados (uma linha por destino quebrado)"""
+        try:
+            print(f"🔗 LINKS QUEBRADOS - DESTINOS ÚNICOS, HEAD + POOL POR HOST")
+
+            if 'url' not in self.df.columns or self.df['url'].dropna().empty:
+                df_vazio = pd.DataFrame(columns=COLUNAS_LINKS_QUEBRADOS)
+                self._gravar(df_vazio, "Links_Quebrados")
+                return df_vazio
+
+            origens = indice_destinos(self.df)
+            dominio = urlparse(str(self.df['url'].dropna().iloc[0])).netloc
+            total_ocorrencias = sum(len(paginas) for paginas in origens.values())
+            print(f"   🗂️ {total_ocorrencias} links em páginas -> {len(origens)} destinos únicos")
+
+            self.verificador = self.verificador or VerificadorLinks()
+            status = self.verificador.verificar(origens.keys(), conhecidos=self._status_do_crawl())
+
+            rows = []
+            for destino, paginas in origens.items():
+                codigo, detalhe = status.get(destino, (None, 'não verificado'))
+                if not link_quebrado(codigo):
+                    continue
+                tipo = tipo_link(destino, dominio)
+                rows.append({
+                    'URL_Destino': destino,
+                    'Tipo': tipo,
+                    'Status_Code': '' if codigo is None else codigo,
+                    'Erro': detalhe if codigo is None else '',
+                    'Total_Paginas_Origem': len(paginas),
+                    'Amostra_Origens': '\n'.join(paginas[:AMOSTRA_ORIGENS]),
+                    'Gravidade': self._gravidade(tipo, codigo)
+                })
+
+            df_quebrados = pd.DataFrame(rows, columns=COLUNAS_LINKS_QUEBRADOS)
+            gravidade_order = {'ALTO': 0, 'MEDIO': 1, 'BAIXO': 2}
+            df_quebrados['_ordem'] = df_quebrados['Gravidade'].map(gravidade_order)
+            df_quebrados = df_quebrados.sort_values(['_ordem', 'Total_Paginas_Origem'], ascending=[True, False]) \
+                .drop(columns='_ordem')
+            self._gravar(df_quebrados, "Links_Quebrados")
+
+            stats = self.verificador.get_stats()
+            print(f"   📊 Destinos: {stats['destinos']} | Do crawl: {stats['do_crawl']} | "
+                  f"Cache em disco: {stats['cache_disco']} | Verificados: {stats['verificados']} "
+                  f"({stats['pool_cliente']}) | Quebrados: {len(df_quebrados)}")
+            for tipo, total in df_quebrados['Tipo'].value_counts().items():
+                print(f"      • {tipo}: {total} destinos quebrados")
+            print(f"   📋 Aba 'Links_Quebrados' criada")
+
+            return df_quebrados
+
+        except Exception as e:
+            print(f"❌ Erro no engine de links quebrados: {e}")
+            import traceback
+            traceback.print_exc()
+
+            df_erro = pd.DataFrame(columns=COLUNAS_LINKS_QUEBRADOS)
+            self._gravar(df_erro, "Links_Quebrados")
+            return df_erro
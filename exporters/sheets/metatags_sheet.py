@@ -2,8 +2,6 @@
 # 🏷️ ENGINE CIRÚRGICA: Extração e análise completa de metatags SEO
 
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from exporters.base_exporter import BaseSheetExporter
 import warnings
@@ -23,7 +21,7 @@ class MetatagsSheet(BaseSheetExporter):
         
         if not urls:
             print("   ⚠️ Nenhuma URL encontrada")
-            pd.DataFrame({
+            self._gravar(pd.DataFrame({
                 'URL': [],
                 'Title_Length': [],
                 'Title_SEO_Score': [],
@@ -37,7 +35,7 @@ class MetatagsSheet(BaseSheetExporter):
                 'Viewport': [],
                 'Keywords': [],
                 'Problemas_SEO': []
-            }).to_excel(self.writer, index=False, sheet_name="Metatags")
+            }), "Metatags")
             return
         
         print(f"   🌐 Processando {len(urls)} URLs...")
@@ -56,7 +54,7 @@ class MetatagsSheet(BaseSheetExporter):
             df_final = df_final.drop('score_problemas', axis=1)
         
         # Exporta para Excel
-        df_final.to_excel(self.writer, index=False, sheet_name="Metatags")
+        self._gravar(df_final, "Metatags")
         
         # Estatísticas
         total_problemas = sum(len(row.get('Problemas_SEO', [])) for row in resultados)
@@ -66,35 +64,20 @@ class MetatagsSheet(BaseSheetExporter):
     def _processar_urls_paralelo(self, urls):
         """⚡ Processa URLs em paralelo com otimização"""
         
-        HEADERS = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-            "Accept-Language": "pt-BR,pt;q=0.9"
-        }
-        
         def extrair_metatags_url(url):
             """🎯 Extrai metatags de uma URL específica"""
             try:
-                response = requests.get(url, timeout=10, headers=HEADERS, verify=False)
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Extrai dados básicos
-                title_tag = soup.find('title')
-                title_text = title_tag.get_text().strip() if title_tag else ""
-                
-                description_tag = soup.find('meta', attrs={'name': 'description'})
-                description_text = description_tag.get('content', '').strip() if description_tag else ""
-                
-                canonical_tag = soup.find('link', rel='canonical')
-                canonical_url = canonical_tag.get('href', '').strip() if canonical_tag else ""
+                registro = self._registro(url)
+                if not registro.sucesso:
+                    raise Exception(registro.erro)
                 
-                robots_tag = soup.find('meta', attrs={'name': 'robots'})
-                robots_text = robots_tag.get('content', '').strip() if robots_tag else ""
-                
-                viewport_tag = soup.find('meta', attrs={'name': 'viewport'})
-                viewport_text = viewport_tag.get('content', '').strip() if viewport_tag else ""
-                
-                keywords_tag = soup.find('meta', attrs={'name': 'keywords'})
-                keywords_text = keywords_tag.get('content', '').strip() if keywords_tag else ""
+                # Extrai dados básicos (registro do analisador único)
+                title_text = registro.title_texto.strip()
+                description_text = registro.metas.get('description', '').strip()
+                canonical_url = (registro.canonical or '').strip()
+                robots_text = registro.metas.get('robots', '').strip()
+                viewport_text = registro.metas.get('viewport', '').strip()
+                keywords_text = registro.metas.get('keywords', '').strip()
                 
                 # Análise SEO
                 title_length = len(title_text)
@@ -145,6 +128,10 @@ class MetatagsSheet(BaseSheetExporter):
                     'Problemas_SEO': [f"Erro de acesso: {str(e)}"]
                 }
         
+        # 📄 Registros do analisador único: sem rede, sem re-parse
+        if self.registros is not None:
+            return [extrair_metatags_url(url) for url in urls]
+        
         # Execução paralela
         resultados = []
         
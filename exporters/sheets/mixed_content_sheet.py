@@ -6,14 +6,17 @@ import pandas as pd
 import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from exporters.base_exporter import BaseSheetExporter
-from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup
-import re
+from urllib.parse import urljoin
+from cache_stylesheets import CacheStylesheets
+from scanner_http import GRUPO_CSS_EXTERNO, GRUPO_CSS_INLINE, VarreduraHTTP
+
 
 class MixedContentSheet(BaseSheetExporter):
-    def __init__(self, df, writer):
-        super().__init__(df, writer)
+    def __init__(self, df, writer, registros=None):
+        super().__init__(df, writer, registros)
         self.session = self._criar_sessao_otimizada()
+        # 🎨 Stylesheets externos: 1 download por CSS no crawl inteiro (com @import)
+        self.cache_stylesheets = CacheStylesheets(session=self.session)
         
     def _criar_sessao_otimizada(self) -> requests.Session:
         """🚀 Sessão otimizada para análise de mixed content"""
@@ -26,356 +29,117 @@ class MixedContentSheet(BaseSheetExporter):
         })
         return session
 
-    def _analisar_mixed_content_dom_aware(self, url: str) -> dict:
-        """🔒 Análise DOM AWARE completa de mixed content"""
+    def extrair_de_registro(self, soup, registro) -> dict:
+        """🧩 Extrator para o analisador único: usa a varredura http:// já feita no HTML bruto"""
         
-        try:
-            if not url.startswith('https://'):
-                return {
-                    'url': url,
-                    'sucesso': True,
-                    'tem_mixed_content': False,
-                    'motivo': 'URL não é HTTPS'
-                }
-            
-            response = self.session.get(url, timeout=15, verify=False, allow_redirects=True)
-            
-            if response.status_code != 200:
-                return {
-                    'url': url,
-                    'sucesso': True,
-                    'tem_mixed_content': False,
-                    'motivo': f'Status {response.status_code}'
-                }
-            
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-            mixed_content_issues = self._scan_dom_cirurgico_v3(soup, url)
-            
-            if not mixed_content_issues:
-                return {
-                    'url': url,
-                    'sucesso': True,
-                    'tem_mixed_content': False,
-                    'motivo': 'Nenhum mixed content encontrado'
-                }
-            else:
-                return {
-                    'url': url,
-                    'sucesso': True,
-                    'tem_mixed_content': True,
-                    'total_issues': len(mixed_content_issues),
-                    'issues_detalhados': mixed_content_issues
-                }
-                
-        except requests.exceptions.Timeout:
+        url = registro.url
+        
+        if not url.startswith('https://'):
             return {
                 'url': url,
-                'sucesso': False,
-                'erro': 'Timeout',
-                'tem_mixed_content': False
+                'sucesso': True,
+                'tem_mixed_content': False,
+                'motivo': 'URL não é HTTPS'
             }
-        except Exception as e:
+        
+        if registro.status_code != 200:
             return {
                 'url': url,
-                'sucesso': False,
-                'erro': str(e),
-                'tem_mixed_content': False
+                'sucesso': True,
+                'tem_mixed_content': False,
+                'motivo': f'Status {registro.status_code}'
             }
-
-    def _scan_dom_cirurgico_v3(self, soup: BeautifulSoup, base_url: str) -> list:
-        """🧠 Scanner DOM CIRÚRGICO v3.0 - FULL SCAN DOM com localização"""
         
-        issues = []
+        mixed_content_issues = self._issues_de_varredura(registro.referencias_http or VarreduraHTTP(), url)
         
-        # 🔥 FULL SCAN: TODAS AS TAGS E ATRIBUTOS (EXCETO SCRIPTS)
-        url_patterns = [
-            # Recursos de mídia
-            ('img', 'src'),
-            ('img', 'data-src'),  # Lazy loading
-            ('video', 'src'),
-            ('video', 'poster'),
-            ('audio', 'src'),
-            ('source', 'src'),
-            ('source', 'srcset'),
-            
-            # iframes e embeds (scripts HTTP são bloqueados pelo navegador)
-            ('iframe', 'src'),
-            ('embed', 'src'),
-            ('object', 'data'),
-            
-            # Links e CSS
-            ('link', 'href'),
-            ('a', 'href'),
-            
-            # Formulários
-            ('form', 'action'),
-            
-            # Background images via atributos
-            ('div', 'data-bg'),
-            ('section', 'data-background'),
-            ('header', 'data-bg-image'),
-        ]
-        
-        for tag_name, attr_name in url_patterns:
-            elements = soup.find_all(tag_name, {attr_name: True})
-            
-            for element in elements:
-                url_value = element.get(attr_name, '').strip()
-                
-                if not url_value:
-                    continue
-                
-                # Normaliza URL
-                if url_value.startswith('//'):
-                    url_absoluta = 'http:' + url_value
-                elif url_value.startswith('/'):
-                    url_absoluta = urljoin(base_url, url_value)
-                elif url_value.startswith('http://'):
-                    url_absoluta = url_value
-                elif url_value.startswith('https://'):
-                    continue  # HTTPS é seguro
-                else:
-                    url_absoluta = urljoin(base_url, url_value)
-                
-                # Verifica se é HTTP inseguro
-                if url_absoluta.startswith('http://'):
-                    severidade = self._classificar_severidade(tag_name, attr_name)
-                    localizacao_dom = self._detectar_localizacao_dom(element)
-                    prioridade_correcao = self._calcular_prioridade_correcao(localizacao_dom, tag_name)
-                    contexto_semantico = self._extrair_contexto_semantico(element)
-                    path_dom = self._extrair_path_dom(element)
-                    
-                    issues.append({
-                        'tipo': tag_name,
-                        'url_recurso': url_value,
-                        'url_absoluta': url_absoluta,
-                        'severidade': severidade,
-                        'localizacao_dom': localizacao_dom,
-                        'prioridade_correcao': prioridade_correcao,
-                        'atributo': attr_name,
-                        'contexto_semantico': contexto_semantico,
-                        'path_dom': path_dom,
-                        'tag_completa': str(element)[:200]
-                    })
-        
-        # 🎨 SCAN CSS: Inline styles e external stylesheets
-        css_issues = self._scan_css_mixed_content(soup, base_url)
-        issues.extend(css_issues)
-        
-        # 📱 SCAN BACKGROUND IMAGES: Via style attributes
-        bg_issues = self._scan_background_images(soup, base_url)
-        issues.extend(bg_issues)
-        
-        return issues
-
-    def _scan_css_mixed_content(self, soup: BeautifulSoup, base_url: str) -> list:
-        """🎨 Scanner específico para CSS mixed content"""
-        css_issues = []
-        
-        # 1. Style tags inline
-        style_elements = soup.find_all('style')
-        for element in style_elements:
-            css_content = element.get_text()
-            localizacao_dom = self._detectar_localizacao_dom(element)
-            
-            http_urls = re.findall(r'url\(["\']?(http://[^"\')]+)["\']?\)', css_content)
-            for css_url in http_urls:
-                css_issues.append({
-                    'tipo': 'css_inline',
-                    'url_recurso': css_url,
-                    'url_absoluta': css_url,
-                    'severidade': 'MÉDIO',
-                    'localizacao_dom': localizacao_dom,
-                    'prioridade_correcao': self._calcular_prioridade_correcao(localizacao_dom, 'css'),
-                    'atributo': 'url()',
-                    'contexto_semantico': f'CSS inline em {localizacao_dom}',
-                    'path_dom': self._extrair_path_dom(element),
-                    'tag_completa': f'<style>...{css_url}...</style>'
-                })
-        
-        # 2. External stylesheets (opcional: fetch e analisa)
-        link_elements = soup.find_all('link', rel='stylesheet', href=True)
-        for element in link_elements:
-            href = element.get('href')
-            if href and href.startswith('https://'):
-                try:
-                    # Busca CSS externo para analisar
-                    css_url = urljoin(base_url, href)
-                    css_response = self.session.get(css_url, timeout=5)
-                    css_content = css_response.text
-                    
-                    localizacao_dom = self._detectar_localizacao_dom(element)
-                    
-                    http_urls = re.findall(r'url\(["\']?(http://[^"\')]+)["\']?\)', css_content)
-                    for css_http_url in http_urls:
-                        css_issues.append({
-                            'tipo': 'css_external',
-                            'url_recurso': css_http_url,
-                            'url_absoluta': css_http_url,
-                            'severidade': 'MÉDIO',
-                            'localizacao_dom': localizacao_dom,
-                            'prioridade_correcao': self._calcular_prioridade_correcao(localizacao_dom, 'css'),
-                            'atributo': 'url()',
-                            'contexto_semantico': f'CSS externo: {href}',
-                            'path_dom': self._extrair_path_dom(element),
-                            'tag_completa': f'External CSS: {css_http_url}'
-                        })
-                except:
-                    # Se falhar ao buscar CSS externo, ignora
-                    continue
-        
-        return css_issues
+        if not mixed_content_issues:
+            return {
+                'url': url,
+                'sucesso': True,
+                'tem_mixed_content': False,
+                'motivo': 'Nenhum mixed content encontrado'
+            }
+        else:
+            return {
+                'url': url,
+                'sucesso': True,
+                'tem_mixed_content': True,
+                'total_issues': len(mixed_content_issues),
+                'issues_detalhados': mixed_content_issues
+            }
 
-    def _scan_background_images(self, soup: BeautifulSoup, base_url: str) -> list:
-        """📱 Scanner para background images via style attribute"""
-        bg_issues = []
-        
-        # Busca elementos com style attribute
-        elements_with_style = soup.find_all(attrs={'style': True})
+    def _analisar_mixed_content_dom_aware(self, url: str) -> dict:
+        """🔒 Análise DOM AWARE completa de mixed content"""
         
-        for element in elements_with_style:
-            style_content = element.get('style', '')
-            localizacao_dom = self._detectar_localizacao_dom(element)
-            
-            # Procura background-image: url(http://...)
-            bg_urls = re.findall(r'background-image\s*:\s*url\(["\']?(http://[^"\')]+)["\']?\)', style_content)
-            bg_urls.extend(re.findall(r'background\s*:\s*[^;]*url\(["\']?(http://[^"\')]+)["\']?\)', style_content))
-            
-            for bg_url in bg_urls:
-                bg_issues.append({
-                    'tipo': 'background_image',
-                    'url_recurso': bg_url,
-                    'url_absoluta': bg_url,
-                    'severidade': 'MÉDIO',
-                    'localizacao_dom': localizacao_dom,
-                    'prioridade_correcao': self._calcular_prioridade_correcao(localizacao_dom, 'background'),
-                    'atributo': 'style',
-                    'contexto_semantico': f'Background image em {element.name}',
-                    'path_dom': self._extrair_path_dom(element),
-                    'tag_completa': f'<{element.name} style="...{bg_url}...">'
-                })
-        
-        return bg_issues
-
-    def _detectar_localizacao_dom(self, element) -> str:
-        """🧠 Detecta localização semântica no DOM"""
+        if not url.startswith('https://'):
+            return {
+                'url': url,
+                'sucesso': True,
+                'tem_mixed_content': False,
+                'motivo': 'URL não é HTTPS'
+            }
         
-        # 1. HEAD
-        if element.find_parent("head"):
-            return "HEAD"
+        registro = self._registro(url, {'mixed_content': self.extrair_de_registro})
         
-        # 2. BODY com análise semântica
-        if element.find_parent("body"):
-            
-            # 2.1 FOOTER
-            for parent in element.parents:
-                if parent.name == 'footer':
-                    return "FOOTER"
-                
-                parent_class = ' '.join(parent.get('class', [])).lower()
-                parent_id = parent.get('id', '').lower()
-                
-                if any(keyword in parent_class or keyword in parent_id for keyword in ['footer', 'rodape', 'bottom']):
-                    return "FOOTER"
-            
-            # 2.2 HEADER
-            for parent in element.parents:
-                if parent.name == 'header':
-                    return "HEADER"
-                
-                parent_class = ' '.join(parent.get('class', [])).lower()
-                parent_id = parent.get('id', '').lower()
-                
-                if any(keyword in parent_class or keyword in parent_id for keyword in ['header', 'cabecalho', 'top', 'nav', 'navbar']):
-                    return "HEADER"
-            
-            # 2.3 SIDEBAR
-            for parent in element.parents:
-                parent_class = ' '.join(parent.get('class', [])).lower()
-                parent_id = parent.get('id', '').lower()
-                
-                if any(keyword in parent_class or keyword in parent_id for keyword in ['sidebar', 'aside', 'lateral']):
-                    return "SIDEBAR"
-            
-            # 2.4 MODAL
-            for parent in element.parents:
-                parent_class = ' '.join(parent.get('class', [])).lower()
-                parent_id = parent.get('id', '').lower()
-                
-                if any(keyword in parent_class or keyword in parent_id for keyword in ['modal', 'popup', 'overlay', 'dialog']):
-                    return "MODAL"
-            
-            # 2.5 MAIN_CONTENT
-            for parent in element.parents:
-                parent_class = ' '.join(parent.get('class', [])).lower()
-                parent_id = parent.get('id', '').lower()
-                
-                if any(keyword in parent_class or keyword in parent_id for keyword in ['main', 'content', 'conteudo', 'article']):
-                    return "MAIN_CONTENT"
-            
-            return "BODY"
+        if not registro.sucesso:
+            return {
+                'url': url,
+                'sucesso': False,
+                'erro': registro.erro,
+                'tem_mixed_content': False
+            }
         
-        return "UNKNOWN"
+        # Extrator falhou no analisador ou registro pré-construído sem mixed content
+        resultado = registro.extras.get('mixed_content') or {
+            'url': url, 'sucesso': False, 'erro': 'Registro sem análise de mixed content'
+        }
+        resultado.setdefault('tem_mixed_content', False)
+        return resultado
 
-    def _extrair_contexto_semantico(self, element) -> str:
-        """📋 Extrai contexto semântico melhorado"""
-        contexto_parts = []
-        
-        # Localização DOM
-        localizacao = self._detectar_localizacao_dom(element)
-        contexto_parts.append(f"DOM: {localizacao}")
-        
-        # ID do elemento
-        if element.get('id'):
-            contexto_parts.append(f"ID: {element['id']}")
-        
-        # Classe do elemento
-        if element.get('class'):
-            classes = ' '.join(element['class'][:2])
-            contexto_parts.append(f"Class: {classes}")
-        
-        # Alt text para imagens
-        if element.name == 'img' and element.get('alt'):
-            contexto_parts.append(f"Alt: {element['alt'][:30]}")
-        
-        # Title
-        if element.get('title'):
-            contexto_parts.append(f"Title: {element['title'][:30]}")
-        
-        # Parent context
-        immediate_parent = element.parent
-        if immediate_parent and immediate_parent.name != 'body':
-            parent_info = immediate_parent.name
-            if immediate_parent.get('class'):
-                parent_class = ' '.join(immediate_parent['class'][:1])
-                parent_info += f".{parent_class}"
-            contexto_parts.append(f"Parent: {parent_info}")
-        
-        return ' | '.join(contexto_parts) if contexto_parts else 'Sem contexto'
+    def _issues_de_varredura(self, varredura: VarreduraHTTP, base_url: str) -> list:
+        """🧠 Issues de mixed content a partir do passe único do tokenizer
 
-    def _extrair_path_dom(self, element) -> str:
-        """🗺️ Extrai caminho DOM para debug avançado"""
-        path_parts = []
+        O scanner já entrega região DOM e path de cada recurso; aqui entram severidade,
+        prioridade e os url(http://) dos stylesheets externos (cache do crawl).
+        """
         
-        current = element
-        while current and current.name and current.name != '[document]':
-            part = current.name
-            
-            if current.get('id'):
-                part += f"#{current['id']}"
-            
-            if current.get('class'):
-                first_class = current['class'][0]
-                part += f".{first_class}"
-            
-            path_parts.append(part)
-            current = current.parent
-            
-            if len(path_parts) >= 5:
-                break
-        
-        return ' > '.join(reversed(path_parts))
+        issues = []
+        for recurso in varredura.recursos:
+            issue = {k: v for k, v in recurso.items() if k != 'grupo'}
+            tag_name = 'css' if recurso['tipo'] == 'css_inline' else \
+                'background' if recurso['tipo'] == 'background_image' else recurso['tipo']
+            issue['severidade'] = self._classificar_severidade(recurso['tipo'], recurso['atributo']) \
+                if recurso['grupo'] < GRUPO_CSS_INLINE else 'MÉDIO'
+            issue['prioridade_correcao'] = self._calcular_prioridade_correcao(recurso['localizacao_dom'], tag_name)
+            issues.append((recurso['grupo'], issue))
+        
+        for stylesheet in varredura.stylesheets:
+            issues.extend((GRUPO_CSS_EXTERNO, issue) for issue in self._issues_css_externo(stylesheet, base_url))
+        
+        # Mesma ordem do relatório: padrões na ordem declarada, depois CSS e backgrounds
+        issues.sort(key=lambda item: item[0])
+        return [issue for _, issue in issues]
+
+    def _issues_css_externo(self, stylesheet: dict, base_url: str) -> list:
+        """🎨 url(http://...) em stylesheet HTTPS externo e nos seus @import (cache do crawl)"""
+        href = stylesheet['href']
+        localizacao_dom = stylesheet['localizacao_dom']
+        
+        # Falha ao buscar o CSS externo = nenhum achado (stylesheet fica em cache com o erro)
+        css_url = urljoin(base_url, href)
+        
+        return [{
+            'tipo': 'css_external',
+            'url_recurso': css_http_url,
+            'url_absoluta': css_http_url,
+            'severidade': 'MÉDIO',
+            'localizacao_dom': localizacao_dom,
+            'prioridade_correcao': self._calcular_prioridade_correcao(localizacao_dom, 'css'),
+            'atributo': 'url()',
+            'contexto_semantico': f'CSS externo: {href}' if origem == css_url else f'CSS externo: {href} (@import {origem})',
+            'path_dom': stylesheet['path_dom'],
+            'tag_completa': f'External CSS: {css_http_url}'
+        } for origem, css_http_url in self.cache_stylesheets.achados_http(css_url)]
 
     def _calcular_prioridade_correcao(self, localizacao_dom: str, tag_name: str) -> str:
         """🎯 Calcula prioridade de correção baseada em localização DOM"""
@@ -456,6 +220,10 @@ class MixedContentSheet(BaseSheetExporter):
         
         print(f"🔒 Análise SEMI-CONSOLIDATOR v3.0 iniciada: {len(urls)} URLs HTTPS")
         
+        # 📄 Registros do analisador único: sem rede, sem re-parse
+        if self.registros is not None:
+            return [self._analisar_mixed_content_dom_aware(url) for url in urls]
+        
         resultados = []
         
         with ThreadPoolExecutor(max_workers=15) as executor:
@@ -689,11 +457,14 @@ class MixedContentSheet(BaseSheetExporter):
                 return pd.DataFrame()
             
             # 📤 EXPORTA VERSÃO SEMI-CONSOLIDADA
-            df_final.to_excel(self.writer, index=False, sheet_name="Mixed_Content")
+            self._gravar(df_final, "Mixed_Content")
             
             # 🧠 RELATÓRIO v3.0
             self._gerar_relatorio_v3(resultados, df_final)
             
+            stats_css = self.cache_stylesheets.get_stats()
+            print(f"   🎨 CSS externo: {stats_css['stylesheets']} stylesheets baixados 1x, {stats_css['reusos']} reusos entre páginas")
+            
             return df_final
             
         except Exception as e:
@@ -712,4 +483,4 @@ class MixedContentSheet(BaseSheetExporter):
             'Contexto_Semântico', 'Path_DOM', 'Atributo', 'URL_Original',
             'Recomendação_HTTPS', 'Estratégia_Correção'
         ])
-        df_vazio.to_excel(self.writer, index=False, sheet_name="Mixed_Content") 
\ No newline at end of file
+        self._gravar(df_vazio, "Mixed_Content") 
\ No newline at end of file
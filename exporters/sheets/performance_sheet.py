@@ -0,0 +1,245 @@
+# exporters/sheets/performance_sheet.py - PERFORMANCE DE LABORATÓRIO POR TEMPLATE
+# 📈 ENGINE: Agrega métricas coletadas pelo Playwright (LCP, CLS, TTFB, peso) por template
+# 📦 Peso_*: bytes de rede por página. Com modo_cache_browser='route' os recursos servidos pelo cache
+#    do crawler não passam pela rede do browser - o crawler soma o tamanho deles a partir do cache
+#    (Content-Length), e Peso_Cache_Route_KB mostra quanto do Peso_KB veio dessa estimativa
+
+import pandas as pd
+from exporters.base_exporter import BaseSheetExporter
+from templates_url import chave_template_url
+
+# 🎯 LIMITES (Core Web Vitals + boas práticas de peso/DOM)
+LIMITES_PERFORMANCE = {
+    'lcp_ms': (2500, 4000),          # bom / ruim
+    'cls': (0.1, 0.25),
+    'ttfb_ms': (800, 1800),
+    'load_ms': (3000, 6000),
+    'bytes': (2 * 1024 * 1024, 5 * 1024 * 1024),
+    'dom_nodes': (1500, 3000),
+    'requests': (80, 150)
+}
+
+COLUNAS_PERFORMANCE = [
+    'URL', 'Template', 'LCP_ms', 'CLS', 'TTFB_ms', 'DOM_Content_Loaded_ms', 'Load_ms',
+    'Peso_KB', 'Peso_JS_KB', 'Peso_CSS_KB', 'Peso_Cache_Route_KB', 'Requests', 'DOM_Nodes',
+    'Status_Performance', 'Problemas_Performance', 'Total_URLs_Template', 'Tipo_Linha'
+]
+
+
+class PerformanceSheet(BaseSheetExporter):
+
+    def _valor(self, row, coluna):
+        """🔢 Lê valor numérico do DataFrame (None se ausente/inválido)"""
+        valor = row.get(coluna)
+        if valor is None or valor == '':
+            return None
+        try:
+            valor = float(valor)
+        except (ValueError, TypeError):
+            return None
+        return None if pd.isna(valor) else valor
+
+    def _classificar_pagina(self, metricas: dict) -> tuple:
+        """🚦 Classifica página e lista problemas de performance"""
+
+        problemas = []
+        gravidade = 0
+
+        def _checar(chave, valor, descricao, formato):
+            nonlocal gravidade
+            if valor is None:
+                return
+            bom, ruim = LIMITES_PERFORMANCE[chave]
+            if valor > ruim:
+                problemas.append(f"{descricao} crítico ({formato(valor)})")
+                gravidade = max(gravidade, 2)
+            elif valor > bom:
+                problemas.append(f"{descricao} alto ({formato(valor)})")
+                gravidade = max(gravidade, 1)
+
+        _checar('lcp_ms', metricas['lcp_ms'], 'LCP', lambda v: f"{v / 1000:.1f}s")
+        _checar('cls', metricas['cls'], 'CLS', lambda v: f"{v:.3f}")
+        _checar('ttfb_ms', metricas['ttfb_ms'], 'TTFB', lambda v: f"{v:.0f}ms")
+        _checar('load_ms', metricas['load_ms'], 'Load', lambda v: f"{v / 1000:.1f}s")
+        _checar('bytes', metricas['bytes'], 'Peso', lambda v: f"{v / 1024 / 1024:.1f}MB")
+        _checar('dom_nodes', metricas['dom_nodes'], 'DOM', lambda v: f"{v:.0f} nós")
+        _checar('requests', metricas['requests'], 'Requests', lambda v: f"{v:.0f}")
+
+        status = {0: 'BOM', 1: 'PRECISA MELHORAR', 2: 'LENTO'}[gravidade]
+        return status, '; '.join(problemas) if problemas else 'Nenhum'
+
+    def _coletar_metricas(self) -> list:
+        """📊 Extrai métricas por URL das colunas perf_* do crawler"""
+
+        registros = []
+
+        for _, row in self.df.iterrows():
+            url = row.get('url', '')
+            if not url or pd.isna(url):
+                continue
+
+            metricas = {
+                'lcp_ms': self._valor(row, 'perf_lcp_ms'),
+                'cls': self._valor(row, 'perf_cls'),
+                'ttfb_ms': self._valor(row, 'perf_ttfb_ms'),
+                'dcl_ms': self._valor(row, 'perf_dom_content_loaded_ms'),
+                'load_ms': self._valor(row, 'perf_load_ms'),
+                'bytes': self._valor(row, 'perf_bytes_transferidos'),
+                'bytes_js': self._valor(row, 'perf_bytes_js'),
+                'bytes_css': self._valor(row, 'perf_bytes_css'),
+                'bytes_route_cache': self._valor(row, 'perf_bytes_route_cache'),
+                'requests': self._valor(row, 'perf_requests'),
+                'dom_nodes': self._valor(row, 'perf_dom_nodes')
+            }
+
+            # Página sem nenhuma métrica (erro de navegação, crawler requests)
+            if all(v is None for v in metricas.values()):
+                continue
+
+            template = row.get('template_id') if 'template_id' in self.df.columns else None
+            if not template or pd.isna(template):
+                template = chave_template_url(str(url))
+
+            status, problemas = self._classificar_pagina(metricas)
+
+            registros.append({
+                'url': str(url),
+                'template': str(template),
+                'status': status,
+                'problemas': problemas,
+                **metricas
+            })
+
+        return registros
+
+    def _kb(self, valor):
+        return round(valor / 1024, 1) if valor is not None else None
+
+    def export(self):
+        """📈 Gera aba Performance agrupada por template"""
+        try:
+            print(f"📈 PERFORMANCE - MÉTRICAS DE LABORATÓRIO POR TEMPLATE")
+
+            colunas_perf = [c for c in self.df.columns if str(c).startswith('perf_')]
+            if not colunas_perf:
+                print(f"   ⚠️ Sem métricas perf_* no DataFrame (disponível apenas no crawler Playwright)")
+                df_vazio = pd.DataFrame(columns=COLUNAS_PERFORMANCE)
+                self._gravar(df_vazio, "Performance")
+                return df_vazio
+
+            registros = self._coletar_metricas()
+
+            if not registros:
+                print(f"   ⚠️ Nenhuma URL com métricas válidas")
+                df_vazio = pd.DataFrame(columns=COLUNAS_PERFORMANCE)
+                self._gravar(df_vazio, "Performance")
+                return df_vazio
+
+            df_metricas = pd.DataFrame(registros)
+
+            # 📊 AGREGAÇÃO POR TEMPLATE (mediana = robusta a outliers, p75 = referência CWV)
+            agregado = df_metricas.groupby('template').agg(
+                total=('url', 'size'),
+                lcp_p75=('lcp_ms', lambda s: s.quantile(0.75)),
+                cls_p75=('cls', lambda s: s.quantile(0.75)),
+                ttfb_med=('ttfb_ms', 'median'),
+                dcl_med=('dcl_ms', 'median'),
+                load_med=('load_ms', 'median'),
+                bytes_med=('bytes', 'median'),
+                bytes_js_med=('bytes_js', 'median'),
+                bytes_css_med=('bytes_css', 'median'),
+                bytes_route_cache_med=('bytes_route_cache', 'median'),
+                requests_med=('requests', 'median'),
+                dom_med=('dom_nodes', 'median'),
+                lentas=('status', lambda s: int((s == 'LENTO').sum()))
+            ).reset_index()
+
+            # Templates mais lentos primeiro
+            agregado = agregado.sort_values(['lentas', 'lcp_p75'], ascending=[False, False], na_position='last')
+
+            rows = []
+            for _, tpl in agregado.iterrows():
+                metricas_tpl = {
+                    'lcp_ms': tpl['lcp_p75'] if pd.notna(tpl['lcp_p75']) else None,
+                    'cls': tpl['cls_p75'] if pd.notna(tpl['cls_p75']) else None,
+                    'ttfb_ms': tpl['ttfb_med'] if pd.notna(tpl['ttfb_med']) else None,
+                    'load_ms': tpl['load_med'] if pd.notna(tpl['load_med']) else None,
+                    'bytes': tpl['bytes_med'] if pd.notna(tpl['bytes_med']) else None,
+                    'dom_nodes': tpl['dom_med'] if pd.notna(tpl['dom_med']) else None,
+                    'requests': tpl['requests_med'] if pd.notna(tpl['requests_med']) else None
+                }
+                status_tpl, problemas_tpl = self._classificar_pagina(metricas_tpl)
+
+                # Linha de cabeçalho do template (p75 LCP/CLS, mediana do resto)
+                rows.append({
+                    'URL': f">>> TEMPLATE {tpl['template']} ({int(tpl['total'])} PÁGINAS, {tpl['lentas']} LENTAS) <<<",
+                    'Template': tpl['template'],
+                    'LCP_ms': metricas_tpl['lcp_ms'],
+                    'CLS': metricas_tpl['cls'],
+                    'TTFB_ms': metricas_tpl['ttfb_ms'],
+                    'DOM_Content_Loaded_ms': tpl['dcl_med'] if pd.notna(tpl['dcl_med']) else None,
+                    'Load_ms': metricas_tpl['load_ms'],
+                    'Peso_KB': self._kb(metricas_tpl['bytes']),
+                    'Peso_JS_KB': self._kb(tpl['bytes_js_med']) if pd.notna(tpl['bytes_js_med']) else None,
+                    'Peso_CSS_KB': self._kb(tpl['bytes_css_med']) if pd.notna(tpl['bytes_css_med']) else None,
+                    'Peso_Cache_Route_KB': self._kb(tpl['bytes_route_cache_med']) if pd.notna(tpl['bytes_route_cache_med']) else None,
+                    'Requests': metricas_tpl['requests'],
+                    'DOM_Nodes': metricas_tpl['dom_nodes'],
+                    'Status_Performance': status_tpl,
+                    'Problemas_Performance': problemas_tpl,
+                    'Total_URLs_Template': int(tpl['total']),
+                    'Tipo_Linha': 'CABECALHO'
+                })
+
+                paginas = df_metricas[df_metricas['template'] == tpl['template']]
+                paginas = paginas.sort_values('lcp_ms', ascending=False, na_position='last')
+
+                for _, pagina in paginas.iterrows():
+                    rows.append({
+                        'URL': pagina['url'],
+                        'Template': pagina['template'],
+                        'LCP_ms': pagina['lcp_ms'],
+                        'CLS': pagina['cls'],
+                        'TTFB_ms': pagina['ttfb_ms'],
+                        'DOM_Content_Loaded_ms': pagina['dcl_ms'],
+                        'Load_ms': pagina['load_ms'],
+                        'Peso_KB': self._kb(pagina['bytes']) if pd.notna(pagina['bytes']) else None,
+                        'Peso_JS_KB': self._kb(pagina['bytes_js']) if pd.notna(pagina['bytes_js']) else None,
+                        'Peso_CSS_KB': self._kb(pagina['bytes_css']) if pd.notna(pagina['bytes_css']) else None,
+                        'Peso_Cache_Route_KB': self._kb(pagina['bytes_route_cache']) if pd.notna(pagina['bytes_route_cache']) else None,
+                        'Requests': pagina['requests'],
+                        'DOM_Nodes': pagina['dom_nodes'],
+                        'Status_Performance': pagina['status'],
+                        'Problemas_Performance': pagina['problemas'],
+                        'Total_URLs_Template': int(tpl['total']),
+                        'Tipo_Linha': 'URL_INDIVIDUAL'
+                    })
+
+            df_performance = pd.DataFrame(rows, columns=COLUNAS_PERFORMANCE)
+
+            # 📤 EXPORTA
+            self._gravar(df_performance, "Performance")
+
+            # 📊 ESTATÍSTICAS
+            total_lentas = int((df_metricas['status'] == 'LENTO').sum())
+            total_melhorar = int((df_metricas['status'] == 'PRECISA MELHORAR').sum())
+
+            print(f"   ✅ URLs com métricas: {len(df_metricas)}")
+            print(f"   🧩 Templates: {len(agregado)}")
+            print(f"   🐢 Páginas lentas: {total_lentas} | Precisam melhorar: {total_melhorar}")
+            if df_metricas['bytes_route_cache'].fillna(0).gt(0).any():
+                print(f"   📦 Peso inclui recursos servidos pelo cache de route do crawler (Peso_Cache_Route_KB)")
+            if df_metricas['lcp_ms'].notna().any():
+                print(f"   ⏱️ LCP p75 geral: {df_metricas['lcp_ms'].quantile(0.75) / 1000:.2f}s")
+            print(f"   📋 Aba 'Performance' criada")
+
+            return df_performance
+
+        except Exception as e:
+            print(f"❌ Erro no engine de performance: {e}")
+            import traceback
+            traceback.print_exc()
+
+            df_erro = pd.DataFrame(columns=COLUNAS_PERFORMANCE)
+            self._gravar(df_erro, "Performance")
+            return df_erro
@@ -7,8 +7,9 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from exporters.base_exporter import BaseSheetExporter
 
 class Redirects3xxSheet(BaseSheetExporter):
-    def __init__(self, df, writer):
-        super().__init__(df, writer)
+    def __init__(self, df, writer, cadeias=None):
+        # cadeias: Dict[url, CadeiaRedirect] resolvido uma vez para todas as abas de status
+        super().__init__(df, writer, cadeias=cadeias)
         self.session = self._criar_sessao_otimizada()
         
     def _criar_sessao_otimizada(self) -> requests.Session:
@@ -23,11 +24,29 @@ class Redirects3xxSheet(BaseSheetExporter):
         return session
 
     def _analisar_redirect_cirurgico(self, url: str) -> dict:
-        """🔄 Análise cirúrgica de redirects 3xx"""
+        """🔄 Análise cirúrgica de redirects 3xx (cadeia completa, salto a salto)"""
         
         try:
-            # Configuração para capturar redirects
-            response = self.session.get(url, timeout=10, verify=False, allow_redirects=True)
+            cadeia = self._cadeia_http(url, timeout=10)
+            
+            # 🔁 Loop ou cadeia longa demais: o requests só daria TooManyRedirects
+            if cadeia.loop or cadeia.excedeu_limite:
+                primeiro_redirect = cadeia.saltos[0]
+                return {
+                    'url': url,
+                    'sucesso': True,
+                    'tem_redirect': True,
+                    'status_code': primeiro_redirect.status_code,
+                    'url_destino': cadeia.final.location,
+                    'tipo_redirect': 'Loop de Redirects' if cadeia.loop else 'Cadeia Excessiva',
+                    'impacto_seo': f'CRÍTICO - {cadeia.erro}',
+                    'cadeia_redirects': len(cadeia.redirects),
+                    'cadeia_completa': cadeia.descrever(),
+                    'tempo_resposta': cadeia.latencia_total,
+                    'headers_relevantes': self._extrair_headers_redirect(primeiro_redirect.headers)
+                }
+            
+            response = cadeia.resposta()
             
             # Verifica se houve redirect
             if response.history:
@@ -50,7 +69,8 @@ class Redirects3xxSheet(BaseSheetExporter):
                         'tipo_redirect': tipo_redirect,
                         'impacto_seo': impacto_seo,
                         'cadeia_redirects': len(response.history),
-                        'tempo_resposta': response.elapsed.total_seconds(),
+                        'cadeia_completa': cadeia.descrever(),
+                        'tempo_resposta': cadeia.latencia_total,
                         'headers_relevantes': self._extrair_headers_redirect(primeiro_redirect.headers)
                     }
                 else:
@@ -187,9 +207,9 @@ class Redirects3xxSheet(BaseSheetExporter):
                 print(f"   ⚠️ Nenhuma URL válida para análise")
                 df_vazio = pd.DataFrame(columns=[
                     'URL', 'Status', 'Tipo_Redirect', 'URL_Destino', 'Impacto_SEO', 
-                    'Cadeia_Redirects', 'Tempo_Resposta', 'Headers_Relevantes'
+                    'Cadeia_Redirects', 'Cadeia_Completa', 'Tempo_Resposta', 'Headers_Relevantes'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="Redirects_3xx")
+                self._gravar(df_vazio, "Redirects_3xx")
                 return df_vazio
             
             # 🔄 ANÁLISE CIRÚRGICA PARALELA
@@ -208,6 +228,7 @@ class Redirects3xxSheet(BaseSheetExporter):
                         'URL_Destino': resultado['url_destino'],
                         'Impacto_SEO': resultado['impacto_seo'],
                         'Cadeia_Redirects': resultado['cadeia_redirects'],
+                        'Cadeia_Completa': resultado['cadeia_completa'],
                         'Tempo_Resposta': f"{resultado['tempo_resposta']:.2f}s",
                         'Headers_Relevantes': resultado['headers_relevantes']
                     })
@@ -217,21 +238,21 @@ class Redirects3xxSheet(BaseSheetExporter):
                 print(f"   🎉 PERFEITO: Nenhum redirect 3xx encontrado!")
                 df_vazio = pd.DataFrame(columns=[
                     'URL', 'Status', 'Tipo_Redirect', 'URL_Destino', 'Impacto_SEO', 
-                    'Cadeia_Redirects', 'Tempo_Resposta', 'Headers_Relevantes'
+                    'Cadeia_Redirects', 'Cadeia_Completa', 'Tempo_Resposta', 'Headers_Relevantes'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="Redirects_3xx")
+                self._gravar(df_vazio, "Redirects_3xx")
                 return df_vazio
             
             df_redirects = pd.DataFrame(rows)
             
             # 🔄 ORDENAÇÃO POR IMPACTO SEO E STATUS
-            impacto_order = {'VERIFICAR': 1, 'MÉDIO': 2, 'NEUTRO': 3}
+            impacto_order = {'CRÍTICO': 0, 'VERIFICAR': 1, 'MÉDIO': 2, 'NEUTRO': 3}
             df_redirects['sort_impacto'] = df_redirects['Impacto_SEO'].str.split(' -').str[0].map(impacto_order).fillna(99)
             df_redirects = df_redirects.sort_values(['sort_impacto', 'Status', 'URL'])
             df_redirects = df_redirects.drop('sort_impacto', axis=1)
             
             # 📤 EXPORTA
-            df_redirects.to_excel(self.writer, index=False, sheet_name="Redirects_3xx")
+            self._gravar(df_redirects, "Redirects_3xx")
             
             # 📊 ESTATÍSTICAS
             urls_analisadas = len([r for r in resultados if r.get('sucesso', False)])
@@ -265,7 +286,7 @@ class Redirects3xxSheet(BaseSheetExporter):
             # Fallback
             df_erro = pd.DataFrame(columns=[
                 'URL', 'Status', 'Tipo_Redirect', 'URL_Destino', 'Impacto_SEO', 
-                'Cadeia_Redirects', 'Tempo_Resposta', 'Headers_Relevantes'
+                'Cadeia_Redirects', 'Cadeia_Completa', 'Tempo_Resposta', 'Headers_Relevantes'
             ])
-            df_erro.to_excel(self.writer, index=False, sheet_name="Redirects_3xx")
+            self._gravar(df_erro, "Redirects_3xx")
             return df_erro
\ No newline at end of file
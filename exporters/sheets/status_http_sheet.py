@@ -7,8 +7,8 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from exporters.base_exporter import BaseSheetExporter
 
 class StatusHTTPSheet(BaseSheetExporter):
-    def __init__(self, df, writer):
-        super().__init__(df, writer)
+    def __init__(self, df, writer, cadeias=None):
+        super().__init__(df, writer, cadeias=cadeias)
         self.session = self._criar_sessao_otimizada()
         
     def _criar_sessao_otimizada(self) -> requests.Session:
@@ -26,7 +26,8 @@ class StatusHTTPSheet(BaseSheetExporter):
         """🌐 Verificação detalhada de status HTTP"""
         
         try:
-            response = self.session.get(url, timeout=10, verify=False, allow_redirects=True)
+            # Cadeia salto a salto (HEAD, memoizada); relança Timeout/SSLError/ConnectionError/TooManyRedirects
+            response = self._cadeia_http(url, timeout=10).resposta()
             
             # Análise do status
             status_code = response.status_code
@@ -38,7 +39,8 @@ class StatusHTTPSheet(BaseSheetExporter):
                 for redirect in response.history:
                     historico_redirects.append({
                         'url': redirect.url,
-                        'status': redirect.status_code
+                        'status': redirect.status_code,
+                        'latencia': redirect.latencia
                     })
             
             # Análise de headers importantes
@@ -63,7 +65,7 @@ class StatusHTTPSheet(BaseSheetExporter):
                 'headers_relevantes': headers_relevantes,
                 'content_type': response.headers.get('content-type', ''),
                 'server': response.headers.get('server', ''),
-                'tamanho_content': len(response.content) if response.content else 0
+                'tamanho_content': self._tamanho_content(response)
             }
             
         except requests.exceptions.Timeout:
@@ -121,6 +123,13 @@ class StatusHTTPSheet(BaseSheetExporter):
                 'tamanho_content': 0
             }
 
+    def _tamanho_content(self, response) -> int:
+        """📦 Content-Length do salto final (HEAD não baixa o corpo)"""
+        try:
+            return int(response.headers.get('content-length') or 0) or len(response.content or b'')
+        except (TypeError, ValueError):
+            return len(response.content or b'')
+
     def _classificar_status(self, status_code) -> str:
         """📊 Classifica status HTTP por categoria"""
         
@@ -252,7 +261,7 @@ class StatusHTTPSheet(BaseSheetExporter):
                     'Houve_Redirect', 'Numero_Redirects', 'Tempo_Resposta', 'Performance',
                     'Content_Type', 'Server', 'Tamanho_Content'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="Status_HTTP")
+                self._gravar(df_vazio, "Status_HTTP")
                 return df_vazio
             
             # 🌐 VERIFICAÇÃO CIRÚRGICA PARALELA
@@ -266,7 +275,7 @@ class StatusHTTPSheet(BaseSheetExporter):
                 historico_str = ""
                 if resultado['historico_redirects']:
                     historico_str = " → ".join([
-                        f"{r['status']} ({r['url'][:50]}...)" 
+                        f"{r['status']} ({r['url'][:50]}...) {r['latencia']:.2f}s" 
                         for r in resultado['historico_redirects']
                     ])
                 
@@ -305,7 +314,7 @@ class StatusHTTPSheet(BaseSheetExporter):
             df_status = df_status.drop(['categoria_sort', 'performance_sort'], axis=1)
             
             # 📤 EXPORTA
-            df_status.to_excel(self.writer, index=False, sheet_name="Status_HTTP")
+            self._gravar(df_status, "Status_HTTP")
             
             # 📊 ESTATÍSTICAS
             urls_com_sucesso = len([r for r in resultados if r.get('sucesso', False)])
@@ -333,5 +342,5 @@ class StatusHTTPSheet(BaseSheetExporter):
                 'Houve_Redirect', 'Numero_Redirects', 'Tempo_Resposta', 'Performance',
                 'Content_Type', 'Server', 'Tamanho_Content'
             ])
-            df_erro.to_excel(self.writer, index=False, sheet_name="Status_HTTP")
+            self._gravar(df_erro, "Status_HTTP")
             return df_erro
\ No newline at end of file
@@ -0,0 +1,96 @@
+# exporters/sheets/templates_sheet.py - TEMPLATES DE PÁGINA + ACHADOS EXTRAPOLADOS
+# 🧩 ENGINE: Lista templates detectados no crawl, representantes renderizados e membros extrapolados
+
+import pandas as pd
+from exporters.base_exporter import BaseSheetExporter
+
+COLUNAS_TEMPLATES = [
+    'URL', 'Template', 'Papel', 'Achados_Template', 'Extrapolado_De',
+    'Total_URLs_Template', 'Tipo_Linha'
+]
+
+
+class TemplatesSheet(BaseSheetExporter):
+
+    def _bool(self, valor) -> bool:
+        if isinstance(valor, str):
+            return valor.strip().lower() in ('true', '1', 'sim')
+        try:
+            return bool(valor) and not pd.isna(valor)
+        except (TypeError, ValueError):
+            return bool(valor)
+
+    def export(self):
+        """🧩 Gera aba Templates com marcação de dados extrapolados"""
+        try:
+            print(f"🧩 TEMPLATES - CLUSTERIZAÇÃO POR ESQUELETO DO DOM")
+
+            if 'template_id' not in self.df.columns:
+                print(f"   ⚠️ Crawl sem clusterização por template (representantes_por_template=0)")
+                df_vazio = pd.DataFrame(columns=COLUNAS_TEMPLATES)
+                self._gravar(df_vazio, "Templates")
+                return df_vazio
+
+            df_tpl = self.df[self.df['template_id'].astype(str).str.strip() != ''].copy()
+            df_tpl = df_tpl[df_tpl['template_id'].notna()]
+
+            rows = []
+            for template_id, grupo in df_tpl.groupby('template_id', sort=False):
+                representantes = grupo[grupo['template_representante'].apply(self._bool)] \
+                    if 'template_representante' in grupo.columns else grupo.iloc[0:0]
+                membros = grupo.drop(representantes.index)
+
+                achados = ''
+                if 'achados_template' in membros.columns and not membros.empty:
+                    achados = str(membros['achados_template'].iloc[-1] or '')
+
+                rows.append({
+                    'URL': f'>>> {template_id}: {len(grupo)} URLs | {len(representantes)} RENDERIZADAS | {len(membros)} EXTRAPOLADAS <<<',
+                    'Template': template_id,
+                    'Papel': '',
+                    'Achados_Template': achados or 'Nenhum',
+                    'Extrapolado_De': '',
+                    'Total_URLs_Template': len(grupo),
+                    'Tipo_Linha': 'CABECALHO'
+                })
+
+                for _, row in representantes.iterrows():
+                    rows.append({
+                        'URL': row.get('url', ''),
+                        'Template': template_id,
+                        'Papel': 'REPRESENTANTE (renderizado)',
+                        'Achados_Template': '',
+                        'Extrapolado_De': '',
+                        'Total_URLs_Template': len(grupo),
+                        'Tipo_Linha': 'URL_INDIVIDUAL'
+                    })
+
+                for _, row in membros.iterrows():
+                    rows.append({
+                        'URL': row.get('url', ''),
+                        'Template': template_id,
+                        'Papel': 'EXTRAPOLADO (fetch estático)',
+                        'Achados_Template': row.get('achados_template', ''),
+                        'Extrapolado_De': row.get('extrapolado_de', ''),
+                        'Total_URLs_Template': len(grupo),
+                        'Tipo_Linha': 'URL_INDIVIDUAL'
+                    })
+
+            df_templates = pd.DataFrame(rows, columns=COLUNAS_TEMPLATES)
+            self._gravar(df_templates, "Templates")
+
+            total_extrapoladas = len([r for r in rows if r['Papel'].startswith('EXTRAPOLADO')])
+            print(f"   ✅ Templates: {df_tpl['template_id'].nunique()}")
+            print(f"   🧩 URLs extrapoladas (não renderizadas): {total_extrapoladas}")
+            print(f"   📋 Aba 'Templates' criada")
+
+            return df_templates
+
+        except Exception as e:
+            print(f"❌ Erro no engine de templates: {e}")
+            import traceback
+            traceback.print_exc()
+
+            df_erro = pd.DataFrame(columns=COLUNAS_TEMPLATES)
+            self._gravar(df_erro, "Templates")
+            return df_erro
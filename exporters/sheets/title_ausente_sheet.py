@@ -2,89 +2,66 @@
 # 🎯 ENGINE CIRÚRGICA 2.0: Detecta APENAS ausência/vazio de tags <title> - SEM heurísticas
 
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from exporters.base_exporter import BaseSheetExporter
 
 class TitleAusenteSheet(BaseSheetExporter):
-    def __init__(self, df, writer):
-        super().__init__(df, writer)
-        self.session = self._criar_sessao_otimizada()
-        
-    def _criar_sessao_otimizada(self) -> requests.Session:
-        """🚀 Sessão otimizada para validação cirúrgica"""
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive'
-        })
-        return session
 
     def _verificar_title_cirurgico(self, url: str) -> dict:
         """🎯 Verificação CIRÚRGICA 2.0: SÓ existência da tag <title>"""
         
-        try:
-            response = self.session.get(url, timeout=10, verify=False)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 🔎 BUSCA TAG <title>
-            title_tag = soup.find('title')
-            
-            if title_tag is None:
-                # TAG AUSENTE
-                return {
-                    'url': url,
-                    'sucesso': True,
-                    'tem_problema': True,
-                    'tipo_problema': 'TAG_AUSENTE',
-                    'title_html': '[TAG NÃO ENCONTRADA]',
-                    'title_texto': '',
-                    'gravidade': 'CRITICO'
-                }
-            
-            # 🔎 EXTRAI TEXTO DA TAG
-            title_texto = title_tag.get_text().strip()
-            
-            if not title_texto:
-                # TAG VAZIA
-                return {
-                    'url': url,
-                    'sucesso': True,
-                    'tem_problema': True,
-                    'tipo_problema': 'TAG_VAZIA',
-                    'title_html': str(title_tag)[:200],
-                    'title_texto': '[VAZIO]',
-                    'gravidade': 'CRITICO'
-                }
-            
-            # TAG OK - TEM CONTEÚDO
-            return {
-                'url': url,
-                'sucesso': True,
-                'tem_problema': False,
-                'tipo_problema': 'OK',
-                'title_html': str(title_tag)[:200],
-                'title_texto': title_texto[:100],
-                'gravidade': 'OK'
-            }
-            
-        except Exception as e:
+        registro = self._registro(url)
+        
+        if not registro.http_ok:
             return {
                 'url': url,
                 'sucesso': False,
-                'erro': str(e),
+                'erro': registro.erro_acesso,
                 'tem_problema': True,
                 'tipo_problema': 'ERRO_ACESSO',
                 'title_html': '[ERRO DE ACESSO]',
                 'title_texto': '',
                 'gravidade': 'ERRO'
             }
+        
+        # 🔎 TAG <title> (primeira do documento)
+        if registro.title_html is None:
+            # TAG AUSENTE
+            return {
+                'url': url,
+                'sucesso': True,
+                'tem_problema': True,
+                'tipo_problema': 'TAG_AUSENTE',
+                'title_html': '[TAG NÃO ENCONTRADA]',
+                'title_texto': '',
+                'gravidade': 'CRITICO'
+            }
+        
+        # 🔎 EXTRAI TEXTO DA TAG
+        title_texto = registro.title_texto.strip()
+        
+        if not title_texto:
+            # TAG VAZIA
+            return {
+                'url': url,
+                'sucesso': True,
+                'tem_problema': True,
+                'tipo_problema': 'TAG_VAZIA',
+                'title_html': registro.title_html,
+                'title_texto': '[VAZIO]',
+                'gravidade': 'CRITICO'
+            }
+        
+        # TAG OK - TEM CONTEÚDO
+        return {
+            'url': url,
+            'sucesso': True,
+            'tem_problema': False,
+            'tipo_problema': 'OK',
+            'title_html': registro.title_html,
+            'title_texto': title_texto[:100],
+            'gravidade': 'OK'
+        }
 
     def _filtrar_urls_validas(self, urls_df) -> list:
         """🧹 Remove URLs inválidas + FILTRA APENAS STATUS 200"""
@@ -128,6 +105,10 @@ class TitleAusenteSheet(BaseSheetExporter):
         
         print(f"🎯 Verificação cirúrgica de titles iniciada: {len(urls)} URLs")
         
+        # 📄 Registros do analisador único: sem rede, sem re-parse
+        if self.registros is not None:
+            return [self._verificar_title_cirurgico(url) for url in urls]
+        
         resultados = []
         
         with ThreadPoolExecutor(max_workers=15) as executor:
@@ -167,7 +148,7 @@ class TitleAusenteSheet(BaseSheetExporter):
                 df_vazio = pd.DataFrame(columns=[
                     'URL', 'Tipo_Problema', 'Title_HTML', 'Title_Texto', 'Gravidade'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="Title_Ausente")
+                self._gravar(df_vazio, "Title_Ausente")
                 return df_vazio
             
             # 🎯 VERIFICAÇÃO CIRÚRGICA PARALELA
@@ -193,7 +174,7 @@ class TitleAusenteSheet(BaseSheetExporter):
                 df_vazio = pd.DataFrame(columns=[
                     'URL', 'Tipo_Problema', 'Title_HTML', 'Title_Texto', 'Gravidade'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="Title_Ausente")
+                self._gravar(df_vazio, "Title_Ausente")
                 return df_vazio
             
             df_problemas = pd.DataFrame(rows)
@@ -205,7 +186,7 @@ class TitleAusenteSheet(BaseSheetExporter):
             df_problemas = df_problemas.drop('sort_gravidade', axis=1)
             
             # 📤 EXPORTA
-            df_problemas.to_excel(self.writer, index=False, sheet_name="Title_Ausente")
+            self._gravar(df_problemas, "Title_Ausente")
             
             # 📊 ESTATÍSTICAS CIRÚRGICAS
             urls_verificadas = len([r for r in resultados if r.get('sucesso', False)])
@@ -237,7 +218,7 @@ class TitleAusenteSheet(BaseSheetExporter):
             df_erro = pd.DataFrame(columns=[
                 'URL', 'Tipo_Problema', 'Title_HTML', 'Title_Texto', 'Gravidade'
             ])
-            df_erro.to_excel(self.writer, index=False, sheet_name="Title_Ausente")
+            self._gravar(df_erro, "Title_Ausente")
             return df_erro
 
 # Aliases para compatibilidade
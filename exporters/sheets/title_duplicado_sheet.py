@@ -2,126 +2,52 @@
 # 🔄 ENGINE CIRÚRGICA: Detecta titles duplicados reais entre páginas com agrupamento visual
 
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from collections import defaultdict
 from exporters.base_exporter import BaseSheetExporter
+from exporters.duplicatas import detectar_duplicatas, filtrar_urls_paginas_200, grupos_para_dict
 
 class TitleDuplicadoSheet(BaseSheetExporter):
-    def __init__(self, df, writer):
-        super().__init__(df, writer)
-        self.session = self._criar_sessao_otimizada()
-        
-    def _criar_sessao_otimizada(self) -> requests.Session:
-        """🚀 Sessão otimizada para análise de titles"""
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive'
-        })
-        return session
+    def __init__(self, df, writer, registros=None, modo_normalizacao='espacos'):
+        super().__init__(df, writer, registros)
+        # 'espacos' = texto idêntico; 'agressiva' também ignora maiúsculas e acentos
+        self.modo_normalizacao = modo_normalizacao
 
     def _extrair_title_real(self, url: str) -> dict:
-        """🎯 Extrai title real via DOM"""
+        """🎯 Extrai title real via DOM (registro do analisador único)"""
         
-        try:
-            response = self.session.get(url, timeout=10, verify=False)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extrai title real
-            title_tag = soup.find('title')
-            title_text = title_tag.get_text().strip() if title_tag else ""
-            
-            # Limpa texto (remove quebras excessivas, espaços múltiplos)
-            if title_text:
-                title_limpo = ' '.join(title_text.split())
-                return {
-                    'url': url,
-                    'sucesso': True,
-                    'title_text': title_limpo,
-                    'title_length': len(title_limpo)
-                }
-            else:
-                return {
-                    'url': url,
-                    'sucesso': True,
-                    'title_text': '',
-                    'title_length': 0
-                }
-            
-        except Exception as e:
+        registro = self._registro(url)
+        
+        if not registro.http_ok:
             return {
                 'url': url,
                 'sucesso': False,
-                'erro': str(e),
+                'erro': registro.erro_acesso,
                 'title_text': '',
                 'title_length': 0
             }
+        
+        # Limpa texto (remove quebras excessivas, espaços múltiplos)
+        title_limpo = ' '.join(registro.title_texto.split())
+        return {
+            'url': url,
+            'sucesso': True,
+            'title_text': title_limpo,
+            'title_length': len(title_limpo)
+        }
 
     def _filtrar_urls_validas(self, urls_df) -> list:
-        """🧹 Remove URLs inválidas + FILTRA APENAS STATUS 200 + SEM PAGINAÇÃO"""
-        urls_validas = []
-        
-        for _, row in urls_df.iterrows():
-            url = row.get('url', '')
-            
-            if not url or pd.isna(url):
-                continue
-            
-            url_str = str(url).strip()
-            
-            # Filtros básicos
-            if not url_str.startswith(('http://', 'https://')):
-                continue
-            
-            # Remove extensões não-HTML
-            if any(url_str.lower().endswith(ext) for ext in [
-                '.pdf', '.jpg', '.jpeg', '.png', '.gif', '.zip', '.rar',
-                '.js', '.css', '.mp3', '.mp4', '.xml', '.json'
-            ]):
-                continue
-            
-            # 🎯 FILTRO CRUCIAL: SÓ PÁGINAS 200 OK
-            status_code = row.get('status_code_http', row.get('status_code', None))
-            if status_code is not None:
-                try:
-                    status_num = int(float(status_code))
-                    if status_num != 200:
-                        continue  # Pula páginas que não são 200 OK
-                except (ValueError, TypeError):
-                    continue  # Pula se não conseguir converter status
-            
-            # 🚫 FILTRO PAGINAÇÃO: Remove URLs com parâmetros de paginação
-            url_lower = url_str.lower()
-            pagination_params = [
-                '?page=', '&page=', '?p=', '&p=',
-                '?pagina=', '&pagina=', '?pg=', '&pg=',
-                '/page/', '/p/', '/pagina/', '/pg/',
-                '?offset=', '&offset=', '?start=', '&start=',
-                '?pagenum=', '&pagenum=', '?paged=', '&paged='
-            ]
-            
-            is_pagination = any(pagination_param in url_lower for pagination_param in pagination_params)
-            if is_pagination:
-                # DEBUG: Mostra URLs de paginação que estão sendo filtradas
-                print(f"      🚫 Filtrado (paginação): {url_str}")
-                continue  # Pula URLs de paginação
-            
-            urls_validas.append(url_str)
-        
-        return list(set(urls_validas))  # Remove duplicatas
+        """🧹 Remove URLs inválidas + FILTRA APENAS STATUS 200 + SEM PAGINAÇÃO (vetorizado)"""
+        return filtrar_urls_paginas_200(urls_df, excluir_paginacao=True)
 
     def _analisar_titles_paralelo(self, urls: list) -> list:
         """🚀 Análise paralela de titles"""
         
         print(f"🔄 Análise de titles duplicados iniciada: {len(urls)} URLs")
         
+        # 📄 Registros do analisador único: sem rede, sem re-parse
+        if self.registros is not None:
+            return [self._extrair_title_real(url) for url in urls]
+        
         resultados = []
         
         with ThreadPoolExecutor(max_workers=15) as executor:
@@ -143,26 +69,18 @@ class TitleDuplicadoSheet(BaseSheetExporter):
         return resultados
 
     def _detectar_duplicacoes(self, resultados: list) -> dict:
-        """🔍 Detecta titles duplicados entre páginas"""
-        
-        titles_map = defaultdict(list)  # {title_text: [lista_urls]}
+        """🔍 Detecta titles duplicados entre páginas (groupby vetorizado)"""
         
-        # Mapeia titles para URLs
-        for resultado in resultados:
-            if not resultado.get('sucesso', False):
-                continue
-            
-            url = resultado['url']
-            title_text = resultado['title_text']
-            
-            # Só considera titles não vazios
-            if title_text and len(title_text) > 3:  # Ignora titles muito curtos
-                titles_map[title_text].append(url)
+        df_resultados = pd.DataFrame(
+            [r for r in resultados if r.get('sucesso', False)], columns=['url', 'title_text']
+        )
         
-        # Filtra apenas duplicados (mesmo title em múltiplas páginas)
-        titles_duplicados = {title: urls for title, urls in titles_map.items() if len(urls) > 1}
+        # Só considera titles não vazios e com mais de 3 caracteres
+        grupos = detectar_duplicatas(
+            df_resultados, 'title_text', min_caracteres=3, modo=self.modo_normalizacao
+        )
         
-        return titles_duplicados
+        return grupos_para_dict(grupos)
 
     def export(self):
         """🔄 Gera aba CIRÚRGICA de titles duplicados com separadores"""
@@ -183,7 +101,7 @@ class TitleDuplicadoSheet(BaseSheetExporter):
                 df_vazio = pd.DataFrame(columns=[
                     'URL', 'Title', 'Total_URLs_Afetadas', 'Tipo_Linha'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="Title_Duplicado")
+                self._gravar(df_vazio, "Title_Duplicado")
                 return df_vazio
             
             # 🔄 ANÁLISE CIRÚRGICA PARALELA
@@ -200,7 +118,7 @@ class TitleDuplicadoSheet(BaseSheetExporter):
                 df_vazio = pd.DataFrame(columns=[
                     'URL', 'Title', 'Total_URLs_Afetadas', 'Tipo_Linha'
                 ])
-                df_vazio.to_excel(self.writer, index=False, sheet_name="Title_Duplicado")
+                self._gravar(df_vazio, "Title_Duplicado")
                 return df_vazio
             
             # Ordena por quantidade de duplicação (maior primeiro)
@@ -242,7 +160,7 @@ class TitleDuplicadoSheet(BaseSheetExporter):
             df_problemas = df_problemas.drop(['Grupo_Ordenacao'], axis=1, errors='ignore')
             
             # 📤 EXPORTA
-            df_problemas.to_excel(self.writer, index=False, sheet_name="Title_Duplicado")
+            self._gravar(df_problemas, "Title_Duplicado")
             
             # 📊 ESTATÍSTICAS
             urls_com_sucesso = len([r for r in resultados if r.get('sucesso', False)])
@@ -266,5 +184,5 @@ class TitleDuplicadoSheet(BaseSheetExporter):
             df_erro = pd.DataFrame(columns=[
                 'URL', 'Title', 'Total_URLs_Afetadas', 'Tipo_Linha'
             ])
-            df_erro.to_excel(self.writer, index=False, sheet_name="Title_Duplicado")
+            self._gravar(df_erro, "Title_Duplicado")
             return df_erro
\ No newline at end of file
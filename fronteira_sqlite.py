@@ -0,0 +1,159 @@
+# fronteira_sqlite.py - Fronteira de URLs compartilhada entre processos (SQLite WAL)
+# 🗂️ Cada processo worker reserva URLs com BEGIN IMMEDIATE - nenhuma URL é processada duas vezes
+
+import os
+import pickle
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+# Estados da URL na fronteira
+PENDENTE = 0
+EM_PROCESSO = 1
+CONCLUIDA = 2
+
+SQLITE_TIMEOUT = 30  # segundos esperando o lock de escrita
+
+
+class FronteiraSQLite:
+    """🗂️ Fila + conjunto de visitadas + resultados, num arquivo SQLite compartilhado"""
+
+    def __init__(self, path: str, domain: str, max_urls: int = 1000):
+        self.path = path
+        self.domain = domain
+        self.max_urls = max_urls
+
+        pasta = os.path.dirname(path)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+
+        # isolation_level=None: transações explícitas (BEGIN IMMEDIATE) controladas aqui
+        self.conn = sqlite3.connect(path, timeout=SQLITE_TIMEOUT, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS fronteira (
+                ordem INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT UNIQUE NOT NULL,
+                nivel INTEGER NOT NULL,
+                estado INTEGER NOT NULL DEFAULT 0,
+                worker INTEGER,
+                resultado BLOB
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_fronteira_estado ON fronteira (estado, nivel, ordem)")
+
+    def _inserir(self, urls: List[str], nivel: int) -> int:
+        """➕ Insere URLs novas respeitando max_urls (dentro de uma transação aberta)"""
+        total = self.conn.execute("SELECT COUNT(*) FROM fronteira").fetchone()[0]
+        adicionadas = 0
+        for url in urls:
+            if total >= self.max_urls:
+                break
+            if not url or self.domain not in url:
+                continue
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO fronteira (url, nivel) VALUES (?, ?)", (url, nivel)
+            )
+            total += cursor.rowcount
+            adicionadas += cursor.rowcount
+        return adicionadas
+
+    def adicionar_urls(self, urls: List[str], nivel: int) -> int:
+        """📦 Adiciona lote de URLs"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            adicionadas = self._inserir(urls, nivel)
+            self.conn.execute("COMMIT")
+            return adicionadas
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def reservar(self, worker_id: int) -> Optional[Tuple[str, int]]:
+        """🔒 Reserva a próxima URL pendente (menor nível primeiro, ordem de descoberta)"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            linha = self.conn.execute(
+                "SELECT ordem, url, nivel FROM fronteira WHERE estado = ? ORDER BY nivel, ordem LIMIT 1",
+                (PENDENTE,)
+            ).fetchone()
+            if linha:
+                self.conn.execute(
+                    "UPDATE fronteira SET estado = ?, worker = ? WHERE ordem = ?",
+                    (EM_PROCESSO, worker_id, linha[0])
+                )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return (linha[1], linha[2]) if linha else None
+
+    def concluir(self, url: str, resultado: Dict, novos_links: List[str], nivel_links: int) -> int:
+        """✅ Grava resultado e enfileira links na mesma transação
+
+        Juntos evitam a janela em que a fronteira parece vazia (nada pendente, nada
+        em processo) antes dos links da última página entrarem - outro worker sairia cedo.
+        """
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            adicionadas = self._inserir(novos_links, nivel_links) if novos_links else 0
+            self.conn.execute(
+                "UPDATE fronteira SET estado = ?, resultado = ? WHERE url = ?",
+                (CONCLUIDA, pickle.dumps(resultado, protocol=pickle.HIGHEST_PROTOCOL), url)
+            )
+            self.conn.execute("COMMIT")
+            return adicionadas
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def liberar_worker(self, worker_id: int) -> int:
+        """♻️ Devolve à fila as URLs reservadas por um worker que morreu"""
+        cursor = self.conn.execute(
+            "UPDATE fronteira SET estado = ?, worker = NULL WHERE estado = ? AND worker = ?",
+            (PENDENTE, EM_PROCESSO, worker_id)
+        )
+        return cursor.rowcount
+
+    def contar(self, estado: int) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM fronteira WHERE estado = ?", (estado,)).fetchone()[0]
+
+    def finalizada(self) -> bool:
+        """🏁 Nada pendente e nada em processo (nenhum worker pode gerar novos links)"""
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM fronteira WHERE estado IN (?, ?)", (PENDENTE, EM_PROCESSO)
+        ).fetchone()[0] == 0
+
+    def resultados(self) -> List[Dict]:
+        """📋 Resultados de todos os workers, na ordem de descoberta"""
+        linhas = self.conn.execute(
+            "SELECT resultado FROM fronteira WHERE estado = ? ORDER BY ordem", (CONCLUIDA,)
+        ).fetchall()
+        return [pickle.loads(linha[0]) for linha in linhas if linha[0] is not None]
+
+    def get_stats(self) -> Dict:
+        """📊 Estatísticas da fronteira"""
+        por_worker = dict(self.conn.execute(
+            "SELECT worker, COUNT(*) FROM fronteira WHERE estado = ? GROUP BY worker", (CONCLUIDA,)
+        ).fetchall())
+        return {
+            'pendentes': self.contar(PENDENTE),
+            'em_processo': self.contar(EM_PROCESSO),
+            'concluidas': self.contar(CONCLUIDA),
+            'por_worker': por_worker
+        }
+
+    def close(self):
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def remover(path: str):
+        """🗑️ Remove arquivo da fronteira (e arquivos WAL)"""
+        for sufixo in ('', '-wal', '-shm'):
+            try:
+                os.remove(path + sufixo)
+            except OSError:
+                pass
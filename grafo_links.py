@@ -0,0 +1,255 @@
+# grafo_links.py - Grafo de links internos (profundidade de clique, inlinks/outlinks, órfãs, PageRank interno)
+# 🕸️ Arestas com IDs inteiros em arrays compactos; BFS e PageRank vetorizados sobre CSR
+
+import re
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urljoin, urlparse
+
+import numpy as np
+
+try:
+    from scipy.sparse import csr_matrix
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# 🎯 CONFIGURAÇÕES
+AMORTECIMENTO = 0.85            # Fator de damping do PageRank
+TOLERANCIA_PAGERANK = 1e-8      # Norma L1 entre iterações para parar
+MAX_ITERACOES_PAGERANK = 100
+LIMITE_PROFUNDIDADE = 3         # Mais cliques que isso a partir da home = página profunda
+MAX_URLS_SITEMAP = 50000
+
+
+def chave_url(url: str) -> str:
+    """🔑 Mesma normalização do crawler: sem fragmento, sem barra final"""
+    return str(url).split('#')[0].strip().rstrip('/')
+
+
+def urls_do_sitemap(url_base: str, session=None, timeout: int = 10, max_sitemaps: int = 20) -> List[str]:
+    """🗺️ URLs do /sitemap.xml (segue um nível de sitemap index)"""
+    import requests
+
+    session = session or requests.Session()
+    pendentes = [urljoin(url_base, '/sitemap.xml')]
+    visitados = set()
+    urls: List[str] = []
+
+    while pendentes and len(visitados) < max_sitemaps and len(urls) < MAX_URLS_SITEMAP:
+        sitemap = pendentes.pop(0)
+        if sitemap in visitados:
+            continue
+        visitados.add(sitemap)
+        try:
+            response = session.get(sitemap, timeout=timeout, verify=False)
+            if response.status_code != 200:
+                continue
+            locs = re.findall(r'<loc>\s*([^<\s]+)\s*</loc>', response.text)
+        except Exception:
+            continue
+        for loc in locs:
+            if loc.endswith('.xml') or loc.endswith('.xml.gz'):
+                if not loc.endswith('.gz'):
+                    pendentes.append(loc)
+            else:
+                urls.append(loc)
+
+    return urls[:MAX_URLS_SITEMAP]
+
+
+class GrafoLinks:
+    """🕸️ Grafo direcionado de links internos: URL -> ID inteiro, arestas em array('i')"""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.urls: List[str] = []
+        self._origens = array('i')
+        self._destinos = array('i')
+
+        self.raizes: List[int] = []
+        self.rastreadas = set()         # IDs das URLs baixadas pelo crawler
+        self.no_sitemap = set()         # IDs das URLs listadas no sitemap
+
+        self._csr = None                # (indptr, indices) sem duplicatas nem self-loops
+        self.stats = {'arestas_brutas': 0}
+
+    # ========================
+    # 🏗️ CONSTRUÇÃO
+    # ========================
+
+    def id_url(self, url: str) -> int:
+        chave = chave_url(url)
+        id_ = self.ids.get(chave)
+        if id_ is None:
+            id_ = self.ids[chave] = len(self.urls)
+            self.urls.append(chave)
+        return id_
+
+    def adicionar_pagina(self, url: str, links: Iterable[str], nivel=None) -> int:
+        """➕ Página rastreada e seus links de saída"""
+        origem = self.id_url(url)
+        self.rastreadas.add(origem)
+        if nivel == 0:
+            self.raizes.append(origem)
+        destinos = [self.id_url(link) for link in links if link]
+        self._origens.extend([origem] * len(destinos))
+        self._destinos.extend(destinos)
+        self._csr = None
+        return origem
+
+    def adicionar_sitemap(self, urls: Iterable[str]):
+        for url in urls:
+            self.no_sitemap.add(self.id_url(url))
+
+    @classmethod
+    def de_resultados(cls, resultados, coluna_links: str = 'links_encontrados',
+                      urls_sitemap: Optional[Iterable[str]] = None) -> 'GrafoLinks':
+        """🏗️ Grafo a partir dos resultados do crawler (lista de dicts ou DataFrame)"""
+        grafo = cls()
+        registros = resultados.to_dict('records') if hasattr(resultados, 'to_dict') else resultados
+
+        for registro in registros:
+            url = registro.get('url')
+            if not isinstance(url, str) or not url.startswith(('http://', 'https://')):
+                continue
+            links = registro.get(coluna_links)
+            links = list(links) if isinstance(links, (list, tuple, set, np.ndarray)) else []
+
+            # Redirect interno vira aresta: o PageRank flui para o destino final
+            final = registro.get('final_url')
+            if isinstance(final, str) and final and chave_url(final) != chave_url(url) \
+                    and urlparse(final).netloc == urlparse(url).netloc:
+                links.append(final)
+
+            try:
+                nivel = int(registro.get('nivel'))
+            except (TypeError, ValueError):
+                nivel = None
+            grafo.adicionar_pagina(url, links, nivel=nivel)
+
+        if not grafo.raizes and grafo.urls:
+            grafo.raizes.append(0)
+        if urls_sitemap:
+            grafo.adicionar_sitemap(urls_sitemap)
+        return grafo
+
+    @property
+    def total_nos(self) -> int:
+        return len(self.urls)
+
+    def csr(self):
+        """🧮 (indptr, indices) por origem - arestas únicas, sem self-loops"""
+        if self._csr is not None:
+            return self._csr
+
+        n = self.total_nos
+        origens = np.frombuffer(self._origens, dtype=np.int32).astype(np.int64)
+        destinos = np.frombuffer(self._destinos, dtype=np.int32).astype(np.int64)
+        self.stats['arestas_brutas'] = len(origens)
+
+        validas = origens != destinos
+        chaves = np.unique(origens[validas] * n + destinos[validas])   # Ordena por origem, depois destino
+        origens, destinos = chaves // n, chaves % n
+
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origens, minlength=n), out=indptr[1:])
+        self._csr = (indptr, destinos, origens)
+        return self._csr
+
+    # ========================
+    # 📊 MÉTRICAS
+    # ========================
+
+    def graus(self):
+        """🔢 (inlinks, outlinks) - páginas distintas que linkam / são linkadas"""
+        indptr, destinos, _ = self.csr()
+        outlinks = np.diff(indptr)
+        inlinks = np.bincount(destinos, minlength=self.total_nos)
+        return inlinks, outlinks
+
+    def profundidade(self, raizes: Optional[List[int]] = None) -> np.ndarray:
+        """🧭 Cliques mínimos a partir das raízes (BFS por camadas sobre CSR); -1 = inalcançável"""
+        indptr, destinos, _ = self.csr()
+        profundidade = np.full(self.total_nos, -1, dtype=np.int32)
+        fronteira = np.unique(np.asarray(raizes if raizes is not None else self.raizes, dtype=np.int64))
+        if fronteira.size == 0:
+            return profundidade
+
+        profundidade[fronteira] = 0
+        nivel = 0
+        while fronteira.size:
+            inicios = indptr[fronteira]
+            contagens = indptr[fronteira + 1] - inicios
+            total = int(contagens.sum())
+            if total == 0:
+                break
+            # Posições de todas as arestas de saída da fronteira, sem laço Python
+            deslocamentos = np.repeat(inicios - np.cumsum(contagens) + contagens, contagens)
+            vizinhos = destinos[deslocamentos + np.arange(total)]
+            vizinhos = np.unique(vizinhos[profundidade[vizinhos] < 0])
+            nivel += 1
+            profundidade[vizinhos] = nivel
+            fronteira = vizinhos
+
+        return profundidade
+
+    def pagerank(self, amortecimento: float = AMORTECIMENTO, tolerancia: float = TOLERANCIA_PAGERANK,
+                 max_iteracoes: int = MAX_ITERACOES_PAGERANK) -> np.ndarray:
+        """📈 PageRank interno por iteração de potência (páginas sem saída redistribuem uniformemente)"""
+        n = self.total_nos
+        if n == 0:
+            return np.zeros(0)
+
+        indptr, destinos, origens = self.csr()
+        outlinks = np.diff(indptr)
+        sem_saida = outlinks == 0
+        pesos = 1.0 / outlinks[origens]
+
+        matriz = csr_matrix((pesos, (destinos, origens)), shape=(n, n)) if SCIPY_AVAILABLE else None
+
+        rank = np.full(n, 1.0 / n)
+        for iteracao in range(1, max_iteracoes + 1):
+            if matriz is not None:
+                propagado = matriz @ rank
+            else:
+                propagado = np.bincount(destinos, weights=rank[origens] * pesos, minlength=n)
+            novo = amortecimento * propagado + (amortecimento * rank[sem_saida].sum() + 1.0 - amortecimento) / n
+            erro = np.abs(novo - rank).sum()
+            rank = novo
+            if erro < tolerancia:
+                break
+
+        self.stats['iteracoes_pagerank'] = iteracao
+        return rank
+
+    def metricas(self) -> Dict[str, np.ndarray]:
+        """📊 Todas as métricas por nó (arrays alinhados com self.urls)"""
+        inicio = time.perf_counter()
+        inlinks, outlinks = self.graus()
+        profundidade = self.profundidade()
+        pagerank = self.pagerank()
+
+        conhecidas = np.zeros(self.total_nos, dtype=bool)
+        conhecidas[list(self.rastreadas | self.no_sitemap)] = True
+        raiz = np.zeros(self.total_nos, dtype=bool)
+        raiz[self.raizes] = True
+
+        self.stats.update({
+            'nos': self.total_nos,
+            'arestas': int(outlinks.sum()),
+            'segundos': round(time.perf_counter() - inicio, 3),
+        })
+        return {
+            'inlinks': inlinks,
+            'outlinks': outlinks,
+            'profundidade': profundidade,
+            'pagerank': pagerank,
+            'orfa': conhecidas & ~raiz & (inlinks == 0),
+            'conhecida': conhecidas,
+        }
+
+    def get_stats(self) -> Dict:
+        """📊 Estatísticas do grafo"""
+        return {**self.stats, 'scipy': SCIPY_AVAILABLE}
@@ -1,64 +1,58 @@
 # http_inseguro.py
+# 🔓 Referências http:// classificadas por contexto (atributo, style, <style>, script, texto) num passe de tokenizer
 
 import requests
-from bs4 import BeautifulSoup
-import re
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 import warnings
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from scanner_http import TAMANHO_BLOCO, varrer_http
+
 warnings.filterwarnings("ignore")
 
-def analisar_http_inseguro(url):
-    resultados = []
+# Session compartilhada com pool: keep-alive entre URLs do mesmo host (sem handshake TCP/TLS por URL)
+def _criar_sessao(max_conexoes=30):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max_conexoes, pool_maxsize=max_conexoes)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
-    try:
-        response = requests.get(url, timeout=10, verify=False)
-        html = response.text
-        soup = BeautifulSoup(html, "lxml")
-
-        # 1. HTML bruto
-        if "http://" in html:
-            ocorrencias_html = re.findall(r'(http://[^"\s\)]+)', html)
-            for ocorrencia in set(ocorrencias_html):
-                resultados.append({
-                    "url": url,
-                    "tipo": "html",
-                    "trecho": ocorrencia
-                })
+SESSION = _criar_sessao()
 
-        # 2. CSS inline
-        for tag in soup.find_all(True):
-            style = tag.get("style")
-            if style and "http://" in style:
-                links_css = re.findall(r'(http://[^"\s\)]+)', style)
-                for link in links_css:
-                    resultados.append({
-                        "url": url,
-                        "tipo": "css_inline",
-                        "trecho": link
-                    })
+def linhas_http_inseguro(url, varredura):
+    """🔓 Linhas da aba HTTP_Inseguro: uma por (contexto, elemento, trecho) da varredura"""
+    linhas = []
+    for ocorrencia in varredura.ocorrencias_unicas():
+        elemento = ocorrencia.tag
+        if ocorrencia.atributo:
+            elemento = f"{ocorrencia.tag}[{ocorrencia.atributo}]"
+        linhas.append({
+            "url": url,
+            "tipo": ocorrencia.contexto,
+            "trecho": ocorrencia.trecho,
+            "elemento": elemento
+        })
+    if varredura.erro:
+        linhas.append({"url": url, "tipo": "erro", "trecho": varredura.erro, "elemento": ""})
+    return linhas
 
-        # 3. CSS em <style>
-        for style_tag in soup.find_all("style"):
-            css = style_tag.get_text()
-            if "http://" in css:
-                links_style = re.findall(r'(http://[^"\s\)]+)', css)
-                for link in links_style:
-                    resultados.append({
-                        "url": url,
-                        "tipo": "style_tag",
-                        "trecho": link
-                    })
+def analisar_http_inseguro(url):
+    try:
+        # Corpo em blocos direto para o tokenizer: sem árvore, sem regex sobre o HTML inteiro
+        with SESSION.get(url, timeout=10, verify=False, stream=True) as response:
+            charset = response.encoding if 'charset' in response.headers.get('Content-Type', '').lower() else None
+            varredura = varrer_http(response.iter_content(TAMANHO_BLOCO), url, charset)
+        return linhas_http_inseguro(url, varredura)
 
     except Exception as e:
-        resultados.append({
+        return [{
             "url": url,
             "tipo": "erro",
-            "trecho": str(e)
-        })
-
-    return resultados
+            "trecho": str(e),
+            "elemento": ""
+        }]
 
 def extrair_http_inseguros(urls, max_threads=30):
     resultados = []
@@ -74,7 +68,8 @@ def extrair_http_inseguros(urls, max_threads=30):
                 resultados.append({
                     "url": futuros[future],
                     "tipo": "erro",
-                    "trecho": str(e)
+                    "trecho": str(e),
+                    "elemento": ""
                 })
 
             if i % 100 == 0 or i == len(urls):
@@ -10,6 +10,9 @@ import warnings
 import os
 import pickle
 
+from diff_estatico_renderizado import diff_de_html
+from armazem_paginas import obter_armazem
+from verificador_links import extrair_links_todos
 
 warnings.filterwarnings("ignore")
 
@@ -149,8 +152,8 @@ def processar_url_playwright(url, nivel, dominio_base):
             # Links internos
             links = []
             link_elements = page.query_selector_all('a[href]')
-            for link in link_elements:
-                href = link.get_attribute('href')
+            hrefs = [link.get_attribute('href') for link in link_elements]
+            for href in hrefs:
                 if href and not href.startswith(('mailto:', 'tel:', 'javascript:', '#')):
                     full_url = urljoin(url, href)
                     parsed = urlparse(full_url)
@@ -160,6 +163,23 @@ def processar_url_playwright(url, nivel, dominio_base):
                             clean_url += f"?{parsed.query}"
                         links.append(clean_url.rstrip('/'))
             
+            # 🔀 Estático x renderizado: corpo da resposta do goto = HTML que o bot recebe
+            diff_js = {}
+            if response:
+                try:
+                    renderizado = page.evaluate("""
+                        () => ({
+                            canonical: document.querySelector('link[rel="canonical"]')?.getAttribute('href') || '',
+                            meta_robots: document.querySelector('meta[name="robots"]')?.getAttribute('content') || '',
+                            h1_texts: Array.from(document.querySelectorAll('h1'))
+                                .map(h => (h.textContent || '').trim()).filter(Boolean)
+                        })
+                    """)
+                    renderizado.update({'title': title, 'description': description, 'links_encontrados': links})
+                    diff_js = diff_de_html(response.text(), page.url, dominio_base, renderizado)
+                except Exception:
+                    pass
+            
             browser.close()
             
             return {
@@ -170,8 +190,10 @@ def processar_url_playwright(url, nivel, dominio_base):
                 "title": title,
                 "description": description,
                 **headings,
+                **diff_js,
                 "response_time": round(response_time, 2),
                 "links_encontrados": list(set(links)),
+                "links_todos": extrair_links_todos(hrefs, page.url),
                 "crawler_method": "playwright"
             }
     
@@ -194,6 +216,10 @@ def processar_url_requests(url, nivel, dominio_base):
         response = fast_session.get(url)
         response_time = (time.time() - start_time) * 1000
         
+        # 📦 Página guardada: analisador e motor de headings não baixam de novo
+        if response.status_code == 200 and 'text/html' in response.headers.get("Content-Type", ""):
+            obter_armazem().guardar_resposta(url, response)
+        
         # Extrai dados básicos
         soup = BeautifulSoup(response.text, 'lxml')
         
@@ -209,8 +235,8 @@ def processar_url_requests(url, nivel, dominio_base):
         
         # Links internos
         links = []
-        for tag in soup.find_all("a", href=True):
-            href = tag["href"]
+        hrefs = [tag["href"] for tag in soup.find_all("a", href=True)]
+        for href in hrefs:
             if not href.startswith(('mailto:', 'tel:', 'javascript:', '#')):
                 full_url = urljoin(url, href)
                 parsed = urlparse(full_url)
@@ -230,6 +256,7 @@ def processar_url_requests(url, nivel, dominio_base):
             **headings,
             "response_time": round(response_time, 2),
             "links_encontrados": list(set(links)),
+            "links_todos": extrair_links_todos(hrefs, response.url),
             "crawler_method": "requests"
         }
         
@@ -284,6 +311,9 @@ def rastrear_hibrido_inteligente(
     resultados = []
     dominio_base = urlparse(url_inicial).netloc
     
+    # 🔖 Páginas guardadas por crawls anteriores deixam de valer para analisador e abas
+    obter_armazem().iniciar_crawl(url_inicial)
+    
     # Modo automático: detecta necessidade de JS
     if modo == "auto" and PLAYWRIGHT_AVAILABLE:
         print(f"🧠 Detectando se site precisa de JavaScript...")
@@ -0,0 +1,115 @@
+# indice_css.py - Índice de seletores do CSS da página (classe/ID -> regras que ocultam)
+# 🗂️ Um passe pelo CSS; a checagem de cada heading vira consulta em dicionário
+
+import re
+from typing import Dict, List, Tuple
+
+# Mesmas propriedades procuradas pelo validador de headings
+PROPRIEDADES_OCULTACAO = ('display:none', 'visibility:hidden', 'color:white', 'color:#fff')
+
+# Fim do seletor ao voltar do '{': nenhum nome indexado atravessa estes caracteres
+DELIMITADORES_SELETOR = '{};'
+
+
+class IndiceCSS:
+    """🗂️ Regras `.classe {...}` e `#id {...}` indexadas pelo nome
+
+    Reproduz re.findall(rf'\\.{classe}\\s*\\{{[^}}]*\\}}', css.lower()): o nome tem que
+    terminar logo antes do '{' (só espaços no meio) e a regra vai até o primeiro '}'.
+    Nomes com espaço ou '{', '}', ';' (não indexáveis) caem no regex original.
+    """
+
+    def __init__(self, css: str):
+        self.css_lower = (css or '').lower()
+
+        # nome -> [(início do match, fim do match, regra oculta?)] em ordem de documento
+        self.classes: Dict[str, List[Tuple[int, int, bool]]] = {}
+        self.ids: Dict[str, List[Tuple[int, int, bool]]] = {}
+        self._cache: Dict[Tuple[str, str], int] = {}
+
+        self._indexar()
+
+    def _indexar(self):
+        css = self.css_lower
+        abre = css.find('{')
+
+        while abre != -1:
+            fecha = css.find('}', abre)
+            if fecha == -1:
+                break  # Sem '}' o regex não casa nada a partir daqui
+
+            # Volta os espaços entre o seletor e o '{'
+            fim_seletor = abre
+            while fim_seletor > 0 and css[fim_seletor - 1].isspace():
+                fim_seletor -= 1
+
+            # Trecho contínuo do seletor (até espaço ou delimitador)
+            inicio = fim_seletor
+            while inicio > 0 and not css[inicio - 1].isspace() and css[inicio - 1] not in DELIMITADORES_SELETOR:
+                inicio -= 1
+
+            # Propriedades não têm espaço nem '{': ou estão no corpo, ou no próprio seletor
+            corpo_oculta = any(prop in css[abre:fecha + 1] for prop in PROPRIEDADES_OCULTACAO)
+
+            for posicao in range(inicio, fim_seletor):
+                marcador = css[posicao]
+                if marcador != '.' and marcador != '#':
+                    continue
+                oculta = corpo_oculta or any(prop in css[posicao:fim_seletor] for prop in PROPRIEDADES_OCULTACAO)
+                destino = self.classes if marcador == '.' else self.ids
+                destino.setdefault(css[posicao + 1:fim_seletor], []).append((posicao, fecha + 1, oculta))
+
+            abre = css.find('{', abre + 1)
+
+    @staticmethod
+    def _indexavel(nome: str) -> bool:
+        return not any(c.isspace() or c in DELIMITADORES_SELETOR for c in nome)
+
+    def _contar_ocultas(self, marcador: str, nome: str) -> int:
+        """🔢 Regras que ocultam, com a mesma sobreposição do re.findall"""
+        chave = (marcador, nome)
+        if chave in self._cache:
+            return self._cache[chave]
+
+        if not nome:
+            total = 0
+        elif self._indexavel(nome):
+            indice = self.classes if marcador == '.' else self.ids
+            total = 0
+            fim_anterior = -1
+            for inicio, fim, oculta in indice.get(nome, ()):
+                # re.findall não devolve matches sobrepostos
+                if inicio < fim_anterior:
+                    continue
+                fim_anterior = fim
+                total += oculta
+        else:
+            pattern = rf'{re.escape(marcador)}{re.escape(nome)}\s*\{{[^}}]*\}}'
+            total = sum(
+                1 for match in re.findall(pattern, self.css_lower, re.DOTALL)
+                if any(prop in match for prop in PROPRIEDADES_OCULTACAO)
+            )
+
+        self._cache[chave] = total
+        return total
+
+    def regras_ocultas_classe(self, classe: str) -> int:
+        """🎨 Quantas regras `.classe {...}` ocultam o elemento"""
+        return self._contar_ocultas('.', classe)
+
+    def regras_ocultas_id(self, id_elemento: str) -> int:
+        """🆔 Quantas regras `#id {...}` ocultam o elemento"""
+        return self._contar_ocultas('#', id_elemento)
+
+
+class IndiceCSSComposto:
+    """🗂️ Soma as regras de vários índices (CSS inline da página + stylesheets externos compartilhados)"""
+
+    def __init__(self, indices: List[IndiceCSS]):
+        self.indices = list(indices)
+
+    def regras_ocultas_classe(self, classe: str) -> int:
+        return sum(indice.regras_ocultas_classe(classe) for indice in self.indices)
+
+    def regras_ocultas_id(self, id_elemento: str) -> int:
+        return sum(indice.regras_ocultas_id(id_elemento) for indice in self.indices)
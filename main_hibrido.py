@@ -15,6 +15,11 @@ from urllib.parse import urlparse
 URL_BASE = "https://ccgsaude.com.br/"
 MAX_URLS = 12000
 MAX_DEPTH = 3
+REEXTRAIR_DO_RENDER_CACHE = False  # True: re-extrai sobre DOMs salvos em vez de re-renderizar
+REPRESENTANTES_POR_TEMPLATE = 0    # K > 0: renderiza só K URLs por template (demais extrapoladas)
+MODO_CACHE_BROWSER = None          # None | 'route' (cache de CSS/JS/fontes do crawler) | 'persistente' (perfil em disco)
+MODO_EXTRACAO = 'dom'              # 'dom' | 'snapshot' (DOMSnapshot CDP: visibilidade real com CSS externo)
+NUM_PROCESSOS_PLAYWRIGHT = 1       # N > 1: N processos worker (event loop + browser pool cada)
 
 def gerar_nome_arquivo_seguro(url_base):
     """🔧 Gera nome de arquivo seguro"""
@@ -48,6 +53,18 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     print("❌ Crawler Playwright não disponível")
 
+# Detecção JS amostral por template
+try:
+    from deteccao_js import DetectorJSAmostral, resumir_veredito, LIMIAR_SITE_JS
+    DETECCAO_JS_AVAILABLE = True
+    print("✅ Detector JS amostral disponível")
+except ImportError:
+    DETECCAO_JS_AVAILABLE = False
+    LIMIAR_SITE_JS = 50
+    print("❌ Detector JS amostral não disponível")
+
+ULTIMA_DETECCAO_JS = {}
+
 # Excel Manager Enterprise
 try:
     from exporters.excel_manager import exportar_relatorio_completo
@@ -57,9 +74,9 @@ except ImportError:
     EXCEL_MANAGER_AVAILABLE = False
     print("❌ Excel Manager Enterprise não disponível")
 
-# SSL Validator Enterprise
+# SSL Validator Enterprise (motor único: pré-auditoria, aba SSL e priorização)
 try:
-    from ssl_problems import validar_ssl_completo
+    from motor_ssl import obter_motor_ssl, avaliar as avaliar_ssl
     SSL_VALIDATOR_AVAILABLE = True
     print("✅ SSL Validator Enterprise disponível")
 except ImportError:
@@ -83,62 +100,30 @@ warnings.filterwarnings("ignore", category=UserWarning)
 # ========================
 
 async def detectar_necessidade_js_enterprise(url: str) -> tuple[bool, str, int]:
-    """🧠 Detecção enterprise de necessidade de JS com score"""
+    """🧠 Detecção enterprise de necessidade de JS - amostral, por template, não bloqueante
+    
+    Retorna (needs_js, reason, score) onde score = % das URLs amostradas em templates
+    que dependem de JS. O detalhe por template fica em ULTIMA_DETECCAO_JS.
+    """
+    
+    global ULTIMA_DETECCAO_JS
+    
+    if not DETECCAO_JS_AVAILABLE:
+        return True, "Detector amostral não disponível - usando Playwright por segurança", 100
     
     try:
-        import requests
-        
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        }
-        
-        response = requests.get(url, headers=headers, timeout=15, verify=False)
-        html_lower = response.text.lower()
+        resultado = await DetectorJSAmostral().detectar(url)
+        ULTIMA_DETECCAO_JS = resultado
         
-        # Sistema de pontuação enterprise
-        js_score = 0
-        reasons = []
+        if not resultado.get('total_amostras'):
+            return True, "Nenhuma URL da amostra respondeu HTML - usando Playwright por segurança", 100
         
-        # Frameworks JS (peso alto)
-        frameworks = ['react', 'vue', 'angular', 'next.js', 'nuxt', 'svelte']
-        if any(fw in html_lower for fw in frameworks):
-            js_score += 30
-            reasons.append("Framework JS detectado")
+        for template, dados in sorted(resultado['templates'].items(), key=lambda x: -x[1]['amostras']):
+            icone = "🎭" if dados.get('precisa_js') else "⚡"
+            print(f"   {icone} {template}: {dados['amostras']} amostras, {dados['renderizadas']} renderizadas, "
+                  f"confiança {dados['confianca']:.0%} ({dados['base']})")
         
-        # SPA patterns (peso alto)
-        spa_patterns = ['data-reactroot', 'ng-app', 'v-app', '__next', '__nuxt']
-        if any(pattern in html_lower for pattern in spa_patterns):
-            js_score += 25
-            reasons.append("SPA pattern detectado")
-        
-        # Dynamic loading (peso médio)
-        loading_indicators = ['loading', 'carregando', 'spinner', 'skeleton']
-        if any(word in html_lower for word in loading_indicators):
-            js_score += 15
-            reasons.append("Loading dinâmico detectado")
-        
-        # API calls (peso médio)
-        api_patterns = ['fetch(', 'axios', '$.ajax', 'api/', 'graphql', 'json']
-        if any(api in html_lower for api in api_patterns):
-            js_score += 20
-            reasons.append("Chamadas de API detectadas")
-        
-        # Bundle patterns (peso baixo)
-        bundle_patterns = ['webpack', 'bundle.js', 'chunk.js', 'vendor.js']
-        if any(bundle in html_lower for bundle in bundle_patterns):
-            js_score += 10
-            reasons.append("Bundles JS detectados")
-        
-        # Hydration patterns (peso alto)
-        hydration_patterns = ['hydrate', 'ssr', 'server-side']
-        if any(hydration in html_lower for hydration in hydration_patterns):
-            js_score += 25
-            reasons.append("SSR/Hydration detectado")
-        
-        needs_js = js_score >= 50  # Threshold enterprise
-        reason = " | ".join(reasons) if reasons else "Site aparenta ser estático"
-        
-        return needs_js, reason, js_score
+        return resultado['precisa_js'], resumir_veredito(resultado), resultado['percentual_urls_js']
         
     except Exception as e:
         return True, f"Erro na detecção: {str(e)} - usando Playwright por segurança", 100
@@ -162,12 +147,20 @@ def executar_pre_auditoria_ssl(url_base: str) -> dict:
     
     if SSL_VALIDATOR_AVAILABLE:
         try:
-            ssl_resultado = validar_ssl_completo(url_base)
+            resultado_tls = obter_motor_ssl().resultado_url(url_base)
             
-            if isinstance(ssl_resultado, dict):
-                if not ssl_resultado.get('ssl_valido', True):
+            if resultado_tls is None:
+                resultado_ssl['ssl_valido'] = False
+                resultado_ssl['problemas_encontrados'] = ['URL base não usa HTTPS']
+                resultado_ssl['recomendacoes'].append("Migrar para HTTPS")
+                print(f"🚨 URL base não usa HTTPS")
+            else:
+                ssl_resultado = avaliar_ssl(resultado_tls, url=url_base)
+                resultado_ssl['grade_ssl'] = ssl_resultado['grade_ssl']
+                
+                if not ssl_resultado['certificado_valido'] or ssl_resultado['grade_ssl'] == 'F':
                     resultado_ssl['ssl_valido'] = False
-                    resultado_ssl['problemas_encontrados'] = ssl_resultado.get('problemas', [])
+                    resultado_ssl['problemas_encontrados'] = ssl_resultado['problemas_detalhados']
                     resultado_ssl['impacto_crawling'] = 'alto'
                     
                     print(f"🚨 PROBLEMAS SSL DETECTADOS:")
@@ -217,10 +210,11 @@ async def executar_crawling_hibrido_enterprise():
                 'needs_js': needs_js,
                 'reason': reason,
                 'score': score,
-                'threshold': 50
+                'threshold': LIMIAR_SITE_JS,
+                'templates': ULTIMA_DETECCAO_JS.get('templates', {})
             }
             
-            print(f"📊 Score JS: {score}/100 (threshold: 50)")
+            print(f"📊 Score JS: {score}/100 (threshold: {LIMIAR_SITE_JS})")
             print(f"📋 Método recomendado: {'Playwright' if needs_js else 'Requests'}")
             print(f"📝 Razão: {reason}")
             
@@ -231,7 +225,12 @@ async def executar_crawling_hibrido_enterprise():
                     URL_BASE,
                     max_urls=MAX_URLS,
                     max_depth=MAX_DEPTH,
-                    forcar_reindexacao=False
+                    forcar_reindexacao=False,
+                    reextrair=REEXTRAIR_DO_RENDER_CACHE,
+                    representantes_por_template=REPRESENTANTES_POR_TEMPLATE,
+                    modo_cache_browser=MODO_CACHE_BROWSER,
+                    modo_extracao=MODO_EXTRACAO,
+                    num_processos=NUM_PROCESSOS_PLAYWRIGHT
                 )
                 metodo_utilizado = "PLAYWRIGHT_ENTERPRISE"
             else:
@@ -249,7 +248,12 @@ async def executar_crawling_hibrido_enterprise():
                         URL_BASE,
                         max_urls=MAX_URLS,
                         max_depth=MAX_DEPTH,
-                        forcar_reindexacao=False
+                        forcar_reindexacao=False,
+                        reextrair=REEXTRAIR_DO_RENDER_CACHE,
+                        representantes_por_template=REPRESENTANTES_POR_TEMPLATE,
+                        modo_cache_browser=MODO_CACHE_BROWSER,
+                        modo_extracao=MODO_EXTRACAO,
+                        num_processos=NUM_PROCESSOS_PLAYWRIGHT
                     )
                     metodo_utilizado = "PLAYWRIGHT_FALLBACK"
                     
@@ -1,6 +1,7 @@
 # metatags.py
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 import warnings
@@ -13,9 +14,20 @@ HEADERS = {
     "Accept-Language": "pt-BR,pt;q=0.9"
 }
 
+# Session compartilhada com pool: keep-alive entre URLs do mesmo host (sem handshake TCP/TLS por URL)
+def _criar_sessao(max_conexoes=30):
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=max_conexoes, pool_maxsize=max_conexoes)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+SESSION = _criar_sessao()
+
 def extrair_metadados(url):
     try:
-        response = requests.get(url, timeout=10, headers=HEADERS, verify=False)
+        response = SESSION.get(url, timeout=10, verify=False)
         soup = BeautifulSoup(response.text, "lxml")
 
         title = soup.title.string.strip() if soup.title else ""
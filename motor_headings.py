@@ -0,0 +1,762 @@
+# motor_headings.py - Motor único de headings vazios e ocultos por CSS
+# 🔠 Um critério, um parse por página: roda sobre DOMSnapshot do crawl, registros do analisador
+#    ou páginas do armazém; a rede só é usada para URL que nunca foi guardada
+
+import re
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+import requests
+from bs4 import BeautifulSoup
+import warnings
+
+from armazem_paginas import ArmazemPaginas, PaginaArmazenada, obter_armazem
+from indice_css import IndiceCSS, IndiceCSSComposto
+
+warnings.filterwarnings("ignore")
+
+TAGS_HEADING = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+MAX_HTML_TRECHO = 200
+MAX_TEXTO_LEGADO = 100
+
+# "Espaços" que o navegador não desenha: &nbsp;, zero width space, word joiner, BOM
+CARACTERES_INVISIVEIS = {ord(c): None for c in '\xa0\u200b\u2060\ufeff'}
+
+COLUNAS_HEADINGS_VAZIOS = [
+    'URL', 'Tag', 'Posicao', 'HTML_Original', 'Texto_Extraido',
+    'Contexto_Pai', 'Atributos_Heading', 'Gravidade', 'Recomendacao'
+]
+ORDEM_GRAVIDADE = {'CRITICO': 1, 'ALTO': 2, 'MEDIO': 3, 'BAIXO': 4}
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive'
+}
+
+# Filtro da revalidação standalone (relatório já pronto)
+EXTENSOES_NAO_HTML = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.doc', '.xls', '.zip', '.js', '.css')
+
+
+# ========================
+# 🩺 CRITÉRIO ÚNICO DE VAZIO
+# ========================
+
+def texto_util(texto: str) -> str:
+    """🧹 Texto sem espaços/caracteres invisíveis (vazio = heading sem conteúdo)"""
+    return ' '.join((texto or '').translate(CARACTERES_INVISIVEIS).split())
+
+
+def heading_realmente_vazio(tag) -> bool:
+    """🩺 CIRÚRGICO 2.0: sobrou algum caractere renderizável? Então NÃO é vazio (tag ou texto já extraído)"""
+    if tag is None:
+        return True
+    try:
+        return not texto_util(tag if isinstance(tag, str) else tag.get_text())
+    except Exception:
+        return True
+
+
+# ========================
+# 📍 CONTEXTO DO HEADING
+# ========================
+
+def descrever_pai(tag) -> str:
+    """📍 Contexto do elemento pai (formato das abas de headings)"""
+    try:
+        if tag and tag.parent:
+            pai = tag.parent
+            pai_info = f"<{pai.name}"
+            if pai.get('class'):
+                pai_info += f" class='{' '.join(pai.get('class'))}'"
+            if pai.get('id'):
+                pai_info += f" id='{pai.get('id')}'"
+            pai_info += ">"
+            return pai_info
+        return "sem pai"
+    except:
+        return "erro contexto"
+
+
+def descrever_atributos(tag) -> str:
+    """🏷️ class/id do heading"""
+    try:
+        atributos = []
+        if tag.get('class'):
+            atributos.append(f"class='{' '.join(tag.get('class'))}'")
+        if tag.get('id'):
+            atributos.append(f"id='{tag.get('id')}'")
+        return ' '.join(atributos) if atributos else 'sem atributos'
+    except:
+        return 'erro atributos'
+
+
+def extrair_contexto_pai(tag):
+    """🔍 Contexto do pai com até 2 data-attributes"""
+    try:
+        if not tag.parent:
+            return "Sem elemento pai"
+
+        pai = tag.parent
+        contexto = descrever_pai(tag)[:-1]
+        data_attrs = [f"{attr}='{value}'" for attr, value in pai.attrs.items()
+                      if attr.startswith('data-') and len(str(value)) < 30]
+        if data_attrs:
+            contexto += ' ' + ' '.join(data_attrs[:2])
+        contexto += ">"
+
+        if len(contexto) > 100:
+            contexto = contexto[:97] + "..."
+        return contexto
+
+    except Exception as e:
+        return f"Erro extraindo contexto: {str(e)}"
+
+
+def extrair_contexto_expandido(tag):
+    """🔍 Pai | avô | texto do irmão anterior"""
+    try:
+        contextos = [f"Pai: {extrair_contexto_pai(tag)}"]
+
+        if tag.parent and tag.parent.parent:
+            avo = tag.parent.parent
+            if avo.name not in ['body', 'html', 'head']:
+                contexto_avo = f"<{avo.name}"
+                classes_avo = avo.get('class', [])
+                if classes_avo:
+                    contexto_avo += f" class='{' '.join(classes_avo[:2])}'..."
+                if avo.get('id'):
+                    contexto_avo += f" id='{avo.get('id')}'"
+                contexto_avo += ">"
+                if len(contexto_avo) < 60:
+                    contextos.append(f"Avô: {contexto_avo}")
+
+        irmao_anterior = tag.find_previous_sibling()
+        if irmao_anterior and hasattr(irmao_anterior, 'get_text'):
+            texto_irmao = irmao_anterior.get_text(strip=True)
+            if texto_irmao and len(texto_irmao) < 50:
+                contextos.append(f"Após: '{texto_irmao}'")
+
+        return " | ".join(contextos)
+
+    except Exception:
+        return extrair_contexto_pai(tag)
+
+
+# ========================
+# 🕵️ OCULTAÇÃO POR CSS
+# ========================
+
+def analisar_css_ocultacao(tag, css_global="", indice_css=None):
+    """🕵️ Analisa se o elemento está oculto por CSS (indice_css: IndiceCSS do css_global já montado)"""
+    problemas_css = []
+
+    # 1. STYLE INLINE do próprio elemento
+    style_inline = tag.get('style', '')
+    if style_inline:
+        style_lower = style_inline.lower()
+
+        # Detecta propriedades que ocultam
+        if 'display:none' in style_lower.replace(' ', ''):
+            problemas_css.append("display:none (inline)")
+        if 'display: none' in style_lower:
+            problemas_css.append("display:none (inline)")
+        if 'visibility:hidden' in style_lower.replace(' ', ''):
+            problemas_css.append("visibility:hidden (inline)")
+        if 'visibility: hidden' in style_lower:
+            problemas_css.append("visibility:hidden (inline)")
+
+        # Detecta cores que "escondem" o texto
+        if any(color_hack in style_lower for color_hack in [
+            'color:white', 'color:#fff', 'color:#ffffff', 'color:transparent',
+            'color: white', 'color: #fff', 'color: #ffffff', 'color: transparent'
+        ]):
+            problemas_css.append("cor de texto invisível (inline)")
+
+        # Detecta posicionamento que remove do fluxo
+        if 'position:absolute' in style_lower.replace(' ', '') and 'left:-' in style_lower.replace(' ', ''):
+            problemas_css.append("posicionamento fora da tela (inline)")
+        if 'text-indent:-' in style_lower.replace(' ', ''):
+            problemas_css.append("text-indent negativo (inline)")
+
+    # 2. CLASSES e IDs que podem ter CSS oculto
+    suspeitas_classe = []
+    classes = tag.get('class', [])
+    if classes:
+        for classe in classes:
+            classe_lower = classe.lower()
+            # Classes suspeitas de ocultação
+            if any(termo in classe_lower for termo in [
+                'hidden', 'hide', 'invisible', 'sr-only', 'screen-reader',
+                'visually-hidden', 'visuallyhidden', 'off-screen', 'offscreen'
+            ]):
+                suspeitas_classe.append(f"classe suspeita: {classe}")
+
+    id_elemento = tag.get('id', '')
+    if id_elemento:
+        id_lower = id_elemento.lower()
+        if any(termo in id_lower for termo in ['hidden', 'hide', 'invisible']):
+            suspeitas_classe.append(f"ID suspeito: {id_elemento}")
+
+    # 3. ANALISA CSS GLOBAL (básico)
+    css_global_problemas = []
+    if indice_css is not None and (classes or id_elemento):
+        # Consulta no índice: mesmo resultado do regex, sem varrer o CSS por classe
+        for classe in classes:
+            for _ in range(indice_css.regras_ocultas_classe(classe)):
+                css_global_problemas.append(f"regra CSS oculta para .{classe}")
+
+        if id_elemento:
+            for _ in range(indice_css.regras_ocultas_id(id_elemento)):
+                css_global_problemas.append(f"regra CSS oculta para #{id_elemento}")
+
+    elif css_global and (classes or id_elemento):
+        css_lower = css_global.lower()
+
+        # Verifica se há regras CSS para as classes/ID do elemento
+        for classe in classes:
+            if f".{classe}" in css_lower:
+                # Busca a regra CSS desta classe
+                pattern = rf'\.{re.escape(classe)}\s*\{{[^}}]*\}}'
+                matches = re.findall(pattern, css_lower, re.DOTALL)
+                for match in matches:
+                    if any(prop in match for prop in ['display:none', 'visibility:hidden', 'color:white', 'color:#fff']):
+                        css_global_problemas.append(f"regra CSS oculta para .{classe}")
+
+        if id_elemento and f"#{id_elemento}" in css_lower:
+            pattern = rf'#{re.escape(id_elemento)}\s*\{{[^}}]*\}}'
+            matches = re.findall(pattern, css_lower, re.DOTALL)
+            for match in matches:
+                if any(prop in match for prop in ['display:none', 'visibility:hidden', 'color:white', 'color:#fff']):
+                    css_global_problemas.append(f"regra CSS oculta para #{id_elemento}")
+
+    # 4. CONSOLIDA RESULTADO
+    todos_problemas = problemas_css + suspeitas_classe + css_global_problemas
+
+    return {
+        'tem_ocultacao': len(todos_problemas) > 0,
+        'problemas_css': todos_problemas,
+        'style_inline': style_inline,
+        'classes_suspeitas': suspeitas_classe,
+        'css_global_issues': css_global_problemas
+    }
+
+
+def analisar_css_pai(tag, css_global="", indice_css=None):
+    """🔍 Analisa se o elemento PAI está oculto por CSS"""
+    if not tag.parent:
+        return {'pai_oculto': False, 'motivos_pai': []}
+
+    pai = tag.parent
+    analise_pai = analisar_css_ocultacao(pai, css_global, indice_css)
+
+    return {
+        'pai_oculto': analise_pai['tem_ocultacao'],
+        'motivos_pai': analise_pai['problemas_css'],
+        'pai_tag': pai.name,
+        'pai_classes': pai.get('class', []),
+        'pai_id': pai.get('id', '')
+    }
+
+
+def extrair_css_global(soup):
+    """🎨 Extrai CSS inline das tags <style> para análise"""
+    return "".join(style_tag.get_text() + "\n" for style_tag in soup.find_all('style'))
+
+
+# ========================
+# 📋 RESULTADO
+# ========================
+
+@dataclass
+class HeadingProblema:
+    """🔠 Heading vazio ou oculto, com o contexto que as abas mostram"""
+    tag: str
+    posicao: int
+    tipo: str                                   # 'vazio' | 'oculto'
+    texto: str
+    gravidade: str
+    html: str = ''
+    contexto_pai: str = 'N/A'
+    atributos: str = 'sem atributos'
+    motivo: str = ''                            # Motivo do DOMSnapshot (display:none, texto oculto...)
+    contexto_expandido: str = ''
+    css_problemas: List[str] = field(default_factory=list)
+    css_pai_problemas: List[str] = field(default_factory=list)
+    style_inline: str = ''
+
+    def como_linha(self) -> Dict:
+        """📋 Formato de headings_problematicos das abas/revalidadores cirúrgicos"""
+        return {
+            'tag': self.tag,
+            'posicao': f'{self.posicao}º {self.tag.upper()} na página',
+            'html_original': self.html or f"<{self.tag.upper()}> ({self.motivo or self.tipo})",
+            'texto_extraido': self.texto,
+            'contexto_pai': self.contexto_pai,
+            'atributos_heading': self.atributos,
+            'gravidade': self.gravidade,
+            'recomendacao': f'Preencher conteúdo do {self.tag.upper()} ou remover tag vazia'
+            if self.tipo == 'vazio' else f'Tornar o {self.tag.upper()} visível ou remover o heading oculto'
+        }
+
+    def como_legado(self) -> Dict:
+        """📋 Formato de headings_problematicos do validador_headings"""
+        nome = self.tag.upper()
+        texto = self.texto.strip()
+        if self.tipo == 'vazio':
+            motivos = ['Vazio/Sem conteúdo útil']
+            descricao_completa = f'{nome} vazio/sem conteúdo: {self.contexto_pai}'
+            if self.css_problemas:
+                motivos.append('Oculto por CSS')
+                descricao_completa += f' [CSS: {", ".join(self.css_problemas)}]'
+            if self.css_pai_problemas:
+                motivos.append('Pai oculto por CSS')
+                descricao_completa += f' [PAI CSS: {", ".join(self.css_pai_problemas)}]'
+            extras = {'descricao': f'{nome} vazio na posição {self.posicao}',
+                      'texto': self.texto[:MAX_TEXTO_LEGADO], 'texto_limpo': texto[:MAX_TEXTO_LEGADO]}
+        else:
+            motivos = ['Oculto por CSS']
+            descricao_completa = f'{nome} oculto por CSS: {self.contexto_pai}'
+            if self.css_problemas:
+                descricao_completa += f' [ELEMENTO: {", ".join(self.css_problemas)}]'
+            if self.css_pai_problemas:
+                motivos.append('Pai oculto por CSS')
+                descricao_completa += f' [PAI: {", ".join(self.css_pai_problemas)}]'
+            extras = {'descricao': f'{nome} oculto por CSS na posição {self.posicao}',
+                      'texto': texto[:MAX_TEXTO_LEGADO] + ('...' if len(texto) > MAX_TEXTO_LEGADO else '')}
+
+        return {
+            'tag': self.tag,
+            'posicao': self.posicao,
+            'contexto_pai': self.contexto_pai,
+            'contexto_expandido': self.contexto_expandido,
+            'atributos_heading': self.atributos,
+            'descricao_completa': descricao_completa,
+            **extras,
+            'motivos': motivos,
+            'gravidade': self.gravidade,
+            'css_oculto': bool(self.css_problemas),
+            'css_problemas': self.css_problemas,
+            'css_pai_oculto': bool(self.css_pai_problemas),
+            'css_pai_problemas': self.css_pai_problemas,
+            'style_inline': self.style_inline
+        }
+
+
+@dataclass
+class AnaliseHeadings:
+    """🔠 Headings de uma página: textos por nível + problemas encontrados"""
+    url: str
+    sucesso: bool = False
+    erro: str = ''
+    origem: str = ''                            # registro | snapshot | armazem | render_cache | rede
+    textos: Dict[str, List[str]] = field(default_factory=lambda: {t: [] for t in TAGS_HEADING})
+    vazios: List[HeadingProblema] = field(default_factory=list)
+    ocultos: List[HeadingProblema] = field(default_factory=list)
+    tem_css_global: bool = False
+
+    def como_resultado(self) -> Dict:
+        """📋 Resultado por URL das abas/revalidadores cirúrgicos (só headings vazios)"""
+        if not self.sucesso:
+            return {'url': self.url, 'sucesso': False, 'erro': self.erro,
+                    'headings_vazios_count': 0, 'headings_problematicos': []}
+        return {
+            'url': self.url,
+            'sucesso': True,
+            'headings_vazios_count': len(self.vazios),
+            'headings_problematicos': [h.como_linha() for h in self.vazios],
+            'total_problemas': len(self.vazios)
+        }
+
+    def como_validacao(self) -> Dict:
+        """📋 Resultado por URL do validador_headings (contagens, estrutura, vazios + ocultos)"""
+        if not self.sucesso:
+            return {
+                "url": self.url, "h1": 0, "h2": 0, "h3": 0, "h4": 0, "h5": 0, "h6": 0,
+                "problemas": f"Erro: {self.erro}",
+                "headings_vazios_count": 0, "headings_ocultos_count": 0, "headings_problematicos": [],
+                "tem_headings_vazios": False, "tem_headings_ocultos": False, "tem_css_global": False,
+                "h1_texts": [], "h2_texts": [], "h1_ausente": True, "h2_ausente": True
+            }
+
+        erros = []
+        if not self.textos["h1"]:
+            erros.append("H1 ausente")
+        elif len(self.textos["h1"]) > 1:
+            erros.append("H1 duplicado")
+        if not self.textos["h2"]:
+            erros.append("H2 ausente")
+        ordem = [i for i, tag in enumerate(TAGS_HEADING, 1) if self.textos[tag]]
+        if ordem != sorted(ordem):
+            erros.append("Hierarquia invertida")
+
+        return {
+            "url": self.url,
+            **{tag: len(self.textos[tag]) for tag in TAGS_HEADING},
+            "problemas": "; ".join(erros) if erros else "OK",
+            "headings_vazios_count": len(self.vazios),
+            "headings_ocultos_count": len(self.ocultos),
+            "headings_problematicos": [h.como_legado() for h in self.vazios + self.ocultos],
+            "tem_headings_vazios": bool(self.vazios),
+            "tem_headings_ocultos": bool(self.ocultos),
+            "tem_css_global": self.tem_css_global,
+            "h1_texts": self.textos["h1"],
+            "h2_texts": self.textos["h2"],
+            "h1_ausente": not self.textos["h1"],
+            "h2_ausente": not self.textos["h2"]
+        }
+
+
+def _posicao(valor, padrao: int = 0) -> int:
+    """🔢 '2º H1 na página' (DOMSnapshot) -> 2"""
+    try:
+        return int(str(valor).split('º')[0])
+    except ValueError:
+        return padrao
+
+
+# ========================
+# 🔠 MOTOR
+# ========================
+
+class MotorHeadings:
+    """🔠 Headings vazios/ocultos de qualquer fonte: DOMSnapshot > registro > armazém > rede (só em miss)"""
+
+    def __init__(self, armazem: Optional[ArmazemPaginas] = None, detectar_ocultos: bool = True,
+                 css_externo: bool = False, permitir_rede: bool = True, max_workers: int = 15, timeout: int = 10,
+                 cache_stylesheets=None):
+        self.armazem = armazem if armazem is not None else obter_armazem()
+        self.detectar_ocultos = detectar_ocultos
+        self.css_externo = css_externo or cache_stylesheets is not None
+        self.permitir_rede = permitir_rede
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+        self._session = None
+        self._cache_stylesheets = cache_stylesheets
+        self._lock = threading.Lock()
+        self.stats = {'registro': 0, 'snapshot': 0, 'armazem': 0, 'render_cache': 0, 'rede': 0,
+                      'sem_pagina': 0, 'erros': 0}
+
+    def _contar(self, chave: str):
+        with self._lock:
+            self.stats[chave] += 1
+
+    def _sessao(self) -> requests.Session:
+        """🚀 Sessão criada só no primeiro miss do armazém"""
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                session.headers.update(HEADERS)
+                adapter = requests.adapters.HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._session = session
+            return self._session
+
+    @property
+    def cache_stylesheets(self):
+        """🎨 Stylesheets externos baixados 1x por execução (só com css_externo)"""
+        if not (self.css_externo and self.detectar_ocultos):
+            return None
+        with self._lock:
+            if self._cache_stylesheets is None:
+                from cache_stylesheets import CacheStylesheets
+                session_css = requests.Session()
+                session_css.headers.update(HEADERS)
+                self._cache_stylesheets = CacheStylesheets(session=session_css)
+            return self._cache_stylesheets
+
+    # ========================
+    # 🔎 ANÁLISE DA ÁRVORE
+    # ========================
+
+    def analisar_soup(self, url: str, soup, origem: str = 'html', base_url: Optional[str] = None) -> AnaliseHeadings:
+        """🔎 Um passe pelos headings da árvore já parseada (chamável do crawl)"""
+        analise = AnaliseHeadings(url=url, sucesso=True, origem=origem)
+
+        css_global, indice_css = "", None
+        if self.detectar_ocultos:
+            css_global = extrair_css_global(soup)
+            indice_css = IndiceCSS(css_global)
+            cache_stylesheets = self.cache_stylesheets
+            if cache_stylesheets is not None:
+                indices_externos = cache_stylesheets.indices_da_pagina(soup, base_url or url)
+                if indices_externos:
+                    indice_css = IndiceCSSComposto([indice_css] + indices_externos)
+            analise.tem_css_global = bool(css_global.strip())
+
+        for tag_nome in TAGS_HEADING:
+            for posicao, tag in enumerate(soup.find_all(tag_nome), 1):
+                texto = tag.get_text()
+                vazio = heading_realmente_vazio(texto)
+                if not vazio:
+                    analise.textos[tag_nome].append(tag.get_text(strip=True))
+
+                css, pai = {'problemas_css': [], 'style_inline': ''}, {'motivos_pai': []}
+                if self.detectar_ocultos:
+                    css = analisar_css_ocultacao(tag, css_global, indice_css)
+                    pai = analisar_css_pai(tag, css_global, indice_css)
+                    oculto = bool(css['problemas_css'] or pai['motivos_pai'])
+                else:
+                    oculto = False
+
+                if not (vazio or oculto):
+                    continue
+
+                problema = HeadingProblema(
+                    tag=tag_nome,
+                    posicao=posicao,
+                    tipo='vazio' if vazio else 'oculto',
+                    texto=texto,
+                    gravidade=('CRITICO' if tag_nome == 'h1' else 'ALTO') if vazio
+                    else ('ALTO' if tag_nome == 'h1' else 'MEDIO'),
+                    html=str(tag)[:MAX_HTML_TRECHO],
+                    contexto_pai=descrever_pai(tag),
+                    atributos=descrever_atributos(tag),
+                    contexto_expandido=extrair_contexto_expandido(tag) if self.detectar_ocultos else '',
+                    css_problemas=css['problemas_css'],
+                    css_pai_problemas=pai['motivos_pai'],
+                    style_inline=css['style_inline']
+                )
+                (analise.vazios if vazio else analise.ocultos).append(problema)
+
+        return analise
+
+    def analisar_pagina(self, pagina: PaginaArmazenada) -> AnaliseHeadings:
+        """📄 Página do armazém ou recém-baixada (4xx/5xx = sem análise, como raise_for_status)"""
+        if pagina.erro_http:
+            return AnaliseHeadings(url=pagina.url, erro=pagina.erro_http, origem=pagina.origem)
+        soup = BeautifulSoup(pagina.html, 'lxml')
+        return self.analisar_soup(pagina.url, soup, origem=pagina.origem, base_url=pagina.final_url or pagina.url)
+
+    def analisar_registro(self, registro) -> AnaliseHeadings:
+        """📄 RegistroPagina do analisador único: headings já extraídos, sem parse nem rede"""
+        self._contar('registro')
+        if not registro.http_ok:
+            return AnaliseHeadings(url=registro.url, erro=registro.erro_acesso, origem='registro')
+
+        analise = AnaliseHeadings(url=registro.url, sucesso=True, origem='registro')
+        for tag_nome in TAGS_HEADING:
+            for heading in registro.headings[tag_nome]:
+                if not heading_realmente_vazio(heading.texto):
+                    analise.textos[tag_nome].append(heading.texto.strip())
+                    continue
+                analise.vazios.append(HeadingProblema(
+                    tag=tag_nome,
+                    posicao=heading.posicao,
+                    tipo='vazio',
+                    texto=heading.texto,
+                    gravidade='CRITICO' if tag_nome == 'h1' else 'ALTO',
+                    html=heading.html,
+                    contexto_pai=heading.contexto_pai,
+                    atributos=heading.atributos
+                ))
+        return analise
+
+    def analisar_snapshot(self, url: str, vazios: Iterable[Dict], ocultos: Optional[Iterable[Dict]] = None) -> AnaliseHeadings:
+        """📸 Headings medidos no crawl via DOMSnapshot (estilos computados, CSS externo)"""
+        analise = AnaliseHeadings(url=url, sucesso=True, origem='snapshot')
+        for destino, itens, tipo in ((analise.vazios, vazios, 'vazio'), (analise.ocultos, ocultos or [], 'oculto')):
+            for item in itens:
+                destino.append(HeadingProblema(
+                    tag=item.get('tag', ''),
+                    posicao=_posicao(item.get('posicao')),
+                    tipo=tipo,
+                    texto=item.get('texto_extraido', ''),
+                    gravidade=item.get('gravidade', 'ALTO'),
+                    contexto_pai=item.get('contexto_pai', 'N/A'),
+                    atributos=item.get('atributos_heading', 'sem atributos'),
+                    motivo=item.get('motivo', tipo)
+                ))
+        return analise
+
+    def analises_de_snapshot(self, df) -> Dict[str, AnaliseHeadings]:
+        """📸 {url: análise} das linhas do crawl com extracao_snapshot"""
+        if 'extracao_snapshot' not in df.columns or 'snapshot_headings_vazios' not in df.columns:
+            return {}
+
+        analises = {}
+        df_snapshot = df[df['extracao_snapshot'] == True]
+        for _, row in df_snapshot.drop_duplicates(subset='url').iterrows():
+            vazios = row.get('snapshot_headings_vazios')
+            if not isinstance(vazios, list):
+                continue
+            ocultos = row.get('snapshot_headings_ocultos')
+            analises[row['url']] = self.analisar_snapshot(row['url'], vazios, ocultos if isinstance(ocultos, list) else None)
+        return analises
+
+    # ========================
+    # 📦 ARMAZÉM / REDE
+    # ========================
+
+    def _baixar(self, url: str) -> PaginaArmazenada:
+        """🌐 GET de página que não está no armazém - guarda para a próxima vez"""
+        response = self._sessao().get(url, timeout=self.timeout, verify=False, allow_redirects=True)
+        return self.armazem.guardar_resposta(url, response)
+
+    def analisar_url(self, url: str) -> AnaliseHeadings:
+        """🔠 Armazém primeiro; rede só se a página nunca foi guardada (e permitir_rede)"""
+        try:
+            # Só o motor de headings aceita o DOM renderizado (snapshot e registro já são pós-JS)
+            pagina = self.armazem.obter(url, render_cache=True)
+            if pagina is None:
+                if not self.permitir_rede:
+                    self._contar('sem_pagina')
+                    return AnaliseHeadings(url=url, erro='página não armazenada (modo sem rede)', origem='sem_pagina')
+                pagina = self._baixar(url)
+            self._contar(pagina.origem)
+            return self.analisar_pagina(pagina)
+        except Exception as e:
+            self._contar('erros')
+            return AnaliseHeadings(url=url, erro=str(e), origem='erro')
+
+    def analisar_urls(self, urls: Iterable[str], registros: Optional[Dict] = None,
+                      snapshots: Optional[Dict[str, AnaliseHeadings]] = None) -> List[AnaliseHeadings]:
+        """🚀 Uma análise por URL (ordem de entrada): DOMSnapshot > registro > armazém > rede"""
+        urls = list(urls)
+        analises: Dict[str, AnaliseHeadings] = {}
+        pendentes = []
+
+        for url in dict.fromkeys(urls):
+            if snapshots and url in snapshots:
+                self._contar('snapshot')
+                analises[url] = snapshots[url]
+            elif registros is not None and url in registros:
+                analises[url] = self.analisar_registro(registros[url])
+            else:
+                pendentes.append(url)
+
+        if pendentes:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                future_to_url = {executor.submit(self.analisar_url, url): url for url in pendentes}
+                for concluidas, future in enumerate(as_completed(future_to_url), 1):
+                    analises[future_to_url[future]] = future.result()
+                    if concluidas % 50 == 0:
+                        print(f"⚡ Headings analisados: {concluidas}/{len(pendentes)}")
+
+        return [analises[url] for url in urls]
+
+    def get_stats(self) -> Dict:
+        """📊 De onde veio cada página analisada"""
+        return {**self.stats, **{f'armazem_{k}': v for k, v in self.armazem.get_stats().items()}}
+
+
+# ========================
+# 📋 ABA HEADINGS_VAZIOS
+# ========================
+
+def linhas_headings_vazios(analises: Iterable[AnaliseHeadings]):
+    """📋 DataFrame da aba Headings_Vazios (ordenado por gravidade)"""
+    import pandas as pd
+
+    rows = []
+    for analise in analises:
+        if not analise.sucesso:
+            continue
+        for heading in analise.vazios:
+            problema = heading.como_linha()
+            rows.append({
+                'URL': analise.url,
+                'Tag': problema['tag'].upper(),
+                'Posicao': problema['posicao'],
+                'HTML_Original': problema['html_original'],
+                'Texto_Extraido': f"'{problema['texto_extraido']}'",
+                'Contexto_Pai': problema['contexto_pai'],
+                'Atributos_Heading': problema['atributos_heading'],
+                'Gravidade': problema['gravidade'],
+                'Recomendacao': problema['recomendacao']
+            })
+
+    df = pd.DataFrame(rows, columns=COLUNAS_HEADINGS_VAZIOS)
+    if df.empty:
+        return df
+    df['sort_gravidade'] = df['Gravidade'].map(ORDEM_GRAVIDADE).fillna(99)
+    return df.sort_values(['sort_gravidade', 'URL', 'Tag']).drop('sort_gravidade', axis=1)
+
+
+# ========================
+# 🔄 REVALIDAÇÃO STANDALONE (relatório já gerado)
+# ========================
+
+def urls_do_relatorio(excel_path: str) -> List[str]:
+    """📥 URLs 200 não-paginadas da aba Resumo (ou da primeira aba) - lê só as colunas necessárias"""
+    import pandas as pd
+
+    colunas = lambda c: c in ('url', 'status_code_http', 'status_code')
+    try:
+        df = pd.read_excel(excel_path, sheet_name='Resumo', usecols=colunas)
+    except ValueError:
+        df = pd.read_excel(excel_path, sheet_name=0, usecols=colunas)
+    if 'url' not in df.columns:
+        raise ValueError("Coluna 'url' não encontrada no relatório")
+
+    status_col = 'status_code_http' if 'status_code_http' in df.columns else \
+        'status_code' if 'status_code' in df.columns else None
+    status = pd.to_numeric(df[status_col], errors='coerce') if status_col else pd.Series(200, index=df.index)
+
+    urls = []
+    for url, codigo in zip(df['url'], status):
+        if not isinstance(url, str) or not url:
+            continue
+        if url.lower().endswith(EXTENSOES_NAO_HTML) or '?page=' in url or '&page=' in url:
+            continue
+        if status_col and codigo != 200:
+            continue
+        urls.append(url)
+    return list(dict.fromkeys(urls))
+
+
+def gravar_aba(excel_path: str, output_path: str, df, nome_aba: str = 'Headings_Vazios'):
+    """📤 Copia o relatório e troca só a aba (as demais não são relidas nem regravadas)"""
+    import pandas as pd
+
+    if output_path != excel_path:
+        shutil.copyfile(excel_path, output_path)
+    with pd.ExcelWriter(output_path, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
+        df.to_excel(writer, sheet_name=nome_aba, index=False)
+
+
+def revalidar_excel(excel_path: str, output_path: Optional[str] = None, motor: Optional[MotorHeadings] = None):
+    """🔄 Headings_Vazios de um relatório pronto a partir das páginas guardadas -> (saida, análises)"""
+    motor = motor or MotorHeadings(detectar_ocultos=False)
+    output_path = output_path or excel_path.replace('.xlsx', '_CIRURGICO.xlsx')
+
+    urls = urls_do_relatorio(excel_path)
+    print(f"📋 URLs para revalidação: {len(urls)}")
+    analises = motor.analisar_urls(urls)
+
+    df = linhas_headings_vazios(analises)
+    gravar_aba(excel_path, output_path, df)
+    print(f"✅ Excel atualizado: {output_path}")
+    print(f"📋 Aba 'Headings_Vazios' criada com {len(df)} problemas REAIS")
+    return output_path, analises
+
+
+def main(argv: List[str]) -> int:
+    args = [a for a in argv if not a.startswith('--')]
+    if not args:
+        print("❌ Uso: python motor_headings.py <arquivo.xlsx> [arquivo_saida.xlsx] [--sem-rede]")
+        return 1
+
+    motor = MotorHeadings(detectar_ocultos=False, permitir_rede='--sem-rede' not in argv)
+    inicio = time.time()
+    saida, analises = revalidar_excel(args[0], args[1] if len(args) > 1 else None, motor)
+
+    stats = motor.get_stats()
+    print(f"📊 {len(analises)} URLs em {time.time() - inicio:.1f}s | armazém: {stats['armazem']} | "
+          f"render cache: {stats['render_cache']} | rede: {stats['rede']} | sem página: {stats['sem_pagina']} | "
+          f"erros: {sum(1 for a in analises if not a.sucesso)}")
+    print(f"🎯 Headings vazios: {sum(len(a.vazios) for a in analises)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,478 @@
+# motor_ssl.py - ENGINE ÚNICA SSL/TLS
+# 🔒 Certificado é por host: um handshake por (host, porta, SNI), todos em paralelo (asyncio),
+#    com cache em disco que respeita a validade do certificado entre auditorias
+
+import asyncio
+import json
+import os
+import socket
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+CACHE_DIR = "cache"
+CACHE_SSL_ARQUIVO = os.path.join(CACHE_DIR, "ssl_certificados.json")
+
+TTL_PADRAO = 24 * 3600          # Certificado válido: reverifica no máximo 1x por dia
+TTL_CURTO = 3600                # Erros e certificados perto de renovar: 1 hora
+JANELA_RENOVACAO_DIAS = 30      # Abaixo disso a renovação pode acontecer a qualquer momento
+MAX_BYTES_HEADERS = 64 * 1024
+
+PROTOCOLOS_FRACOS = ('TLSv1', 'TLSv1.1', 'SSLv2', 'SSLv3')
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+
+AlvoTLS = Tuple[str, int, str]  # (host, porta, sni)
+
+
+@dataclass
+class ResultadoTLS:
+    """🔒 Fatos do handshake de um (host, porta, SNI) - o que pode ir para o cache"""
+    host: str
+    porta: int = 443
+    sni: str = ''
+    conectou: bool = False
+    verificado: bool = False            # Cadeia + hostname validados pelo contexto padrão
+    erro_tipo: str = ''                 # TIMEOUT | DNS | CERTIFICADO | HANDSHAKE | CONEXAO
+    erro: str = ''
+    emissor: str = ''
+    sujeito: str = ''
+    san: List[str] = field(default_factory=list)
+    expira_em: Optional[float] = None   # notAfter (epoch)
+    protocolo_tls: str = ''
+    cipher_suite: str = ''
+    bits_cipher: Optional[int] = None
+    hsts: Optional[str] = None          # Valor do Strict-Transport-Security (None = ausente/desconhecido)
+    latencia: float = 0.0
+    verificado_em: float = 0.0
+
+    @property
+    def expira_em_dias(self) -> Optional[int]:
+        if self.expira_em is None:
+            return None
+        return int((self.expira_em - time.time()) // 86400)
+
+    @property
+    def data_expiracao(self) -> str:
+        if self.expira_em is None:
+            return ''
+        return datetime.fromtimestamp(self.expira_em).strftime('%Y-%m-%d')
+
+    def ttl(self) -> float:
+        """⏳ Quanto tempo o resultado vale: nunca além do notAfter, curto perto da renovação ou com erro"""
+        if self.erro_tipo:
+            return TTL_CURTO
+        ttl = TTL_PADRAO
+        if self.expira_em is not None:
+            restante = self.expira_em - time.time()
+            ttl = min(ttl, max(restante, 0))
+            if restante < JANELA_RENOVACAO_DIAS * 86400:
+                ttl = min(ttl, TTL_CURTO)
+        return ttl
+
+
+def alvo_tls(url: str) -> Optional[AlvoTLS]:
+    """🎯 (host, porta, sni) de uma URL HTTPS (None para http/URL inválida)"""
+    try:
+        parsed = urlparse(str(url).strip())
+        if parsed.scheme != 'https' or not parsed.hostname:
+            return None
+        host = parsed.hostname.lower()
+        return host, parsed.port or 443, host
+    except ValueError:
+        return None
+
+
+def _chave(alvo: AlvoTLS) -> str:
+    host, porta, sni = alvo
+    return f"{host}:{porta}:{sni}"
+
+
+# ========================
+# 🧮 AVALIAÇÃO (GRADE / PROBLEMAS)
+# ========================
+
+def _classificar_erro_certificado(mensagem: str) -> Tuple[str, str]:
+    """🔍 Tipo do problema a partir do verify_message do OpenSSL"""
+    texto = mensagem.lower()
+    if 'expired' in texto:
+        return 'CERT_EXPIRADO', 'Certificado expirado'
+    if 'self signed' in texto or 'self-signed' in texto:
+        return 'CERT_AUTOASSINADO', 'Certificado autoassinado'
+    if 'hostname' in texto or "doesn't match" in texto or 'ip address mismatch' in texto:
+        return 'HOSTNAME_MISMATCH', 'Certificado não cobre o domínio'
+    if 'local issuer' in texto or 'issuer certificate' in texto:
+        return 'CADEIA_INCOMPLETA', 'Cadeia SSL incompleta (CA intermediário ausente)'
+    if 'not yet valid' in texto:
+        return 'CERT_NAO_VALIDO_AINDA', 'Certificado ainda não é válido'
+    return 'SSL_ERROR', f'Erro SSL: {mensagem}'
+
+
+def avaliar(resultado: ResultadoTLS, url: str = '', mixed_content: bool = False) -> dict:
+    """🧮 Problemas, grade e score a partir do resultado do handshake (formato das abas SSL)"""
+
+    avaliacao = {
+        'url': url or f"https://{resultado.host}" + ('' if resultado.porta == 443 else f":{resultado.porta}"),
+        'dominio': resultado.host if resultado.porta == 443 else f"{resultado.host}:{resultado.porta}",
+        'tem_problema': False,
+        'problema_principal': 'SSL_VALIDO',
+        'problemas_detalhados': [],
+        'grade_ssl': 'A',
+        'score_ssl': 90,
+        'certificado_valido': resultado.verificado,
+        'expira_em_dias': resultado.expira_em_dias,
+        'data_expiracao': resultado.data_expiracao,
+        'emissor': resultado.emissor,
+        'sujeito': resultado.sujeito,
+        'algoritmo_assinatura': resultado.protocolo_tls,
+        'protocolo_tls': resultado.protocolo_tls,
+        'cipher_suite': resultado.cipher_suite,
+        'chain_completa': True,
+        'hsts_ativo': bool(resultado.hsts),
+        'mixed_content_risk': mixed_content,
+        'recomendacoes': [],
+        'timestamp_verificacao': datetime.fromtimestamp(resultado.verificado_em).strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+    # Falhas de conexão/handshake/verificação: grade F direto
+    falhas = {
+        'TIMEOUT': ('TIMEOUT_SSL', 'Timeout na conexão SSL'),
+        'DNS': ('DNS_ERROR', 'Erro de resolução DNS'),
+        'HANDSHAKE': ('SSL_HANDSHAKE_ERROR', f'Erro SSL: {resultado.erro}'),
+        'CONEXAO': ('ERRO_DESCONHECIDO', f'Erro: {resultado.erro}'),
+    }
+    if resultado.erro_tipo:
+        if resultado.erro_tipo == 'CERTIFICADO':
+            problema, detalhe = _classificar_erro_certificado(resultado.erro)
+        else:
+            problema, detalhe = falhas.get(resultado.erro_tipo, falhas['CONEXAO'])
+        avaliacao.update({
+            'tem_problema': True,
+            'problema_principal': problema,
+            'grade_ssl': 'F',
+            'score_ssl': 0,
+            'certificado_valido': False,
+            'chain_completa': problema != 'CADEIA_INCOMPLETA',
+            'problemas_detalhados': [detalhe]
+        })
+        if problema in ('CERT_EXPIRADO', 'CERT_AUTOASSINADO', 'HOSTNAME_MISMATCH', 'CADEIA_INCOMPLETA'):
+            avaliacao['recomendacoes'].append('Corrigir certificado SSL - Googlebot pode falhar')
+        return avaliacao
+
+    dias = resultado.expira_em_dias
+    if dias is not None:
+        if dias < 0:
+            avaliacao['problemas_detalhados'].append('Certificado expirado')
+            avaliacao['tem_problema'] = True
+            avaliacao['problema_principal'] = 'CERT_EXPIRADO'
+        elif dias < JANELA_RENOVACAO_DIAS:
+            avaliacao['problemas_detalhados'].append(f'Expira em {dias} dias')
+            avaliacao['recomendacoes'].append('Renovar certificado SSL')
+
+    if resultado.protocolo_tls in PROTOCOLOS_FRACOS:
+        avaliacao['problemas_detalhados'].append(f'Protocolo fraco: {resultado.protocolo_tls}')
+        avaliacao['tem_problema'] = True
+        if avaliacao['problema_principal'] == 'SSL_VALIDO':
+            avaliacao['problema_principal'] = 'PROTOCOLO_FRACO'
+
+    if not resultado.hsts:
+        avaliacao['problemas_detalhados'].append('HSTS não configurado')
+        avaliacao['recomendacoes'].append('Configurar HSTS headers')
+
+    if mixed_content:
+        avaliacao['problemas_detalhados'].append('Risco de mixed content detectado')
+        avaliacao['recomendacoes'].append('Verificar links HTTP em página HTTPS')
+
+    # Penalizações
+    score = 100 - len(avaliacao['problemas_detalhados']) * 10
+    if not resultado.hsts:
+        score -= 5
+    if mixed_content:
+        score -= 15
+    if resultado.protocolo_tls in ('TLSv1', 'TLSv1.1'):
+        score -= 20
+    if dias is not None and dias < JANELA_RENOVACAO_DIAS:
+        score -= 10
+
+    if score >= 95:
+        grade = 'A+'
+    elif score >= 85:
+        grade = 'A'
+    elif score >= 75:
+        grade = 'B'
+    elif score >= 65:
+        grade = 'C'
+    elif score >= 50:
+        grade = 'D'
+    else:
+        grade = 'F'
+
+    avaliacao['score_ssl'] = max(score, 0)
+    avaliacao['grade_ssl'] = grade
+
+    if grade in ['D', 'F'] or avaliacao['tem_problema']:
+        avaliacao['tem_problema'] = True
+        if avaliacao['problema_principal'] == 'SSL_VALIDO':
+            avaliacao['problema_principal'] = 'SSL_DEGRADADO'
+
+    return avaliacao
+
+
+# ========================
+# 💾 CACHE ENTRE AUDITORIAS
+# ========================
+
+class CacheSSL:
+    """💾 Resultados por (host, porta, SNI) em JSON, válidos até o TTL de cada certificado"""
+
+    def __init__(self, caminho: str = CACHE_SSL_ARQUIVO):
+        self.caminho = caminho
+        self._entradas: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._carregar()
+
+    def _carregar(self):
+        if not self.caminho or not os.path.exists(self.caminho):
+            return
+        try:
+            with open(self.caminho, "r", encoding="utf-8") as f:
+                self._entradas = json.load(f)
+        except (OSError, ValueError):
+            self._entradas = {}
+
+    def obter(self, alvo: AlvoTLS) -> Optional[ResultadoTLS]:
+        with self._lock:
+            entrada = self._entradas.get(_chave(alvo))
+        if not entrada or entrada.get('valido_ate', 0) <= time.time():
+            return None
+        try:
+            return ResultadoTLS(**entrada['resultado'])
+        except TypeError:
+            return None
+
+    def guardar(self, resultado: ResultadoTLS):
+        with self._lock:
+            self._entradas[_chave((resultado.host, resultado.porta, resultado.sni))] = {
+                'resultado': asdict(resultado),
+                'valido_ate': resultado.verificado_em + resultado.ttl()
+            }
+
+    def salvar(self):
+        if not self.caminho:
+            return
+        agora = time.time()
+        with self._lock:
+            vigentes = {k: v for k, v in self._entradas.items() if v.get('valido_ate', 0) > agora}
+        try:
+            os.makedirs(os.path.dirname(self.caminho) or '.', exist_ok=True)
+            with open(self.caminho, "w", encoding="utf-8") as f:
+                json.dump(vigentes, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"   ⚠️ Cache SSL não salvo: {e}")
+
+
+# ========================
+# 🔒 MOTOR SSL
+# ========================
+
+class MotorSSL:
+    """🔒 Handshakes TLS concorrentes, um por (host, porta, SNI), memo na auditoria + cache em disco"""
+
+    def __init__(self, timeout: float = 10, max_concorrentes: int = 50,
+                 cache_path: Optional[str] = CACHE_SSL_ARQUIVO, verificar_hsts: bool = True):
+        self.timeout = timeout
+        self.max_concorrentes = max_concorrentes
+        self.verificar_hsts = verificar_hsts
+        self.cache = CacheSSL(cache_path) if cache_path else None
+        self._contextos = {True: self._criar_contexto(True), False: self._criar_contexto(False)}
+
+        self.resultados: Dict[AlvoTLS, ResultadoTLS] = {}
+        self._lock = threading.Lock()
+
+        self.stats = {'urls': 0, 'handshakes': 0, 'cache_disco': 0, 'memo': 0}
+
+    # ========================
+    # 🤝 UM HANDSHAKE
+    # ========================
+
+    def _criar_contexto(self, verificar: bool) -> ssl.SSLContext:
+        contexto = ssl.create_default_context()
+        if not verificar:
+            contexto.check_hostname = False
+            contexto.verify_mode = ssl.CERT_NONE
+        return contexto
+
+    async def _conectar(self, alvo: AlvoTLS, verificar: bool):
+        host, porta, sni = alvo
+        return await asyncio.wait_for(
+            asyncio.open_connection(host, porta, ssl=self._contextos[verificar], server_hostname=sni),
+            timeout=self.timeout
+        )
+
+    async def _fechar(self, writer):
+        try:
+            writer.close()
+            await asyncio.wait_for(writer.wait_closed(), timeout=2)
+        except Exception:
+            pass
+
+    async def _ler_hsts(self, reader, writer, host: str) -> Optional[str]:
+        """📨 HEAD / na mesma conexão do handshake: só os headers, para o Strict-Transport-Security"""
+        try:
+            writer.write(
+                f"HEAD / HTTP/1.1\r\nHost: {host}\r\nUser-Agent: {USER_AGENT}\r\n"
+                f"Accept: */*\r\nConnection: close\r\n\r\n".encode('ascii')
+            )
+            await writer.drain()
+            bruto = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), timeout=self.timeout)
+        except Exception:
+            return None
+
+        for linha in bruto[:MAX_BYTES_HEADERS].decode('latin-1').split('\r\n')[1:]:
+            nome, _, valor = linha.partition(':')
+            if nome.strip().lower() == 'strict-transport-security':
+                return valor.strip()
+        return None
+
+    def _ler_certificado(self, resultado: ResultadoTLS, ssl_obj):
+        resultado.protocolo_tls = ssl_obj.version() or ''
+        cipher = ssl_obj.cipher()
+        if cipher:
+            resultado.cipher_suite = cipher[0] or ''
+            resultado.bits_cipher = cipher[2] if len(cipher) > 2 else None
+
+        cert = ssl_obj.getpeercert() or {}
+        if not cert:
+            return
+        emissor = dict(x[0] for x in cert.get('issuer', ()))
+        sujeito = dict(x[0] for x in cert.get('subject', ()))
+        resultado.emissor = emissor.get('organizationName', emissor.get('commonName', 'N/A'))
+        resultado.sujeito = sujeito.get('commonName', resultado.host)
+        resultado.san = [valor for tipo, valor in cert.get('subjectAltName', ()) if tipo == 'DNS']
+        if cert.get('notAfter'):
+            resultado.expira_em = float(ssl.cert_time_to_seconds(cert['notAfter']))
+
+    async def _handshake(self, alvo: AlvoTLS) -> ResultadoTLS:
+        host, porta, sni = alvo
+        resultado = ResultadoTLS(host=host, porta=porta, sni=sni, verificado_em=time.time())
+        inicio = time.perf_counter()
+
+        try:
+            reader, writer = await self._conectar(alvo, verificar=True)
+            resultado.conectou = True
+            resultado.verificado = True
+            self._ler_certificado(resultado, writer.get_extra_info('ssl_object'))
+            if self.verificar_hsts:
+                resultado.hsts = await self._ler_hsts(reader, writer, host)
+            await self._fechar(writer)
+
+        except ssl.SSLCertVerificationError as e:
+            resultado.erro_tipo = 'CERTIFICADO'
+            resultado.erro = getattr(e, 'verify_message', '') or str(e)
+            # Protocolo/cipher mesmo com certificado inválido (sem verificação)
+            try:
+                _, writer = await self._conectar(alvo, verificar=False)
+                resultado.conectou = True
+                self._ler_certificado(resultado, writer.get_extra_info('ssl_object'))
+                await self._fechar(writer)
+            except Exception:
+                pass
+        except asyncio.TimeoutError:
+            resultado.erro_tipo = 'TIMEOUT'
+            resultado.erro = f'Timeout ({self.timeout}s)'
+        except socket.gaierror as e:
+            resultado.erro_tipo = 'DNS'
+            resultado.erro = str(e)
+        except ssl.SSLError as e:
+            resultado.erro_tipo = 'HANDSHAKE'
+            resultado.erro = str(e)
+        except Exception as e:
+            resultado.erro_tipo = 'CONEXAO'
+            resultado.erro = str(e) or type(e).__name__
+
+        resultado.latencia = time.perf_counter() - inicio
+        return resultado
+
+    # ========================
+    # 🚀 VÁRIOS HOSTS
+    # ========================
+
+    async def verificar_async(self, urls: Iterable[str]) -> Dict[AlvoTLS, ResultadoTLS]:
+        """🚀 Resultados de todos os (host, porta, SNI) das URLs HTTPS - handshakes só para os novos"""
+        alvos = list(dict.fromkeys(a for a in (alvo_tls(u) for u in urls if u) if a))
+        self.stats['urls'] += len(alvos)
+
+        pendentes = []
+        for alvo in alvos:
+            with self._lock:
+                if alvo in self.resultados:
+                    self.stats['memo'] += 1
+                    continue
+            em_cache = self.cache.obter(alvo) if self.cache else None
+            if em_cache is not None:
+                with self._lock:
+                    self.resultados[alvo] = em_cache
+                    self.stats['cache_disco'] += 1
+                continue
+            pendentes.append(alvo)
+
+        if pendentes:
+            semaforo = asyncio.Semaphore(self.max_concorrentes)
+
+            async def _limitado(alvo):
+                async with semaforo:
+                    return await self._handshake(alvo)
+
+            for resultado in await asyncio.gather(*(_limitado(a) for a in pendentes)):
+                with self._lock:
+                    self.resultados[(resultado.host, resultado.porta, resultado.sni)] = resultado
+                    self.stats['handshakes'] += 1
+                if self.cache:
+                    self.cache.guardar(resultado)
+            if self.cache:
+                self.cache.salvar()
+
+        with self._lock:
+            return {alvo: self.resultados[alvo] for alvo in alvos}
+
+    def verificar(self, urls: Iterable[str]) -> Dict[AlvoTLS, ResultadoTLS]:
+        """🔒 Versão síncrona (roda em thread própria se já houver event loop ativo, ex.: pipeline async)"""
+        urls = list(urls)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.verificar_async(urls))
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.verificar_async(urls)).result()
+
+    def resultado_url(self, url: str) -> Optional[ResultadoTLS]:
+        """🎯 Resultado do host da URL (verifica agora se ainda não foi visto)"""
+        alvo = alvo_tls(url)
+        if alvo is None:
+            return None
+        with self._lock:
+            if alvo in self.resultados:
+                return self.resultados[alvo]
+        return self.verificar([url]).get(alvo)
+
+    def get_stats(self) -> Dict:
+        """📊 Estatísticas do motor"""
+        return {**self.stats, 'hosts': len(self.resultados)}
+
+
+_MOTOR_PADRAO: Optional[MotorSSL] = None
+_LOCK_MOTOR = threading.Lock()
+
+
+def obter_motor_ssl() -> MotorSSL:
+    """🔒 Motor compartilhado: pré-auditoria, aba SSL e priorização leem o mesmo conjunto de resultados"""
+    global _MOTOR_PADRAO
+    with _LOCK_MOTOR:
+        if _MOTOR_PADRAO is None:
+            _MOTOR_PADRAO = MotorSSL()
+        return _MOTOR_PADRAO
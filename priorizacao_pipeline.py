@@ -47,6 +47,18 @@ class SEOPriorizationEngine:
                 'gravidade': 60, 'impacto_seo': 70, 'esforco': 50,
                 'categoria': 'INFRAESTRUTURA', 'descricao': 'Cadeias de redirect muito longas'
             },
+            'paginas_orfas': {
+                'gravidade': 75, 'impacto_seo': 70, 'esforco': 30,
+                'categoria': 'ESTRUTURAL', 'descricao': 'Páginas sem nenhum link interno'
+            },
+            'profundidade_excessiva': {
+                'gravidade': 55, 'impacto_seo': 60, 'esforco': 40,
+                'categoria': 'ESTRUTURAL', 'descricao': 'Páginas a muitos cliques da home'
+            },
+            'links_quebrados': {
+                'gravidade': 70, 'impacto_seo': 55, 'esforco': 20,
+                'categoria': 'ESTRUTURAL', 'descricao': 'Links para destinos 4xx/5xx ou fora do ar'
+            },
             
             # PROBLEMAS DE CONTEÚDO (Afetam relevância)
             'description_ausente': {
@@ -120,45 +132,48 @@ class SEOPriorizationEngine:
         return problemas
     
     def analisar_ssl_problemas(self, df: pd.DataFrame) -> list:
-        """🔒 Analisa problemas SSL detectados"""
+        """🔒 Analisa problemas SSL detectados (aba do motor SSL: Problema_Principal/Grade_SSL)"""
         problemas = []
-        if not df.empty:
-            # Verifica domínios com problemas SSL
-            dominios_com_problema = df[df['Problema'] != 'OK']
+        if df.empty:
+            return problemas
+        
+        # Aba SSL_Problemas atual (motor_ssl) ou formato legado (Problema/Grade)
+        coluna_problema = 'Problema_Principal' if 'Problema_Principal' in df.columns else 'Problema'
+        if coluna_problema not in df.columns:
+            return problemas  # Aba "sem problemas" (TODOS_CERTIFICADOS_VALIDOS)
+        
+        dominios_com_problema = df[~df[coluna_problema].isin(['OK', 'SSL_VALIDO'])]
+        config = self.scoring_matrix['ssl_problemas']
+        
+        for _, row in dominios_com_problema.iterrows():
+            problema_ssl = str(row.get(coluna_problema, ''))
+            expiracao = str(row.get('Status_Expiracao', ''))
+            impacto = row.get('Impacto_SEO', row.get('Gravidade', 'MÉDIO'))
+            recomendacao = row.get('Recomendacao', row.get('Recomendacoes', '')) or 'Verificar configuração SSL'
+            texto = f"{problema_ssl} {expiracao}".lower()
             
-            for _, row in dominios_com_problema.iterrows():
-                problema_ssl = row.get('Problema', '')
-                grade = row.get('Grade', '')
-                impacto = row.get('Impacto_SEO', 'MÉDIO')
-                
-                # Determina score baseado no tipo de problema
-                if 'expirado' in problema_ssl.lower() or 'timeout' in problema_ssl.lower():
-                    config = self.scoring_matrix['ssl_problemas']
-                    config['gravidade'] = 100  # Crítico
-                elif 'cadeia' in problema_ssl.lower():
-                    config = self.scoring_matrix['ssl_problemas'] 
-                    config['gravidade'] = 95   # Muito alto
-                elif 'expirando' in problema_ssl.lower():
-                    config = self.scoring_matrix['ssl_problemas']
-                    config['gravidade'] = 80   # Alto
-                else:
-                    config = self.scoring_matrix['ssl_problemas']
-                    config['gravidade'] = 70   # Padrão
-                
-                score = self._calcular_score_final(
-                    config['gravidade'], config['impacto_seo'], config['esforco']
-                )
-                
-                problemas.append({
-                    'problema': f'SSL: {problema_ssl}',
-                    'url': row.get('Dominio', ''),
-                    'score': score,
-                    'prioridade': self._classificar_prioridade(score),
-                    'categoria': config['categoria'],
-                    'aba_origem': 'SSL_Problemas',
-                    'recomendacao': row.get('Recomendacao', 'Verificar configuração SSL'),
-                    'impacto_estimado': f'{impacto} - SSL afeta crawling e trust'
-                })
+            # Gravidade pelo tipo de problema (sem alterar a matriz compartilhada)
+            if 'expirado' in texto or 'timeout' in texto:
+                gravidade = 100  # Crítico
+            elif 'cadeia' in texto:
+                gravidade = 95   # Muito alto
+            elif 'expira' in texto:
+                gravidade = 80   # Alto
+            else:
+                gravidade = 70   # Padrão
+            
+            score = self._calcular_score_final(gravidade, config['impacto_seo'], config['esforco'])
+            
+            problemas.append({
+                'problema': f'SSL: {problema_ssl}',
+                'url': row.get('Dominio', ''),
+                'score': score,
+                'prioridade': self._classificar_prioridade(score),
+                'categoria': config['categoria'],
+                'aba_origem': 'SSL_Problemas',
+                'recomendacao': recomendacao,
+                'impacto_estimado': f'{impacto} - SSL afeta crawling e trust'
+            })
         
         return problemas
     
@@ -344,6 +359,84 @@ class SEOPriorizationEngine:
                 })
         return problemas
     
+    def analisar_links_internos(self, df: pd.DataFrame) -> list:
+        """🕸️ Analisa órfãs e páginas profundas do grafo de links internos"""
+        problemas = []
+        if df.empty or 'Situacao' not in df.columns:
+            return problemas
+        
+        grupos = [
+            ('paginas_orfas', df['Situacao'].astype(str).str.startswith('ÓRFÃ'),
+             'Páginas Órfãs', 'Linkar a partir de páginas relevantes ou remover do sitemap',
+             'ALTO - Googlebot não descobre nem distribui autoridade'),
+            ('profundidade_excessiva', df['Situacao'].astype(str).str.startswith(('PROFUNDA', 'INALCANÇÁVEL')),
+             'Profundidade de Clique Excessiva', 'Aproximar da home (menus, hubs, links contextuais)',
+             'MÉDIO - Menos rastreio e menos PageRank interno'),
+        ]
+        
+        for chave, mascara, nome, recomendacao, impacto in grupos:
+            total = int(mascara.sum())
+            if not total:
+                continue
+            config = self.scoring_matrix[chave]
+            score = self._calcular_score_final(config['gravidade'], config['impacto_seo'], config['esforco'])
+            problemas.append({
+                'problema': nome,
+                'url': f"{total} URLs",
+                'score': score,
+                'prioridade': self._classificar_prioridade(score),
+                'categoria': config['categoria'],
+                'aba_origem': 'Links_Internos',
+                'recomendacao': recomendacao,
+                'impacto_estimado': impacto
+            })
+        
+        return problemas
+    
+    def analisar_links_quebrados(self, df: pd.DataFrame) -> list:
+        """🔗 Um problema por tipo de destino quebrado (interno, externo, arquivo)"""
+        problemas = []
+        if df.empty or 'Tipo' not in df.columns:
+            return problemas
+        
+        config = self.scoring_matrix['links_quebrados']
+        origens = pd.to_numeric(df.get('Total_Paginas_Origem'), errors='coerce').fillna(0)
+        for tipo, grupo in df.groupby('Tipo'):
+            # Link interno quebrado pesa mais: o site inteiro manda crawl budget para o erro
+            impacto = config['impacto_seo'] + (15 if tipo in ('INTERNO', 'ARQUIVO') else 0)
+            score = self._calcular_score_final(config['gravidade'], impacto, config['esforco'])
+            problemas.append({
+                'problema': f'Links Quebrados ({tipo})',
+                'url': f"{len(grupo)} destinos em {int(origens[grupo.index].sum())} links",
+                'score': score,
+                'prioridade': self._classificar_prioridade(score),
+                'categoria': config['categoria'],
+                'aba_origem': 'Links_Quebrados',
+                'recomendacao': 'Corrigir ou remover o link nas páginas de origem (ou redirecionar o destino)',
+                'impacto_estimado': 'ALTO - Usuário e Googlebot caem em erro' if tipo != 'EXTERNO'
+                                    else 'MÉDIO - Experiência e confiança da página'
+            })
+        
+        return problemas
+    
+    def aplicar_sinal_pagerank(self, problemas: list, df_links: pd.DataFrame, bonus_maximo: int = 10) -> list:
+        """📈 Problemas em páginas com mais PageRank interno sobem na fila (até +bonus_maximo)"""
+        if df_links.empty or 'PageRank_Relativo' not in df_links.columns:
+            return problemas
+        
+        relevancia = dict(zip(
+            df_links['URL'].astype(str).str.rstrip('/'),
+            pd.to_numeric(df_links['PageRank_Relativo'], errors='coerce').fillna(0) / 100
+        ))
+        
+        for problema in problemas:
+            peso = relevancia.get(str(problema.get('url', '')).rstrip('/'))
+            if peso:
+                problema['score'] = min(100, problema['score'] + int(round(bonus_maximo * peso)))
+                problema['prioridade'] = self._classificar_prioridade(problema['score'])
+        
+        return problemas
+    
     def processar_excel_completo(self) -> dict:
         """📊 Processa todas as abas do Excel e gera inteligência"""
         
@@ -402,6 +495,19 @@ class SEOPriorizationEngine:
                 todos_problemas.extend(problemas)
                 print(f"      🔒 SSL_Problemas: {len(problemas)} problemas")
             
+            # Links quebrados 🔗
+            if 'Links_Quebrados' in excel_data:
+                problemas = self.analisar_links_quebrados(excel_data['Links_Quebrados'])
+                todos_problemas.extend(problemas)
+                print(f"      🔗 Links_Quebrados: {len(problemas)} problemas")
+            
+            # Links internos 🕸️: órfãs/profundas + PageRank como peso das URLs
+            if 'Links_Internos' in excel_data:
+                problemas = self.analisar_links_internos(excel_data['Links_Internos'])
+                todos_problemas.extend(problemas)
+                print(f"      🕸️ Links_Internos: {len(problemas)} problemas")
+                self.aplicar_sinal_pagerank(todos_problemas, excel_data['Links_Internos'])
+            
             # Ordena por score (maior primeiro)
             todos_problemas.sort(key=lambda x: x['score'], reverse=True)
             
@@ -0,0 +1,182 @@
+# render_cache.py - Cache de DOM renderizado (pós-JS) para re-extração sem re-renderizar
+# 💾 Chave: URL + hash do HTML original + validadores dos subrecursos (JS/CSS)
+
+import os
+import gzip
+import pickle
+import hashlib
+import re
+import time
+from typing import Dict, Optional
+
+RENDER_CACHE_DIR = os.path.join(".cache", "render")
+RENDER_CACHE_VERSION = 2     # v2: headings ocultos da renderização salvos nos dois modos de extração
+
+# Scripts do DOM salvo já executaram - na re-extração ficam inertes.
+# O primeiro atributo "type" vence no parser HTML, então o original é ignorado.
+_RE_SCRIPT_TAG = re.compile(r'<script\b', re.IGNORECASE)
+
+# Subrecursos que alteram o DOM renderizado
+SUBRECURSOS_RELEVANTES = ('script', 'stylesheet')
+
+
+def calcular_hash_conteudo(conteudo) -> str:
+    """🔑 Hash md5 do conteúdo (bytes ou str)"""
+    if isinstance(conteudo, str):
+        conteudo = conteudo.encode('utf-8', errors='ignore')
+    return hashlib.md5(conteudo or b'').hexdigest()
+
+
+def validador_de_headers(headers: Dict[str, str]) -> str:
+    """🏷️ Validador HTTP barato de um subrecurso (ETag > Last-Modified > Content-Length)"""
+    headers = {k.lower(): v for k, v in (headers or {}).items()}
+    if headers.get('etag'):
+        return f"etag:{headers['etag']}"
+    if headers.get('last-modified'):
+        return f"lm:{headers['last-modified']}"
+    if headers.get('content-length'):
+        return f"len:{headers['content-length']}"
+    return ''
+
+
+def neutralizar_scripts(dom: str) -> str:
+    """🧊 Torna scripts inertes para reabrir o DOM sem reexecutar JS"""
+    return _RE_SCRIPT_TAG.sub('<script type="text/x-render-cache"', dom)
+
+
+class RenderCache:
+    """💾 Cache em disco do DOM serializado pós-JS, comprimido, por URL"""
+
+    def __init__(self, domain: str, cache_dir: str = RENDER_CACHE_DIR):
+        self.domain = domain
+        self.dir = os.path.join(cache_dir, domain.replace('.', '_'))
+        os.makedirs(self.dir, exist_ok=True)
+
+        # Validadores de subrecursos consultados nesta execução (bundles são compartilhados)
+        self._validadores_atuais: Dict[str, str] = {}
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'invalidados_html': 0,
+            'invalidados_subrecursos': 0,
+            'salvos': 0,
+            'bytes_salvos': 0
+        }
+
+    def _arquivo(self, url: str) -> str:
+        return os.path.join(self.dir, f"{calcular_hash_conteudo(url)}.pkl.gz")
+
+    def carregar(self, url: str) -> Optional[Dict]:
+        """📂 Carrega entrada do cache (sem validar)"""
+        path = self._arquivo(url)
+        if not os.path.exists(path):
+            return None
+        try:
+            with gzip.open(path, 'rb') as f:
+                entrada = pickle.load(f)
+            if entrada.get('versao') != RENDER_CACHE_VERSION or entrada.get('url') != url:
+                return None
+            return entrada
+        except Exception:
+            return None
+
+    def salvar(self, url: str, final_url: str, status_code: Optional[int], tipo_conteudo: str,
+               hash_html: str, subrecursos: Dict[str, str], dom: str, analise_render: Dict):
+        """💾 Salva DOM renderizado + dados que só existem durante a renderização"""
+        entrada = {
+            'versao': RENDER_CACHE_VERSION,
+            'url': url,
+            'final_url': final_url,
+            'status_code_http': status_code,
+            'tipo_conteudo': tipo_conteudo,
+            'hash_html': hash_html,
+            'subrecursos': subrecursos,
+            'dom': neutralizar_scripts(dom),
+            'analise_render': analise_render,
+            'renderizado_em': time.time()
+        }
+        try:
+            path = self._arquivo(url)
+            with gzip.open(path, 'wb', compresslevel=6) as f:
+                pickle.dump(entrada, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self.stats['salvos'] += 1
+            self.stats['bytes_salvos'] += os.path.getsize(path)
+        except Exception as e:
+            print(f"   ⚠️ Erro salvando render cache de {url}: {e}")
+
+    async def _validador_atual(self, sub_url: str, request_context) -> str:
+        """🏷️ Validador atual de um subrecurso (HEAD memoizado por execução)"""
+        if sub_url in self._validadores_atuais:
+            return self._validadores_atuais[sub_url]
+        try:
+            response = await request_context.head(sub_url, timeout=10000)
+            validador = validador_de_headers(response.headers)
+        except Exception:
+            validador = ''
+        self._validadores_atuais[sub_url] = validador
+        return validador
+
+    async def obter_valido(self, url: str, request_context) -> Optional[Dict]:
+        """✅ Retorna entrada se HTML original e subrecursos não mudaram"""
+
+        entrada = self.carregar(url)
+        if not entrada:
+            self.stats['misses'] += 1
+            return None
+
+        # Fetch estático barato: só o HTML original, sem renderizar
+        try:
+            response = await request_context.get(url, timeout=15000)
+            hash_atual = calcular_hash_conteudo(await response.body())
+        except Exception:
+            self.stats['misses'] += 1
+            return None
+
+        if hash_atual != entrada['hash_html']:
+            self.stats['invalidados_html'] += 1
+            return None
+
+        for sub_url, validador in entrada.get('subrecursos', {}).items():
+            # Sem validador na renderização = sem como comparar barato; URL já está no hash do HTML
+            if not validador:
+                continue
+            if await self._validador_atual(sub_url, request_context) != validador:
+                self.stats['invalidados_subrecursos'] += 1
+                return None
+
+        self.stats['hits'] += 1
+        self._marcar_validado(url)
+        return entrada
+
+    def _marcar_validado(self, url: str):
+        """🕒 mtime do arquivo = última vez que a entrada foi salva ou revalidada contra o site"""
+        try:
+            os.utime(self._arquivo(url))
+        except OSError:
+            pass
+
+    def validado_em(self, url: str) -> float:
+        """🕒 Última renderização ou revalidação da URL (0 = sem entrada)"""
+        try:
+            return os.path.getmtime(self._arquivo(url))
+        except OSError:
+            return 0.0
+
+    def limpar(self):
+        """🗑️ Remove todas as entradas do domínio"""
+        for nome in os.listdir(self.dir):
+            if nome.endswith('.pkl.gz'):
+                try:
+                    os.remove(os.path.join(self.dir, nome))
+                except OSError:
+                    pass
+
+    def get_stats(self) -> Dict:
+        """📊 Estatísticas do render cache"""
+        consultas = self.stats['hits'] + self.stats['misses'] + self.stats['invalidados_html'] + self.stats['invalidados_subrecursos']
+        return {
+            **self.stats,
+            'hit_rate_percent': round(self.stats['hits'] / consultas * 100, 1) if consultas else 0.0,
+            'mb_em_disco': round(self.stats['bytes_salvos'] / 1024 / 1024, 2)
+        }
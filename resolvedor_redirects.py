@@ -0,0 +1,267 @@
+# resolvedor_redirects.py - Cadeias de redirect salto a salto (HEAD, sem seguir redirects automaticamente)
+# 🔗 Cada salto é requisitado UMA vez no crawl: cadeias com o mesmo sufixo (http -> https -> www -> /) reaproveitam
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urljoin
+
+import requests
+import urllib3
+from requests.structures import CaseInsensitiveDict
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+MAX_SALTOS = 10                     # Mesmo limite prático do requests (30) seria lento demais por URL
+MAX_BYTES_CORPO_ERRO = 64 * 1024    # Trecho da página de erro (4xx/5xx) para as abas de erro
+STATUS_SEM_HEAD = (405, 501)        # Servidor não aceita HEAD: repete o salto com GET sem baixar o corpo
+
+HEADERS_PADRAO = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
+    'Connection': 'keep-alive'
+}
+
+
+@dataclass
+class Salto:
+    """🔗 Uma requisição da cadeia (mesmos atributos de requests.Response que as abas leem)"""
+    url: str
+    status_code: Optional[int] = None
+    location: str = ''                  # Destino absoluto do redirect
+    latencia: float = 0.0               # Segundos
+    metodo: str = 'HEAD'
+    headers: Dict[str, str] = field(default_factory=CaseInsensitiveDict)
+    corpo: bytes = b''                  # Só para 4xx/5xx finais (trecho da página de erro)
+    encoding: Optional[str] = None
+    erro: str = ''
+    excecao: Optional[BaseException] = None
+
+    @property
+    def eh_redirect(self) -> bool:
+        return self.status_code is not None and 300 <= self.status_code < 400 and bool(self.location)
+
+
+class RespostaCadeia:
+    """📨 Fim da cadeia no formato de requests.Response (status, url final, history, headers, elapsed, corpo)"""
+
+    def __init__(self, saltos: List[Salto]):
+        final = saltos[-1]
+        self.status_code = final.status_code
+        self.url = final.url
+        self.headers = final.headers
+        self.history = saltos[:-1]
+        self.elapsed = timedelta(seconds=final.latencia)
+        self.content = final.corpo
+        self.encoding = final.encoding
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+
+@dataclass
+class CadeiaRedirect:
+    """🔗 Cadeia completa de uma URL: saltos com status e latência, loop, limite excedido"""
+    url: str
+    saltos: List[Salto] = field(default_factory=list)
+    loop: bool = False
+    excedeu_limite: bool = False
+
+    @property
+    def final(self) -> Salto:
+        return self.saltos[-1]
+
+    @property
+    def status_inicial(self) -> Optional[int]:
+        return self.saltos[0].status_code if self.saltos else None
+
+    @property
+    def status_final(self) -> Optional[int]:
+        return self.final.status_code if self.saltos else None
+
+    @property
+    def url_final(self) -> str:
+        return self.final.url if self.saltos else self.url
+
+    @property
+    def redirects(self) -> List[Salto]:
+        return [salto for salto in self.saltos if salto.eh_redirect]
+
+    @property
+    def tem_redirect(self) -> bool:
+        return bool(self.saltos) and self.saltos[0].eh_redirect
+
+    @property
+    def latencia_total(self) -> float:
+        return sum(salto.latencia for salto in self.saltos)
+
+    @property
+    def erro(self) -> str:
+        if self.loop:
+            return 'Loop de redirects'
+        if self.excedeu_limite:
+            return f'Mais de {MAX_SALTOS} redirects'
+        return self.final.erro if self.saltos else 'Cadeia vazia'
+
+    def descrever(self, max_url: int = 80) -> str:
+        """📝 "301 http://a (0.12s) → 301 https://a (0.10s) → 200 https://www.a/ (0.20s)" """
+        partes = [
+            f"{salto.status_code if salto.status_code is not None else 'ERRO'} "
+            f"{salto.url[:max_url]} ({salto.latencia:.2f}s)"
+            for salto in self.saltos
+        ]
+        if self.loop:
+            partes.append(f'LOOP → {self.final.location[:max_url]}')
+        return ' → '.join(partes)
+
+    def resposta(self) -> RespostaCadeia:
+        """📨 Como session.get(url, allow_redirects=True): relança o erro do último salto"""
+        if self.loop or self.excedeu_limite:
+            raise requests.exceptions.TooManyRedirects(f'{self.erro}: {self.url}')
+        if self.final.excecao is not None:
+            raise self.final.excecao
+        return RespostaCadeia(self.saltos)
+
+
+class ResolvedorRedirects:
+    """🔗 Memo por salto, single-flight: N URLs x cadeias parecidas viram 1 requisição por URL distinta"""
+
+    def __init__(self, session: Optional[requests.Session] = None, timeout: int = 10,
+                 max_saltos: int = MAX_SALTOS, max_workers: int = 20):
+        if session is None:
+            session = requests.Session()
+            session.headers.update(HEADERS_PADRAO)
+        self.session = session
+        self.timeout = timeout
+        self.max_saltos = max_saltos
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self._saltos: Dict[str, Future] = {}
+
+        self.stats = {'requisicoes': 0, 'reusos': 0, 'get_sem_head': 0, 'get_erro': 0, 'loops': 0}
+
+    # ========================
+    # 🌐 UM SALTO
+    # ========================
+
+    def _requisitar(self, url: str, metodo: str) -> requests.Response:
+        if metodo == 'HEAD':
+            return self.session.head(url, timeout=self.timeout, verify=False, allow_redirects=False)
+        return self.session.get(url, timeout=self.timeout, verify=False, allow_redirects=False, stream=True)
+
+    def _ler_corpo(self, response: requests.Response) -> bytes:
+        """📄 Até MAX_BYTES_CORPO_ERRO do corpo (páginas de erro), sem baixar o resto"""
+        lido = b''
+        try:
+            for bloco in response.iter_content(chunk_size=8192):
+                lido += bloco
+                if len(lido) >= MAX_BYTES_CORPO_ERRO:
+                    break
+        except Exception:
+            pass
+        return lido[:MAX_BYTES_CORPO_ERRO]
+
+    def _executar_salto(self, url: str) -> Salto:
+        salto = Salto(url=url)
+        inicio = time.perf_counter()
+        try:
+            response = self._requisitar(url, 'HEAD')
+            with self._lock:
+                self.stats['requisicoes'] += 1
+
+            # HEAD recusado, ou erro: confirma com GET (alguns servidores só erram no HEAD)
+            if response.status_code in STATUS_SEM_HEAD or response.status_code >= 400:
+                response.close()
+                response = self._requisitar(url, 'GET')
+                salto.metodo = 'GET'
+                with self._lock:
+                    self.stats['requisicoes'] += 1
+                    self.stats['get_sem_head' if response.status_code < 400 else 'get_erro'] += 1
+                if response.status_code >= 400:
+                    salto.corpo = self._ler_corpo(response)
+                    salto.encoding = response.encoding
+                response.close()
+
+            salto.status_code = response.status_code
+            salto.headers = response.headers
+            salto.latencia = response.elapsed.total_seconds()
+            if 300 <= response.status_code < 400 and response.headers.get('location'):
+                salto.location = urljoin(url, response.headers['location'].strip())
+
+        except Exception as e:
+            salto.erro = str(e)
+            salto.excecao = e
+            salto.latencia = time.perf_counter() - inicio
+
+        return salto
+
+    def salto(self, url: str) -> Salto:
+        """🔗 Salto memoizado: o primeiro pedido requisita, os simultâneos esperam o mesmo resultado"""
+        with self._lock:
+            futuro = self._saltos.get(url)
+            dono = futuro is None
+            if dono:
+                futuro = self._saltos[url] = Future()
+            else:
+                self.stats['reusos'] += 1
+
+        if dono:
+            futuro.set_result(self._executar_salto(url))
+        return futuro.result()
+
+    # ========================
+    # 🔗 CADEIAS
+    # ========================
+
+    def resolver(self, url: str) -> CadeiaRedirect:
+        """🔗 Segue a cadeia salto a salto até um não-redirect, loop ou limite"""
+        cadeia = CadeiaRedirect(url=url)
+        visitadas = set()
+        atual = url
+
+        while True:
+            visitadas.add(atual)
+            salto = self.salto(atual)
+            cadeia.saltos.append(salto)
+
+            if not salto.eh_redirect:
+                break
+            if salto.location in visitadas:
+                cadeia.loop = True
+                with self._lock:
+                    self.stats['loops'] += 1
+                break
+            if len(cadeia.saltos) > self.max_saltos:
+                cadeia.excedeu_limite = True
+                break
+            atual = salto.location
+
+        return cadeia
+
+    def resolver_todas(self, urls: Iterable[str]) -> Dict[str, CadeiaRedirect]:
+        """🚀 Cadeias de todas as URLs em paralelo (saltos compartilhados entre elas)"""
+        urls = [u for u in dict.fromkeys(urls) if u]
+        cadeias: Dict[str, CadeiaRedirect] = {}
+
+        print(f"🔗 Resolvendo cadeias de redirect: {len(urls)} URLs")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futuros = {executor.submit(self.resolver, url): url for url in urls}
+            for futuro in as_completed(futuros):
+                cadeias[futuros[futuro]] = futuro.result()
+                if len(cadeias) % 100 == 0:
+                    print(f"⚡ Cadeias resolvidas: {len(cadeias)}/{len(urls)}")
+
+        stats = self.get_stats()
+        print(f"   ✅ {stats['saltos']} saltos distintos | {stats['requisicoes']} requisições | "
+              f"{stats['reusos']} reaproveitados | {stats['loops']} loops")
+        return cadeias
+
+    def get_stats(self) -> Dict:
+        """📊 Estatísticas do resolvedor"""
+        return {**self.stats, 'saltos': len(self._saltos)}
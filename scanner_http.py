@@ -0,0 +1,378 @@
+# scanner_http.py - Referências http:// num único passe de tokenizer (sem árvore DOM)
+# 🔓 Cada ocorrência é classificada pelo contexto: atributo, style inline, bloco <style>, script, texto, comentário
+#    O mesmo passe separa os recursos que viram mixed content numa página HTTPS (com região e path DOM)
+
+import codecs
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Dict, Iterable, List, Tuple, Union
+from urllib.parse import urljoin
+
+# ========================
+# 🎯 PADRÕES
+# ========================
+
+# (tag, atributo) com URL de recurso - a ordem define a ordem das issues no relatório
+PADROES_URL = [
+    # Recursos de mídia
+    ('img', 'src'),
+    ('img', 'data-src'),  # Lazy loading
+    ('video', 'src'),
+    ('video', 'poster'),
+    ('audio', 'src'),
+    ('source', 'src'),
+    ('source', 'srcset'),
+
+    # iframes e embeds (scripts HTTP são bloqueados pelo navegador)
+    ('iframe', 'src'),
+    ('embed', 'src'),
+    ('object', 'data'),
+
+    # Links e CSS
+    ('link', 'href'),
+    ('a', 'href'),
+
+    # Formulários
+    ('form', 'action'),
+
+    # Background images via atributos
+    ('div', 'data-bg'),
+    ('section', 'data-background'),
+    ('header', 'data-bg-image'),
+]
+
+# Tabela de despacho: tag -> [(índice do padrão, atributo)]
+DESPACHO_ATRIBUTOS = {}
+for _indice, (_tag, _atributo) in enumerate(PADROES_URL):
+    DESPACHO_ATRIBUTOS.setdefault(_tag, []).append((_indice, _atributo))
+
+# Grupos depois dos padrões de atributo (mesma ordem do relatório de mixed content)
+GRUPO_CSS_INLINE = len(PADROES_URL)
+GRUPO_CSS_EXTERNO = len(PADROES_URL) + 1
+GRUPO_BACKGROUND = len(PADROES_URL) + 2
+
+RE_TRECHO_HTTP = re.compile(r'http://[^"\'\s\)<>]+')
+RE_CSS_URL_HTTP = re.compile(r'url\(["\']?(http://[^"\')]+)["\']?\)')
+RE_BACKGROUND_IMAGE = re.compile(r'background-image\s*:\s*url\(["\']?(http://[^"\')]+)["\']?\)')
+RE_BACKGROUND = re.compile(r'background\s*:\s*[^;]*url\(["\']?(http://[^"\')]+)["\']?\)')
+
+# Contextos de uma ocorrência http:// (coluna 'tipo' da aba HTTP_Inseguro)
+CONTEXTO_ATRIBUTO = 'atributo'
+CONTEXTO_IDENTIFICADOR = 'identificador'    # xmlns, itemtype...: nunca é baixado pelo navegador
+CONTEXTO_CSS_INLINE = 'css_inline'          # Atributo style
+CONTEXTO_STYLE_TAG = 'style_tag'            # Bloco <style>
+CONTEXTO_SCRIPT = 'script'
+CONTEXTO_TEXTO = 'texto'
+CONTEXTO_COMENTARIO = 'comentario'
+
+ATRIBUTOS_IDENTIFICADORES = ('xmlns', 'itemtype', 'vocab', 'profile')
+
+# Elementos sem fechamento: não entram na pilha
+TAGS_VAZIAS = frozenset((
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr'
+))
+
+# Bits de ancestralidade (acumulados da raiz até o nó)
+BIT_HEAD = 1
+BIT_BODY = 2
+
+# Regiões em ordem de prioridade: (localização, bit, tag semântica, palavras em class/id)
+REGIOES_DOM = [
+    ('FOOTER', 4, 'footer', re.compile('footer|rodape|bottom')),
+    ('HEADER', 8, 'header', re.compile('header|cabecalho|top|nav|navbar')),
+    ('SIDEBAR', 16, None, re.compile('sidebar|aside|lateral')),
+    ('MODAL', 32, None, re.compile('modal|popup|overlay|dialog')),
+    ('MAIN_CONTENT', 64, None, re.compile('main|content|conteudo|article')),
+]
+
+TAMANHO_BLOCO = 64 * 1024
+
+
+def _bits_proprios(nome: str, attrs: Dict[str, str]) -> int:
+    """🧭 Regiões que o próprio elemento abre (tag semântica ou palavra em class/id)"""
+    bits = BIT_HEAD if nome == 'head' else BIT_BODY if nome == 'body' else 0
+
+    tem_classe_ou_id = 'class' in attrs or 'id' in attrs
+    if tem_classe_ou_id:
+        # Separador sem espaço: nenhuma palavra-chave casa atravessando class e id
+        alvo = ' '.join((attrs.get('class') or '').split()).lower() + '\x00' + (attrs.get('id') or '').lower()
+
+    for _, bit, tag_semantica, palavras in REGIOES_DOM:
+        if nome == tag_semantica or (tem_classe_ou_id and palavras.search(alvo)):
+            bits |= bit
+    return bits
+
+
+def _localizacao_por_bits(bits: int) -> str:
+    """🧠 Mesma precedência do detector por ancestrais: HEAD, depois regiões do BODY"""
+    if bits & BIT_HEAD:
+        return "HEAD"
+    if bits & BIT_BODY:
+        for localizacao, bit, _, _ in REGIOES_DOM:
+            if bits & bit:
+                return localizacao
+        return "BODY"
+    return "UNKNOWN"
+
+
+def _parte_path(nome: str, attrs: Dict[str, str]) -> str:
+    parte = nome
+    if attrs.get('id'):
+        parte += f"#{attrs['id']}"
+    classes = (attrs.get('class') or '').split()
+    if classes:
+        parte += f".{classes[0]}"
+    return parte
+
+
+# ========================
+# 📦 RESULTADO
+# ========================
+
+@dataclass
+class OcorrenciaHTTP:
+    """🔓 Um http:// no documento e onde ele aparece"""
+    contexto: str
+    trecho: str
+    tag: str = ''
+    atributo: str = ''
+
+
+@dataclass
+class VarreduraHTTP:
+    """📦 Produto do passe único: ocorrências (HTTP_Inseguro) + candidatos a mixed content"""
+    ocorrencias: List[OcorrenciaHTTP] = field(default_factory=list)
+    recursos: List[dict] = field(default_factory=list)        # Achados de mixed content, com 'grupo' de ordenação
+    stylesheets: List[dict] = field(default_factory=list)     # <link rel=stylesheet href=https://...> a inspecionar
+    erro: str = ''
+
+    def ocorrencias_unicas(self) -> List[OcorrenciaHTTP]:
+        """🧹 Uma ocorrência por (contexto, elemento, trecho) - o mesmo link repetido no menu conta uma vez"""
+        vistas = set()
+        unicas = []
+        for ocorrencia in self.ocorrencias:
+            chave = (ocorrencia.contexto, ocorrencia.tag, ocorrencia.atributo, ocorrencia.trecho)
+            if chave not in vistas:
+                vistas.add(chave)
+                unicas.append(ocorrencia)
+        return unicas
+
+
+# ========================
+# 🔍 SCANNER
+# ========================
+
+class ScannerHTTP(HTMLParser):
+    """🔍 Tokenizer com pilha de (tag, bits de região, path): nenhum nó é construído"""
+
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.resultado = VarreduraHTTP()
+        # (tag, bits acumulados, partes do path do nó para cima, classes)
+        self.pilha: List[Tuple[str, int, tuple, List[str]]] = []
+        self._texto: List[str] = []
+        self._localizacoes: Dict[int, str] = {}
+
+    def _localizacao(self, bits: int) -> str:
+        localizacao = self._localizacoes.get(bits)
+        if localizacao is None:
+            localizacao = self._localizacoes[bits] = _localizacao_por_bits(bits)
+        return localizacao
+
+    def _ocorrencias(self, contexto: str, texto: str, tag: str = '', atributo: str = ''):
+        for trecho in RE_TRECHO_HTTP.findall(texto):
+            self.resultado.ocorrencias.append(OcorrenciaHTTP(contexto, trecho, tag, atributo))
+
+    # ========================
+    # 🏷️ TAGS
+    # ========================
+
+    def handle_starttag(self, tag, attrs):
+        self._descarregar_texto()
+        bits = self._abrir(tag, attrs)
+        if tag not in TAGS_VAZIAS:
+            self.pilha.append(bits)
+
+    def handle_startendtag(self, tag, attrs):
+        self._descarregar_texto()
+        self._abrir(tag, attrs)
+
+    def handle_endtag(self, tag):
+        self._descarregar_texto()
+        # Fecha até a tag correspondente (HTML real tem tags sem fechamento)
+        for i in range(len(self.pilha) - 1, -1, -1):
+            if self.pilha[i][0] == tag:
+                del self.pilha[i:]
+                break
+
+    def _abrir(self, tag: str, lista_attrs) -> tuple:
+        """🏷️ Atributos do elemento: ocorrências http:// e recursos de mixed content"""
+        attrs = {nome: valor if valor is not None else '' for nome, valor in lista_attrs}
+        nome_pai, bits_pai, partes_pai, classes_pai = self.pilha[-1] if self.pilha else ('[document]', 0, (), [])
+        partes = (_parte_path(tag, attrs),) + partes_pai[:4]
+        no = (tag, bits_pai | _bits_proprios(tag, attrs), partes, (attrs.get('class') or '').split())
+
+        # Sem http:// e sem atributo de recurso: nada a classificar
+        despacho = DESPACHO_ATRIBUTOS.get(tag)
+        if not despacho and tag != 'link' and not any('http://' in valor for valor in attrs.values()):
+            return no
+
+        localizacao = self._localizacao(bits_pai)
+        caminho = None
+
+        for atributo, valor in attrs.items():
+            if 'http://' not in valor:
+                continue
+            if atributo == 'style':
+                contexto = CONTEXTO_CSS_INLINE
+            elif atributo.startswith(ATRIBUTOS_IDENTIFICADORES):
+                contexto = CONTEXTO_IDENTIFICADOR
+            else:
+                contexto = CONTEXTO_ATRIBUTO
+            self._ocorrencias(contexto, valor, tag, atributo)
+
+        recursos = self.resultado.recursos
+        for indice, atributo in despacho or ():
+            valor = attrs.get(atributo)
+            if valor is None:
+                continue
+            url_absoluta = self._url_absoluta(valor.strip())
+            if url_absoluta is None:
+                continue
+            caminho = caminho or ' > '.join(reversed(partes))
+            recursos.append({
+                'grupo': indice,
+                'tipo': tag,
+                'url_recurso': valor.strip(),
+                'url_absoluta': url_absoluta,
+                'localizacao_dom': localizacao,
+                'atributo': atributo,
+                'contexto_semantico': self._contexto_semantico(attrs, tag, localizacao, nome_pai, classes_pai),
+                'path_dom': caminho,
+                'tag_completa': self.get_starttag_text()[:200]
+            })
+
+        if tag == 'link' and 'stylesheet' in attrs.get('rel', '').split() and attrs.get('href', '').startswith('https://'):
+            self.resultado.stylesheets.append({
+                'href': attrs['href'],
+                'localizacao_dom': localizacao,
+                'path_dom': caminho or ' > '.join(reversed(partes))
+            })
+
+        estilo = attrs.get('style', '')
+        if 'http://' in estilo:
+            for bg_url in RE_BACKGROUND_IMAGE.findall(estilo) + RE_BACKGROUND.findall(estilo):
+                recursos.append({
+                    'grupo': GRUPO_BACKGROUND,
+                    'tipo': 'background_image',
+                    'url_recurso': bg_url,
+                    'url_absoluta': bg_url,
+                    'localizacao_dom': localizacao,
+                    'atributo': 'style',
+                    'contexto_semantico': f'Background image em {tag}',
+                    'path_dom': caminho or ' > '.join(reversed(partes)),
+                    'tag_completa': f'<{tag} style="...{bg_url}...">'
+                })
+
+        return no
+
+    def _url_absoluta(self, valor: str):
+        """🔗 URL como o navegador busca (None se vazia ou segura)"""
+        if not valor or valor.startswith('https://'):
+            return None
+        if valor.startswith('//'):
+            url_absoluta = 'http:' + valor
+        elif valor.startswith('http://'):
+            url_absoluta = valor
+        else:
+            url_absoluta = urljoin(self.base_url, valor)
+        return url_absoluta if url_absoluta.startswith('http://') else None
+
+    @staticmethod
+    def _contexto_semantico(attrs: Dict[str, str], tag: str, localizacao: str, nome_pai: str, classes_pai: List[str]) -> str:
+        """📋 DOM, id/class/alt/title do elemento e pai imediato"""
+        contexto_parts = [f"DOM: {localizacao}"]
+        if attrs.get('id'):
+            contexto_parts.append(f"ID: {attrs['id']}")
+        classes = (attrs.get('class') or '').split()
+        if classes:
+            contexto_parts.append(f"Class: {' '.join(classes[:2])}")
+        if tag == 'img' and attrs.get('alt'):
+            contexto_parts.append(f"Alt: {attrs['alt'][:30]}")
+        if attrs.get('title'):
+            contexto_parts.append(f"Title: {attrs['title'][:30]}")
+        if nome_pai != 'body':
+            contexto_parts.append(f"Parent: {nome_pai}.{classes_pai[0]}" if classes_pai else f"Parent: {nome_pai}")
+        return ' | '.join(contexto_parts)
+
+    # ========================
+    # 📝 TEXTO, SCRIPT, STYLE, COMENTÁRIOS
+    # ========================
+
+    def handle_data(self, data):
+        # Texto chega fatiado entre blocos: junta até o próximo token de tag
+        self._texto.append(data)
+
+    def handle_comment(self, data):
+        self._descarregar_texto()
+        if 'http://' in data:
+            self._ocorrencias(CONTEXTO_COMENTARIO, data)
+
+    def _descarregar_texto(self):
+        if not self._texto:
+            return
+        texto = ''.join(self._texto)
+        self._texto = []
+        if 'http://' not in texto:
+            return
+
+        tag, bits, partes, _ = self.pilha[-1] if self.pilha else ('', 0, (), [])
+        if tag == 'style':
+            self._ocorrencias(CONTEXTO_STYLE_TAG, texto, 'style')
+            pai = self.pilha[-2][1] if len(self.pilha) > 1 else 0
+            localizacao = self._localizacao(pai)
+            self.resultado.recursos.extend({
+                'grupo': GRUPO_CSS_INLINE,
+                'tipo': 'css_inline',
+                'url_recurso': css_url,
+                'url_absoluta': css_url,
+                'localizacao_dom': localizacao,
+                'atributo': 'url()',
+                'contexto_semantico': f'CSS inline em {localizacao}',
+                'path_dom': ' > '.join(reversed(partes)),
+                'tag_completa': f'<style>...{css_url}...</style>'
+            } for css_url in RE_CSS_URL_HTTP.findall(texto))
+        elif tag == 'script':
+            self._ocorrencias(CONTEXTO_SCRIPT, texto, 'script')
+        else:
+            self._ocorrencias(CONTEXTO_TEXTO, texto, tag)
+
+    def close(self):
+        super().close()
+        self._descarregar_texto()
+
+
+def varrer_http(conteudo: Union[bytes, str, Iterable[bytes]], base_url: str, encoding: str = None,
+                tamanho_bloco: int = TAMANHO_BLOCO) -> VarreduraHTTP:
+    """🔍 Varre o HTML em blocos (bytes da resposta ou iter_content) num único passe"""
+    scanner = ScannerHTTP(base_url)
+    try:
+        try:
+            decodificador = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+        except LookupError:
+            decodificador = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+        if isinstance(conteudo, str):
+            scanner.feed(conteudo)
+        else:
+            blocos = (conteudo[i:i + tamanho_bloco] for i in range(0, len(conteudo), tamanho_bloco)) \
+                if isinstance(conteudo, (bytes, bytearray)) else conteudo
+            for bloco in blocos:
+                scanner.feed(decodificador.decode(bloco))
+            scanner.feed(decodificador.decode(b'', final=True))
+        scanner.close()
+    except Exception as e:
+        scanner.resultado.erro = str(e)
+    return scanner.resultado
@@ -1,13 +1,10 @@
 # exporters/sheets/ssl_problemas_sheet.py - ENGINE CIRÚRGICA SSL
 # 🔒 ENGINE CIRÚRGICA: Análise SSL completa para auditoria de infraestrutura SEO
 
-import ssl
-import socket
 import pandas as pd
-import datetime
 from urllib.parse import urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from exporters.base_exporter import BaseSheetExporter
+from motor_ssl import alvo_tls, avaliar, obter_motor_ssl
 
 class SSLProblemasSheet(BaseSheetExporter):
     def __init__(self, df, writer):
@@ -111,246 +108,58 @@ class SSLProblemasSheet(BaseSheetExporter):
         
         return list(dominios)
 
-    def _analisar_ssl_cirurgico(self, dominio: str) -> dict:
-        """🔒 Análise SSL cirúrgica de um domínio"""
-        
-        try:
-            # Cria contexto SSL
-            contexto = ssl.create_default_context()
-            
-            # Conecta via SSL
-            with socket.create_connection((dominio, 443), timeout=10) as sock:
-                with contexto.wrap_socket(sock, server_hostname=dominio) as ssock:
-                    # Obtém certificado
-                    cert = ssock.getpeercert()
-                    
-                    # Analisa certificado
-                    valido_ate = datetime.datetime.strptime(cert['notAfter'], "%b %d %H:%M:%S %Y %Z")
-                    valido_desde = datetime.datetime.strptime(cert['notBefore'], "%b %d %H:%M:%S %Y %Z")
-                    
-                    dias_restantes = (valido_ate - datetime.datetime.utcnow()).days
-                    
-                    # Extrai informações do certificado
-                    issuer = dict(x[0] for x in cert['issuer']).get('organizationName', 
-                             dict(x[0] for x in cert['issuer']).get('O', 'Desconhecido'))
-                    
-                    subject = dict(x[0] for x in cert['subject']).get('commonName', dominio)
-                    
-                    # Verifica chain SSL
-                    chain_ok = self._validar_chain_ssl(ssock, cert)
-                    
-                    # Calcula grade SSL
-                    grade = self._calcular_grade_ssl(chain_ok, dias_restantes, cert)
-                    
-                    # Detecta problemas
-                    problema, impacto, recomendacao = self._detectar_problemas_ssl(
-                        chain_ok, dias_restantes, cert, dominio
-                    )
-                    
-                    return {
-                        'Dominio': dominio,
-                        'Subject': subject,
-                        'Emitido_Por': issuer,
-                        'Valido_Ate': valido_ate.strftime("%Y-%m-%d"),
-                        'Dias_Restantes': dias_restantes,
-                        'Chain_OK': 'Sim' if chain_ok else 'Não',
-                        'Grade': grade,
-                        'Problema': problema,
-                        'Impacto_SEO': impacto,
-                        'Recomendacao': recomendacao
-                    }
-        
-        except socket.timeout:
-            return {
-                'Dominio': dominio,
-                'Subject': '',
-                'Emitido_Por': '',
-                'Valido_Ate': '',
-                'Dias_Restantes': 0,
-                'Chain_OK': 'Não',
-                'Grade': 'FAIL',
-                'Problema': 'Timeout SSL',
-                'Impacto_SEO': 'CRÍTICO',
-                'Recomendacao': 'Servidor SSL não responde - verificar configuração'
-            }
-        
-        except ssl.SSLError as e:
-            ssl_error = str(e)
-            return {
-                'Dominio': dominio,
-                'Subject': '',
-                'Emitido_Por': '',
-                'Valido_Ate': '',
-                'Dias_Restantes': 0,
-                'Chain_OK': 'Não',
-                'Grade': 'FAIL',
-                'Problema': f'Erro SSL: {ssl_error[:50]}',
-                'Impacto_SEO': 'CRÍTICO',
-                'Recomendacao': 'Corrigir configuração SSL - Googlebot pode falhar'
-            }
-        
-        except socket.gaierror:
-            return {
-                'Dominio': dominio,
-                'Subject': '',
-                'Emitido_Por': '',
-                'Valido_Ate': '',
-                'Dias_Restantes': 0,
-                'Chain_OK': 'Não',
-                'Grade': 'FAIL',
-                'Problema': 'DNS não resolve',
-                'Impacto_SEO': 'CRÍTICO',
-                'Recomendacao': 'Verificar configuração DNS'
-            }
-        
-        except Exception as e:
-            return {
-                'Dominio': dominio,
-                'Subject': '',
-                'Emitido_Por': '',
-                'Valido_Ate': '',
-                'Dias_Restantes': 0,
-                'Chain_OK': 'Não',
-                'Grade': 'FAIL',
-                'Problema': f'Erro: {str(e)[:50]}',
-                'Impacto_SEO': 'ALTO',
-                'Recomendacao': 'Investigar problema SSL específico'
-            }
-
-    def _validar_chain_ssl(self, ssock, cert) -> bool:
-        """🔗 Valida se a cadeia SSL está completa"""
-        try:
-            # Verifica se conseguiu obter certificado completo
-            if not cert:
-                return False
-            
-            # Verifica se há issuer válido
-            issuer = dict(x[0] for x in cert.get('issuer', []))
-            if not issuer:
-                return False
-            
-            # Se chegou até aqui sem erro SSL, chain provavelmente está OK
-            # (Análise mais profunda requereria bibliotecas específicas)
-            return True
-            
-        except Exception:
-            return False
-
-    def _calcular_grade_ssl(self, chain_ok: bool, dias_restantes: int, cert: dict) -> str:
-        """📊 Calcula grade SSL simplificada"""
-        
-        # Grade base por validade
-        if dias_restantes < 0:
-            return "F"  # Expirado
-        elif not chain_ok:
-            return "C"  # Chain incompleta
-        elif dias_restantes < 15:
-            return "D"  # Expirando muito em breve
-        elif dias_restantes < 30:
-            return "C"  # Expirando em breve
-        elif dias_restantes < 90:
-            return "B"  # Válido por pouco tempo
+    def _linha_dominio(self, dominio: str, resultado) -> dict:
+        """🔒 Linha da aba a partir do resultado do motor SSL"""
+        
+        avaliacao = avaliar(resultado)
+        problema = avaliacao['problema_principal']
+        dias = avaliacao['expira_em_dias']
+        
+        if problema in ('SSL_VALIDO', 'SSL_DEGRADADO') and not (dias is not None and dias < 30):
+            problema_texto, impacto, recomendacao = "OK", "BAIXO", "SSL configurado corretamente"
+        elif problema == 'CERT_EXPIRADO':
+            problema_texto, impacto, recomendacao = "SSL expirado", "CRÍTICO", "Renovar certificado SSL imediatamente"
+        elif problema == 'CADEIA_INCOMPLETA':
+            problema_texto, impacto, recomendacao = "Cadeia SSL incompleta", "ALTO", "Configurar CA intermediário completo"
+        elif problema == 'HOSTNAME_MISMATCH':
+            problema_texto, impacto, recomendacao = "Mismatch de domínio", "ALTO", f"Certificado não cobre '{dominio}'"
+        elif problema == 'TIMEOUT_SSL':
+            problema_texto, impacto, recomendacao = "Timeout SSL", "CRÍTICO", "Servidor SSL não responde - verificar configuração"
+        elif problema == 'DNS_ERROR':
+            problema_texto, impacto, recomendacao = "DNS não resolve", "CRÍTICO", "Verificar configuração DNS"
+        elif dias is not None and 0 <= dias < 15:
+            problema_texto, impacto, recomendacao = "SSL expirando em breve", "ALTO", f"Renovar SSL - expira em {dias} dias"
+        elif dias is not None and 0 <= dias < 30:
+            problema_texto, impacto, recomendacao = "SSL expirando", "MÉDIO", f"Planejar renovação SSL - expira em {dias} dias"
         else:
-            # Verifica outros fatores para grade A
-            try:
-                # Verifica algoritmo de assinatura
-                sig_algorithm = cert.get('signatureAlgorithm', '').lower()
-                if 'sha1' in sig_algorithm:
-                    return "B"  # SHA1 é fraco
-                elif 'sha256' in sig_algorithm or 'sha384' in sig_algorithm:
-                    return "A"  # SHA256+ é bom
-                else:
-                    return "A-"  # Desconhecido
-            except:
-                return "A-"
-
-    def _detectar_problemas_ssl(self, chain_ok: bool, dias_restantes: int, 
-                               cert: dict, dominio: str) -> tuple:
-        """🚨 Detecta problemas específicos de SSL"""
-        
-        # Certificado expirado
-        if dias_restantes < 0:
-            return (
-                "SSL expirado",
-                "CRÍTICO",
-                "Renovar certificado SSL imediatamente"
-            )
-        
-        # Chain incompleta
-        if not chain_ok:
-            return (
-                "Cadeia SSL incompleta",
-                "ALTO",
-                "Configurar CA intermediário completo"
-            )
-        
-        # Expirando em breve
-        if dias_restantes < 15:
-            return (
-                "SSL expirando em breve",
-                "ALTO",
-                f"Renovar SSL - expira em {dias_restantes} dias"
-            )
-        elif dias_restantes < 30:
-            return (
-                "SSL expirando",
-                "MÉDIO",
-                f"Planejar renovação SSL - expira em {dias_restantes} dias"
-            )
-        
-        # Verifica mismatch de domínio
-        try:
-            subject = dict(x[0] for x in cert['subject']).get('commonName', '')
-            if subject and dominio not in subject and subject not in dominio:
-                # Verifica SAN (Subject Alternative Names)
-                san_domains = []
-                for ext in cert.get('subjectAltName', []):
-                    if ext[0] == 'DNS':
-                        san_domains.append(ext[1])
-                
-                if dominio not in san_domains:
-                    return (
-                        "Mismatch de domínio",
-                        "ALTO",
-                        f"Certificado para '{subject}' não cobre '{dominio}'"
-                    )
-        except:
-            pass
-        
-        # Algoritmo fraco
-        try:
-            sig_algorithm = cert.get('signatureAlgorithm', '').lower()
-            if 'sha1' in sig_algorithm:
-                return (
-                    "Algoritmo SSL fraco",
-                    "MÉDIO",
-                    "Atualizar para SHA256 ou superior"
-                )
-        except:
-            pass
-        
-        # SSL OK
-        return ("OK", "BAIXO", "SSL configurado corretamente")
+            detalhe = '; '.join(avaliacao['problemas_detalhados'])
+            problema_texto, impacto, recomendacao = detalhe[:60] or problema, "ALTO", "Corrigir configuração SSL - Googlebot pode falhar"
+        
+        return {
+            'Dominio': dominio,
+            'Subject': avaliacao['sujeito'],
+            'Emitido_Por': avaliacao['emissor'],
+            'Valido_Ate': avaliacao['data_expiracao'],
+            'Dias_Restantes': dias if dias is not None else 0,
+            'Chain_OK': 'Sim' if avaliacao['chain_completa'] and avaliacao['certificado_valido'] else 'Não',
+            'Grade': 'FAIL' if resultado.erro_tipo else avaliacao['grade_ssl'],
+            'Problema': problema_texto,
+            'Impacto_SEO': impacto,
+            'Recomendacao': recomendacao
+        }
 
     def _analisar_ssl_paralelo(self, dominios: list) -> list:
-        """🚀 Análise SSL paralela"""
+        """🚀 Análise SSL pelo motor único (handshakes assíncronos + cache entre auditorias)"""
         
         print(f"🔒 Análise SSL iniciada: {len(dominios)} domínios")
         
-        resultados = []
+        urls = {dominio: f"https://{dominio}/" for dominio in dominios}
+        resultados_host = obter_motor_ssl().verificar(urls.values())
         
-        # Menos threads para SSL (pode ser lento)
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_dominio = {
-                executor.submit(self._analisar_ssl_cirurgico, dominio): dominio
-                for dominio in dominios
-            }
-            
-            for future in as_completed(future_to_dominio):
-                resultado = future.result()
-                resultados.append(resultado)
-                
-                # Progress
-                print(f"      🔒 Analisado: {resultado['Dominio']} - Grade: {resultado['Grade']}")
+        resultados = []
+        for dominio, url in urls.items():
+            resultado = self._linha_dominio(dominio, resultados_host[alvo_tls(url)])
+            resultados.append(resultado)
+            print(f"      🔒 Analisado: {resultado['Dominio']} - Grade: {resultado['Grade']}")
         
-        return resultados
\ No newline at end of file
+        return resultados
@@ -1,48 +1,289 @@
 # status_checker.py
+# ⚡ Status HTTP com pool de conexões: keep-alive, limite por host, HEAD -> GET (405/501), cache com TTL
+
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 import warnings
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 warnings.filterwarnings("ignore")
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 HEADERS_PADRAO = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
 }
 
-def checar_status_http(url, timeout=10):
-    try:
-        response = requests.head(url, allow_redirects=True, timeout=timeout, headers=HEADERS_PADRAO, verify=False)
-        if response.status_code == 405:
-            response = requests.get(url, stream=True, timeout=timeout, headers=HEADERS_PADRAO, verify=False)
-        return response.status_code, response.headers.get("Content-Type", "")
-    except requests.exceptions.RequestException as e:
-        return None, str(e)
+STATUS_SEM_HEAD = (405, 501)    # Servidor não aceita HEAD: repete com GET (corpo descartado)
+LIMITE_CONEXOES = 100           # Conexões simultâneas no total
+LIMITE_POR_HOST = 10            # Conexões simultâneas por host (não derruba o servidor auditado)
+TTL_CACHE_STATUS = 300          # Segundos que um status vale (auditorias/abas repetidas no mesmo run)
 
-def verificar_status_http(lista_urls, max_threads=30):
-    resultados = []
+ResultadoStatus = Tuple[Optional[int], str]   # (status_code, content-type ou mensagem de erro)
 
-    def tarefa(url):
-        status_code, tipo_conteudo = checar_status_http(url)
-        return {
-            "url": url,
-            "status_code_http": status_code,
-            "tipo_conteudo_http": tipo_conteudo
-        }
 
-    print(f"🔄 Verificando com até {max_threads} threads...")
+# ========================
+# 💾 CACHE COM TTL
+# ========================
+
+class CacheStatus:
+    """💾 {url: (status, tipo)} em memória, cada entrada válida por ttl segundos"""
+
+    def __init__(self, ttl: float = TTL_CACHE_STATUS):
+        self.ttl = ttl
+        self._entradas: Dict[str, Tuple[float, ResultadoStatus]] = {}
+        self._lock = threading.Lock()
+
+    def obter(self, url: str) -> Optional[ResultadoStatus]:
+        with self._lock:
+            entrada = self._entradas.get(url)
+            if entrada is None:
+                return None
+            if entrada[0] <= time.monotonic():
+                del self._entradas[url]
+                return None
+            return entrada[1]
+
+    def guardar(self, url: str, resultado: ResultadoStatus):
+        # Erros de rede não vão para o cache: podem ser transitórios
+        if resultado[0] is None:
+            return
+        with self._lock:
+            self._entradas[url] = (time.monotonic() + self.ttl, resultado)
+
+    def limpar(self):
+        with self._lock:
+            self._entradas.clear()
+
+
+# ========================
+# ⚡ VERIFICADOR COM POOL
+# ========================
+
+class VerificadorStatus:
+    """⚡ Cliente assíncrono com pool (aiohttp) ou Session com pool + threads (fallback)"""
+
+    def __init__(self, timeout: float = 10, limite_conexoes: int = LIMITE_CONEXOES,
+                 limite_por_host: int = LIMITE_POR_HOST, ttl: float = TTL_CACHE_STATUS,
+                 usar_aiohttp: Optional[bool] = None, repetir_com_get: Iterable[int] = STATUS_SEM_HEAD):
+        self.timeout = timeout
+        self.repetir_com_get = frozenset(repetir_com_get)
+        self.limite_conexoes = limite_conexoes
+        self.limite_por_host = limite_por_host
+        self.usar_aiohttp = AIOHTTP_AVAILABLE if usar_aiohttp is None else (usar_aiohttp and AIOHTTP_AVAILABLE)
+        self.cache = CacheStatus(ttl)
+
+        self._session: Optional[requests.Session] = None
+        self._semaforos_host: Dict[str, threading.BoundedSemaphore] = defaultdict(
+            lambda: threading.BoundedSemaphore(self.limite_por_host)
+        )
+        self._lock = threading.Lock()
+
+        self.stats = {'verificadas': 0, 'cache': 0, 'get_sem_head': 0, 'erros': 0}
+
+    def _contar(self, chave: str):
+        with self._lock:
+            self.stats[chave] += 1
+
+    # ========================
+    # 🚀 CAMINHO ASSÍNCRONO (aiohttp)
+    # ========================
+
+    async def _checar_aiohttp(self, session, url: str) -> ResultadoStatus:
+        try:
+            async with session.head(url, allow_redirects=True) as response:
+                status, tipo = response.status, response.headers.get("Content-Type", "")
+
+            if status in self.repetir_com_get:
+                self._contar('get_sem_head')
+                async with session.get(url, allow_redirects=True) as response:
+                    status, tipo = response.status, response.headers.get("Content-Type", "")
+                    response.close()  # Só o status importa: não baixa o corpo
+
+            return status, tipo
+        except asyncio.TimeoutError:
+            self._contar('erros')
+            return None, f"Timeout ({self.timeout}s): {url}"
+        except Exception as e:
+            self._contar('erros')
+            return None, str(e) or type(e).__name__
+
+    async def _verificar_aiohttp(self, urls: List[str], progresso) -> Dict[str, ResultadoStatus]:
+        connector = aiohttp.TCPConnector(
+            limit=self.limite_conexoes, limit_per_host=self.limite_por_host, ssl=False, ttl_dns_cache=300
+        )
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        resultados: Dict[str, ResultadoStatus] = {}
+
+        # Semáforos além do connector: o timeout de cada requisição só começa a contar quando ela sai da fila
+        semaforo_total = asyncio.Semaphore(self.limite_conexoes)
+        semaforos_host = defaultdict(lambda: asyncio.Semaphore(self.limite_por_host))
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=HEADERS_PADRAO) as session:
+            async def _tarefa(url):
+                async with semaforos_host[urlparse(url).netloc], semaforo_total:
+                    resultados[url] = await self._checar_aiohttp(session, url)
+                progresso(url)
 
-    with ThreadPoolExecutor(max_workers=max_threads) as executor:
-        futuros = {executor.submit(tarefa, url): url for url in lista_urls}
-        for i, future in enumerate(as_completed(futuros), 1):
+            await asyncio.gather(*(_tarefa(url) for url in urls))
+
+        return resultados
+
+    # ========================
+    # 🧵 FALLBACK (requests.Session com pool)
+    # ========================
+
+    def _sessao(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                session.headers.update(HEADERS_PADRAO)
+                adapter = HTTPAdapter(pool_connections=self.limite_conexoes, pool_maxsize=self.limite_por_host)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._session = session
+            return self._session
+
+    def checar(self, url: str, timeout: Optional[float] = None) -> ResultadoStatus:
+        """🔍 Status de uma URL pela Session com pool (sem cache)"""
+        session = self._sessao()
+        timeout = timeout or self.timeout
+        host = urlparse(url).netloc
+        with self._lock:
+            semaforo = self._semaforos_host[host]
+
+        with semaforo:
             try:
-                resultados.append(future.result())
-            except Exception as e:
-                resultados.append({"url": futuros[future], "status_code_http": None, "tipo_conteudo_http": str(e)})
+                response = session.head(url, allow_redirects=True, timeout=timeout, verify=False)
+                response.close()
+                if response.status_code in self.repetir_com_get:
+                    self._contar('get_sem_head')
+                    response = session.get(url, stream=True, allow_redirects=True, timeout=timeout, verify=False)
+                    response.close()  # Só o status importa: não baixa o corpo
+                return response.status_code, response.headers.get("Content-Type", "")
+            except requests.exceptions.RequestException as e:
+                self._contar('erros')
+                return None, str(e)
+
+    def _verificar_threads(self, urls: List[str], progresso, max_workers: Optional[int] = None) -> Dict[str, ResultadoStatus]:
+        resultados: Dict[str, ResultadoStatus] = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers or self.limite_conexoes, max(len(urls), 1))) as executor:
+            futuros = {executor.submit(self.checar, url): url for url in urls}
+            for future in as_completed(futuros):
+                url = futuros[future]
+                try:
+                    resultados[url] = future.result()
+                except Exception as e:
+                    resultados[url] = (None, str(e))
+                progresso(url)
+        return resultados
+
+    # ========================
+    # 📊 API
+    # ========================
+
+    def verificar(self, urls: Iterable[str], max_workers: Optional[int] = None) -> Dict[str, ResultadoStatus]:
+        """⚡ {url: (status, tipo)} - cache primeiro, o resto pelo pool (max_workers: threads do fallback)"""
+        urls = list(dict.fromkeys(u for u in urls if u))
+        resultados: Dict[str, ResultadoStatus] = {}
+        pendentes = []
+        for url in urls:
+            em_cache = self.cache.obter(url)
+            if em_cache is not None:
+                resultados[url] = em_cache
+            else:
+                pendentes.append(url)
+        with self._lock:
+            self.stats['cache'] += len(urls) - len(pendentes)
+
+        feitas = [len(resultados)]
+
+        def _progresso(url):
+            feitas[0] += 1
+            if feitas[0] % 100 == 0 or feitas[0] == len(urls):
+                print(f"⏱️ {feitas[0]}/{len(urls)} URLs verificadas...")
+
+        if pendentes:
+            if self.usar_aiohttp:
+                novos = _executar_coroutine(self._verificar_aiohttp(pendentes, _progresso))
+            else:
+                novos = self._verificar_threads(pendentes, _progresso, max_workers)
+            for url, resultado in novos.items():
+                self.cache.guardar(url, resultado)
+            resultados.update(novos)
+            with self._lock:
+                self.stats['verificadas'] += len(novos)
+
+        return resultados
+
+    def get_stats(self) -> Dict:
+        """📊 Estatísticas do verificador"""
+        return {**self.stats, 'cliente': 'aiohttp' if self.usar_aiohttp else 'requests'}
+
 
-            if i % 100 == 0 or i == len(lista_urls):
-                print(f"⏱️ {i}/{len(lista_urls)} URLs verificadas...")
+def _executar_coroutine(coroutine):
+    """🔁 asyncio.run, em thread própria se já houver event loop ativo (pipeline async)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+_VERIFICADOR_PADRAO: Optional[VerificadorStatus] = None
+_LOCK_VERIFICADOR = threading.Lock()
+
+
+def obter_verificador_status() -> VerificadorStatus:
+    """⚡ Verificador compartilhado (pool e cache valem para todas as chamadas do run)"""
+    global _VERIFICADOR_PADRAO
+    with _LOCK_VERIFICADOR:
+        if _VERIFICADOR_PADRAO is None:
+            _VERIFICADOR_PADRAO = VerificadorStatus()
+        return _VERIFICADOR_PADRAO
+
+
+# ========================
+# 🔁 API COMPATÍVEL
+# ========================
 
-    return resultados
+def checar_status_http(url, timeout=10):
+    em_cache = obter_verificador_status().cache.obter(url)
+    if em_cache is not None:
+        return em_cache
+    resultado = obter_verificador_status().checar(url, timeout)
+    obter_verificador_status().cache.guardar(url, resultado)
+    return resultado
+
+def verificar_status_http(lista_urls, max_threads=30):
+    verificador = obter_verificador_status()
+    cliente = 'aiohttp' if verificador.usar_aiohttp else 'requests + threads'
+    print(f"🔄 Verificando com pool de até {verificador.limite_conexoes} conexões "
+          f"({verificador.limite_por_host} por host, {cliente})...")
+    if not AIOHTTP_AVAILABLE:
+        print(f"   ⚠️ aiohttp não instalado: usando o fallback com threads (pip install aiohttp)")
+
+    status = verificador.verificar(lista_urls, max_workers=max_threads)
+
+    return [
+        {
+            "url": url,
+            "status_code_http": status.get(url, (None, ''))[0],
+            "tipo_conteudo_http": status.get(url, (None, ''))[1]
+        }
+        for url in lista_urls
+    ]
@@ -0,0 +1,67 @@
+# templates_url.py - Identificação de templates de página pelo padrão da URL
+# 🧩 Agrupa URLs que compartilham o mesmo layout (ex: /blog/{slug}, /produto/{id})
+
+import re
+from urllib.parse import urlparse
+from typing import List
+
+# 🎯 PADRÕES DE SEGMENTOS VARIÁVEIS
+_RE_NUMERICO = re.compile(r'^\d+$')
+_RE_DATA = re.compile(r'^\d{4}(-\d{2}){0,2}$')
+_RE_HASH = re.compile(r'^[0-9a-f]{12,}$|^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$')
+_RE_ARQUIVO = re.compile(r'\.([a-z0-9]{2,5})$')
+
+MAX_SEGMENTOS_TEMPLATE = 4
+
+
+def _normalizar_segmento(segmento: str, posicao: int) -> str:
+    """🔣 Converte segmento variável em placeholder"""
+
+    if _RE_NUMERICO.match(segmento):
+        return '{id}'
+    if _RE_DATA.match(segmento):
+        return '{data}'
+    if _RE_HASH.match(segmento):
+        return '{hash}'
+
+    arquivo = _RE_ARQUIVO.search(segmento)
+    if arquivo:
+        return '{arquivo}.' + arquivo.group(1)
+
+    # Primeiro segmento costuma ser a seção do site (/blog, /planos)
+    if posicao == 0:
+        return segmento
+
+    # Slugs longos ou com dígitos são conteúdo, não estrutura
+    if segmento.count('-') >= 2 or len(segmento) > 25 or any(c.isdigit() for c in segmento):
+        return '{slug}'
+
+    return segmento
+
+
+def segmentos_template_url(url: str) -> List[str]:
+    """🧩 Retorna segmentos normalizados do path da URL"""
+
+    path = urlparse(str(url)).path.lower().strip('/')
+    if not path:
+        return []
+
+    segmentos = [s for s in path.split('/') if s]
+    return [_normalizar_segmento(s, i) for i, s in enumerate(segmentos[:MAX_SEGMENTOS_TEMPLATE])]
+
+
+def chave_template_url(url: str) -> str:
+    """🧩 Chave de template pelo padrão da URL (ex: /blog/{slug})"""
+
+    segmentos = segmentos_template_url(url)
+    if not segmentos:
+        return '/'
+
+    chave = '/' + '/'.join(segmentos)
+
+    # Segmentos além do limite viram um único sufixo
+    path = urlparse(str(url)).path.strip('/')
+    if len([s for s in path.split('/') if s]) > MAX_SEGMENTOS_TEMPLATE:
+        chave += '/...'
+
+    return chave
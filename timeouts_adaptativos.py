@@ -0,0 +1,122 @@
+# timeouts_adaptativos.py - Timeouts de espera aprendidos por host e por template
+# ⏱️ Espera = percentil alto do "tempo até o title aparecer" observado no crawl, com teto
+
+import math
+from collections import defaultdict, deque
+from urllib.parse import urlparse
+from typing import Dict
+
+from templates_url import chave_template_url
+
+# 🎯 CONFIGURAÇÕES PADRÃO
+PERCENTIL_PADRAO = 0.95
+MARGEM_SEGURANCA = 1.5       # Multiplica o percentil observado
+MIN_AMOSTRAS = 5             # Antes disso usa o teto (comportamento hardened original)
+JANELA_AMOSTRAS = 200        # Últimas N observações por chave
+MIN_TENTATIVAS_FALLBACK = 10 # Fallback só é cortado após N tentativas sem sucesso
+
+
+def percentil(valores, p: float) -> float:
+    """📐 Percentil nearest-rank"""
+    ordenados = sorted(valores)
+    if not ordenados:
+        return 0.0
+    indice = max(0, min(len(ordenados) - 1, math.ceil(p * len(ordenados)) - 1))
+    return ordenados[indice]
+
+
+class EstimadorTimeoutAdaptativo:
+    """⏱️ Aprende a distribuição de espera por template (e por host como fallback)"""
+
+    def __init__(self, teto_ms: int, piso_ms: int = 1000, percentil: float = PERCENTIL_PADRAO,
+                 margem: float = MARGEM_SEGURANCA, min_amostras: int = MIN_AMOSTRAS,
+                 espera_fixa_original: bool = False):
+        self.teto_ms = teto_ms
+        # True quando o código original dormia o teto inteiro (não só até o elemento aparecer)
+        self.espera_fixa_original = espera_fixa_original
+        self.piso_ms = min(piso_ms, teto_ms)
+        self.percentil = percentil
+        self.margem = margem
+        self.min_amostras = min_amostras
+
+        self.observacoes_template: Dict[tuple, deque] = defaultdict(lambda: deque(maxlen=JANELA_AMOSTRAS))
+        self.observacoes_host: Dict[str, deque] = defaultdict(lambda: deque(maxlen=JANELA_AMOSTRAS))
+        self.fallback_host: Dict[str, Dict[str, int]] = defaultdict(lambda: {'tentativas': 0, 'sucessos': 0})
+
+        self.stats = {
+            'esperas': 0,
+            'esperas_expiradas': 0,
+            'espera_total_ms': 0.0,
+            'espera_economizada_ms': 0.0,
+            'fallbacks_pulados': 0
+        }
+
+    def _chaves(self, url: str):
+        host = urlparse(url).netloc
+        return host, (host, chave_template_url(url))
+
+    def timeout_para(self, url: str) -> int:
+        """⏱️ Timeout de espera para a URL (template > host > teto)"""
+        host, chave_tpl = self._chaves(url)
+
+        amostras = self.observacoes_template.get(chave_tpl)
+        if not amostras or len(amostras) < self.min_amostras:
+            amostras = self.observacoes_host.get(host)
+        if not amostras or len(amostras) < self.min_amostras:
+            return self.teto_ms
+
+        estimado = percentil(amostras, self.percentil) * self.margem
+        return int(min(self.teto_ms, max(self.piso_ms, estimado)))
+
+    def registrar(self, url: str, tempo_ms: float):
+        """📝 Registra tempo observado até o elemento aparecer"""
+        host, chave_tpl = self._chaves(url)
+        self.observacoes_template[chave_tpl].append(tempo_ms)
+        self.observacoes_host[host].append(tempo_ms)
+
+    def registrar_espera(self, timeout_ms: int, tempo_ms: float, expirou: bool):
+        """📊 Contabiliza espera real e economia em relação ao teto fixo"""
+        self.stats['esperas'] += 1
+        self.stats['espera_total_ms'] += tempo_ms
+        if expirou:
+            self.stats['esperas_expiradas'] += 1
+        if self.espera_fixa_original:
+            self.stats['espera_economizada_ms'] += max(0, self.teto_ms - tempo_ms)
+        elif expirou:
+            # Com o teto fixo a espera expirada teria durado teto_ms
+            self.stats['espera_economizada_ms'] += max(0, self.teto_ms - timeout_ms)
+
+    def usar_fallback(self, url: str) -> bool:
+        """🔁 Fallback extra só enquanto ele já resolveu algo neste host"""
+        host, _ = self._chaves(url)
+        historico = self.fallback_host[host]
+        if historico['tentativas'] >= MIN_TENTATIVAS_FALLBACK and historico['sucessos'] == 0:
+            self.stats['fallbacks_pulados'] += 1
+            return False
+        return True
+
+    def registrar_fallback(self, url: str, sucesso: bool):
+        host, _ = self._chaves(url)
+        self.fallback_host[host]['tentativas'] += 1
+        if sucesso:
+            self.fallback_host[host]['sucessos'] += 1
+
+    def economia_fallback_ms(self, fallback_ms: int) -> float:
+        return self.stats['fallbacks_pulados'] * fallback_ms
+
+    def get_stats(self) -> Dict:
+        """📊 Estatísticas de espera adaptativa"""
+        return {
+            'esperas': self.stats['esperas'],
+            'esperas_expiradas': self.stats['esperas_expiradas'],
+            'espera_total_ms': round(self.stats['espera_total_ms'], 1),
+            'espera_economizada_ms': round(self.stats['espera_economizada_ms'], 1),
+            'fallbacks_pulados': self.stats['fallbacks_pulados'],
+            'templates_aprendidos': len([a for a in self.observacoes_template.values() if len(a) >= self.min_amostras]),
+            'hosts_aprendidos': len([a for a in self.observacoes_host.values() if len(a) >= self.min_amostras])
+        }
+
+    def reset(self):
+        """🔄 Esquece observações e estatísticas"""
+        self.__init__(self.teto_ms, self.piso_ms, self.percentil, self.margem, self.min_amostras,
+                      self.espera_fixa_original)
@@ -4,15 +4,31 @@ from playwright.async_api import Page
 from playwright._impl._errors import TimeoutError as PlaywrightTimeoutError
 from typing import Dict, Optional
 import logging
+import time
+
+from timeouts_adaptativos import EstimadorTimeoutAdaptativo
+from config import CrawlerGlobalConfig
 
 logger = logging.getLogger(__name__)
 
 class TitleExtractorV5:
     """📝 Title Extractor V5 Hardened - Standalone e focado"""
     
-    def __init__(self, timeout: int = 15000, fallback_timeout: int = 3000):
+    def __init__(self, timeout: int = CrawlerGlobalConfig.DEFAULT_TITLE_TIMEOUT, fallback_timeout: int = 3000,
+                 adaptativo: bool = CrawlerGlobalConfig.ADAPTIVE_TITLE_TIMEOUT,
+                 estimador: Optional[EstimadorTimeoutAdaptativo] = None):
+        # timeout = teto; com adaptativo=True a espera real é aprendida por host/template
+        # estimador compartilhado (ESTIMADOR_TITLE do crawler) soma o que cada página já ensinou
         self.timeout = timeout
         self.fallback_timeout = fallback_timeout
+        self.adaptativo = adaptativo
+        self._estimador_proprio = estimador is None
+        self.estimador = estimador or EstimadorTimeoutAdaptativo(
+            timeout, piso_ms=CrawlerGlobalConfig.MIN_TITLE_TIMEOUT,
+            percentil=CrawlerGlobalConfig.ADAPTIVE_TIMEOUT_PERCENTILE
+        )
+        self._ultimo_timeout = timeout
+        self._ultima_espera_expirou = False
         
         # Blacklist simples
         self.blacklist = [
@@ -37,7 +53,7 @@ class TitleExtractorV5:
         
         try:
             # ESTRATÉGIA 1: Wait for function (timeout aumentado)
-            title, strategy = await self._strategy_wait_for_function(page)
+            title, strategy = await self._strategy_wait_for_function(page, url)
             
             # ESTRATÉGIA 2: Title API direto
             if not title:
@@ -49,7 +65,7 @@ class TitleExtractorV5:
             
             # ESTRATÉGIA 4: Fallback agressivo (SPAs)
             if not title or self._is_loading_state(title):
-                title, strategy = await self._strategy_spa_fallback(page)
+                title, strategy = await self._strategy_spa_fallback(page, url)
             
             # ESTRATÉGIA 5: Title alternativo (H1, OG)
             if not title or self._is_blacklisted(title):
@@ -90,16 +106,25 @@ class TitleExtractorV5:
                 'url': url
             }
     
-    async def _strategy_wait_for_function(self, page: Page) -> tuple[str, str]:
-        """🔧 Estratégia 1: Wait for function com timeout aumentado"""
+    async def _strategy_wait_for_function(self, page: Page, url: str) -> tuple[str, str]:
+        """🔧 Estratégia 1: Wait for function com timeout aprendido (teto = self.timeout)"""
+        timeout = self.estimador.timeout_para(url) if self.adaptativo else self.timeout
+        self._ultimo_timeout = timeout
+        self._ultima_espera_expirou = False
+        inicio = time.time()
         try:
             await page.wait_for_function(
                 "document.title && document.title.trim().length > 0", 
-                timeout=self.timeout
+                timeout=timeout
             )
+            decorrido = (time.time() - inicio) * 1000
+            self.estimador.registrar(url, decorrido)
+            self.estimador.registrar_espera(timeout, decorrido, False)
             title = await page.title()
             return title.strip() if title else "", "wait_for_function"
         except PlaywrightTimeoutError:
+            self._ultima_espera_expirou = True
+            self.estimador.registrar_espera(timeout, (time.time() - inicio) * 1000, True)
             return "", "wait_for_function_timeout"
         except Exception:
             return "", "wait_for_function_error"
@@ -123,17 +148,25 @@ class TitleExtractorV5:
         except Exception:
             return "", "dom_direct_error"
     
-    async def _strategy_spa_fallback(self, page: Page) -> tuple[str, str]:
+    async def _strategy_spa_fallback(self, page: Page, url: str) -> tuple[str, str]:
         """🔧 Estratégia 4: Fallback agressivo para SPAs"""
         try:
-            # Wait adicional para JS assíncrono
-            await page.wait_for_timeout(self.fallback_timeout)
+            # Wait adicional para JS assíncrono (cortado se nunca resolve neste host)
+            usar_fallback = not self.adaptativo or self.estimador.usar_fallback(url)
+            if usar_fallback:
+                await page.wait_for_timeout(self.fallback_timeout)
             
             # Nova tentativa
             title = await page.title()
             if not title or title.strip() == "":
                 title = await page.evaluate("document.title")
             
+            if usar_fallback:
+                resolvido = bool(title and title.strip())
+                self.estimador.registrar_fallback(url, resolvido)
+                if resolvido and self._ultima_espera_expirou:
+                    self.estimador.registrar(url, self._ultimo_timeout + self.fallback_timeout)
+            
             return title.strip() if title else "", "spa_fallback"
         except Exception:
             return "", "spa_fallback_error"
@@ -208,17 +241,28 @@ class TitleExtractorV5:
         if self.stats['total_extractions'] > 0:
             success_rate = (self.stats['successful_extractions'] / self.stats['total_extractions']) * 100
         
+        espera = self.estimador.get_stats()
+        wait_saved_ms = espera['espera_economizada_ms'] + self.estimador.economia_fallback_ms(self.fallback_timeout)
+        
         return {
             'total_extractions': self.stats['total_extractions'],
             'successful_extractions': self.stats['successful_extractions'],
             'success_rate_percent': round(success_rate, 2),
             'blacklisted_count': self.stats['blacklisted_count'],
+            'adaptive_timeout': self.adaptativo,
+            'wait_total_ms': espera['espera_total_ms'],
+            'wait_saved_ms': round(wait_saved_ms, 1),
+            'wait_timeouts': espera['esperas_expiradas'],
+            'fallbacks_skipped': espera['fallbacks_pulados'],
+            'learned_templates': espera['templates_aprendidos'],
             'strategy_usage': self.stats['strategy_used'].copy(),
             'most_used_strategy': max(self.stats['strategy_used'], key=self.stats['strategy_used'].get) if self.stats['strategy_used'] else None
         }
     
     def reset_stats(self):
-        """🔄 Reseta estatísticas"""
+        """🔄 Reseta estatísticas (observações aprendidas só se o estimador é deste extrator)"""
+        if self._estimador_proprio:
+            self.estimador.reset()
         self.stats = {
             'total_extractions': 0,
             'successful_extractions': 0,
@@ -233,8 +277,9 @@ class TitleExtractorV5:
 async def test_title_extractor():
     """🧪 Testa o extrator de title"""
     from playwright.async_api import async_playwright
+    from crawler_playwright import ESTIMADOR_TITLE, FALLBACK_TIMEOUT, TITLE_TIMEOUT
     
-    extractor = TitleExtractorV5(timeout=15000, fallback_timeout=3000)
+    extractor = TitleExtractorV5(timeout=TITLE_TIMEOUT, fallback_timeout=FALLBACK_TIMEOUT, estimador=ESTIMADOR_TITLE)
     
     test_urls = [
         "https://example.com",
@@ -267,6 +312,7 @@ async def test_title_extractor():
     print(f"\n📊 Estatísticas:")
     print(f"   Success rate: {stats['success_rate_percent']:.1f}%")
     print(f"   Strategy usage: {stats['strategy_usage']}")
+    print(f"   Wait saved: {stats['wait_saved_ms'] / 1000:.1f}s")
 
 if __name__ == "__main__":
     import asyncio
@@ -0,0 +1,195 @@
+# verificador_links.py - Links quebrados (internos, externos e arquivos) com dedupe global
+# 🔗 Cada destino é verificado uma vez por auditoria: HEAD primeiro, pool com limite por host, cache em disco com TTL
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urljoin, urlparse
+
+from status_checker import VerificadorStatus
+
+# 🎯 CONFIGURAÇÕES
+CACHE_LINKS_ARQUIVO = os.path.join("cache", "links_verificados.json")
+TTL_LINK_OK = 7 * 24 * 3600         # Destino respondeu 2xx/3xx: só reverifica na semana seguinte
+TTL_LINK_QUEBRADO = 6 * 3600        # Quebrado: reverifica logo (pode ter sido corrigido)
+LIMITE_POR_HOST_LINKS = 4           # Sites de terceiros: poucas conexões por host
+AMOSTRA_ORIGENS = 5                 # Páginas de origem listadas por destino
+
+# HEAD com erro é confirmado com GET: muitos servidores respondem HEAD errado (403/404) e GET certo
+REPETIR_COM_GET_LINKS = (400, 403, 404, 405, 406, 410, 429, 500, 501, 502, 503)
+
+EXTENSOES_ARQUIVO = ('.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.zip', '.rar',
+                     '.csv', '.txt', '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.mp4', '.mp3')
+
+PREFIXOS_IGNORADOS = ('mailto:', 'tel:', 'javascript:', '#', 'data:', 'whatsapp:', 'sms:')
+
+
+# ========================
+# 🔗 COLETA DE DESTINOS
+# ========================
+
+def normalizar_link(href: str, base_url: str) -> Optional[str]:
+    """🔗 URL absoluta http(s) sem fragmento (query preservada: é o destino exato do clique)"""
+    if not href:
+        return None
+    href = str(href).strip()
+    if not href or href.lower().startswith(PREFIXOS_IGNORADOS):
+        return None
+    try:
+        url = urljoin(base_url, href.split('#')[0])
+    except ValueError:
+        return None
+    if urlparse(url).scheme not in ('http', 'https'):
+        return None
+    return url
+
+
+def extrair_links_todos(hrefs: Iterable[str], base_url: str) -> List[str]:
+    """🔗 Todos os <a href> da página (externos e arquivos incluídos), sem repetição"""
+    links = (normalizar_link(href, base_url) for href in hrefs)
+    return list(dict.fromkeys(link for link in links if link))
+
+
+def tipo_link(url: str, dominio: str) -> str:
+    """🏷️ ARQUIVO (pdf, doc...), INTERNO (mesmo domínio) ou EXTERNO"""
+    parsed = urlparse(url)
+    if parsed.path.lower().endswith(EXTENSOES_ARQUIVO):
+        return 'ARQUIVO'
+    return 'INTERNO' if parsed.netloc == dominio else 'EXTERNO'
+
+
+def link_quebrado(status: Optional[int]) -> bool:
+    return status is None or status >= 400
+
+
+def indice_destinos(resultados, colunas=('links_todos', 'links_encontrados')) -> Dict[str, List[str]]:
+    """🗂️ {destino: [páginas de origem]} - o link do rodapé repetido em 10 mil páginas vira 1 destino"""
+    registros = resultados.to_dict('records') if hasattr(resultados, 'to_dict') else resultados
+    origens: Dict[str, Dict[str, None]] = defaultdict(dict)
+
+    for registro in registros:
+        origem = registro.get('url')
+        if not isinstance(origem, str):
+            continue
+        for coluna in colunas:
+            links = registro.get(coluna)
+            if isinstance(links, (list, tuple, set)) or hasattr(links, 'tolist'):
+                break
+        else:
+            continue
+        for link in list(links):
+            if isinstance(link, str) and link:
+                origens[link][origem] = None
+
+    return {destino: list(paginas) for destino, paginas in origens.items()}
+
+
+# ========================
+# 💾 CACHE PERSISTENTE
+# ========================
+
+class CacheLinks:
+    """💾 {url: (status, detalhe)} em JSON entre auditorias; TTL curto para quebrados"""
+
+    def __init__(self, caminho: str = CACHE_LINKS_ARQUIVO, ttl_ok: float = TTL_LINK_OK,
+                 ttl_quebrado: float = TTL_LINK_QUEBRADO):
+        self.caminho = caminho
+        self.ttl_ok = ttl_ok
+        self.ttl_quebrado = ttl_quebrado
+        self._entradas: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._carregar()
+
+    def _carregar(self):
+        if not self.caminho or not os.path.exists(self.caminho):
+            return
+        try:
+            with open(self.caminho, "r", encoding="utf-8") as f:
+                self._entradas = json.load(f)
+        except (OSError, ValueError):
+            self._entradas = {}
+
+    def obter(self, url: str):
+        with self._lock:
+            entrada = self._entradas.get(url)
+        if not entrada or entrada.get('valido_ate', 0) <= time.time():
+            return None
+        return entrada['status'], entrada.get('detalhe', '')
+
+    def guardar(self, url: str, status: Optional[int], detalhe: str):
+        # Erros de rede não vão para o cache: podem ser transitórios
+        if status is None:
+            return
+        ttl = self.ttl_quebrado if link_quebrado(status) else self.ttl_ok
+        with self._lock:
+            self._entradas[url] = {'status': status, 'detalhe': detalhe, 'valido_ate': time.time() + ttl}
+
+    def salvar(self):
+        if not self.caminho:
+            return
+        agora = time.time()
+        with self._lock:
+            vigentes = {k: v for k, v in self._entradas.items() if v.get('valido_ate', 0) > agora}
+        try:
+            os.makedirs(os.path.dirname(self.caminho) or '.', exist_ok=True)
+            with open(self.caminho, "w", encoding="utf-8") as f:
+                json.dump(vigentes, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"⚠️ Cache de links não salvo: {e}")
+
+
+# ========================
+# 🔍 VERIFICADOR
+# ========================
+
+class VerificadorLinks:
+    """🔍 Status de cada destino único: status já conhecidos do crawl > cache em disco > pool HEAD-first"""
+
+    def __init__(self, timeout: float = 10, limite_por_host: int = LIMITE_POR_HOST_LINKS,
+                 cache_path: Optional[str] = CACHE_LINKS_ARQUIVO, usar_aiohttp: Optional[bool] = None):
+        self.cache = CacheLinks(cache_path)
+        self.verificador = VerificadorStatus(
+            timeout=timeout, limite_por_host=limite_por_host, usar_aiohttp=usar_aiohttp,
+            repetir_com_get=REPETIR_COM_GET_LINKS
+        )
+        self.stats = {'destinos': 0, 'do_crawl': 0, 'cache_disco': 0, 'verificados': 0, 'quebrados': 0}
+
+    def verificar(self, destinos: Iterable[str], conhecidos: Optional[Dict[str, int]] = None) -> Dict[str, tuple]:
+        """🔍 {destino: (status, detalhe)} - conhecidos: {url: status} das páginas já baixadas pelo crawler"""
+        destinos = list(dict.fromkeys(destinos))
+        conhecidos = conhecidos or {}
+        resultados: Dict[str, tuple] = {}
+        pendentes = []
+
+        for url in destinos:
+            status = conhecidos.get(url.rstrip('/'))
+            if status is not None:
+                resultados[url] = (status, 'crawl')
+                self.stats['do_crawl'] += 1
+                continue
+            em_cache = self.cache.obter(url)
+            if em_cache is not None:
+                resultados[url] = em_cache
+                self.stats['cache_disco'] += 1
+            else:
+                pendentes.append(url)
+
+        if pendentes:
+            novos = self.verificador.verificar(pendentes)
+            for url in pendentes:
+                status, detalhe = novos.get(url, (None, 'não verificado'))
+                self.cache.guardar(url, status, detalhe)
+                resultados[url] = (status, detalhe)
+            self.cache.salvar()
+
+        self.stats['destinos'] += len(destinos)
+        self.stats['verificados'] += len(pendentes)
+        self.stats['quebrados'] += sum(1 for status, _ in resultados.values() if link_quebrado(status))
+        return resultados
+
+    def get_stats(self) -> Dict:
+        """📊 Estatísticas do verificador"""
+        return {**self.stats, **{f'pool_{k}': v for k, v in self.verificador.get_stats().items()}}